@@ -0,0 +1,7 @@
+"""
+Micro-benchmarks for API hot paths.
+
+Each module is runnable with `python -m api.benchmarks.<module>` and prints
+per-operation timings. bench_cold_start, bench_transitions and
+bench_repository_create need a database.
+"""
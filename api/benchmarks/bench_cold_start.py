@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cold start to first 200 for each startup mode.
+
+Launches the API under uvicorn once per DB_STARTUP_MODE and measures:
+
+- ready: process launch until /health answers
+- first 200: process launch until GET /api/v1/jobs returns 200
+- burst: latency of a concurrent burst of list requests sent as soon as
+  the app is ready (the requests that pay for pool growth in
+  create_all mode)
+
+Needs a migrated database reachable through MEDIA_DATABASE_URL.
+
+Usage:
+    MEDIA_DATABASE_URL=postgresql://... python -m api.benchmarks.bench_cold_start
+    python -m api.benchmarks.bench_cold_start --burst 20 --runs 5
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Tuple
+
+MODES = ("create_all", "fast")
+LIST_PATH = "/api/v1/jobs?page_size=1&include_total=false"
+
+
+def get_status(url: str, timeout: float = 5.0) -> int:
+    """Return the HTTP status for url, or 0 if the server is not answering."""
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+    except OSError:
+        return 0
+
+
+def timed_get(url: str) -> Tuple[int, float, float]:
+    """One GET: (status, latency in ms, perf_counter at completion)."""
+    start = time.perf_counter()
+    status = get_status(url)
+    done = time.perf_counter()
+    return status, (done - start) * 1000, done
+
+
+def run_once(mode: str, port: int, burst: int) -> Dict[str, float]:
+    """Start the API in mode, measure startup and the first burst, then stop it."""
+    base = f"http://127.0.0.1:{port}"
+    env = dict(os.environ, DB_STARTUP_MODE=mode)
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "api.main:app", "--port", str(port), "--log-level", "warning"],
+        env=env
+    )
+    try:
+        while get_status(f"{base}/health", timeout=0.5) != 200:
+            if process.poll() is not None:
+                raise RuntimeError(f"API exited during startup in {mode} mode")
+            time.sleep(0.01)
+        ready = (time.perf_counter() - started) * 1000
+
+        with ThreadPoolExecutor(max_workers=burst) as pool:
+            responses = list(pool.map(timed_get, [base + LIST_PATH] * burst))
+        ok = [done for status, _, done in responses if status == 200]
+        if not ok:
+            raise RuntimeError(f"No 200 from {LIST_PATH} in {mode} mode")
+        first_200 = (min(ok) - started) * 1000
+        latencies = [latency for _, latency, _ in responses]
+
+        return {
+            "ready": ready,
+            "first_200": first_200,
+            "burst_p50": statistics.median(latencies),
+            "burst_max": max(latencies),
+        }
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark API cold start per startup mode")
+    parser.add_argument("--port", type=int, default=8765, help="Port to run uvicorn on")
+    parser.add_argument("--burst", type=int, default=20, help="Concurrent requests after ready")
+    parser.add_argument("--runs", type=int, default=3, help="Cold starts per mode")
+    args = parser.parse_args()
+
+    print(f"burst={args.burst} runs={args.runs} (median of runs, ms)")
+    print(f"{'mode':<12}{'ready':>10}{'first 200':>12}{'burst p50':>12}{'burst max':>12}")
+    for mode in MODES:
+        runs = [run_once(mode, args.port, args.burst) for _ in range(args.runs)]
+        row = {key: statistics.median(run[key] for run in runs) for key in runs[0]}
+        print(
+            f"{mode:<12}{row['ready']:>10.0f}{row['first_200']:>12.0f}"
+            f"{row['burst_p50']:>12.1f}{row['burst_max']:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
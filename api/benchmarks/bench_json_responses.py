@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Benchmark: default vs fast JSON response path for list endpoints.
+
+Measures per-request CPU time spent turning a page of ORM rows into the
+response body for list_jobs and list_results.
+
+The default path mirrors what FastAPI does for a response_model endpoint:
+the endpoint validates each row into the schema, FastAPI re-validates the
+returned model against response_model (TypeAdapter.validate_python with
+from_attributes), dumps it to JSON-compatible Python and JSONResponse
+encodes it with the stdlib json module. The fast path is rows_to_dicts plus
+FastJSONResponse, as used by `?fast=true`.
+
+Usage:
+    python -m api.benchmarks.bench_json_responses
+    python -m api.benchmarks.bench_json_responses --page-size 100 --iterations 500
+"""
+
+import argparse
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List
+from uuid import uuid4
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from api.main import JOB_RELATION_FIELDS, RESULT_RELATION_FIELDS
+from api.models.job import AnalysisJob, JobStatus, MediaType
+from api.models.result import AnalysisResult
+from api.responses import FastJSONResponse, orjson, rows_to_dicts
+from api.schemas.job import JobListResponse, JobResponse
+from api.schemas.result import AnalysisResultListResponse, AnalysisResultResponse
+
+
+def make_jobs(count: int) -> List[AnalysisJob]:
+    """Build transient jobs with realistic metadata payloads."""
+    now = datetime.now(timezone.utc)
+    return [
+        AnalysisJob(
+            id=uuid4(),
+            status=JobStatus.COMPLETED,
+            media_type=MediaType.VIDEO,
+            source_url=f"https://cdn.example.com/media/{i}.mp4",
+            metadata_json={
+                "description": "Interview recording " * 4,
+                "tags": [f"tag-{n}" for n in range(10)],
+                "source": {"uploader": "ingest", "bitrate": 4_500_000, "fps": 29.97},
+            },
+            created_at=now - timedelta(seconds=i),
+            updated_at=now,
+            completed_at=now,
+        )
+        for i in range(count)
+    ]
+
+
+def make_results(count: int) -> List[AnalysisResult]:
+    """Build transient results with realistic result_json payloads."""
+    now = datetime.now(timezone.utc)
+    return [
+        AnalysisResult(
+            id=uuid4(),
+            job_id=uuid4(),
+            provider="minimax",
+            model="minimax-video-2.0",
+            result_json={
+                "summary": "A video about technology and its impact. " * 5,
+                "topics": [f"topic-{n}" for n in range(15)],
+                "scenes": [
+                    {"start": n * 5.0, "end": n * 5.0 + 5.0, "label": f"scene {n}"}
+                    for n in range(20)
+                ],
+            },
+            confidence=0.93,
+            tokens_used=1500,
+            latency_ms=5000,
+            created_at=now - timedelta(seconds=i),
+            updated_at=now,
+        )
+        for i in range(count)
+    ]
+
+
+def default_jobs(jobs: List[AnalysisJob], adapter: TypeAdapter) -> bytes:
+    """Endpoint validation, response_model validation, stdlib encoding."""
+    content = JobListResponse(
+        items=[JobResponse.model_validate(job) for job in jobs],
+        total=None, page=1, page_size=len(jobs), has_more=False, next_cursor=None
+    )
+    value = adapter.validate_python(content, from_attributes=True)
+    return JSONResponse(adapter.dump_python(value, mode="json")).body
+
+
+def fast_jobs(jobs: List[AnalysisJob]) -> bytes:
+    """Direct dict building and a single orjson encode."""
+    return FastJSONResponse({
+        "items": rows_to_dicts(jobs, JobResponse, JOB_RELATION_FIELDS),
+        "total": None, "page": 1, "page_size": len(jobs), "has_more": False, "next_cursor": None
+    }).body
+
+
+def default_results(results: List[AnalysisResult], adapter: TypeAdapter) -> bytes:
+    """Endpoint validation, response_model validation, stdlib encoding."""
+    content = AnalysisResultListResponse(
+        items=[AnalysisResultResponse.model_validate(result) for result in results],
+        total=None, page=1, page_size=len(results), has_more=False, next_cursor=None
+    )
+    value = adapter.validate_python(content, from_attributes=True)
+    return JSONResponse(adapter.dump_python(value, mode="json")).body
+
+
+def fast_results(results: List[AnalysisResult]) -> bytes:
+    """Direct dict building and a single orjson encode."""
+    return FastJSONResponse({
+        "items": rows_to_dicts(results, AnalysisResultResponse, RESULT_RELATION_FIELDS),
+        "total": None, "page": 1, "page_size": len(results), "has_more": False, "next_cursor": None
+    }).body
+
+
+def cpu_ms_per_call(fn: Callable[[], bytes], iterations: int) -> float:
+    """Average process CPU time of fn in milliseconds."""
+    fn()  # warm caches (schema fields, pydantic validators)
+    start = time.process_time()
+    for _ in range(iterations):
+        fn()
+    return (time.process_time() - start) * 1000 / iterations
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark list response serialization")
+    parser.add_argument("--page-size", type=int, default=100, help="Rows per page")
+    parser.add_argument("--iterations", type=int, default=200, help="Requests to time")
+    args = parser.parse_args()
+
+    jobs = make_jobs(args.page_size)
+    results = make_results(args.page_size)
+    job_adapter = TypeAdapter(JobListResponse)
+    result_adapter = TypeAdapter(AnalysisResultListResponse)
+
+    cases = [
+        ("list_jobs", lambda: default_jobs(jobs, job_adapter), lambda: fast_jobs(jobs)),
+        ("list_results", lambda: default_results(results, result_adapter), lambda: fast_results(results)),
+    ]
+
+    encoder = "orjson" if orjson is not None else "stdlib json (orjson not installed)"
+    print(f"page_size={args.page_size} iterations={args.iterations} fast encoder={encoder}")
+    print(f"{'endpoint':<14}{'default ms':>12}{'fast ms':>12}{'speedup':>10}")
+    for name, default, fast in cases:
+        before = cpu_ms_per_call(default, args.iterations)
+        after = cpu_ms_per_call(fast, args.iterations)
+        print(f"{name:<14}{before:>12.3f}{after:>12.3f}{before / after:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
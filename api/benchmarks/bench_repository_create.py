@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Benchmark: round trips and latency of BaseRepository.create.
+
+Creates jobs, results and processing log entries two ways:
+
+- add_flush_refresh: the previous create (session.add, flush, refresh),
+  whose refresh re-SELECTs the row (and, for jobs, every selectin
+  relationship)
+- insert_returning: BaseRepository.create, one INSERT ... RETURNING
+
+Reported per model and strategy: SQL statements per create and mean
+microseconds per create. Every create runs in one transaction that is
+rolled back at the end, so nothing is left behind.
+
+Needs a migrated database reachable through MEDIA_DATABASE_URL.
+
+Usage:
+    MEDIA_DATABASE_URL=postgresql://... python -m api.benchmarks.bench_repository_create
+    python -m api.benchmarks.bench_repository_create --iterations 2000
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any, Callable, Dict, Tuple
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.models.database import close_engine, create_async_engine_configured, init_session_factory
+from api.models.job import AnalysisJob, JobStatus, MediaType
+from api.models.processing_log import ProcessingLog, ProcessingLogStatus, ProcessingStage
+from api.models.result import AnalysisProvider, AnalysisResult
+from api.repositories.base import BaseRepository
+from api.repositories.job import JobRepository
+from api.repositories.processing_log import ProcessingLogRepository
+from api.repositories.result import ResultRepository
+
+# name -> (model, repository class, values for one create given a parent job id)
+MODELS: Dict[str, Tuple[type, type, Callable[[UUID], Dict[str, Any]]]] = {
+    "job": (AnalysisJob, JobRepository, lambda _job_id: {
+        "status": JobStatus.PENDING,
+        "media_type": MediaType.VIDEO,
+        "source_url": "https://bench.example.com/create.mp4",
+        "metadata_json": {"bench": True},
+    }),
+    "result": (AnalysisResult, ResultRepository, lambda job_id: {
+        "job_id": job_id,
+        "provider": AnalysisProvider.GROQ,
+        "model": "bench-model",
+        "result_json": {"labels": ["a", "b"]},
+        "confidence": 0.9,
+        "tokens_used": 512,
+        "latency_ms": 800,
+    }),
+    "processing_log": (ProcessingLog, ProcessingLogRepository, lambda job_id: {
+        "job_id": job_id,
+        "stage": ProcessingStage.DOWNLOAD,
+        "status": ProcessingLogStatus.COMPLETED,
+        "message": "Downloaded",
+    }),
+}
+
+
+async def add_flush_refresh(session: AsyncSession, model: type, values: Dict[str, Any]) -> Any:
+    """The former BaseRepository.create."""
+    instance = model(**values)
+    session.add(instance)
+    await session.flush()
+    await session.refresh(instance)
+    return instance
+
+
+async def insert_returning(session: AsyncSession, repository: BaseRepository, values: Dict[str, Any]) -> Any:
+    """BaseRepository.create: one INSERT ... RETURNING."""
+    return await repository.create(**values)
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    """Time both strategies for every model."""
+    engine = create_async_engine_configured()
+    session_factory = init_session_factory(engine)
+
+    statements = 0
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def count_statement(*_args) -> None:
+        nonlocal statements
+        statements += 1
+
+    print(f"iterations={args.iterations} (per create)")
+    print(f"{'model':<16}{'strategy':<20}{'stmts':>8}{'us':>10}")
+    try:
+        for name, (model, repository_class, make_values) in MODELS.items():
+            for strategy in ("add_flush_refresh", "insert_returning"):
+                async with session_factory() as session:
+                    parent = await JobRepository(session).create(
+                        status=JobStatus.PENDING, media_type=MediaType.VIDEO
+                    )
+                    values = make_values(parent.id)
+                    repository = repository_class(session)
+
+                    statements = 0
+                    started = time.perf_counter()
+                    for _ in range(args.iterations):
+                        if strategy == "add_flush_refresh":
+                            instance = await add_flush_refresh(session, model, values)
+                        else:
+                            instance = await insert_returning(session, repository, values)
+                        assert instance.id is not None and instance.created_at is not None
+                    elapsed = time.perf_counter() - started
+                    await session.rollback()
+
+                print(
+                    f"{name:<16}{strategy:<20}{statements / args.iterations:>8.2f}"
+                    f"{elapsed / args.iterations * 1_000_000:>10.0f}"
+                )
+    finally:
+        await close_engine()
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark BaseRepository.create round trips")
+    parser.add_argument("--iterations", type=int, default=500, help="Creates per model and strategy")
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
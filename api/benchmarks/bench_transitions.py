@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Benchmark: job status transitions under concurrent workers.
+
+Every job is raced by --racers workers that each try to move it
+pending -> processing and, if they got it, processing -> completed, each
+in its own transaction. Two strategies are compared:
+
+- select_mutate_refresh: the previous update_status (SELECT with
+  populate_existing, set attributes, flush, refresh), which has no guard
+  so every racer "wins"
+- conditional_update: JobRepository.transition, one
+  UPDATE ... WHERE status IN (allowed) RETURNING per move
+
+Reported per strategy: transitions attempted per second, SQL statements
+per attempt, conflicts returned, and jobs completed by more than one
+worker (should be 0).
+
+Needs a migrated database reachable through MEDIA_DATABASE_URL. Creates
+its own jobs and hard-deletes them afterwards.
+
+Usage:
+    MEDIA_DATABASE_URL=postgresql://... python -m api.benchmarks.bench_transitions
+    python -m api.benchmarks.bench_transitions --jobs 500 --racers 4 --concurrency 32
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, List
+from uuid import UUID
+
+from sqlalchemy import delete, event, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import noload
+
+from api.models.database import close_engine, create_async_engine_configured, init_session_factory
+from api.models.job import AnalysisJob, JobStatus, MediaType
+from api.repositories.job import JobRepository
+
+Move = Callable[[AsyncSession, UUID, JobStatus], Awaitable[bool]]
+
+
+async def select_mutate_refresh(session: AsyncSession, job_id: UUID, status: JobStatus) -> bool:
+    """The former update_status: three round trips and no transition guard."""
+    stmt = (
+        select(AnalysisJob)
+        .options(noload("*"))
+        .where(AnalysisJob.id == job_id)
+        .execution_options(populate_existing=True)
+    )
+    job = (await session.execute(stmt)).scalar_one_or_none()
+    if job is None:
+        return False
+    job.status = status
+    job.updated_at = datetime.now(timezone.utc)
+    if status == JobStatus.COMPLETED:
+        job.completed_at = datetime.now(timezone.utc)
+    await session.flush()
+    await session.refresh(job)
+    return True
+
+
+async def conditional_update(session: AsyncSession, job_id: UUID, status: JobStatus) -> bool:
+    """JobRepository.transition: one conditional UPDATE ... RETURNING."""
+    result = await JobRepository(session).transition(job_id, status)
+    return result.applied
+
+
+STRATEGIES: Dict[str, Move] = {
+    "select_mutate_refresh": select_mutate_refresh,
+    "conditional_update": conditional_update,
+}
+
+
+async def create_jobs(session_factory: async_sessionmaker[AsyncSession], count: int) -> List[UUID]:
+    """Insert count pending jobs and return their ids."""
+    rows = [
+        {"status": JobStatus.PENDING, "media_type": MediaType.VIDEO,
+         "source_url": f"https://bench.example.com/transitions/{i}.mp4"}
+        for i in range(count)
+    ]
+    async with session_factory() as session:
+        result = await session.execute(insert(AnalysisJob).returning(AnalysisJob.id), rows)
+        ids = list(result.scalars().all())
+        await session.commit()
+    return ids
+
+
+async def drop_jobs(session_factory: async_sessionmaker[AsyncSession], ids: List[UUID]) -> None:
+    """Hard-delete the benchmark's jobs."""
+    async with session_factory() as session:
+        await session.execute(delete(AnalysisJob).where(AnalysisJob.id.in_(ids)))
+        await session.commit()
+
+
+async def run(
+    session_factory: async_sessionmaker[AsyncSession],
+    move: Move,
+    job_ids: List[UUID],
+    racers: int,
+    concurrency: int
+) -> Dict[str, float]:
+    """Race racers workers per job through pending -> processing -> completed."""
+    work: "asyncio.Queue[UUID]" = asyncio.Queue()
+    for job_id in random.sample(job_ids * racers, len(job_ids) * racers):
+        work.put_nowait(job_id)
+
+    completions: Counter = Counter()
+    attempts = 0
+    conflicts = 0
+
+    async def worker() -> None:
+        nonlocal attempts, conflicts
+        while not work.empty():
+            job_id = work.get_nowait()
+            async with session_factory() as session:
+                for status in (JobStatus.PROCESSING, JobStatus.COMPLETED):
+                    attempts += 1
+                    if not await move(session, job_id, status):
+                        conflicts += 1
+                        break
+                else:
+                    completions[job_id] += 1
+                await session.commit()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    return {
+        "attempts": attempts,
+        "per_second": attempts / elapsed,
+        "conflicts": conflicts,
+        "double_completed": sum(1 for count in completions.values() if count > 1),
+    }
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    """Run every strategy on a fresh set of jobs."""
+    engine = create_async_engine_configured()
+    session_factory = init_session_factory(engine)
+
+    statements = 0
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def count_statement(*_args) -> None:
+        nonlocal statements
+        statements += 1
+
+    print(f"jobs={args.jobs} racers={args.racers} concurrency={args.concurrency}")
+    print(f"{'strategy':<24}{'moves/s':>10}{'stmts/move':>12}{'conflicts':>11}{'double':>8}")
+    try:
+        for name, move in STRATEGIES.items():
+            job_ids = await create_jobs(session_factory, args.jobs)
+            try:
+                statements = 0
+                row = await run(session_factory, move, job_ids, args.racers, args.concurrency)
+                # BEGIN/COMMIT are not cursor executes, so this counts SQL statements only
+                per_move = statements / row["attempts"]
+            finally:
+                await drop_jobs(session_factory, job_ids)
+            print(
+                f"{name:<24}{row['per_second']:>10.0f}{per_move:>12.2f}"
+                f"{row['conflicts']:>11}{row['double_completed']:>8}"
+            )
+    finally:
+        await close_engine()
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark job status transitions under concurrency")
+    parser.add_argument("--jobs", type=int, default=200, help="Jobs per strategy")
+    parser.add_argument("--racers", type=int, default=4, help="Workers racing for each job")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent worker sessions")
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
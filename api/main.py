@@ -5,32 +5,77 @@ FastAPI application with repository pattern integration.
 Provides REST endpoints for media analysis job management.
 """
 
+import asyncio
+import csv
+import io
+import json
 import logging
+import time
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from datetime import datetime
+from typing import AbstractSet, AsyncGenerator, Any, Dict, Optional, Type
 
-from fastapi import FastAPI, Request, Depends
+from fastapi import FastAPI, Request, Response, Depends, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.models.database import (
     create_async_engine_configured,
+    REPLICA_CONFIG,
+    get_async_read_session,
     get_engine,
+    get_replica_set,
+    get_session_factory,
     close_engine,
     init_session_factory,
     verify_database_connection,
 )
 from api.models.base import Base
-from api.models.job import AnalysisJob
+from api.models.job import AnalysisJob, JobStatus
 from api.models.media import MediaFile
 from api.models.result import AnalysisResult
 from api.models.transcription import Transcription
-from api.models.dependencies import get_session
+from api.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, instrument_engine, render_metrics
+from api.services.job_events import (
+    JOB_EVENTS_CONFIG,
+    JobEventHub,
+    get_job_event_hub,
+    start_job_event_hub,
+    stop_job_event_hub,
+)
+from api.services.log_sink import get_log_sink, start_log_sink, stop_log_sink
+from api.services.reaper import get_reaper, start_reaper, stop_reaper
+from api.services.webhooks import get_webhook_dispatcher, start_webhook_dispatcher, stop_webhook_dispatcher
+from api.startup import STARTUP_CONFIG, check_schema_revision, warm_pool
+from api.profiling import PROFILE_CONFIG, start_profile
+from api.models.dependencies import READ_YOUR_WRITES_COOKIE, get_read_session, get_session
+from api.repositories.cache import get_entity_cache
+from api.responses import FastJSONResponse, rows_to_dicts
 from api.repositories.job import JobRepository
+from api.repositories.transitions import TransitionResult
+from api.repositories.triggers import MissingTriggersError
 from api.repositories.result import ResultRepository
-from api.schemas.job import JobCreate, JobResponse, JobListResponse, JobUpdate
-from api.schemas.result import AnalysisResultCreate, AnalysisResultResponse, AnalysisResultListResponse
+from api.repositories.transcription import TranscriptionRepository
+from api.schemas.job import (
+    JobCreate,
+    JobResponse,
+    JobListResponse,
+    JobUpdate,
+    JobClaimRequest,
+    JobHeartbeatRequest,
+)
+from api.schemas.result import (
+    AnalysisResultCreate,
+    AnalysisResultResponse,
+    AnalysisResultListResponse,
+    AnalysisResultSearchHit,
+    AnalysisResultBatchCreate,
+    AnalysisResultBatchResponse,
+    BatchItemError,
+)
+from api.schemas.transcription import TranscriptSegmentHit
 
 
 # Configure logging
@@ -55,24 +100,51 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """
     # Startup
     logger.info("Starting Media Analysis API...")
+    started = time.perf_counter()
 
     try:
         # Initialize database engine
         engine = create_async_engine_configured()
         set_engine = init_session_factory(engine)
 
-        # Verify database connection
-        connected = await verify_database_connection()
-        if connected:
-            logger.info("Database connection established successfully")
+        # Client-side query, pool and transaction metrics for /metrics
+        instrument_engine(engine)
+        replicas = get_replica_set()
+        for index, replica in enumerate(replicas.engines if replicas else []):
+            instrument_engine(replica, pool=f"replica-{index}")
+
+        if STARTUP_CONFIG["mode"] == "fast":
+            # Production: schema comes from migrations; open the pool up front
+            await check_schema_revision(engine)
+            await warm_pool(engine)
         else:
-            logger.warning("Database connection verification failed")
+            # Verify database connection
+            connected = await verify_database_connection()
+            if connected:
+                logger.info("Database connection established successfully")
+            else:
+                logger.warning("Database connection verification failed")
+
+            # Create tables (for development - use migrations in production)
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+
+        # Batched processing_log writer (drained on shutdown)
+        start_log_sink(get_session_factory())
 
-        # Create tables (for development - use migrations in production)
-        async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
+        # LISTEN connection feeding job event streams
+        event_hub = start_job_event_hub()
 
-        logger.info("Application startup complete")
+        # Job completion callbacks from the webhook outbox
+        start_webhook_dispatcher(get_session_factory(), event_hub)
+
+        # Requeue or fail jobs whose worker stopped heartbeating
+        start_reaper(get_session_factory())
+
+        logger.info(
+            f"Application startup complete ({STARTUP_CONFIG['mode']} mode, "
+            f"{(time.perf_counter() - started) * 1000:.0f}ms)"
+        )
 
     except Exception as e:
         logger.error(f"Startup error: {e}")
@@ -82,6 +154,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     # Shutdown
     logger.info("Shutting down Media Analysis API...")
+    await stop_reaper()
+    await stop_webhook_dispatcher()
+    await stop_job_event_hub()
+    await stop_log_sink()
     await close_engine()
     logger.info("Application shutdown complete")
 
@@ -108,7 +184,12 @@ app = FastAPI(
 @app.middleware("http")
 async def db_session_middleware(request: Request, call_next):
     """
-    Middleware to ensure database session is properly managed.
+    Profile database use per request.
+
+    Counts the statements a request issues and the time spent in them
+    (recorded by the engine listeners in api.metrics), reports DB versus
+    Python time in a Server-Timing header and logs requests that cross the
+    query-count or repeated-statement thresholds (N+1 patterns).
 
     Note:
         The main session management is handled by get_db dependency.
@@ -117,16 +198,77 @@ async def db_session_middleware(request: Request, call_next):
     # Request ID for logging
     request_id = request.headers.get("X-Request-ID", "unknown")
 
+    if not PROFILE_CONFIG["enabled"]:
+        try:
+            return await call_next(request)
+        except Exception as e:
+            logger.error(f"Request {request_id} failed: {e}")
+            return JSONResponse(
+                status_code=500,
+                content={"detail": "Internal server error"}
+            )
+
+    profile = start_profile()
+    started = time.perf_counter()
+
     try:
         response = await call_next(request)
-        return response
     except Exception as e:
-        logger.error(f"Request {request_id} failed: {e}")
+        logger.error(
+            f"Request {request_id} failed after {profile.query_count} queries: {e}"
+        )
         return JSONResponse(
             status_code=500,
             content={"detail": "Internal server error"}
         )
 
+    elapsed = time.perf_counter() - started
+    if PROFILE_CONFIG["server_timing"]:
+        response.headers["Server-Timing"] = profile.server_timing(elapsed)
+    response.headers["X-Query-Count"] = str(profile.query_count)
+
+    if profile.is_suspicious():
+        repeated = profile.repeated(PROFILE_CONFIG["repeat_threshold"])
+        detail = "; ".join(
+            f"{count}x {' '.join(statement.split())[:120]}" for statement, count in repeated[:3]
+        )
+        logger.warning(
+            f"Request {request_id} {request.method} {request.url.path} issued "
+            f"{profile.query_count} queries in {profile.db_seconds * 1000:.1f}ms"
+            + (f"; repeated: {detail}" if detail else "")
+        )
+
+    return response
+
+
+# Methods that never write; anything else may start read-your-writes stickiness
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+@app.middleware("http")
+async def read_your_writes_middleware(request: Request, call_next):
+    """
+    Pin a client's reads to the primary for a short window after a write.
+
+    Successful non-GET requests set a short-lived cookie; while it is
+    present get_read_session routes reads to the primary, so clients see
+    their own writes despite replica lag. No-op without replicas.
+    """
+    response = await call_next(request)
+    if (
+        get_replica_set() is not None
+        and request.method not in SAFE_METHODS
+        and response.status_code < 400
+    ):
+        response.set_cookie(
+            READ_YOUR_WRITES_COOKIE,
+            "1",
+            max_age=REPLICA_CONFIG["sticky_seconds"],
+            httponly=True,
+            samesite="lax"
+        )
+    return response
+
 
 # Add CORS middleware
 app.add_middleware(
@@ -135,9 +277,17 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing", "X-Query-Count", "X-Wait-Result"],
 )
 
 
+@app.exception_handler(MissingTriggersError)
+async def missing_triggers_handler(request: Request, exc: MissingTriggersError) -> JSONResponse:
+    """Refuse trigger-maintained statistics on a database built without the triggers."""
+    logger.error(f"Request {request.url.path} needs missing triggers: {exc}")
+    return JSONResponse(status_code=503, content={"detail": str(exc)})
+
+
 # =============================================================================
 # Health Check Endpoints
 # =============================================================================
@@ -176,16 +326,191 @@ async def detailed_health_check() -> dict:
     except Exception:
         db_status = "error"
 
+    cache = get_entity_cache()
+    replicas = get_replica_set()
+    log_sink = get_log_sink()
+    event_hub = get_job_event_hub()
+    webhooks = get_webhook_dispatcher()
+    reaper = get_reaper()
+
     return {
         "status": "healthy" if db_status == "connected" else "degraded",
         "service": "media-analysis-api",
         "version": "1.0.0",
         "components": {
-            "database": db_status
+            "database": db_status,
+            "entity_cache": cache.stats() if cache else "disabled",
+            "read_replicas": replicas.status() if replicas else "disabled",
+            "processing_log_sink": log_sink.stats() if log_sink else "disabled",
+            "job_events": event_hub.stats() if event_hub else "disabled",
+            "webhooks": webhooks.stats() if webhooks else "disabled",
+            "stale_job_reaper": reaper.stats() if reaper else "disabled"
         }
     }
 
 
+@app.get("/metrics", tags=["Health"], include_in_schema=False)
+async def metrics() -> Response:
+    """
+    Prometheus scrape endpoint.
+
+    Returns:
+        Repository, statement and pool metrics in the text exposition format
+    """
+    return Response(content=render_metrics(), media_type=METRICS_CONTENT_TYPE)
+
+
+# =============================================================================
+# Conditional Requests
+# =============================================================================
+
+# Clients may cache representations but must revalidate them on every use
+CONDITIONAL_CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(id_: Any, updated_at: datetime) -> str:
+    """
+    Build a strong ETag for a resource version.
+
+    Args:
+        id_: Resource UUID
+        updated_at: Resource last modification timestamp
+
+    Returns:
+        Quoted entity tag
+    """
+    return f'"{id_.hex}-{int(updated_at.timestamp() * 1_000_000):x}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag (weak comparison).
+
+    Args:
+        if_none_match: Raw If-None-Match header value
+        etag: Current entity tag
+
+    Returns:
+        True if the client's cached representation is current
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in candidates
+
+
+def not_modified(etag: str) -> Response:
+    """Build an empty 304 response for a matching conditional GET."""
+    return Response(
+        status_code=304,
+        headers={"ETag": etag, "Cache-Control": CONDITIONAL_CACHE_CONTROL}
+    )
+
+
+def set_etag(response: Response, id_: Any, updated_at: datetime) -> None:
+    """Attach validator headers to a full response."""
+    response.headers["ETag"] = make_etag(id_, updated_at)
+    response.headers["Cache-Control"] = CONDITIONAL_CACHE_CONTROL
+
+
+# =============================================================================
+# Export Streaming
+# =============================================================================
+
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+# Relationship fields of the response schemas; exports and the fast JSON path
+# emit scalar columns only
+JOB_RELATION_FIELDS = frozenset({"media_files", "results", "transcriptions", "processing_logs"})
+RESULT_RELATION_FIELDS = frozenset({"job"})
+EXPORT_BATCH_SIZE = 500
+
+
+def _csv_value(value: Any) -> Any:
+    """Flatten a JSON-mode field value into a CSV cell."""
+    if value is None:
+        return ""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return value
+
+
+async def _export_rows(
+    repository_class: Type,
+    schema: Type[BaseModel],
+    exclude: AbstractSet[str],
+    filters: Dict[str, Any],
+    export_format: str
+) -> AsyncGenerator[str, None]:
+    """
+    Serialize repository rows to NDJSON or CSV one batch at a time.
+
+    Opens its own session: request-scoped dependencies are torn down before a
+    streaming response body is sent, so the cursor cannot borrow theirs.
+
+    Args:
+        repository_class: Repository to stream from
+        schema: Response schema used to serialize each row
+        exclude: Schema fields left out of the export
+        filters: Equality filters passed to the repository
+        export_format: "ndjson" or "csv"
+
+    Yields:
+        Encoded chunks of the export body
+    """
+    exclude = set(exclude)
+    fields = [name for name in schema.model_fields if name not in exclude]
+
+    if export_format == "csv":
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow(fields)
+        yield buffer.getvalue()
+
+    async with get_async_read_session() as session:
+        repo = repository_class(session)
+        async for batch in repo.stream(filters=filters, batch_size=EXPORT_BATCH_SIZE):
+            if export_format == "ndjson":
+                yield "".join(
+                    schema.model_validate(row).model_dump_json(exclude=exclude) + "\n"
+                    for row in batch
+                )
+            else:
+                buffer = io.StringIO()
+                writer = csv.writer(buffer)
+                for row in batch:
+                    data = schema.model_validate(row).model_dump(mode="json", exclude=exclude)
+                    writer.writerow([_csv_value(data[name]) for name in fields])
+                yield buffer.getvalue()
+
+
+def _export_response(
+    repository_class: Type,
+    schema: Type[BaseModel],
+    exclude: AbstractSet[str],
+    filters: Dict[str, Any],
+    export_format: str,
+    filename: str
+) -> StreamingResponse:
+    """Build a streaming export response, rejecting unknown formats."""
+    from fastapi import HTTPException
+
+    if export_format not in EXPORT_MEDIA_TYPES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported export format: {export_format!r}"
+        )
+
+    return StreamingResponse(
+        _export_rows(repository_class, schema, exclude, filters, export_format),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}.{export_format}"'
+        }
+    )
+
+
 # =============================================================================
 # Job API Endpoints
 # =============================================================================
@@ -197,68 +522,259 @@ async def get_job_repository(
     return JobRepository(session)
 
 
+async def get_job_read_repository(
+    session: AsyncSession = Depends(get_read_session)
+) -> JobRepository:
+    """Dependency to provide a JobRepository for read-only endpoints."""
+    return JobRepository(session)
+
+
+def _transitioned(result: TransitionResult, resource: str) -> Any:
+    """
+    Return a transition's entity, or raise 404 (missing) or 409 (refused move).
+
+    Args:
+        result: Result of a repository transition()
+        resource: Resource name for the error message
+
+    Returns:
+        Updated entity
+    """
+    from fastapi import HTTPException
+
+    if result.applied:
+        return result.entity
+    conflict = result.conflict
+    if conflict.not_found:
+        raise HTTPException(status_code=404, detail=f"{resource} not found")
+    raise HTTPException(
+        status_code=409,
+        detail={
+            "message": conflict.detail,
+            "current_status": str(conflict.current_status),
+            "target_status": str(conflict.target_status),
+        }
+    )
+
+
 @app.get("/api/v1/jobs", response_model=JobListResponse, tags=["Jobs"])
 async def list_jobs(
     *,
     page: int = 1,
     page_size: int = 20,
     status: str = None,
-    repo: JobRepository = Depends(get_job_repository)
+    cursor: str = None,
+    include_total: bool = True,
+    fast: bool = False,
+    repo: JobRepository = Depends(get_job_read_repository)
 ) -> JobListResponse:
     """
     List all jobs with pagination.
 
+    Pass the `next_cursor` of a page as `cursor` to fetch the following page
+    by keyset instead of offset; `page` is ignored when a cursor is given.
+
+    With `fast=true` the page is encoded straight from the ORM rows with
+    orjson, skipping schema validation; relationship fields are omitted.
+
     Args:
         page: Page number (1-indexed)
         page_size: Number of items per page
         status: Optional status filter
+        cursor: Opaque keyset cursor from a previous page
+        include_total: Whether to compute the total count
+        fast: Use the fast JSON response path
         repo: JobRepository dependency
 
     Returns:
         Paginated list of jobs
     """
+    from fastapi import HTTPException
+    from api.repositories.pagination import InvalidCursorError, encode_cursor
+
     offset = (page - 1) * page_size
+    total = None
 
-    if status:
-        jobs = await repo.get_by_status(
-            status=status,
-            offset=offset,
-            limit=page_size
-        )
-        total = await repo.get_by_status_count(status=status)
-    else:
-        jobs = await repo.get_all(offset=offset, limit=page_size)
-        total = await repo.count()
+    try:
+        if status:
+            jobs = await repo.get_by_status(
+                status=status,
+                offset=offset,
+                limit=page_size + 1,
+                cursor=cursor
+            )
+            if include_total:
+                total = await repo.get_by_status_count(status=status)
+        else:
+            jobs = await repo.get_all(offset=offset, limit=page_size + 1, cursor=cursor)
+            if include_total:
+                total = await repo.count()
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    has_more = len(jobs) > page_size
+    jobs = jobs[:page_size]
+    next_cursor = encode_cursor(jobs[-1].created_at, jobs[-1].id) if has_more else None
+
+    if fast:
+        return FastJSONResponse({
+            "items": rows_to_dicts(jobs, JobResponse, JOB_RELATION_FIELDS),
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "has_more": has_more,
+            "next_cursor": next_cursor
+        })
 
     return JobListResponse(
         items=[JobResponse.model_validate(job) for job in jobs],
         total=total,
         page=page,
         page_size=page_size,
-        has_more=(offset + len(jobs)) < total
+        has_more=has_more,
+        next_cursor=next_cursor
+    )
+
+
+@app.get("/api/v1/jobs/pending", response_model=list[JobResponse], tags=["Jobs"])
+async def get_pending_jobs(
+    limit: int = 10,
+    repo: JobRepository = Depends(get_job_read_repository)
+) -> list[JobResponse]:
+    """
+    Get pending jobs for processing.
+
+    Args:
+        limit: Maximum number of jobs to return
+        repo: JobRepository dependency
+
+    Returns:
+        List of pending jobs
+    """
+    jobs = await repo.get_pending_jobs(limit=limit)
+    return [JobResponse.model_validate(job) for job in jobs]
+
+
+@app.get("/api/v1/jobs/statistics", tags=["Jobs"])
+async def get_job_statistics(
+    repo: JobRepository = Depends(get_job_read_repository)
+) -> dict:
+    """
+    Get job statistics summary.
+
+    Args:
+        repo: JobRepository dependency
+
+    Returns:
+        Dictionary with counts by status
+    """
+    return await repo.get_statistics()
+
+
+@app.get("/api/v1/jobs/export", tags=["Jobs"])
+async def export_jobs(
+    *,
+    format: str = "ndjson",
+    status: str = None,
+    media_type: str = None
+) -> StreamingResponse:
+    """
+    Export all matching jobs as NDJSON or CSV.
+
+    Rows are streamed from a server-side cursor, so memory use does not grow
+    with the number of jobs exported.
+
+    Args:
+        format: Export format ("ndjson" or "csv")
+        status: Optional status filter
+        media_type: Optional media type filter
+
+    Returns:
+        Streaming export of jobs, oldest first
+    """
+    filters = {
+        key: value
+        for key, value in {"status": status, "media_type": media_type}.items()
+        if value is not None
+    }
+    return _export_response(
+        JobRepository,
+        JobResponse,
+        JOB_RELATION_FIELDS,
+        filters,
+        format,
+        "jobs"
     )
 
 
+JOB_INCLUDE_OPTIONS = {"media", "results", "transcriptions", "logs"}
+
+
 @app.get("/api/v1/jobs/{job_id}", response_model=JobResponse, tags=["Jobs"])
 async def get_job(
     job_id: str,
-    repo: JobRepository = Depends(get_job_repository)
+    request: Request,
+    response: Response,
+    include: str = None,
+    repo: JobRepository = Depends(get_job_read_repository)
 ) -> JobResponse:
     """
     Get a job by ID.
 
+    Related entities are only loaded when named in `include`, e.g.
+    `?include=results,transcriptions`.
+
+    Without `include`, the response carries an ETag and an If-None-Match
+    that still matches is answered with 304 after an updated_at-only
+    lookup. Responses with `include` are not conditional, since changes to
+    child rows do not move the job's updated_at.
+
     Args:
         job_id: Job UUID
+        request: Incoming request (for If-None-Match)
+        response: Outgoing response (for ETag)
+        include: Comma-separated relations (media, results, transcriptions, logs)
         repo: JobRepository dependency
 
     Returns:
         Job details
     """
     from uuid import UUID
+    from fastapi import HTTPException
+
+    requested = {part.strip() for part in (include or "").split(",") if part.strip()}
+    unknown = requested - JOB_INCLUDE_OPTIONS
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown include value(s): {', '.join(sorted(unknown))}"
+        )
+
+    if requested:
+        job = await repo.get_job_with_relations(
+            UUID(job_id),
+            include_media="media" in requested,
+            include_results="results" in requested,
+            include_transcriptions="transcriptions" in requested,
+            include_logs="logs" in requested
+        )
+        if not job:
+            raise HTTPException(status_code=404, detail="Job not found")
+        return JobResponse.model_validate(job)
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        updated_at = await repo.get_updated_at(UUID(job_id))
+        if updated_at is None:
+            raise HTTPException(status_code=404, detail="Job not found")
+        etag = make_etag(UUID(job_id), updated_at)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
     job = await repo.get_by_id(UUID(job_id))
     if not job:
-        from fastapi import HTTPException
         raise HTTPException(status_code=404, detail="Job not found")
+    set_etag(response, job.id, job.updated_at)
     return JobResponse.model_validate(job)
 
 
@@ -281,7 +797,8 @@ async def create_job(
         status="pending",
         media_type=job_data.media_type.value,
         source_url=job_data.source_url,
-        metadata_json=job_data.metadata_json
+        metadata_json=job_data.metadata_json,
+        callback_url=job_data.callback_url
     )
     return JobResponse.model_validate(job)
 
@@ -308,14 +825,24 @@ async def update_job(
 
     update_data = job_update.model_dump(exclude_unset=True)
 
-    # Handle enum conversion
-    if "status" in update_data and update_data["status"]:
-        update_data["status"] = update_data["status"].value
+    # Status changes go through transition so illegal moves are refused and
+    # completion callbacks are queued
+    status = update_data.pop("status", None)
 
-    job = await repo.update(UUID(job_id), **update_data)
-    if not job:
-        from fastapi import HTTPException
-        raise HTTPException(status_code=404, detail="Job not found")
+    if update_data or not status:
+        job = await repo.update(UUID(job_id), **update_data)
+        if not job:
+            from fastapi import HTTPException
+            raise HTTPException(status_code=404, detail="Job not found")
+    if status:
+        job = _transitioned(
+            await repo.transition(
+                UUID(job_id),
+                JobStatus(status.value),
+                update_data.get("error_message")
+            ),
+            "Job"
+        )
     return JobResponse.model_validate(job)
 
 
@@ -344,48 +871,55 @@ async def delete_job(
 @app.post("/api/v1/jobs/{job_id}/processing", response_model=JobResponse, tags=["Jobs"])
 async def mark_job_processing(
     job_id: str,
+    worker_id: Optional[str] = None,
     repo: JobRepository = Depends(get_job_repository)
 ) -> JobResponse:
     """
     Mark a job as processing.
 
+    The job gets the same lease as a claimed job, so the reaper requeues
+    it if it is never completed or failed.
+
     Args:
         job_id: Job UUID
+        worker_id: Worker taking the job (holds the lease)
         repo: JobRepository dependency
 
     Returns:
         Updated job details
     """
     from uuid import UUID
-    from fastapi import HTTPException
 
-    job = await repo.mark_as_processing(UUID(job_id))
-    if not job:
-        raise HTTPException(status_code=404, detail="Job not found")
+    job = _transitioned(
+        await repo.transition(UUID(job_id), JobStatus.PROCESSING, worker_id=worker_id),
+        "Job"
+    )
     return JobResponse.model_validate(job)
 
 
 @app.post("/api/v1/jobs/{job_id}/complete", response_model=JobResponse, tags=["Jobs"])
 async def mark_job_completed(
     job_id: str,
+    worker_id: Optional[str] = None,
     repo: JobRepository = Depends(get_job_repository)
 ) -> JobResponse:
     """
-    Mark a job as completed.
+    Mark a processing job as completed.
 
     Args:
         job_id: Job UUID
+        worker_id: If given, only the worker holding the job may complete it
         repo: JobRepository dependency
 
     Returns:
         Updated job details
     """
     from uuid import UUID
-    from fastapi import HTTPException
 
-    job = await repo.mark_as_completed(UUID(job_id))
-    if not job:
-        raise HTTPException(status_code=404, detail="Job not found")
+    job = _transitioned(
+        await repo.transition(UUID(job_id), JobStatus.COMPLETED, worker_id=worker_id),
+        "Job"
+    )
     return JobResponse.model_validate(job)
 
 
@@ -393,61 +927,321 @@ async def mark_job_completed(
 async def mark_job_failed(
     job_id: str,
     error_message: str,
+    worker_id: Optional[str] = None,
     repo: JobRepository = Depends(get_job_repository)
 ) -> JobResponse:
     """
-    Mark a job as failed.
+    Mark a pending or processing job as failed.
 
     Args:
         job_id: Job UUID
         error_message: Error description
+        worker_id: If given, only the worker holding the job may fail it
         repo: JobRepository dependency
 
     Returns:
         Updated job details
     """
     from uuid import UUID
-    from fastapi import HTTPException
 
-    job = await repo.mark_as_failed(UUID(job_id), error_message)
-    if not job:
-        raise HTTPException(status_code=404, detail="Job not found")
+    job = _transitioned(
+        await repo.transition(UUID(job_id), JobStatus.FAILED, error_message, worker_id=worker_id),
+        "Job"
+    )
     return JobResponse.model_validate(job)
 
 
-@app.get("/api/v1/jobs/pending", response_model=list[JobResponse], tags=["Jobs"])
-async def get_pending_jobs(
-    limit: int = 10,
+@app.post("/api/v1/jobs/claim", response_model=list[JobResponse], tags=["Jobs"])
+async def claim_jobs(
+    claim: JobClaimRequest,
     repo: JobRepository = Depends(get_job_repository)
 ) -> list[JobResponse]:
     """
-    Get pending jobs for processing.
+    Atomically claim pending jobs for a worker.
+
+    Moves up to `limit` of the oldest pending jobs to processing under a
+    lease held by `worker_id`. Concurrent workers never receive the same job.
 
     Args:
-        limit: Maximum number of jobs to return
+        claim: Claim request (limit, worker_id, lease_seconds)
         repo: JobRepository dependency
 
     Returns:
-        List of pending jobs
+        List of claimed jobs (may be empty)
     """
-    jobs = await repo.get_pending_jobs(limit=limit)
+    jobs = await repo.claim_batch(
+        claim.limit,
+        claim.worker_id,
+        lease_seconds=claim.lease_seconds
+    )
     return [JobResponse.model_validate(job) for job in jobs]
 
 
-@app.get("/api/v1/jobs/statistics", tags=["Jobs"])
-async def get_job_statistics(
+@app.post("/api/v1/jobs/{job_id}/heartbeat", response_model=JobResponse, tags=["Jobs"])
+async def heartbeat_job(
+    job_id: str,
+    heartbeat: JobHeartbeatRequest,
     repo: JobRepository = Depends(get_job_repository)
-) -> dict:
+) -> JobResponse:
     """
-    Get job statistics summary.
+    Extend a claimed job's lease.
+
+    Workers call this periodically (well within lease_seconds) while they
+    process a job; jobs whose lease expires are recovered by the stale-job
+    reaper. A 409 means the worker no longer holds the job and should stop
+    working on it.
 
     Args:
+        job_id: Job UUID
+        heartbeat: Worker id and new lease duration
         repo: JobRepository dependency
 
     Returns:
-        Dictionary with counts by status
+        Job details with the extended lease
     """
-    return await repo.get_statistics()
+    from uuid import UUID
+    from fastapi import HTTPException
+
+    job = await repo.heartbeat(
+        UUID(job_id),
+        heartbeat.worker_id,
+        lease_seconds=heartbeat.lease_seconds
+    )
+    if job:
+        return JobResponse.model_validate(job)
+    if await repo.get_updated_at(UUID(job_id)) is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    raise HTTPException(status_code=409, detail="Job is not processing under this worker's lease")
+
+
+# =============================================================================
+# Job Event Streams
+# =============================================================================
+
+# Statuses after which a job emits no further status events
+TERMINAL_JOB_STATUSES = frozenset({JobStatus.COMPLETED.value, JobStatus.FAILED.value})
+
+
+def _require_event_hub() -> JobEventHub:
+    """Return the running event hub or raise 503 when job events are disabled."""
+    from fastapi import HTTPException
+
+    hub = get_job_event_hub()
+    if hub is None:
+        raise HTTPException(status_code=503, detail="Job events are disabled")
+    return hub
+
+
+async def _job_status_event(job_id: Any) -> Optional[Dict[str, Any]]:
+    """
+    Read a job's current status as a status event.
+
+    Uses a short-lived primary session (a lagging replica could report an
+    older status than events already delivered) that is released before
+    the caller goes back to waiting.
+
+    Args:
+        job_id: Job UUID
+
+    Returns:
+        Status event dict, or None if the job does not exist
+    """
+    async with get_async_read_session(read_only=False) as session:
+        return await JobRepository(session).get_status_event(job_id)
+
+
+def _sse_message(event: Dict[str, Any]) -> str:
+    """Format an event as a Server-Sent Events message."""
+    return f"event: {event.get('type', 'message')}\ndata: {json.dumps(event)}\n\n"
+
+
+@app.get("/api/v1/jobs/{job_id}/events", tags=["Jobs"])
+async def stream_job_events(job_id: str, request: Request) -> StreamingResponse:
+    """
+    Stream a job's status changes and processing log entries (SSE).
+
+    The first event is the job's current status. Status and log events
+    follow as they are committed; the stream ends after a terminal status.
+    Comment lines are sent every JOB_EVENTS_KEEPALIVE_SECONDS so idle
+    proxies keep the connection open.
+
+    No database connection is held while streaming: events come from the
+    process-wide LISTEN connection.
+
+    Args:
+        job_id: Job UUID
+        request: Incoming request (for disconnect detection)
+
+    Returns:
+        text/event-stream response
+    """
+    from uuid import UUID
+    from fastapi import HTTPException
+
+    job_uuid = UUID(job_id)
+    hub = _require_event_hub()
+
+    # Subscribe before reading the baseline so no change falls in between
+    subscription = hub.subscribe({job_uuid})
+    try:
+        snapshot = await _job_status_event(job_uuid)
+    except Exception:
+        hub.unsubscribe(subscription)
+        raise
+    if snapshot is None:
+        hub.unsubscribe(subscription)
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    async def events() -> AsyncGenerator[str, None]:
+        async with subscription:
+            event: Optional[Dict[str, Any]] = snapshot
+            while True:
+                if event is None:
+                    if await request.is_disconnected():
+                        return
+                    yield ": keepalive\n\n"
+                else:
+                    if event.get("type") == "reset":
+                        # Notifications may have been missed: re-read state
+                        event = await _job_status_event(job_uuid) or event
+                    yield _sse_message(event)
+                    if event.get("type") == "status" and event.get("status") in TERMINAL_JOB_STATUSES:
+                        return
+                event = await subscription.get(timeout=JOB_EVENTS_CONFIG["keepalive_seconds"])
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@app.get("/api/v1/jobs/{job_id}/wait", response_model=JobResponse, tags=["Jobs"])
+async def wait_for_job(
+    job_id: str,
+    response: Response,
+    timeout: float = 30,
+    until: str = "completed,failed"
+) -> JobResponse:
+    """
+    Long-poll until a job reaches one of the `until` statuses.
+
+    Returns as soon as the job is (or becomes) in one of the statuses, or
+    with its current state once `timeout` seconds pass; the X-Wait-Result
+    header says which ("reached" or "timeout"). Returns immediately if the
+    job is already there.
+
+    The request holds no database connection while parked: it waits on the
+    process-wide job event hub, and costs one status read before parking
+    and one job read before answering.
+
+    Args:
+        job_id: Job UUID
+        response: Outgoing response (for X-Wait-Result)
+        timeout: Seconds to wait (0 to JOB_WAIT_MAX_SECONDS)
+        until: Comma-separated job statuses that end the wait
+
+    Returns:
+        Job details
+    """
+    from uuid import UUID
+    from fastapi import HTTPException
+
+    job_uuid = UUID(job_id)
+    statuses = {part.strip() for part in until.split(",") if part.strip()}
+    unknown = statuses - {status.value for status in JobStatus}
+    if not statuses or unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown until status(es): {', '.join(sorted(unknown)) or '(none)'}"
+        )
+    max_timeout = JOB_EVENTS_CONFIG["wait_max_seconds"]
+    if not 0 <= timeout <= max_timeout:
+        raise HTTPException(status_code=400, detail=f"timeout must be between 0 and {max_timeout:g}")
+
+    current, reached = await _require_event_hub().wait_for_status(
+        job_uuid, statuses, timeout, lambda: _job_status_event(job_uuid)
+    )
+    if current is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    # Fresh read (bypasses the entity cache, which may predate the event)
+    async with get_async_read_session(read_only=False) as session:
+        job = await JobRepository(session).get_job_with_relations(
+            job_uuid,
+            include_media=False,
+            include_results=False,
+            include_transcriptions=False
+        )
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    response.headers["X-Wait-Result"] = "reached" if reached else "timeout"
+    return JobResponse.model_validate(job)
+
+
+@app.websocket("/api/v1/jobs/events/ws")
+async def job_events_websocket(websocket: WebSocket) -> None:
+    """
+    Multiplexed job event stream over a single WebSocket.
+
+    Client messages:
+        {"subscribe": [job_id, ...]}: follow jobs; the current status of
+            each is sent first ({"type": "error"} for unknown jobs)
+        {"unsubscribe": [job_id, ...]}: stop following jobs
+
+    Server messages are the same status, log and reset events as the SSE
+    stream, plus {"type": "keepalive"} when idle.
+    """
+    from uuid import UUID
+
+    hub = get_job_event_hub()
+    if hub is None:
+        # 1013: try again later
+        await websocket.close(code=1013)
+        return
+
+    await websocket.accept()
+    subscription = hub.subscribe(())
+
+    async def receive_commands() -> None:
+        while True:
+            message = await websocket.receive_json()
+            if not isinstance(message, dict):
+                await websocket.send_json({"type": "error", "detail": "Expected a JSON object"})
+                continue
+            for action in ("subscribe", "unsubscribe"):
+                for raw_id in message.get(action) or []:
+                    try:
+                        job_uuid = UUID(str(raw_id))
+                    except ValueError:
+                        await websocket.send_json({"type": "error", "job_id": raw_id, "detail": "Invalid job id"})
+                        continue
+                    if action == "unsubscribe":
+                        hub.unfollow(subscription, [job_uuid])
+                        continue
+                    hub.follow(subscription, [job_uuid])
+                    snapshot = await _job_status_event(job_uuid)
+                    if snapshot is None:
+                        hub.unfollow(subscription, [job_uuid])
+                        snapshot = {"type": "error", "job_id": str(job_uuid), "detail": "Job not found"}
+                    subscription.deliver(snapshot)
+
+    async def send_events() -> None:
+        while True:
+            event = await subscription.get(timeout=JOB_EVENTS_CONFIG["keepalive_seconds"])
+            await websocket.send_json(event if event is not None else {"type": "keepalive"})
+
+    async with subscription:
+        tasks = [asyncio.create_task(receive_commands()), asyncio.create_task(send_events())]
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in pending:
+            task.cancel()
+        for task in done:
+            error = task.exception()
+            if error is not None and not isinstance(error, WebSocketDisconnect):
+                logger.error(f"Job event WebSocket failed: {error}")
+                await websocket.close(code=1011)
 
 
 # =============================================================================
@@ -489,6 +1283,83 @@ async def create_result(
     return AnalysisResultResponse.model_validate(result)
 
 
+# Batches at or above this size are ingested with COPY instead of INSERT
+RESULT_COPY_THRESHOLD = 1000
+
+
+@app.post("/api/v1/results:batch", response_model=AnalysisResultBatchResponse, status_code=201, tags=["Results"])
+async def create_results_batch(
+    batch: AnalysisResultBatchCreate,
+    response: Response,
+    session: AsyncSession = Depends(get_session)
+) -> AnalysisResultBatchResponse:
+    """
+    Create many analysis results in one request.
+
+    Each item is validated on its own; invalid items and items referencing
+    unknown jobs are reported in `errors` while the rest are inserted with
+    a single multi-row INSERT (or COPY for very large batches). The status
+    is 201 when every item was inserted, 207 when only some were and 400
+    when none were.
+
+    Args:
+        batch: Result payloads to ingest
+        response: Response whose status reflects partial or total failure
+        session: Database session dependency
+
+    Returns:
+        Inserted result IDs and per-item validation errors
+    """
+    from pydantic import ValidationError
+
+    errors: list[BatchItemError] = []
+    valid: list[tuple[int, AnalysisResultCreate]] = []
+
+    for index, item in enumerate(batch.items):
+        try:
+            valid.append((index, AnalysisResultCreate.model_validate(item)))
+        except ValidationError as e:
+            errors.append(BatchItemError(
+                index=index,
+                errors=[
+                    {"loc": list(err["loc"]), "msg": err["msg"], "type": err["type"]}
+                    for err in e.errors()
+                ]
+            ))
+
+    existing_jobs = await JobRepository(session).get_existing_ids(
+        list({data.job_id for _, data in valid})
+    )
+    rows = []
+    for index, data in valid:
+        if data.job_id not in existing_jobs:
+            errors.append(BatchItemError(
+                index=index,
+                errors=[{"loc": ["job_id"], "msg": "Job not found", "type": "not_found"}]
+            ))
+            continue
+        rows.append({
+            "job_id": data.job_id,
+            "provider": data.provider.value,
+            "model": data.model,
+            "result_json": data.result_json,
+            "confidence": data.confidence,
+            "tokens_used": data.tokens_used,
+            "latency_ms": data.latency_ms,
+        })
+
+    repo = ResultRepository(session)
+    if len(rows) >= RESULT_COPY_THRESHOLD:
+        ids = await repo.copy_create(rows)
+    else:
+        ids = await repo.bulk_create(rows)
+
+    errors.sort(key=lambda error: error.index)
+    if errors:
+        response.status_code = 207 if ids else 400
+    return AnalysisResultBatchResponse(inserted=len(ids), ids=ids, errors=errors)
+
+
 @app.get("/api/v1/results", response_model=AnalysisResultListResponse, tags=["Results"])
 async def list_results(
     *,
@@ -497,70 +1368,280 @@ async def list_results(
     min_confidence: float = None,
     page: int = 1,
     page_size: int = 20,
-    session: AsyncSession = Depends(get_session)
+    cursor: str = None,
+    include_total: bool = True,
+    fast: bool = False,
+    session: AsyncSession = Depends(get_read_session)
 ) -> AnalysisResultListResponse:
     """
     List analysis results with optional filtering.
 
+    Pass the `next_cursor` of a page as `cursor` to fetch the following page
+    by keyset instead of offset. Cursors are not available with
+    `min_confidence`, which orders by confidence rather than creation time.
+
+    With `fast=true` the page is encoded straight from the ORM rows with
+    orjson, skipping schema validation; the nested job is omitted.
+
     Args:
         job_id: Filter by job ID (UUID string)
         provider: Filter by provider name
         min_confidence: Filter by minimum confidence score
         page: Page number (1-indexed)
         page_size: Number of items per page
+        cursor: Opaque keyset cursor from a previous page
+        include_total: Whether to compute the total count
+        fast: Use the fast JSON response path
         session: Database session dependency
 
     Returns:
         Paginated list of results
     """
     from uuid import UUID
+    from fastapi import HTTPException
+    from api.repositories.pagination import InvalidCursorError, encode_cursor
 
     repo = ResultRepository(session)
     offset = (page - 1) * page_size
+    total = None
+    by_confidence = not job_id and not provider and min_confidence is not None
 
-    if job_id:
-        results = await repo.get_by_job_id(
-            UUID(job_id),
-            offset=offset,
-            limit=page_size
-        )
-        total = await repo.get_result_count_by_job(UUID(job_id))
-    elif provider:
-        results = await repo.get_by_provider(
-            provider=provider,
-            offset=offset,
-            limit=page_size
-        )
-        total = await repo.get_result_count_by_provider(provider=provider)
-    elif min_confidence is not None:
-        results = await repo.get_high_confidence_results(
-            min_confidence=min_confidence,
-            limit=page_size
+    if cursor and by_confidence:
+        raise HTTPException(
+            status_code=400,
+            detail="Cursor pagination is not supported with min_confidence"
         )
+
+    try:
+        if job_id:
+            results = await repo.get_by_job_id(
+                UUID(job_id),
+                offset=offset,
+                limit=page_size + 1,
+                cursor=cursor
+            )
+            if include_total:
+                total = await repo.get_result_count_by_job(UUID(job_id))
+        elif provider:
+            results = await repo.get_by_provider(
+                provider=provider,
+                offset=offset,
+                limit=page_size + 1,
+                cursor=cursor
+            )
+            if include_total:
+                total = await repo.get_result_count_by_provider(provider=provider)
+        elif min_confidence is not None:
+            results = await repo.get_high_confidence_results(
+                min_confidence=min_confidence,
+                offset=offset,
+                limit=page_size + 1
+            )
+        else:
+            results = await repo.get_all(offset=offset, limit=page_size + 1, cursor=cursor)
+            if include_total:
+                total = await repo.count()
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    has_more = len(results) > page_size
+    results = results[:page_size]
+    if by_confidence:
+        # No count query for this filter; total is the size of the page
         total = len(results)
-    else:
-        results = await repo.get_all(offset=offset, limit=page_size)
-        total = await repo.count()
+    # A creation-time cursor cannot resume a listing ordered by confidence
+    next_cursor = (
+        encode_cursor(results[-1].created_at, results[-1].id)
+        if has_more and not by_confidence else None
+    )
+
+    if fast:
+        return FastJSONResponse({
+            "items": rows_to_dicts(results, AnalysisResultResponse, RESULT_RELATION_FIELDS),
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "has_more": has_more,
+            "next_cursor": next_cursor
+        })
 
     return AnalysisResultListResponse(
         items=[AnalysisResultResponse.model_validate(result) for result in results],
         total=total,
         page=page,
         page_size=page_size,
-        has_more=(offset + len(results)) < total
+        has_more=has_more,
+        next_cursor=next_cursor
+    )
+
+
+@app.get("/api/v1/results/search", response_model=list[AnalysisResultSearchHit], tags=["Results"])
+async def search_results(
+    q: str,
+    limit: int = 20,
+    offset: int = 0,
+    session: AsyncSession = Depends(get_read_session)
+) -> list[AnalysisResultSearchHit]:
+    """
+    Full-text search analysis results by model name and result content.
+
+    Supports web-search syntax: quoted phrases, `or`, and `-term` exclusion.
+    Hits are ranked by relevance, with matches on the model name weighted
+    above matches in the result JSON.
+
+    Args:
+        q: Search query
+        limit: Maximum number of hits (1-100)
+        offset: Number of hits to skip
+        session: Database session dependency
+
+    Returns:
+        Ranked list of matching results
+    """
+    from fastapi import HTTPException
+
+    if not q.strip():
+        raise HTTPException(status_code=400, detail="Search query must not be empty")
+
+    repo = ResultRepository(session)
+    hits = await repo.search_results(q, limit=max(1, min(limit, 100)), offset=max(offset, 0))
+    return [
+        AnalysisResultSearchHit(
+            **AnalysisResultResponse.model_validate(result).model_dump(),
+            rank=rank
+        )
+        for result, rank in hits
+    ]
+
+
+@app.get("/api/v1/results/export", tags=["Results"])
+async def export_results(
+    *,
+    format: str = "ndjson",
+    job_id: str = None,
+    provider: str = None
+) -> StreamingResponse:
+    """
+    Export all matching analysis results as NDJSON or CSV.
+
+    Rows are streamed from a server-side cursor, so memory use does not grow
+    with the number of results exported.
+
+    Args:
+        format: Export format ("ndjson" or "csv")
+        job_id: Filter by job ID (UUID string)
+        provider: Filter by provider name
+
+    Returns:
+        Streaming export of results, oldest first
+    """
+    from uuid import UUID
+    from fastapi import HTTPException
+
+    filters: Dict[str, Any] = {}
+    if job_id:
+        try:
+            filters["job_id"] = UUID(job_id)
+        except ValueError:
+            raise HTTPException(status_code=400, detail=f"Invalid job_id: {job_id!r}")
+    if provider:
+        filters["provider"] = provider
+
+    return _export_response(
+        ResultRepository,
+        AnalysisResultResponse,
+        RESULT_RELATION_FIELDS,
+        filters,
+        format,
+        "results"
+    )
+
+
+def _validate_rollup_query(
+    since: Optional[datetime],
+    until: Optional[datetime],
+    group_by: str,
+    group_by_choices: AbstractSet[str],
+    granularity: Optional[str]
+) -> None:
+    """Reject malformed provider statistics queries with 400."""
+    from fastapi import HTTPException
+    from api.repositories.rollup import ROLLUP_GRANULARITIES, as_utc
+
+    if group_by not in group_by_choices:
+        raise HTTPException(
+            status_code=400,
+            detail=f"group_by must be one of: {', '.join(sorted(group_by_choices))}"
+        )
+    if granularity is not None and granularity not in ROLLUP_GRANULARITIES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"granularity must be one of: {', '.join(ROLLUP_GRANULARITIES)}"
+        )
+    if since is not None and until is not None and as_utc(since) >= as_utc(until):
+        raise HTTPException(status_code=400, detail="since must be before until")
+
+
+@app.get("/api/v1/results/statistics", tags=["Results"])
+async def get_result_statistics(
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    group_by: str = "provider",
+    granularity: Optional[str] = None,
+    session: AsyncSession = Depends(get_read_session)
+) -> dict:
+    """
+    Provider (or provider and model) result statistics over a time window.
+
+    Served from hourly rollups, so any window costs the same regardless of
+    result volume. Windows have hourly resolution: since is rounded down to
+    the hour.
+
+    Args:
+        since: Window start (default: all time)
+        until: Window end, exclusive (default: now)
+        group_by: "provider" or "model"
+        granularity: Optional time series bucket ("hour", "day", "week", "month")
+        session: Database session dependency
+
+    Returns:
+        The window and one row per group with counts, average confidence,
+        token totals, average latency, latency quantiles and histogram
+    """
+    _validate_rollup_query(since, until, group_by, {"provider", "model"}, granularity)
+
+    rows = await ResultRepository(session).get_provider_rollups(
+        since=since,
+        until=until,
+        by_model=group_by == "model",
+        granularity=granularity
     )
+    return {
+        "since": since,
+        "until": until,
+        "group_by": group_by,
+        "granularity": granularity,
+        "rows": rows,
+    }
 
 
 @app.get("/api/v1/results/{result_id}", response_model=AnalysisResultResponse, tags=["Results"])
 async def get_result(
     result_id: str,
-    session: AsyncSession = Depends(get_session)
+    request: Request,
+    response: Response,
+    session: AsyncSession = Depends(get_read_session)
 ) -> AnalysisResultResponse:
     """
     Get a result by ID.
 
+    The response carries an ETag; an If-None-Match that still matches is
+    answered with 304 after an updated_at-only lookup.
+
     Args:
         result_id: Result UUID
+        request: Incoming request (for If-None-Match)
+        response: Outgoing response (for ETag)
         session: Database session dependency
 
     Returns:
@@ -570,12 +1651,116 @@ async def get_result(
     from fastapi import HTTPException
 
     repo = ResultRepository(session)
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        updated_at = await repo.get_updated_at(UUID(result_id))
+        if updated_at is None:
+            raise HTTPException(status_code=404, detail="Result not found")
+        etag = make_etag(UUID(result_id), updated_at)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
     result = await repo.get_by_id(UUID(result_id))
     if not result:
         raise HTTPException(status_code=404, detail="Result not found")
+    set_etag(response, result.id, result.updated_at)
     return AnalysisResultResponse.model_validate(result)
 
 
+# =============================================================================
+# Transcription API Endpoints
+# =============================================================================
+
+@app.get("/api/v1/transcriptions/statistics", tags=["Transcriptions"])
+async def get_transcription_statistics(
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    group_by: str = "provider",
+    granularity: Optional[str] = None,
+    session: AsyncSession = Depends(get_read_session)
+) -> dict:
+    """
+    Provider (or provider and language) transcription statistics over a time window.
+
+    Served from hourly rollups; since is rounded down to the hour.
+
+    Args:
+        since: Window start (default: all time)
+        until: Window end, exclusive (default: now)
+        group_by: "provider" or "language"
+        granularity: Optional time series bucket ("hour", "day", "week", "month")
+        session: Database session dependency
+
+    Returns:
+        The window and one row per group with counts and media durations
+    """
+    _validate_rollup_query(since, until, group_by, {"provider", "language"}, granularity)
+
+    rows = await TranscriptionRepository(session).get_provider_rollups(
+        since=since,
+        until=until,
+        by_language=group_by == "language",
+        granularity=granularity
+    )
+    return {
+        "since": since,
+        "until": until,
+        "group_by": group_by,
+        "granularity": granularity,
+        "rows": rows,
+    }
+
+
+@app.get(
+    "/api/v1/transcriptions/segments/search",
+    response_model=list[TranscriptSegmentHit],
+    tags=["Transcriptions"]
+)
+async def search_transcript_segments(
+    q: str,
+    job_id: str = None,
+    limit: int = 50,
+    offset: int = 0,
+    session: AsyncSession = Depends(get_read_session)
+) -> list[TranscriptSegmentHit]:
+    """
+    Find where a phrase was spoken across transcripts.
+
+    Returns the matching segments with their start/end timestamps and job
+    ids. Hits are ranked by relevance, or in time order when job_id is given.
+
+    Args:
+        q: Search query (web-search syntax: quoted phrases, `or`, `-term`)
+        job_id: Optional job to restrict the search to (UUID string)
+        limit: Maximum number of segments (1-200)
+        offset: Number of segments to skip
+        session: Database session dependency
+
+    Returns:
+        Matching transcript segments
+    """
+    from uuid import UUID
+    from fastapi import HTTPException
+
+    if not q.strip():
+        raise HTTPException(status_code=400, detail="Search query must not be empty")
+
+    try:
+        job_uuid = UUID(job_id) if job_id else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid job_id: {job_id!r}")
+
+    repo = TranscriptionRepository(session)
+    segments = await repo.search_segments(
+        q,
+        job_id=job_uuid,
+        limit=max(1, min(limit, 200)),
+        offset=max(offset, 0)
+    )
+    return [TranscriptSegmentHit.model_validate(segment) for segment in segments]
+
+
 # =============================================================================
 # Root Endpoint
 # =============================================================================
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Media Analysis API - Management Commands
+
+Operational commands that run against the configured database outside the
+request path.
+
+Usage:
+    python -m api.manage reconcile-counters
+    python -m api.manage create-log-partitions [--months-ahead 3]
+    python -m api.manage prune-log-partitions [--retention-months 6] [--detach-only]
+
+Environment Variables:
+    MEDIA_DATABASE_URL: PostgreSQL connection string (optional override)
+    PROCESSING_LOG_PARTITIONS_AHEAD: Default for --months-ahead (3)
+    PROCESSING_LOG_RETENTION_MONTHS: Default for --retention-months (6)
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+
+from api.models.database import (
+    close_engine,
+    create_async_engine_configured,
+    get_async_session,
+    init_session_factory,
+)
+from api.repositories.job import JobRepository
+from api.repositories.processing_log import ProcessingLogRepository
+
+
+logger = logging.getLogger(__name__)
+
+
+async def reconcile_counters(args: argparse.Namespace) -> dict:
+    """Rebuild the job status counters from analysis_job."""
+    async with get_async_session() as session:
+        return await JobRepository(session).reconcile_status_counters()
+
+
+async def create_log_partitions(args: argparse.Namespace) -> dict:
+    """Create processing_log partitions for the coming months."""
+    async with get_async_session() as session:
+        names = await ProcessingLogRepository(session).create_partitions(args.months_ahead)
+    return {"partitions": names}
+
+
+async def prune_log_partitions(args: argparse.Namespace) -> dict:
+    """Detach or drop processing_log partitions past the retention window."""
+    async with get_async_session() as session:
+        retired = await ProcessingLogRepository(session).retire_partitions(
+            args.retention_months,
+            detach_only=args.detach_only
+        )
+    return {
+        "action": "detached" if args.detach_only else "dropped",
+        "partitions": retired
+    }
+
+
+COMMANDS = {
+    "reconcile-counters": reconcile_counters,
+    "create-log-partitions": create_log_partitions,
+    "prune-log-partitions": prune_log_partitions,
+}
+
+
+async def run(args: argparse.Namespace) -> dict:
+    """Initialize the database engine and run a management command."""
+    engine = create_async_engine_configured()
+    init_session_factory(engine)
+    try:
+        return await COMMANDS[args.command](args)
+    finally:
+        await close_engine()
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Media analysis API management commands"
+    )
+    parser.add_argument(
+        "command",
+        choices=sorted(COMMANDS),
+        help="Command to run"
+    )
+    parser.add_argument(
+        "--months-ahead",
+        type=int,
+        default=int(os.environ.get("PROCESSING_LOG_PARTITIONS_AHEAD", "3")),
+        help="create-log-partitions: future months to create"
+    )
+    parser.add_argument(
+        "--retention-months",
+        type=int,
+        default=int(os.environ.get("PROCESSING_LOG_RETENTION_MONTHS", "6")),
+        help="prune-log-partitions: whole months to keep before the current one"
+    )
+    parser.add_argument(
+        "--detach-only",
+        action="store_true",
+        help="prune-log-partitions: detach old partitions instead of dropping them"
+    )
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    try:
+        result = asyncio.run(run(args))
+        print(json.dumps(result, indent=2, default=str))
+    except Exception as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,445 @@
+"""
+Prometheus Metrics Module
+
+Client-side database metrics exposed at /metrics in the Prometheus text
+format:
+
+- media_db_repository_call_seconds: latency per repository method
+- media_db_statement_duration_seconds / media_db_statement_rows: latency and
+  rows returned per statement, labelled by operation and first table
+- media_db_pool_checkout_wait_seconds: time spent waiting for a pooled
+  connection
+- media_db_pool_checked_out / media_db_pool_capacity: pool usage, the
+  client-side counterpart of the connection alerts in
+  docker/media-db-alerts.yml
+- media_db_transactions_total: commits and rollbacks
+
+The statement listeners also feed the per-request profile (api.profiling).
+
+Metric types are implemented here rather than pulling in prometheus_client;
+the exposition format is small and the process is single-threaded asyncio.
+"""
+
+import functools
+import inspect
+import re
+import time
+import types
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from api.models.database import CHECKOUT_WAIT_OBSERVERS
+from api.profiling import record_statement
+
+
+# Content type of the Prometheus text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Latency buckets in seconds (1ms .. 10s)
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Row-count buckets for statement results
+ROW_BUCKETS = (0, 1, 5, 10, 50, 100, 500, 1000, 5000, 10000)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str]) -> str:
+    """Render a label set as {a="x",b="y"}, or "" when empty."""
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    """Render a sample value, using integer notation where exact."""
+    if value == float("inf"):
+        return "+Inf"
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Metric:
+    """Base class for a named metric family with fixed label names."""
+
+    type_name = "untyped"
+
+    def __init__(self, name: str, help_text: str, labelnames: Tuple[str, ...] = ()) -> None:
+        """
+        Initialize a metric family.
+
+        Args:
+            name: Metric name
+            help_text: HELP line text
+            labelnames: Names of the labels every sample carries
+        """
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = labelnames
+
+    def _key(self, labels: Dict[str, Any]) -> LabelValues:
+        """Order label values by labelnames, rejecting unknown or missing labels."""
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self) -> List[str]:
+        """Return sample lines for this family."""
+        raise NotImplementedError
+
+    def render(self) -> str:
+        """Render HELP, TYPE and sample lines."""
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.type_name}"]
+        lines.extend(self.samples())
+        return "\n".join(lines)
+
+
+class Counter(Metric):
+    """Monotonically increasing counter."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, help_text: str, labelnames: Tuple[str, ...] = ()) -> None:
+        super().__init__(name, help_text, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        """Increase the counter for a label set."""
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: Any) -> float:
+        """Current value for a label set."""
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in sorted(self._values.items())
+        ]
+
+
+class Gauge(Metric):
+    """Value that can go up and down, typically set by a collector."""
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, help_text: str, labelnames: Tuple[str, ...] = ()) -> None:
+        super().__init__(name, help_text, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: Any) -> None:
+        """Set the gauge for a label set."""
+        self._values[self._key(labels)] = value
+
+    def value(self, **labels: Any) -> float:
+        """Current value for a label set."""
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in sorted(self._values.items())
+        ]
+
+
+class Histogram(Metric):
+    """Cumulative histogram with fixed upper bounds."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = LATENCY_BUCKETS
+    ) -> None:
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # label values -> [per-bucket counts..., +Inf count, sum]
+        self._values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        """Record one observation for a label set."""
+        key = self._key(labels)
+        state = self._values.get(key)
+        if state is None:
+            state = self._values[key] = [0.0] * (len(self.buckets) + 2)
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                state[index] += 1
+                break
+        else:
+            state[len(self.buckets)] += 1
+        state[-1] += value
+
+    def count(self, **labels: Any) -> int:
+        """Number of observations for a label set."""
+        state = self._values.get(self._key(labels))
+        return int(sum(state[:-1])) if state else 0
+
+    def samples(self) -> List[str]:
+        lines = []
+        for key, state in sorted(self._values.items()):
+            cumulative = 0.0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), state[:-1]):
+                cumulative += bucket_count
+                labels = _format_labels(self.labelnames + ("le",), key + (_format_value(bound),))
+                lines.append(f"{self.name}_bucket{labels} {_format_value(cumulative)}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(state[-1])}")
+            lines.append(f"{self.name}_count{labels} {_format_value(cumulative)}")
+        return lines
+
+
+class MetricsRegistry:
+    """Collection of metric families plus collectors run at scrape time."""
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, Metric] = {}
+        self._collectors: List[Callable[[], None]] = []
+
+    def register(self, metric: Metric) -> Metric:
+        """Add a metric family; names must be unique."""
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        """Register a callable that refreshes gauges before each render."""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """Run collectors and render every family in the text format."""
+        for collector in self._collectors:
+            collector()
+        return "\n".join(metric.render() for metric in self._metrics.values()) + "\n"
+
+
+# =============================================================================
+# Database metrics
+# =============================================================================
+REGISTRY = MetricsRegistry()
+
+REPOSITORY_CALL_SECONDS = REGISTRY.register(Histogram(
+    "media_db_repository_call_seconds",
+    "Latency of repository method calls",
+    ("repository", "method"),
+))
+REPOSITORY_ERRORS = REGISTRY.register(Counter(
+    "media_db_repository_errors_total",
+    "Repository method calls that raised",
+    ("repository", "method"),
+))
+STATEMENT_SECONDS = REGISTRY.register(Histogram(
+    "media_db_statement_duration_seconds",
+    "Latency of SQL statements as seen by the client",
+    ("pool", "operation", "table"),
+))
+STATEMENT_ROWS = REGISTRY.register(Histogram(
+    "media_db_statement_rows",
+    "Rows returned or affected per SQL statement",
+    ("pool", "operation", "table"),
+    buckets=ROW_BUCKETS,
+))
+STATEMENT_ERRORS = REGISTRY.register(Counter(
+    "media_db_statement_errors_total",
+    "SQL statements that raised",
+    ("pool", "operation", "table"),
+))
+POOL_CHECKOUT_WAIT_SECONDS = REGISTRY.register(Histogram(
+    "media_db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled connection",
+    ("pool",),
+))
+POOL_CHECKED_OUT = REGISTRY.register(Gauge(
+    "media_db_pool_checked_out",
+    "Connections currently checked out of the pool",
+    ("pool",),
+))
+POOL_CAPACITY = REGISTRY.register(Gauge(
+    "media_db_pool_capacity",
+    "Maximum connections the pool will open (pool_size + max_overflow)",
+    ("pool",),
+))
+TRANSACTIONS = REGISTRY.register(Counter(
+    "media_db_transactions_total",
+    "Transactions ended, by outcome",
+    ("pool", "outcome"),
+))
+
+# Engines instrumented in this process, by pool label
+_ENGINES: Dict[str, AsyncEngine] = {}
+
+# Connection.info key holding statement start times
+_STATEMENT_START_KEY = "metrics_statement_start"
+
+_STATEMENT_TABLE = re.compile(r'\b(?:FROM|INTO|UPDATE|JOIN)\s+"?(\w+)', re.IGNORECASE)
+
+
+def statement_labels(statement: str) -> Tuple[str, str]:
+    """
+    Derive low-cardinality (operation, table) labels from SQL text.
+
+    Args:
+        statement: SQL statement as sent to the driver
+
+    Returns:
+        Tuple of upper-cased leading keyword and first table referenced
+    """
+    words = statement.lstrip().split(None, 1)
+    operation = words[0].upper() if words else "UNKNOWN"
+    match = _STATEMENT_TABLE.search(statement)
+    return operation, match.group(1) if match else ""
+
+
+def _pool_label(pool: Any) -> str:
+    """Map a pool instance back to the label of its engine."""
+    for label, engine in _ENGINES.items():
+        if engine.sync_engine.pool is pool:
+            return label
+    return "unknown"
+
+
+def _observe_checkout_wait(pool: Any, seconds: float) -> None:
+    POOL_CHECKOUT_WAIT_SECONDS.observe(seconds, pool=_pool_label(pool))
+
+
+def _collect_pool_usage() -> None:
+    for label, engine in _ENGINES.items():
+        pool = engine.sync_engine.pool
+        if hasattr(pool, "checkedout"):
+            POOL_CHECKED_OUT.set(pool.checkedout(), pool=label)
+            POOL_CAPACITY.set(pool.size() + max(pool._max_overflow, 0), pool=label)
+
+
+REGISTRY.add_collector(_collect_pool_usage)
+
+
+def instrument_engine(engine: AsyncEngine, pool: str = "primary") -> None:
+    """
+    Attach statement, transaction and pool metrics to an engine.
+
+    Safe to call again for the same label (e.g. after an engine is
+    recreated); listeners are only added to engines not yet instrumented.
+
+    Args:
+        engine: AsyncEngine to instrument
+        pool: Label identifying the engine ("primary", "replica-0", ...)
+    """
+    if _ENGINES.get(pool) is engine:
+        return
+    _ENGINES[pool] = engine
+    sync_engine = engine.sync_engine
+
+    if _observe_checkout_wait not in CHECKOUT_WAIT_OBSERVERS:
+        CHECKOUT_WAIT_OBSERVERS.append(_observe_checkout_wait)
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault(_STATEMENT_START_KEY, []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info[_STATEMENT_START_KEY].pop()
+        operation, table = statement_labels(statement)
+        STATEMENT_SECONDS.observe(elapsed, pool=pool, operation=operation, table=table)
+        record_statement(statement, elapsed)
+        rowcount = getattr(cursor, "rowcount", -1)
+        if rowcount is not None and rowcount >= 0:
+            STATEMENT_ROWS.observe(rowcount, pool=pool, operation=operation, table=table)
+
+    @event.listens_for(sync_engine, "handle_error")
+    def handle_error(context):
+        starts = context.connection.info.get(_STATEMENT_START_KEY) if context.connection else None
+        if starts:
+            starts.pop()
+        operation, table = statement_labels(context.statement or "")
+        STATEMENT_ERRORS.inc(pool=pool, operation=operation, table=table)
+
+    @event.listens_for(sync_engine, "commit")
+    def commit(conn):
+        TRANSACTIONS.inc(pool=pool, outcome="commit")
+
+    @event.listens_for(sync_engine, "rollback")
+    def rollback(conn):
+        TRANSACTIONS.inc(pool=pool, outcome="rollback")
+
+
+# =============================================================================
+# Repository instrumentation
+# =============================================================================
+
+def _timed(repository: str, method: str, func: Callable) -> Callable:
+    """Wrap a repository coroutine to record its latency and errors."""
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return await func(*args, **kwargs)
+        except Exception:
+            REPOSITORY_ERRORS.inc(repository=repository, method=method)
+            raise
+        finally:
+            REPOSITORY_CALL_SECONDS.observe(
+                time.perf_counter() - start, repository=repository, method=method
+            )
+
+    wrapper.__instrumented__ = func
+    return wrapper
+
+
+def instrument_repository(cls: type) -> type:
+    """
+    Time every public coroutine method of a repository class.
+
+    Inherited methods are wrapped on the subclass so samples carry the
+    concrete repository name (JobRepository.get_by_id rather than
+    BaseRepository.get_by_id). Async generators such as stream() are left
+    alone.
+
+    Args:
+        cls: Repository class to instrument in place
+
+    Returns:
+        The same class
+    """
+    seen = set()
+    for klass in cls.__mro__:
+        for name, attr in vars(klass).items():
+            if name.startswith("_") or name in seen:
+                continue
+            seen.add(name)
+            if not isinstance(attr, types.FunctionType):
+                continue
+            func = getattr(attr, "__instrumented__", attr)
+            if not inspect.iscoroutinefunction(func):
+                continue
+            setattr(cls, name, _timed(cls.__name__, name, func))
+    return cls
+
+
+def render_metrics() -> str:
+    """Render the process-wide registry."""
+    return REGISTRY.render()
+
+
+__all__ = [
+    "CONTENT_TYPE",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "REGISTRY",
+    "instrument_engine",
+    "instrument_repository",
+    "render_metrics",
+    "statement_labels",
+]
@@ -7,6 +7,11 @@ Exports:
     - MediaFile: Media file tracking model
     - AnalysisResult: AI analysis result model
     - Transcription: Speech-to-text transcription model
+    - TranscriptSegment: Trigger-maintained searchable transcript segments
+    - JobStatusCounter: Trigger-maintained per-status job counts
+    - ResultHourlyRollup: Trigger-maintained hourly result aggregates per provider/model
+    - TranscriptionHourlyRollup: Trigger-maintained hourly transcription aggregates
+    - WebhookOutbox: Durable queue of job callbacks awaiting delivery
     - JobStatus: Enumeration of job states
     - MediaType: Enumeration of media types
     - FileType: Enumeration of file types
@@ -21,6 +26,7 @@ from api.models.job import (
     JobStatus,
     MediaType,
 )
+from api.models.job_status_counter import JobStatusCounter
 from api.models.media import (
     FileType,
     MediaFile,
@@ -34,6 +40,9 @@ from api.models.transcription import (
     Transcription,
     TranscriptionProvider,
 )
+from api.models.transcript_segment import TranscriptSegment
+from api.models.provider_rollup import ResultHourlyRollup, TranscriptionHourlyRollup
+from api.models.webhook_outbox import WebhookDeliveryStatus, WebhookOutbox
 from api.models.processing_log import (
     ProcessingLog,
     ProcessingLogStatus,
@@ -47,6 +56,7 @@ __all__ = [
     "AnalysisJob",
     "JobStatus",
     "MediaType",
+    "JobStatusCounter",
     # Media model
     "MediaFile",
     "FileType",
@@ -57,6 +67,13 @@ __all__ = [
     # Transcription model
     "Transcription",
     "TranscriptionProvider",
+    "TranscriptSegment",
+    # Provider rollups
+    "ResultHourlyRollup",
+    "TranscriptionHourlyRollup",
+    # Webhook outbox model
+    "WebhookOutbox",
+    "WebhookDeliveryStatus",
     # Processing log model
     "ProcessingLog",
     "ProcessingLogStatus",
@@ -13,7 +13,8 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import DateTime, func
+from sqlalchemy import Computed, DateTime, func
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, declared_attr
 
 
@@ -142,6 +143,18 @@ class UUIDMixin:
         return snake_case + "s"
 
 
+@compiles(Computed, "sqlite")
+def _compile_computed_sqlite(element: Computed, compiler, **kw) -> str:
+    """
+    Render generated columns as plain columns on SQLite.
+
+    The generated columns in this schema are PostgreSQL full-text vectors
+    (to_tsvector), which SQLite cannot evaluate; test databases built with
+    Base.metadata.create_all get a nullable column instead.
+    """
+    return ""
+
+
 # Convenience exports
 __all__ = [
     "Base",
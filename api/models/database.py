@@ -8,6 +8,12 @@ Supports two database modes:
 1. media_analysis (new independent database) - DEFAULT
 2. af_memory (legacy AF infrastructure) - fallback
 
+Read Replicas (optional):
+- MEDIA_DATABASE_REPLICA_URLS: comma-separated replica connection URLs
+- Read sessions route plain SELECTs to a healthy replica (round-robin) and
+  everything else to the primary; a replica that fails to connect is skipped
+  for DB_REPLICA_RETRY_SECONDS and reads fall back to the primary
+
 Pool Configuration:
 - min_size: 5 (minimum connections)
 - max_size: 20 (maximum connections)
@@ -21,16 +27,20 @@ from __future__ import annotations
 
 import logging
 import os
+import time
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator, Optional
+from typing import Any, AsyncGenerator, Callable, Dict, List, Optional
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.orm import Session
 from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.sql import Select
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +49,8 @@ logger = logging.getLogger(__name__)
 # =============================================================================
 _ENGINE: Optional[AsyncEngine] = None
 _SESSION_FACTORY: Optional[async_sessionmaker[AsyncSession]] = None
+_REPLICAS: Optional["ReplicaSet"] = None
+_READ_SESSION_FACTORY: Optional[async_sessionmaker[AsyncSession]] = None
 
 # =============================================================================
 # Database Configuration - Media Analysis (NEW - Independent Database)
@@ -82,6 +94,31 @@ POOL_CONFIG = {
     "pool_pre_ping": True,
 }
 
+# =============================================================================
+# Read Replica Settings
+# =============================================================================
+REPLICA_CONFIG = {
+    "urls": [
+        url.strip()
+        for url in os.environ.get("MEDIA_DATABASE_REPLICA_URLS", "").split(",")
+        if url.strip()
+    ],
+    "retry_seconds": float(os.environ.get("DB_REPLICA_RETRY_SECONDS", "30")),
+    "sticky_seconds": int(os.environ.get("DB_REPLICA_STICKY_SECONDS", "5")),
+}
+
+# Session.info keys used by RoutingSession
+READ_ONLY_KEY = "read_only"
+PINNED_PRIMARY_KEY = "pinned_primary"
+REPLICA_KEY = "replica"
+
+
+def to_async_url(url: str) -> str:
+    """Ensure a PostgreSQL URL uses the asyncpg driver."""
+    if url.startswith("postgresql://"):
+        return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    return url
+
 
 def get_database_url() -> str:
     """
@@ -97,10 +134,7 @@ def get_database_url() -> str:
     # Allow full URL override via environment variable
     env_url = os.environ.get("MEDIA_DATABASE_URL")
     if env_url:
-        # Ensure it's an async URL
-        if env_url.startswith("postgresql://"):
-            env_url = env_url.replace("postgresql://", "postgresql+asyncpg://", 1)
-        return env_url
+        return to_async_url(env_url)
 
     config = DATABASE_CONFIG
     password_part = f":{config['password']}" if config.get('password') else ""
@@ -114,6 +148,30 @@ def get_database_url() -> str:
 DATABASE_URL = get_database_url()
 
 
+# Callables receiving (pool, seconds) for every pool checkout (see api.metrics)
+CHECKOUT_WAIT_OBSERVERS: List[Callable[[Any, float], None]] = []
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Queue pool that reports how long each checkout waited for a connection.
+
+    The time covers queueing behind other checkouts and opening a new
+    connection when the pool grows; pool events only fire after checkout,
+    so the measurement has to wrap the pool itself.
+    """
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            if CHECKOUT_WAIT_OBSERVERS:
+                waited = time.perf_counter() - start
+                for observer in CHECKOUT_WAIT_OBSERVERS:
+                    observer(self, waited)
+
+
 def create_async_engine_configured() -> AsyncEngine:
     """
     Create configured async SQLAlchemy engine with connection pooling.
@@ -130,7 +188,7 @@ def create_async_engine_configured() -> AsyncEngine:
         logger.warning("Engine already exists, returning existing engine")
         return _ENGINE
 
-    pool_class = AsyncAdaptedQueuePool
+    pool_class = TimedQueuePool
 
     _ENGINE = create_async_engine(
         get_database_url(),
@@ -153,9 +211,145 @@ def create_async_engine_configured() -> AsyncEngine:
         f"max_overflow={POOL_CONFIG['max_overflow']}"
     )
 
+    create_replica_set()
+
     return _ENGINE
 
 
+# =============================================================================
+# Read Replica Routing
+# =============================================================================
+
+class ReplicaSet:
+    """
+    Replica engines with round-robin selection and failure back-off.
+
+    A replica whose connection attempt or connection fails is skipped for
+    retry_seconds; when every replica is down, pick() returns None and
+    callers fall back to the primary.
+    """
+
+    def __init__(self, engines: List[AsyncEngine], retry_seconds: float) -> None:
+        """
+        Initialize the replica set and hook connection error tracking.
+
+        Args:
+            engines: Replica AsyncEngine instances
+            retry_seconds: How long a failed replica is skipped
+        """
+        self.engines = engines
+        self.retry_seconds = retry_seconds
+        self._down_until: Dict[int, float] = {}
+        self._next = 0
+
+        for index, engine in enumerate(engines):
+            event.listen(engine.sync_engine, "handle_error", self._error_handler(index))
+
+    def _error_handler(self, index: int):
+        """Build a handle_error listener that marks replica index down."""
+        def on_error(context: Any) -> None:
+            if context.is_disconnect or context.connection is None:
+                self.mark_down(index)
+        return on_error
+
+    def mark_down(self, index: int) -> None:
+        """Skip a replica until the retry window has passed."""
+        self._down_until[index] = time.monotonic() + self.retry_seconds
+        logger.warning(f"Read replica {index} marked unhealthy for {self.retry_seconds}s")
+
+    def healthy(self) -> List[int]:
+        """Indexes of replicas currently eligible for reads."""
+        now = time.monotonic()
+        return [
+            index for index in range(len(self.engines))
+            if self._down_until.get(index, 0.0) <= now
+        ]
+
+    def pick(self) -> Optional[AsyncEngine]:
+        """Return the next healthy replica, or None if all are down."""
+        healthy = self.healthy()
+        if not healthy:
+            return None
+        self._next = (self._next + 1) % len(healthy)
+        return self.engines[healthy[self._next]]
+
+    def status(self) -> Dict[str, int]:
+        """Configured and healthy replica counts."""
+        return {"configured": len(self.engines), "healthy": len(self.healthy())}
+
+    async def dispose(self) -> None:
+        """Dispose every replica pool."""
+        for engine in self.engines:
+            await engine.dispose()
+
+
+def create_replica_set() -> Optional[ReplicaSet]:
+    """
+    Create replica engines from MEDIA_DATABASE_REPLICA_URLS, if any.
+
+    Returns:
+        ReplicaSet instance, or None when no replicas are configured
+    """
+    global _REPLICAS
+
+    if _REPLICAS is not None or not REPLICA_CONFIG["urls"]:
+        return _REPLICAS
+
+    engines = [
+        create_async_engine(
+            to_async_url(url),
+            poolclass=TimedQueuePool,
+            pool_size=POOL_CONFIG["min_size"],
+            max_overflow=POOL_CONFIG["max_overflow"],
+            pool_timeout=POOL_CONFIG["pool_timeout"],
+            pool_recycle=POOL_CONFIG["pool_recycle"],
+            pool_pre_ping=POOL_CONFIG["pool_pre_ping"],
+            echo=os.environ.get("DB_ECHO", "false").lower() == "true",
+        )
+        for url in REPLICA_CONFIG["urls"]
+    ]
+    _REPLICAS = ReplicaSet(engines, REPLICA_CONFIG["retry_seconds"])
+    logger.info(f"Created {len(engines)} read replica engine(s)")
+    return _REPLICAS
+
+
+def get_replica_set() -> Optional[ReplicaSet]:
+    """Get the replica set, or None when no replicas are configured."""
+    return _REPLICAS
+
+
+def _is_plain_read(clause: Any) -> bool:
+    """True for SELECTs that take no row locks."""
+    return isinstance(clause, Select) and clause._for_update_arg is None
+
+
+class RoutingSession(Session):
+    """
+    Session that sends reads to a replica and everything else to the primary.
+
+    Routing applies only to sessions created with info[READ_ONLY_KEY] set.
+    The first write, flush, locking SELECT or textual statement pins the
+    session to the primary for the rest of its life, so a request always
+    reads its own writes. One replica is chosen per session, so all reads
+    in a request see the same snapshot.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        primary = get_engine().sync_engine
+
+        if not self.info.get(READ_ONLY_KEY) or self.info.get(PINNED_PRIMARY_KEY):
+            return primary
+        if self._flushing or not _is_plain_read(clause):
+            self.info[PINNED_PRIMARY_KEY] = True
+            return primary
+
+        replica = self.info.get(REPLICA_KEY)
+        if replica is None and _REPLICAS is not None:
+            replica = _REPLICAS.pick()
+            self.info[REPLICA_KEY] = replica
+        return replica.sync_engine if replica is not None else primary
+
+
 def init_session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
     """
     Initialize session factory with configured engine.
@@ -178,11 +372,39 @@ def init_session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession
         expire_on_commit=False,
         autoflush=False,
     )
+    init_read_session_factory(engine)
 
     logger.info("Initialized async session factory")
     return _SESSION_FACTORY
 
 
+def init_read_session_factory(engine: AsyncEngine) -> Optional[async_sessionmaker[AsyncSession]]:
+    """
+    Initialize the replica-routing session factory when replicas exist.
+
+    Args:
+        engine: Primary AsyncEngine instance
+
+    Returns:
+        Routing async_sessionmaker, or None when no replicas are configured
+    """
+    global _READ_SESSION_FACTORY
+
+    if _REPLICAS is None:
+        return None
+
+    _READ_SESSION_FACTORY = async_sessionmaker(
+        bind=engine,
+        class_=AsyncSession,
+        sync_session_class=RoutingSession,
+        expire_on_commit=False,
+        autoflush=False,
+        info={READ_ONLY_KEY: True},
+    )
+    logger.info("Initialized read replica session factory")
+    return _READ_SESSION_FACTORY
+
+
 def set_engine(engine: AsyncEngine) -> None:
     """
     Set global engine reference.
@@ -222,6 +444,22 @@ def get_engine() -> AsyncEngine:
     return _ENGINE
 
 
+def get_read_session_factory() -> async_sessionmaker[AsyncSession]:
+    """
+    Get the session factory for read-only work.
+
+    Returns:
+        Replica-routing factory when replicas are configured, otherwise the
+        primary session factory
+
+    Raises:
+        RuntimeError: If session factory not initialized
+    """
+    if _READ_SESSION_FACTORY is not None:
+        return _READ_SESSION_FACTORY
+    return get_session_factory()
+
+
 def get_session_factory() -> async_sessionmaker[AsyncSession]:
     """
     Get global session factory instance.
@@ -263,6 +501,29 @@ async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
             raise
 
 
+@asynccontextmanager
+async def get_async_read_session(
+    read_only: bool = True
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Get a replica-routed async session as context manager.
+
+    Args:
+        read_only: Route plain reads to a replica (False pins to the primary)
+
+    Yields:
+        AsyncSession instance for read operations
+    """
+    session_factory = get_read_session_factory()
+    async with session_factory(info={READ_ONLY_KEY: read_only}) as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+
+
 async def close_engine() -> None:
     """
     Close global engine and cleanup resources.
@@ -270,14 +531,20 @@ async def close_engine() -> None:
     Properly disposes of connection pool and clears global references.
     Should be called during application shutdown.
     """
-    global _ENGINE, _SESSION_FACTORY
+    global _ENGINE, _SESSION_FACTORY, _REPLICAS, _READ_SESSION_FACTORY
 
     if _ENGINE is not None:
         await _ENGINE.dispose()
         logger.info("Async engine disposed")
         _ENGINE = None
 
+    if _REPLICAS is not None:
+        await _REPLICAS.dispose()
+        logger.info("Read replica engines disposed")
+        _REPLICAS = None
+
     _SESSION_FACTORY = None
+    _READ_SESSION_FACTORY = None
     logger.info("Database engine cleanup complete")
 
 
@@ -317,6 +584,7 @@ __all__ = [
     "MEDIA_DATABASE_CONFIG",
     "AF_DATABASE_CONFIG",
     "POOL_CONFIG",
+    "REPLICA_CONFIG",
     "DATABASE_URL",
     # Engine management
     "create_async_engine_configured",
@@ -326,8 +594,20 @@ __all__ = [
     "get_engine",
     "get_session_factory",
     "get_database_url",
+    "to_async_url",
+    "TimedQueuePool",
+    "CHECKOUT_WAIT_OBSERVERS",
+    # Read replicas
+    "ReplicaSet",
+    "RoutingSession",
+    "READ_ONLY_KEY",
+    "create_replica_set",
+    "get_replica_set",
+    "init_read_session_factory",
+    "get_read_session_factory",
     # Session management
     "get_async_session",
+    "get_async_read_session",
     # Cleanup
     "close_engine",
     "verify_database_connection",
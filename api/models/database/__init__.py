@@ -10,6 +10,7 @@ Exports:
     - MEDIA_DATABASE_CONFIG: Media analysis database configuration
     - AF_DATABASE_CONFIG: Legacy AF database configuration
     - POOL_CONFIG: Connection pool settings
+    - REPLICA_CONFIG: Read replica settings
     - DATABASE_URL: Constructed database URL for Alembic
     - create_async_engine_configured: Create async SQLAlchemy engine
     - init_session_factory: Initialize session factory
@@ -19,6 +20,10 @@ Exports:
     - get_session_factory: Get global session factory instance
     - get_database_url: Get database URL
     - get_async_session: Get async database session
+    - get_async_read_session: Get replica-routed async session
+    - get_read_session_factory: Get replica-routing session factory
+    - get_replica_set: Get configured read replicas
+    - RoutingSession: Session class that routes reads to replicas
     - close_engine: Close global engine
     - verify_database_connection: Verify database connectivity
 """
@@ -44,6 +49,10 @@ DATABASE_CONFIG = database_module.DATABASE_CONFIG
 MEDIA_DATABASE_CONFIG = database_module.MEDIA_DATABASE_CONFIG
 AF_DATABASE_CONFIG = database_module.AF_DATABASE_CONFIG
 POOL_CONFIG = database_module.POOL_CONFIG
+REPLICA_CONFIG = database_module.REPLICA_CONFIG
+READ_ONLY_KEY = database_module.READ_ONLY_KEY
+CHECKOUT_WAIT_OBSERVERS = database_module.CHECKOUT_WAIT_OBSERVERS
+TimedQueuePool = database_module.TimedQueuePool
 DATABASE_URL = database_module.DATABASE_URL
 create_async_engine_configured = database_module.create_async_engine_configured
 init_session_factory = database_module.init_session_factory
@@ -53,6 +62,11 @@ get_engine = database_module.get_engine
 get_session_factory = database_module.get_session_factory
 get_database_url = database_module.get_database_url
 get_async_session = database_module.get_async_session
+get_async_read_session = database_module.get_async_read_session
+get_read_session_factory = database_module.get_read_session_factory
+get_replica_set = database_module.get_replica_set
+ReplicaSet = database_module.ReplicaSet
+RoutingSession = database_module.RoutingSession
 close_engine = database_module.close_engine
 verify_database_connection = database_module.verify_database_connection
 
@@ -62,6 +76,10 @@ __all__ = [
     "MEDIA_DATABASE_CONFIG",
     "AF_DATABASE_CONFIG",
     "POOL_CONFIG",
+    "REPLICA_CONFIG",
+    "READ_ONLY_KEY",
+    "CHECKOUT_WAIT_OBSERVERS",
+    "TimedQueuePool",
     "DATABASE_URL",
     # Engine management
     "create_async_engine_configured",
@@ -71,8 +89,14 @@ __all__ = [
     "get_engine",
     "get_session_factory",
     "get_database_url",
+    # Read replicas
+    "ReplicaSet",
+    "RoutingSession",
+    "get_replica_set",
+    "get_read_session_factory",
     # Session management
     "get_async_session",
+    "get_async_read_session",
     # Cleanup
     "close_engine",
     "verify_database_connection",
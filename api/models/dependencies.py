@@ -6,6 +6,7 @@ Provides FastAPI Depends() compatible functions for:
 - get_session: Dependency to get async session
 - get_session_factory: Dependency to get session factory
 - get_async_session: Context manager dependency
+- get_read_session: Dependency to get a replica-routed session for reads
 
 Usage in FastAPI routes:
     ```python
@@ -29,11 +30,13 @@ from __future__ import annotations
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator, Generator
 
-from fastapi import Depends
+from fastapi import Depends, Request
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
 from api.models.database import (
+    READ_ONLY_KEY,
     get_engine,
+    get_read_session_factory,
     get_session_factory,
 )
 
@@ -41,6 +44,11 @@ from api.models.database import (
 SessionFactory = async_sessionmaker[AsyncSession]
 Engine = AsyncEngine
 
+# Set on responses to writes; while present, reads go to the primary
+READ_YOUR_WRITES_COOKIE = "media_rw_sticky"
+# Request header letting a client ask for primary reads explicitly
+READ_CONSISTENCY_HEADER = "X-Read-Consistency"
+
 
 def get_engine_dependency() -> Engine:
     """
@@ -120,6 +128,55 @@ async def get_session_dependency(
             raise
 
 
+def wants_primary(request: Request) -> bool:
+    """
+    Check whether a request must read from the primary.
+
+    True if the client wrote recently (stickiness cookie) or sent
+    "X-Read-Consistency: primary".
+    """
+    if request.cookies.get(READ_YOUR_WRITES_COOKIE):
+        return True
+    return request.headers.get(READ_CONSISTENCY_HEADER, "").lower() == "primary"
+
+
+async def get_read_session_dependency(
+    request: Request
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    FastAPI dependency to get a session for read-only endpoints.
+
+    Plain SELECTs go to a read replica when replicas are configured; any
+    write in the session pins it to the primary. Clients that wrote within
+    the stickiness window read from the primary.
+
+    Args:
+        request: Incoming request (for stickiness cookie and headers)
+
+    Yields:
+        AsyncSession instance
+
+    Raises:
+        HTTPException: 503 if session factory not initialized
+    """
+    try:
+        session_factory = get_read_session_factory()
+    except RuntimeError as e:
+        from fastapi import HTTPException
+        raise HTTPException(
+            status_code=503,
+            detail=f"Database session factory not available: {str(e)}"
+        )
+
+    async with session_factory(info={READ_ONLY_KEY: not wants_primary(request)}) as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+
+
 @asynccontextmanager
 async def get_async_session_dependency(
     session_factory: SessionFactory = Depends(get_session_factory_dependency)
@@ -147,16 +204,22 @@ async def get_async_session_dependency(
 # Convenience function aliases for common usage
 get_engine = get_engine_dependency
 get_session = get_session_dependency
+get_read_session = get_read_session_dependency
 get_session_factory = get_session_factory_dependency
 
 # Re-export for Depends usage
 __all__ = [
     "get_engine",
     "get_session",
+    "get_read_session",
     "get_session_factory",
     "get_async_session",
+    "READ_YOUR_WRITES_COOKIE",
+    "READ_CONSISTENCY_HEADER",
+    "wants_primary",
     "get_engine_dependency",
     "get_session_factory_dependency",
     "get_session_dependency",
+    "get_read_session_dependency",
     "get_async_session_dependency",
 ]
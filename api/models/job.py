@@ -10,11 +10,11 @@ from enum import StrEnum
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from sqlalchemy import DateTime, Enum, String, Text, text
+from sqlalchemy import DateTime, Enum, Integer, String, Text, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID as PostgresUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from api.models.base import Base, TimestampMixin
+from api.models.base import Base, SoftDeleteMixin, TimestampMixin
 
 if TYPE_CHECKING:
     from api.models.media import MediaFile
@@ -55,7 +55,7 @@ class MediaType(StrEnum):
     IMAGE = "image"
 
 
-class AnalysisJob(Base, TimestampMixin):
+class AnalysisJob(Base, TimestampMixin, SoftDeleteMixin):
     """
     Model representing a media analysis job.
 
@@ -69,6 +69,12 @@ class AnalysisJob(Base, TimestampMixin):
         completed_at: Timestamp when job completed (nullable)
         error_message: Error details if job failed (nullable)
         metadata_json: Additional metadata as JSONB (nullable)
+        claimed_by: Worker holding the processing lease (nullable)
+        lease_expires_at: Timestamp when the worker lease expires (nullable)
+        callback_url: Endpoint notified when the job completes or fails (nullable)
+        attempts: Number of times the job has been claimed by a worker
+        is_deleted: Soft delete flag
+        deleted_at: Soft delete timestamp (None if active)
 
     Relationships:
         media_files: Associated media files for this job
@@ -133,6 +139,32 @@ class AnalysisJob(Base, TimestampMixin):
         doc="Additional metadata as JSONB"
     )
 
+    claimed_by: Mapped[str | None] = mapped_column(
+        String(length=128),
+        nullable=True,
+        doc="Identifier of the worker holding the processing lease"
+    )
+
+    lease_expires_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        doc="Timestamp when the worker lease expires"
+    )
+
+    callback_url: Mapped[str | None] = mapped_column(
+        String(length=2048),
+        nullable=True,
+        doc="Endpoint notified when the job completes or fails"
+    )
+
+    attempts: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default=text("0"),
+        doc="Number of times the job has been claimed by a worker"
+    )
+
     # Relationships
     media_files: Mapped[list["MediaFile"]] = relationship(
         "MediaFile",
@@ -0,0 +1,66 @@
+"""
+JobStatusCounter model for O(1) job statistics.
+
+Holds per-status job counts maintained by a trigger on analysis_job, so
+statistics and status-filtered totals never aggregate the job table.
+Counts are spread over a small number of slots per status to avoid every
+concurrent job write contending on a single counter row; readers sum the
+slots for a status.
+"""
+
+from sqlalchemy import BigInteger, SmallInteger, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from api.models.base import Base
+
+
+# Number of counter rows per status (trigger picks one at random per write)
+STATUS_COUNTER_SLOTS = 8
+
+# Trigger on analysis_job that maintains the counters (created by the
+# add_job_status_counters migration, not by Base.metadata.create_all)
+STATUS_COUNTER_TRIGGER = "trg_analysis_job_status_counter"
+
+
+class JobStatusCounter(Base):
+    """
+    Model representing one slot of a per-status job counter.
+
+    Rows are written only by the analysis_job_status_counter trigger and by
+    JobRepository.reconcile_status_counters.
+
+    Attributes:
+        status: Job status the counter tracks
+        slot: Counter slot (0 to STATUS_COUNTER_SLOTS - 1)
+        count: Number of active (non-deleted) jobs attributed to this slot
+    """
+
+    __tablename__ = "job_status_counter"
+
+    status: Mapped[str] = mapped_column(
+        String(length=32),
+        primary_key=True,
+        doc="Job status the counter tracks"
+    )
+
+    slot: Mapped[int] = mapped_column(
+        SmallInteger,
+        primary_key=True,
+        default=0,
+        doc="Counter slot for write spreading"
+    )
+
+    count: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+        doc="Number of active jobs attributed to this slot"
+    )
+
+    def __repr__(self) -> str:
+        """String representation of the counter slot."""
+        return (
+            f"<JobStatusCounter(status={self.status}, "
+            f"slot={self.slot}, "
+            f"count={self.count})>"
+        )
@@ -5,7 +5,7 @@ Represents processing stages and events for analysis jobs,
 providing a detailed audit trail for debugging and compliance.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import StrEnum
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
@@ -32,6 +32,7 @@ class ProcessingStage(StrEnum):
         - analysis: AI analysis processing
         - completion: Job completion
         - cleanup: Resource cleanup
+        - recovery: Job recovered after its worker's lease expired
     """
 
     UPLOAD = "upload"
@@ -41,6 +42,7 @@ class ProcessingStage(StrEnum):
     ANALYSIS = "analysis"
     COMPLETION = "completion"
     CLEANUP = "cleanup"
+    RECOVERY = "recovery"
 
 
 class ProcessingLogStatus(StrEnum):
@@ -69,15 +71,20 @@ class ProcessingLog(Base):
     Provides detailed audit trail for analysis job processing stages.
     Used for debugging, compliance, and performance monitoring.
 
+    The table is range-partitioned by month on created_at (migration
+    000000000009), so created_at is part of the primary key and is set
+    client-side to keep the full identity known before INSERT. Old months
+    are retired with `python -m api.manage prune-log-partitions`.
+
     Attributes:
-        id: Unique identifier (UUID primary key)
+        id: Unique identifier (primary key with created_at)
         job_id: Foreign key to the parent AnalysisJob
         stage: Processing stage (upload/download/transcription/analysis/etc.)
         status: Status of the processing stage
         message: Human-readable log message
         details_json: Additional details as JSONB
         duration_ms: Duration of the stage in milliseconds
-        created_at: Timestamp when log was recorded
+        created_at: Timestamp when log was recorded (partition key)
 
     Relationships:
         job: Parent AnalysisJob
@@ -136,9 +143,11 @@ class ProcessingLog(Base):
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        primary_key=True,
         nullable=False,
+        default=lambda: datetime.now(timezone.utc),
         server_default="now()",
-        doc="Timestamp when log entry was created"
+        doc="Timestamp when log entry was created (partition key)"
     )
 
     # Relationships
@@ -0,0 +1,161 @@
+"""
+Hourly provider rollup models for result and transcription analytics.
+
+Per-hour aggregates maintained by triggers on analysis_result and
+transcription, so provider statistics over any time window read a few
+rollup rows per hour instead of aggregating the raw tables. As with
+job_status_counter, each aggregate is spread over a small number of slots
+so concurrent inserts for the same provider and model do not all contend
+on one row; readers sum the slots.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import JSON, BigInteger, DateTime, Float, SmallInteger, String
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Mapped, mapped_column
+
+from api.models.base import Base
+
+
+# Number of rollup rows per (hour, provider, model) (trigger picks one at random)
+ROLLUP_SLOTS = 4
+
+# Exclusive upper bounds of the latency histogram buckets, in milliseconds;
+# latency_buckets has one more element for latencies at or above the last bound
+LATENCY_BUCKET_BOUNDS_MS = (100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+
+# Statement triggers maintaining the rollups (created by the
+# add_provider_hourly_rollups migration, not by Base.metadata.create_all)
+RESULT_ROLLUP_TRIGGERS = tuple(
+    f"trg_analysis_result_rollup_{event}" for event in ("insert", "update", "delete")
+)
+TRANSCRIPTION_ROLLUP_TRIGGERS = tuple(
+    f"trg_transcription_rollup_{event}" for event in ("insert", "update", "delete")
+)
+
+
+class ResultHourlyRollup(Base):
+    """
+    Model representing one slot of an hourly analysis result aggregate.
+
+    Rows are written only by the analysis_result_rollup trigger.
+
+    Attributes:
+        bucket: Start of the UTC hour the results were created in
+        provider: AI provider
+        model: Model name
+        slot: Rollup slot (0 to ROLLUP_SLOTS - 1)
+        result_count: Number of active results
+        confidence_count: Results with a confidence score
+        confidence_sum: Sum of confidence scores
+        tokens_sum: Sum of tokens used
+        latency_count: Results with a latency
+        latency_sum: Sum of latencies in milliseconds
+        latency_buckets: Result counts per LATENCY_BUCKET_BOUNDS_MS bucket
+    """
+
+    __tablename__ = "result_hourly_rollup"
+
+    bucket: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        primary_key=True,
+        doc="Start of the UTC hour"
+    )
+
+    provider: Mapped[str] = mapped_column(
+        String(length=64),
+        primary_key=True,
+        doc="AI provider"
+    )
+
+    model: Mapped[str] = mapped_column(
+        String(length=256),
+        primary_key=True,
+        doc="Model name"
+    )
+
+    slot: Mapped[int] = mapped_column(
+        SmallInteger,
+        primary_key=True,
+        default=0,
+        doc="Rollup slot for write spreading"
+    )
+
+    result_count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    confidence_count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    confidence_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    tokens_sum: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    latency_count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    latency_sum: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+    latency_buckets: Mapped[list[int]] = mapped_column(
+        ARRAY(BigInteger).with_variant(JSON(), "sqlite"),
+        nullable=False,
+        doc="Result counts per latency histogram bucket"
+    )
+
+    def __repr__(self) -> str:
+        """String representation of the rollup slot."""
+        return (
+            f"<ResultHourlyRollup(bucket={self.bucket}, "
+            f"provider={self.provider}, "
+            f"model={self.model}, "
+            f"result_count={self.result_count})>"
+        )
+
+
+class TranscriptionHourlyRollup(Base):
+    """
+    Model representing one slot of an hourly transcription aggregate.
+
+    Transcriptions have no model column; they are rolled up by language.
+    Rows are written only by the transcription_rollup trigger.
+
+    Attributes:
+        bucket: Start of the UTC hour the transcriptions were created in
+        provider: Speech-to-text provider
+        language: Language code
+        slot: Rollup slot (0 to ROLLUP_SLOTS - 1)
+        transcription_count: Number of active transcriptions
+        duration_sum: Sum of media durations in seconds
+    """
+
+    __tablename__ = "transcription_hourly_rollup"
+
+    bucket: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        primary_key=True,
+        doc="Start of the UTC hour"
+    )
+
+    provider: Mapped[str] = mapped_column(
+        String(length=64),
+        primary_key=True,
+        doc="Speech-to-text provider"
+    )
+
+    language: Mapped[str] = mapped_column(
+        String(length=10),
+        primary_key=True,
+        doc="Language code"
+    )
+
+    slot: Mapped[int] = mapped_column(
+        SmallInteger,
+        primary_key=True,
+        default=0,
+        doc="Rollup slot for write spreading"
+    )
+
+    transcription_count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    duration_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+
+    def __repr__(self) -> str:
+        """String representation of the rollup slot."""
+        return (
+            f"<TranscriptionHourlyRollup(bucket={self.bucket}, "
+            f"provider={self.provider}, "
+            f"language={self.language}, "
+            f"transcription_count={self.transcription_count})>"
+        )
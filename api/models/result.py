@@ -10,16 +10,27 @@ from enum import StrEnum
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from sqlalchemy import DateTime, Float, ForeignKey, Integer, String, Text
-from sqlalchemy.dialects.postgresql import JSONB, UUID as PostgresUUID
+from sqlalchemy import Computed, DateTime, Float, ForeignKey, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID as PostgresUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from api.models.base import Base, TimestampMixin
+from api.models.base import Base, SoftDeleteMixin, TimestampMixin
 
 if TYPE_CHECKING:
     from api.models.job import AnalysisJob
 
 
+# Text search configuration shared by the search_vector column and its queries
+RESULT_SEARCH_CONFIG = "english"
+
+# Generation expression for analysis_result.search_vector (keep in sync with
+# the add_result_search_vector migration)
+RESULT_SEARCH_VECTOR_SQL = (
+    f"setweight(to_tsvector('{RESULT_SEARCH_CONFIG}', coalesce(model, '')), 'A') || "
+    f"setweight(jsonb_to_tsvector('{RESULT_SEARCH_CONFIG}', result_json, '[\"string\"]'), 'B')"
+)
+
+
 class AnalysisProvider(StrEnum):
     """
     Enumeration of supported AI analysis providers.
@@ -41,7 +52,7 @@ class AnalysisProvider(StrEnum):
     LOCAL = "local"
 
 
-class AnalysisResult(Base, TimestampMixin):
+class AnalysisResult(Base, TimestampMixin, SoftDeleteMixin):
     """
     Model representing an analysis result from an AI provider.
 
@@ -54,7 +65,10 @@ class AnalysisResult(Base, TimestampMixin):
         confidence: Confidence score of the analysis (nullable)
         tokens_used: Number of tokens consumed (nullable)
         latency_ms: Processing latency in milliseconds (nullable)
+        search_vector: Generated full-text search vector (deferred)
         created_at: Timestamp when result was recorded
+        is_deleted: Soft delete flag
+        deleted_at: Soft delete timestamp (None if active)
 
     Relationships:
         job: Parent AnalysisJob
@@ -117,6 +131,14 @@ class AnalysisResult(Base, TimestampMixin):
         doc="Processing latency in milliseconds"
     )
 
+    # Full-text search vector, computed by PostgreSQL and never loaded by default
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR().with_variant(Text(), "sqlite"),
+        Computed(RESULT_SEARCH_VECTOR_SQL, persisted=True),
+        deferred=True,
+        doc="Weighted tsvector over model (A) and result_json string values (B)"
+    )
+
     # Relationships
     job: Mapped["AnalysisJob"] = relationship(
         "AnalysisJob",
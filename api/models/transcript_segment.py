@@ -0,0 +1,103 @@
+"""
+TranscriptSegment model for segment-level transcript search.
+
+Holds one row per timestamped segment of Transcription.segments_json, kept
+in sync by a trigger on transcription, so a phrase can be located with a
+single indexed query instead of downloading and scanning whole transcripts.
+"""
+
+from uuid import UUID
+
+from sqlalchemy import Computed, Float, ForeignKey, Integer, String, Text
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID as PostgresUUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from api.models.base import Base
+
+
+# Text search configuration for segment text; 'simple' does not stem, so it
+# behaves the same for every transcript language
+SEGMENT_SEARCH_CONFIG = "simple"
+
+
+class TranscriptSegment(Base):
+    """
+    Model representing one timestamped segment of a transcription.
+
+    Rows are written only by the transcription_sync_segments trigger, which
+    rebuilds a transcription's segments whenever its segments_json changes.
+
+    Attributes:
+        transcription_id: Foreign key to the parent Transcription
+        segment_index: Position of the segment in segments_json
+        job_id: Job of the parent transcription (denormalized for filtering)
+        start_seconds: Segment start offset in seconds (nullable)
+        end_seconds: Segment end offset in seconds (nullable)
+        speaker: Speaker label if the provider supplied one (nullable)
+        text: Segment text
+        search_vector: Generated full-text search vector (deferred)
+    """
+
+    __tablename__ = "transcript_segment"
+
+    transcription_id: Mapped[UUID] = mapped_column(
+        PostgresUUID(as_uuid=True),
+        ForeignKey(
+            column="transcription.id",
+            ondelete="CASCADE",
+            name="fk_transcript_segment_transcription_id",
+        ),
+        primary_key=True,
+        doc="Foreign key to the parent transcription"
+    )
+
+    segment_index: Mapped[int] = mapped_column(
+        Integer,
+        primary_key=True,
+        doc="Position of the segment in segments_json"
+    )
+
+    job_id: Mapped[UUID] = mapped_column(
+        PostgresUUID(as_uuid=True),
+        nullable=False,
+        doc="Job of the parent transcription"
+    )
+
+    start_seconds: Mapped[float | None] = mapped_column(
+        Float,
+        nullable=True,
+        doc="Segment start offset in seconds"
+    )
+
+    end_seconds: Mapped[float | None] = mapped_column(
+        Float,
+        nullable=True,
+        doc="Segment end offset in seconds"
+    )
+
+    speaker: Mapped[str | None] = mapped_column(
+        String(length=64),
+        nullable=True,
+        doc="Speaker label"
+    )
+
+    text: Mapped[str] = mapped_column(
+        Text,
+        nullable=False,
+        doc="Segment text"
+    )
+
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR().with_variant(Text(), "sqlite"),
+        Computed(f"to_tsvector('{SEGMENT_SEARCH_CONFIG}', text)", persisted=True),
+        deferred=True,
+        doc="Full-text search vector over the segment text"
+    )
+
+    def __repr__(self) -> str:
+        """String representation of the transcript segment."""
+        return (
+            f"<TranscriptSegment(transcription_id={self.transcription_id}, "
+            f"segment_index={self.segment_index}, "
+            f"start_seconds={self.start_seconds})>"
+        )
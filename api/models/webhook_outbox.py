@@ -0,0 +1,130 @@
+"""
+WebhookOutbox model for durable job callback delivery.
+
+A row is written in the same transaction as the job status change that
+triggers the callback, so a callback is never lost to a crash between the
+commit and the HTTP request, and never sent for a change that rolled back.
+The webhook dispatcher delivers pending rows in the background.
+"""
+
+from datetime import datetime
+from enum import StrEnum
+from uuid import UUID, uuid4
+
+from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PostgresUUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from api.models.base import Base, TimestampMixin
+
+
+class WebhookDeliveryStatus(StrEnum):
+    """
+    Enumeration of outbox row states.
+
+    States:
+        - pending: Awaiting (re)delivery at next_attempt_at
+        - delivered: Acknowledged with a 2xx response
+        - dead: Gave up after the maximum number of attempts
+    """
+
+    PENDING = "pending"
+    DELIVERED = "delivered"
+    DEAD = "dead"
+
+
+class WebhookOutbox(Base, TimestampMixin):
+    """
+    Model representing one callback awaiting delivery.
+
+    Attributes:
+        id: Unique identifier, sent to receivers for de-duplication
+        job_id: Foreign key to the job the event is about
+        callback_url: Endpoint to POST the event to
+        event: Event name (job.completed, job.failed)
+        payload: Event body as JSONB
+        status: Delivery state (pending/delivered/dead)
+        attempts: Delivery attempts made so far
+        next_attempt_at: When the row is next due (also the claim lease)
+        last_error: Error from the most recent failed attempt (nullable)
+        delivered_at: Timestamp of successful delivery (nullable)
+    """
+
+    __tablename__ = "webhook_outbox"
+
+    id: Mapped[UUID] = mapped_column(
+        PostgresUUID(as_uuid=True),
+        primary_key=True,
+        default=uuid4,
+        doc="Unique identifier for the outbox entry"
+    )
+
+    job_id: Mapped[UUID] = mapped_column(
+        PostgresUUID(as_uuid=True),
+        ForeignKey(
+            column="analysis_job.id",
+            ondelete="CASCADE",
+            name="fk_webhook_outbox_job_id",
+        ),
+        nullable=False,
+        doc="Job the event is about"
+    )
+
+    callback_url: Mapped[str] = mapped_column(
+        String(length=2048),
+        nullable=False,
+        doc="Endpoint to POST the event to"
+    )
+
+    event: Mapped[str] = mapped_column(
+        String(length=64),
+        nullable=False,
+        doc="Event name"
+    )
+
+    payload: Mapped[dict] = mapped_column(
+        JSONB,
+        nullable=False,
+        doc="Event body"
+    )
+
+    status: Mapped[str] = mapped_column(
+        String(length=16),
+        nullable=False,
+        default=WebhookDeliveryStatus.PENDING.value,
+        doc="Delivery state"
+    )
+
+    attempts: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        doc="Delivery attempts made so far"
+    )
+
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        doc="When the entry is next due for delivery"
+    )
+
+    last_error: Mapped[str | None] = mapped_column(
+        Text,
+        nullable=True,
+        doc="Error from the most recent failed attempt"
+    )
+
+    delivered_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        doc="Timestamp of successful delivery"
+    )
+
+    def __repr__(self) -> str:
+        """String representation of the outbox entry."""
+        return (
+            f"<WebhookOutbox(id={self.id}, "
+            f"event={self.event}, "
+            f"status={self.status})>"
+        )
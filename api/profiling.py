@@ -0,0 +1,119 @@
+"""
+Request Profiling Module
+
+Per-request database accounting for the HTTP middleware in api.main.
+
+The middleware opens a RequestProfile in a context variable; the statement
+listeners installed by api.metrics.instrument_engine add every executed
+statement to it. SQLAlchemy runs those listeners in a greenlet that shares
+the request task's context, so no session plumbing is needed.
+
+At the end of the request the profile yields:
+- query count and DB time versus Python time (Server-Timing header)
+- statements repeated with identical SQL, the signature of an N+1 pattern
+  such as lazy or per-row relationship loads
+"""
+
+import os
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+
+
+# =============================================================================
+# Profiling Configuration
+# =============================================================================
+PROFILE_CONFIG = {
+    "enabled": os.environ.get("REQUEST_PROFILING_ENABLED", "true").lower() == "true",
+    # Flag requests issuing at least this many statements
+    "query_threshold": int(os.environ.get("REQUEST_QUERY_THRESHOLD", "20")),
+    # Flag identical statements executed at least this many times in one request
+    "repeat_threshold": int(os.environ.get("REQUEST_REPEAT_THRESHOLD", "5")),
+    "server_timing": os.environ.get("SERVER_TIMING_ENABLED", "true").lower() == "true",
+}
+
+
+class RequestProfile:
+    """Statement count, DB time and statement repetition for one request."""
+
+    __slots__ = ("query_count", "db_seconds", "statements")
+
+    def __init__(self) -> None:
+        self.query_count = 0
+        self.db_seconds = 0.0
+        self.statements: Dict[str, int] = {}
+
+    def record(self, statement: str, seconds: float) -> None:
+        """Add one executed statement."""
+        self.query_count += 1
+        self.db_seconds += seconds
+        self.statements[statement] = self.statements.get(statement, 0) + 1
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """
+        Statements executed at least threshold times, most frequent first.
+
+        Args:
+            threshold: Minimum executions of the same SQL text
+
+        Returns:
+            List of (statement, count) tuples
+        """
+        return sorted(
+            ((statement, count) for statement, count in self.statements.items() if count >= threshold),
+            key=lambda item: -item[1]
+        )
+
+    def is_suspicious(self) -> bool:
+        """True when the request crosses the query-count or repeat threshold."""
+        return (
+            self.query_count >= PROFILE_CONFIG["query_threshold"]
+            or bool(self.repeated(PROFILE_CONFIG["repeat_threshold"]))
+        )
+
+    def server_timing(self, total_seconds: float) -> str:
+        """
+        Build a Server-Timing header value splitting DB and Python time.
+
+        Args:
+            total_seconds: Wall time spent handling the request
+
+        Returns:
+            Header value such as 'db;dur=12.5;desc="7 queries", app;dur=3.1'
+        """
+        db_ms = self.db_seconds * 1000
+        app_ms = max(total_seconds * 1000 - db_ms, 0.0)
+        return (
+            f'db;dur={db_ms:.1f};desc="{self.query_count} queries", '
+            f"app;dur={app_ms:.1f}"
+        )
+
+
+_CURRENT_PROFILE: ContextVar[Optional[RequestProfile]] = ContextVar("request_profile", default=None)
+
+
+def start_profile() -> RequestProfile:
+    """Begin profiling the current request and return its profile."""
+    profile = RequestProfile()
+    _CURRENT_PROFILE.set(profile)
+    return profile
+
+
+def current_profile() -> Optional[RequestProfile]:
+    """Profile of the request being handled, or None outside a request."""
+    return _CURRENT_PROFILE.get()
+
+
+def record_statement(statement: str, seconds: float) -> None:
+    """Add a statement to the current request's profile, if any."""
+    profile = _CURRENT_PROFILE.get()
+    if profile is not None:
+        profile.record(statement, seconds)
+
+
+__all__ = [
+    "PROFILE_CONFIG",
+    "RequestProfile",
+    "current_profile",
+    "record_statement",
+    "start_profile",
+]
@@ -14,6 +14,18 @@ from api.repositories.media import MediaRepository
 from api.repositories.result import ResultRepository
 from api.repositories.transcription import TranscriptionRepository
 from api.repositories.processing_log import ProcessingLogRepository
+from api.repositories.webhook_outbox import WebhookOutboxRepository
+from api.repositories.pagination import InvalidCursorError, decode_cursor, encode_cursor
+from api.repositories.transitions import TransitionConflict, TransitionResult
+from api.repositories.triggers import MissingTriggersError, require_triggers, triggers_installed
+from api.repositories.rollup import ROLLUP_GRANULARITIES
+from api.repositories.cache import (
+    CacheBackend,
+    EntityCache,
+    LRUCacheBackend,
+    configure_entity_cache,
+    get_entity_cache,
+)
 
 
 # Type variable for models
@@ -103,6 +115,7 @@ RepositoryFactory.register("media")(MediaRepository)
 RepositoryFactory.register("result")(ResultRepository)
 RepositoryFactory.register("transcription")(TranscriptionRepository)
 RepositoryFactory.register("processing_log")(ProcessingLogRepository)
+RepositoryFactory.register("webhook_outbox")(WebhookOutboxRepository)
 
 
 __all__ = [
@@ -112,6 +125,21 @@ __all__ = [
     "ResultRepository",
     "TranscriptionRepository",
     "ProcessingLogRepository",
+    "WebhookOutboxRepository",
     "RepositoryFactory",
     "get_repository",
+    "InvalidCursorError",
+    "encode_cursor",
+    "decode_cursor",
+    "TransitionConflict",
+    "TransitionResult",
+    "MissingTriggersError",
+    "require_triggers",
+    "triggers_installed",
+    "ROLLUP_GRANULARITIES",
+    "CacheBackend",
+    "EntityCache",
+    "LRUCacheBackend",
+    "configure_entity_cache",
+    "get_entity_cache",
 ]
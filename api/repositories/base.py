@@ -5,20 +5,50 @@ Generic repository pattern implementation for async SQLAlchemy operations.
 Provides common CRUD operations with type safety and async context manager support.
 """
 
+import copy
 from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Generic, TypeVar, AsyncGenerator, Type, Optional, List, Dict, Any
+from typing import Generic, TypeVar, AsyncGenerator, Type, Optional, List, Dict, Any, FrozenSet, Tuple
 
-from sqlalchemy import select, update, delete, func
+from sqlalchemy import select, insert, update, delete, func, inspect, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import noload
 from sqlalchemy.sql import Select
 
+from api.metrics import instrument_repository
 from api.models.base import Base
+from api.repositories.cache import SESSION_BYPASS_CACHE, SESSION_DIRTY_KEYS, EntityCache, get_entity_cache
+from api.repositories.pagination import decode_cursor
+from api.repositories.transitions import TransitionConflict, TransitionResult
 
 
 # Type variable for generic repository
 T = TypeVar("T", bound=Base)
 
+# Escape character for LIKE patterns built by contains_pattern
+LIKE_ESCAPE = "!"
+
+
+def contains_pattern(query: str) -> str:
+    """
+    Build a substring ILIKE pattern with LIKE metacharacters escaped.
+
+    Use with `column.ilike(pattern, escape=LIKE_ESCAPE)` so a literal % or _
+    in the query matches itself instead of acting as a wildcard.
+
+    Args:
+        query: Raw search string
+
+    Returns:
+        Pattern of the form %query%
+    """
+    escaped = (
+        query.replace(LIKE_ESCAPE, LIKE_ESCAPE * 2)
+        .replace("%", LIKE_ESCAPE + "%")
+        .replace("_", LIKE_ESCAPE + "_")
+    )
+    return f"%{escaped}%"
+
 
 class BaseRepository(Generic[T]):
     """
@@ -38,6 +68,20 @@ class BaseRepository(Generic[T]):
         ```
     """
 
+    # Loader options applied to entity-returning queries (override per model)
+    default_load_options: Tuple[Any, ...] = ()
+
+    # Serve get_by_id through the entity cache (see api.repositories.cache)
+    cache_enabled: bool = False
+
+    # Legal status moves for _transition: target status -> statuses it may follow
+    status_transitions: Dict[Any, FrozenSet[Any]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Record per-method latency for every concrete repository (see api.metrics)."""
+        super().__init_subclass__(**kwargs)
+        instrument_repository(cls)
+
     def __init__(self, model: Type[T], session: AsyncSession) -> None:
         """
         Initialize repository with model class and database session.
@@ -63,19 +107,99 @@ class BaseRepository(Generic[T]):
         """
         Retrieve a record by its primary key ID.
 
+        When cache_enabled is set, lookups go through the entity cache. A
+        cache hit returns a transient snapshot that is not attached to the
+        session; modify records through the repository write methods.
+
         Args:
             id_: Primary key value (UUID for most models)
 
         Returns:
             Model instance if found, None otherwise
         """
-        stmt = select(self._model).where(
+        cache = self._entity_cache()
+        if cache is not None:
+            values = await cache.get(self.table_name, id_)
+            if values is not None:
+                return self._model(**copy.deepcopy(values))
+
+        stmt = select(self._model).options(*self.default_load_options).where(
+            self._model.id == id_,
+            self._model.is_deleted == False  # type: ignore[attr-defined]
+        )
+        result = await self._session.execute(stmt)
+        instance = result.scalar_one_or_none()
+
+        if cache is not None and instance is not None:
+            await cache.set(self.table_name, id_, self._snapshot(instance))
+        return instance
+
+    async def get_updated_at(self, id_: Any) -> Optional[datetime]:
+        """
+        Return only the updated_at of a record, for cheap change detection.
+
+        Served from the entity cache when it holds the record; otherwise a
+        single-column query that does not materialize the row.
+
+        Args:
+            id_: Primary key value
+
+        Returns:
+            Last modification timestamp, or None if the record does not exist
+        """
+        cache = self._entity_cache()
+        if cache is not None:
+            values = await cache.get(self.table_name, id_)
+            if values is not None:
+                return values["updated_at"]
+
+        stmt = select(self._model.updated_at).where(  # type: ignore[attr-defined]
             self._model.id == id_,
             self._model.is_deleted == False  # type: ignore[attr-defined]
         )
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
 
+    def _entity_cache(self) -> Optional[EntityCache]:
+        """
+        Return the entity cache for reads, or None to bypass it.
+
+        The cache is bypassed for models without cache_enabled, for sessions
+        flagged with SESSION_BYPASS_CACHE, and for any transaction that has
+        written through this repository, so it always reads its own
+        uncommitted changes and never caches them.
+        """
+        info = self._session.info
+        if not self.cache_enabled or info.get(SESSION_BYPASS_CACHE) or info.get(SESSION_DIRTY_KEYS):
+            return None
+        return get_entity_cache()
+
+    def _snapshot(self, instance: T) -> Dict[str, Any]:
+        """Copy the loaded column values of an instance for caching."""
+        return {
+            attr.key: copy.deepcopy(getattr(instance, attr.key))
+            for attr in inspect(self._model).column_attrs
+            if not attr.deferred
+        }
+
+    async def _invalidate_cached(self, *ids: Any) -> None:
+        """
+        Drop cached snapshots for written records.
+
+        Also records the keys in the session so later reads in the same
+        transaction bypass the cache, and so the snapshots are dropped again
+        after commit: a concurrent reader can re-cache the old row between
+        this call and the commit (see api.repositories.cache).
+        """
+        if not self.cache_enabled:
+            return
+        dirty = self._session.info.setdefault(SESSION_DIRTY_KEYS, set())
+        cache = get_entity_cache()
+        for id_ in ids:
+            dirty.add(EntityCache.key(self.table_name, id_))
+            if cache is not None:
+                await cache.invalidate(self.table_name, id_)
+
     async def get_by_id_with_deleted(self, id_: Any) -> Optional[T]:
         """
         Retrieve a record by ID including soft-deleted records.
@@ -86,7 +210,9 @@ class BaseRepository(Generic[T]):
         Returns:
             Model instance if found, None otherwise
         """
-        stmt = select(self._model).where(self._model.id == id_)
+        stmt = select(self._model).options(*self.default_load_options).where(
+            self._model.id == id_
+        )
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
 
@@ -103,47 +229,137 @@ class BaseRepository(Generic[T]):
         Raises:
             MultipleResultsFound: If multiple records match
         """
-        stmt = select(self._model).filter_by(
+        stmt = select(self._model).options(*self.default_load_options).filter_by(
             is_deleted=False,  # type: ignore[attr-defined]
             **kwargs
         )
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def get_all(
+    def _paginate(
         self,
+        stmt: Select,
         *,
         offset: int = 0,
         limit: int = 100,
-        order_by: Optional[str] = None,
+        cursor: Optional[str] = None,
         descending: bool = True
-    ) -> List[T]:
+    ) -> Select:
         """
-        Retrieve all non-deleted records with pagination.
+        Apply (created_at, id) ordering and offset or keyset pagination.
+
+        When a cursor is given the offset is ignored and the statement seeks
+        past the cursor position with a row-value comparison, which the
+        (created_at, id) indexes satisfy without scanning skipped rows.
+
+        Args:
+            stmt: Select statement to paginate
+            offset: Number of records to skip (ignored when cursor is set)
+            limit: Maximum number of records to return
+            cursor: Opaque cursor from a previous page
+            descending: Sort newest first (default: True)
+
+        Returns:
+            Paginated Select statement
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        created_col = self._model.created_at  # type: ignore[attr-defined]
+        id_col = self._model.id  # type: ignore[attr-defined]
+
+        if cursor:
+            created_at, id_ = decode_cursor(cursor)
+            position = tuple_(created_col, id_col)
+            boundary = tuple_(created_at, id_)
+            stmt = stmt.where(position < boundary if descending else position > boundary)
+        elif offset:
+            stmt = stmt.offset(offset)
+
+        if descending:
+            stmt = stmt.order_by(created_col.desc(), id_col.desc())
+        else:
+            stmt = stmt.order_by(created_col.asc(), id_col.asc())
+
+        return stmt.limit(limit)
+
+    def _order_and_paginate(
+        self,
+        stmt: Select,
+        *,
+        offset: int,
+        limit: int,
+        cursor: Optional[str],
+        order_by: Optional[str],
+        descending: bool
+    ) -> Select:
+        """
+        Paginate by keyset when ordering by created_at, otherwise by offset.
 
         Args:
+            stmt: Select statement to paginate
             offset: Number of records to skip
             limit: Maximum number of records to return
+            cursor: Opaque cursor from a previous page
             order_by: Field name to order by (default: created_at)
-            descending: Sort in descending order (default: True)
+            descending: Sort in descending order
 
         Returns:
-            List of model instances
+            Paginated Select statement
+
+        Raises:
+            ValueError: If a cursor is combined with a non-created_at ordering
         """
+        if (order_by or "created_at") == "created_at":
+            return self._paginate(
+                stmt, offset=offset, limit=limit, cursor=cursor, descending=descending
+            )
+
+        if cursor:
+            raise ValueError("Cursor pagination requires ordering by created_at")
+
         order_column = getattr(
             self._model,
-            order_by or "created_at",
+            order_by,
             self._model.created_at  # type: ignore[attr-defined]
         )
         if descending:
             order_column = order_column.desc()
 
-        stmt = (
-            select(self._model)
-            .where(self._model.is_deleted == False)  # type: ignore[attr-defined]
-            .offset(offset)
-            .limit(limit)
-            .order_by(order_column)
+        return stmt.offset(offset).limit(limit).order_by(order_column)
+
+    async def get_all(
+        self,
+        *,
+        offset: int = 0,
+        limit: int = 100,
+        order_by: Optional[str] = None,
+        descending: bool = True,
+        cursor: Optional[str] = None
+    ) -> List[T]:
+        """
+        Retrieve all non-deleted records with pagination.
+
+        Args:
+            offset: Number of records to skip
+            limit: Maximum number of records to return
+            order_by: Field name to order by (default: created_at)
+            descending: Sort in descending order (default: True)
+            cursor: Opaque keyset cursor (only with created_at ordering)
+
+        Returns:
+            List of model instances
+        """
+        stmt = select(self._model).options(*self.default_load_options).where(
+            self._model.is_deleted == False  # type: ignore[attr-defined]
+        )
+        stmt = self._order_and_paginate(
+            stmt,
+            offset=offset,
+            limit=limit,
+            cursor=cursor,
+            order_by=order_by,
+            descending=descending,
         )
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
@@ -155,7 +371,8 @@ class BaseRepository(Generic[T]):
         offset: int = 0,
         limit: int = 100,
         order_by: Optional[str] = None,
-        descending: bool = True
+        descending: bool = True,
+        cursor: Optional[str] = None
     ) -> List[T]:
         """
         List records with optional filtering and pagination.
@@ -166,11 +383,12 @@ class BaseRepository(Generic[T]):
             limit: Maximum number of records to return
             order_by: Field name to order by
             descending: Sort in descending order
+            cursor: Opaque keyset cursor (only with created_at ordering)
 
         Returns:
             List of matching model instances
         """
-        stmt = select(self._model).where(
+        stmt = select(self._model).options(*self.default_load_options).where(
             self._model.is_deleted == False  # type: ignore[attr-defined]
         )
 
@@ -179,18 +397,57 @@ class BaseRepository(Generic[T]):
                 if hasattr(self._model, key):
                     stmt = stmt.where(getattr(self._model, key) == value)
 
-        order_column = getattr(
-            self._model,
-            order_by or "created_at",
-            self._model.created_at  # type: ignore[attr-defined]
+        stmt = self._order_and_paginate(
+            stmt,
+            offset=offset,
+            limit=limit,
+            cursor=cursor,
+            order_by=order_by,
+            descending=descending,
         )
-        if descending:
-            order_column = order_column.desc()
-
-        stmt = stmt.offset(offset).limit(limit).order_by(order_column)
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
 
+    async def stream(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        batch_size: int = 500
+    ) -> AsyncGenerator[List[T], None]:
+        """
+        Stream all matching records in batches from a server-side cursor.
+
+        Rows are fetched batch_size at a time, so memory stays flat no matter
+        how many records match. Relationships are not loaded. The session's
+        connection is held until the generator is exhausted or closed.
+
+        Args:
+            filters: Dictionary of field-value pairs to filter by
+            batch_size: Number of records fetched per round trip
+
+        Yields:
+            Lists of up to batch_size model instances, oldest first
+        """
+        stmt = select(self._model).options(noload("*")).where(
+            self._model.is_deleted == False  # type: ignore[attr-defined]
+        )
+
+        if filters:
+            for key, value in filters.items():
+                if hasattr(self._model, key):
+                    stmt = stmt.where(getattr(self._model, key) == value)
+
+        stmt = stmt.order_by(
+            self._model.created_at.asc(),  # type: ignore[attr-defined]
+            self._model.id.asc()  # type: ignore[attr-defined]
+        ).execution_options(yield_per=batch_size)
+
+        result = await self._session.stream_scalars(stmt)
+        try:
+            async for partition in result.partitions(batch_size):
+                yield list(partition)
+        finally:
+            await result.close()
+
     async def count(self, **kwargs: Any) -> int:
         """
         Count records matching the given criteria.
@@ -225,17 +482,36 @@ class BaseRepository(Generic[T]):
         """
         Create a new record.
 
+        One INSERT ... RETURNING brings back the generated id and the server
+        defaults (created_at, updated_at) with the insert itself, instead of
+        a flush followed by a refresh SELECT. The returned instance is
+        persistent in the session's identity map, as if added and flushed.
+
+        Records created together with related objects (relationship keyword
+        arguments) go through session.add() and flush, so the ORM inserts
+        the whole graph.
+
         Args:
             **kwargs: Field-value pairs for the new record
 
         Returns:
             Created model instance
         """
-        instance = self._model(**kwargs)
-        self._session.add(instance)
-        await self._session.flush()
-        await self._session.refresh(instance)
-        return instance
+        if any(key in inspect(self._model).relationships for key in kwargs):
+            instance = self._model(**kwargs)
+            self._session.add(instance)
+            await self._session.flush()
+            await self._session.refresh(instance)
+            return instance
+
+        stmt = (
+            insert(self._model)
+            .values(**kwargs)
+            .returning(self._model)
+            .options(*self.default_load_options)
+        )
+        result = await self._session.execute(stmt)
+        return result.scalar_one()
 
     async def update(self, id_: Any, **kwargs: Any) -> Optional[T]:
         """
@@ -262,7 +538,9 @@ class BaseRepository(Generic[T]):
             )
             .values(**update_data)
             .returning(self._model)
+            .options(*self.default_load_options)
         )
+        await self._invalidate_cached(id_)
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
 
@@ -329,6 +607,7 @@ class BaseRepository(Generic[T]):
             )
             .returning(self._model.id)
         )
+        await self._invalidate_cached(id_)
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none() is not None
 
@@ -347,6 +626,7 @@ class BaseRepository(Generic[T]):
             .where(self._model.id == id_)
             .returning(self._model.id)
         )
+        await self._invalidate_cached(id_)
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none() is not None
 
@@ -371,10 +651,70 @@ class BaseRepository(Generic[T]):
                 deleted_at=None
             )
             .returning(self._model)
+            .options(*self.default_load_options)
         )
+        await self._invalidate_cached(id_)
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def _transition(
+        self,
+        id_: Any,
+        status: Any,
+        *,
+        criteria: Tuple[Any, ...] = (),
+        **kwargs: Any
+    ) -> TransitionResult[T]:
+        """
+        Move a record to a new status if its current status allows it.
+
+        One conditional `UPDATE ... WHERE status IN (allowed) RETURNING *`
+        applies the move, so two writers racing on the same record cannot
+        both win and an illegal move (say completed back to processing) is
+        never written. Only when nothing matched does a second query read
+        the current status to explain the conflict.
+
+        Args:
+            id_: Primary key of the record
+            status: Target status (a key of status_transitions)
+            criteria: Further WHERE conditions the row must meet (e.g. lease
+                ownership); a row in an allowed status that fails them is
+                reported as a conflict too
+            **kwargs: Further column values written with the status
+
+        Returns:
+            TransitionResult with the updated entity, or the conflict
+        """
+        allowed = self.status_transitions.get(status, frozenset())
+        stmt = (
+            update(self._model)
+            .where(
+                self._model.id == id_,
+                self._model.status.in_(allowed),  # type: ignore[attr-defined]
+                self._model.is_deleted == False,  # type: ignore[attr-defined]
+                *criteria
+            )
+            .values(status=status, updated_at=func.now(), **kwargs)
+            .returning(self._model)
+            .options(*self.default_load_options)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        await self._invalidate_cached(id_)
+        result = await self._session.execute(stmt)
+        entity = result.scalar_one_or_none()
+        if entity is not None:
+            return TransitionResult(entity)
+
+        current = await self._session.execute(
+            select(self._model.status).where(  # type: ignore[attr-defined]
+                self._model.id == id_,
+                self._model.is_deleted == False  # type: ignore[attr-defined]
+            )
+        )
+        return TransitionResult(
+            conflict=TransitionConflict(id_, current.scalar_one_or_none(), status, allowed)
+        )
+
     @asynccontextmanager
     async def transaction(self) -> AsyncGenerator[None, None]:
         """
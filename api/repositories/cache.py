@@ -0,0 +1,310 @@
+"""
+Entity Cache Module
+
+Read-through cache for hot get_by_id lookups.
+
+Entries are column snapshots keyed by "<table>:<id>". Lookups check an
+in-process LRU first, then an optional shared backend (e.g. Redis) that
+implements CacheBackend, and fall through to the database on a miss.
+Repository write paths invalidate both tiers, once before the write and
+again after the transaction commits (a concurrent reader may have cached
+the old row in between); the TTL bounds staleness for writes made by other
+processes or by statements that bypass the repository.
+"""
+
+import asyncio
+import os
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Coroutine, Dict, Iterable, Optional, Set, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+# =============================================================================
+# Cache Configuration
+# =============================================================================
+CACHE_CONFIG = {
+    "enabled": os.environ.get("ENTITY_CACHE_ENABLED", "true").lower() == "true",
+    "max_entries": int(os.environ.get("ENTITY_CACHE_MAX_ENTRIES", "10000")),
+    "ttl_seconds": float(os.environ.get("ENTITY_CACHE_TTL_SECONDS", "5")),
+}
+
+# Session.info key holding cache keys written in the session's transaction
+SESSION_DIRTY_KEYS = "entity_cache_dirty_keys"
+
+# Session.info flag that makes repositories read the database, not the cache
+SESSION_BYPASS_CACHE = "entity_cache_bypass"
+
+
+class CacheBackend(ABC):
+    """
+    Interface for a cache tier.
+
+    Values are plain dicts of column values; shared backends are responsible
+    for serializing them.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached value for key, or None if absent or expired."""
+
+    @abstractmethod
+    async def set(self, key: str, value: Dict[str, Any], ttl_seconds: float) -> None:
+        """Store value under key for ttl_seconds."""
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Remove key if present."""
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Remove all entries."""
+
+
+class LRUCacheBackend(CacheBackend):
+    """
+    In-process LRU cache with per-entry TTL and a size bound.
+
+    Also serves as the local stand-in for a shared backend in tests.
+    """
+
+    def __init__(self, max_entries: int = 10000) -> None:
+        """
+        Initialize an empty LRU cache.
+
+        Args:
+            max_entries: Maximum number of entries before evicting the least
+                recently used
+        """
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        """Number of entries currently held (including expired ones)."""
+        return len(self._entries)
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Dict[str, Any], ttl_seconds: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+
+
+class EntityCache:
+    """
+    Two-tier read-through cache for entity snapshots with hit/miss counters.
+
+    Example:
+        ```python
+        cache = EntityCache(LRUCacheBackend(1000), ttl_seconds=5)
+        values = await cache.get("analysis_job", job_id)
+        ```
+    """
+
+    def __init__(
+        self,
+        local: CacheBackend,
+        shared: Optional[CacheBackend] = None,
+        *,
+        ttl_seconds: float = 5.0
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            local: In-process tier, checked first
+            shared: Optional cross-process tier, checked on a local miss
+            ttl_seconds: Lifetime of an entry in either tier
+        """
+        self.local = local
+        self.shared = shared
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def key(table: str, id_: Any) -> str:
+        """Build the cache key for a row."""
+        return f"{table}:{id_}"
+
+    async def get(self, table: str, id_: Any) -> Optional[Dict[str, Any]]:
+        """
+        Look up a row snapshot, counting the hit or miss.
+
+        Args:
+            table: Table name of the entity
+            id_: Primary key of the entity
+
+        Returns:
+            Column values dict, or None on a miss
+        """
+        key = self.key(table, id_)
+        value = await self.local.get(key)
+        if value is None and self.shared is not None:
+            value = await self.shared.get(key)
+            if value is not None:
+                self.shared_hits += 1
+                await self.local.set(key, value, self.ttl_seconds)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+
+    async def set(self, table: str, id_: Any, value: Dict[str, Any]) -> None:
+        """Store a row snapshot in every tier."""
+        key = self.key(table, id_)
+        await self.local.set(key, value, self.ttl_seconds)
+        if self.shared is not None:
+            await self.shared.set(key, value, self.ttl_seconds)
+
+    async def invalidate(self, table: str, id_: Any) -> None:
+        """Drop a row snapshot from every tier."""
+        await self.invalidate_keys([self.key(table, id_)])
+
+    async def invalidate_keys(self, keys: Iterable[str]) -> None:
+        """Drop row snapshots from every tier by cache key."""
+        for key in keys:
+            self.invalidations += 1
+            await self.local.delete(key)
+            if self.shared is not None:
+                await self.shared.delete(key)
+
+    async def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        await self.local.clear()
+        if self.shared is not None:
+            await self.shared.clear()
+        self.hits = self.shared_hits = self.misses = self.invalidations = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and the hit ratio."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "shared_hits": self.shared_hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "ttl_seconds": self.ttl_seconds,
+        }
+
+
+# =============================================================================
+# Global cache reference
+# =============================================================================
+_ENTITY_CACHE: Optional[EntityCache] = None
+_ENTITY_CACHE_CONFIGURED = False
+
+
+def configure_entity_cache(
+    shared: Optional[CacheBackend] = None,
+    *,
+    max_entries: Optional[int] = None,
+    ttl_seconds: Optional[float] = None,
+    enabled: Optional[bool] = None
+) -> Optional[EntityCache]:
+    """
+    Create (or replace) the global entity cache.
+
+    Args:
+        shared: Optional shared backend behind the in-process LRU
+        max_entries: LRU size bound (default: ENTITY_CACHE_MAX_ENTRIES)
+        ttl_seconds: Entry lifetime (default: ENTITY_CACHE_TTL_SECONDS)
+        enabled: Whether caching is on (default: ENTITY_CACHE_ENABLED)
+
+    Returns:
+        The new EntityCache, or None when caching is disabled
+    """
+    global _ENTITY_CACHE, _ENTITY_CACHE_CONFIGURED
+
+    _ENTITY_CACHE_CONFIGURED = True
+    if not (CACHE_CONFIG["enabled"] if enabled is None else enabled):
+        _ENTITY_CACHE = None
+        return None
+
+    _ENTITY_CACHE = EntityCache(
+        LRUCacheBackend(max_entries or CACHE_CONFIG["max_entries"]),
+        shared,
+        ttl_seconds=CACHE_CONFIG["ttl_seconds"] if ttl_seconds is None else ttl_seconds
+    )
+    return _ENTITY_CACHE
+
+
+def get_entity_cache() -> Optional[EntityCache]:
+    """
+    Get the global entity cache, creating it from the environment on first use.
+
+    Returns:
+        EntityCache instance, or None when caching is disabled
+    """
+    if not _ENTITY_CACHE_CONFIGURED:
+        configure_entity_cache()
+    return _ENTITY_CACHE
+
+
+# =============================================================================
+# Commit-time invalidation
+# =============================================================================
+# Invalidation tasks scheduled from commit hooks (held so they are not
+# garbage collected before they run)
+_PENDING_INVALIDATIONS: Set["asyncio.Task[None]"] = set()
+
+
+def _schedule(coro: Coroutine[Any, Any, None]) -> None:
+    """Run an invalidation on the current event loop without awaiting it."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        coro.close()
+        return
+    task = loop.create_task(coro)
+    _PENDING_INVALIDATIONS.add(task)
+    task.add_done_callback(_PENDING_INVALIDATIONS.discard)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session: Session) -> None:
+    """Drop snapshots of the rows a transaction wrote once it has committed."""
+    keys = session.info.pop(SESSION_DIRTY_KEYS, None)
+    cache = get_entity_cache()
+    if keys and cache is not None:
+        _schedule(cache.invalidate_keys(keys))
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _forget_rolled_back(session: Session, transaction: Any) -> None:
+    """Clear the written keys of an outermost transaction that did not commit."""
+    if transaction.parent is None:
+        session.info.pop(SESSION_DIRTY_KEYS, None)
+
+
+__all__ = [
+    "CacheBackend",
+    "LRUCacheBackend",
+    "EntityCache",
+    "configure_entity_cache",
+    "get_entity_cache",
+]
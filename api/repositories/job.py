@@ -4,15 +4,34 @@ Job Repository Module
 Repository for AnalysisJob model with job-specific query methods.
 """
 
-from datetime import datetime
-from typing import Optional, List
+from datetime import datetime, timedelta, timezone
+from typing import Optional, List, Tuple
 from uuid import UUID
 
-from sqlalchemy import select, desc, and_, or_
+from sqlalchemy import String, select, update, delete, desc, and_, or_, func, case, cast, literal, literal_column
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import noload, selectinload
 
 from api.models.job import AnalysisJob, JobStatus, MediaType
-from api.repositories.base import BaseRepository
+from api.models.job_status_counter import STATUS_COUNTER_TRIGGER, JobStatusCounter
+from api.models.media import MediaFile
+from api.models.processing_log import ProcessingLog
+from api.models.result import AnalysisResult
+from api.models.transcription import Transcription
+from api.repositories.base import BaseRepository, LIKE_ESCAPE, contains_pattern
+from api.repositories.transitions import TransitionResult
+from api.repositories.triggers import triggers_installed
+from api.repositories.webhook_outbox import WebhookOutboxRepository
+
+
+# Statuses that queue a callback to the job's callback_url, with their event names
+CALLBACK_EVENTS = {
+    JobStatus.COMPLETED: "job.completed",
+    JobStatus.FAILED: "job.failed",
+}
+
+# Processing lease when the caller does not choose one (see claim_batch)
+DEFAULT_LEASE_SECONDS = 300
 
 
 class JobRepository(BaseRepository[AnalysisJob]):
@@ -27,8 +46,25 @@ class JobRepository(BaseRepository[AnalysisJob]):
         pending_jobs = await job_repo.get_by_status(JobStatus.PENDING)
         recent_jobs = await job_repo.get_recent(limit=10)
         ```
+
+    Queries load no relationships unless requested through
+    get_job_with_relations, so listings never fetch child rows.
     """
 
+    default_load_options = (noload("*"),)
+
+    # Pollers fetch the same in-flight jobs by id many times per second
+    cache_enabled = True
+
+    # Only a processing job can finish; completed jobs are final, failed and
+    # processing jobs may be requeued
+    status_transitions = {
+        JobStatus.PENDING: frozenset({JobStatus.PROCESSING, JobStatus.FAILED}),
+        JobStatus.PROCESSING: frozenset({JobStatus.PENDING}),
+        JobStatus.COMPLETED: frozenset({JobStatus.PROCESSING}),
+        JobStatus.FAILED: frozenset({JobStatus.PENDING, JobStatus.PROCESSING}),
+    }
+
     def __init__(self, session: AsyncSession) -> None:
         """
         Initialize JobRepository with AnalysisJob model.
@@ -50,12 +86,70 @@ class JobRepository(BaseRepository[AnalysisJob]):
         """
         return await super().get_by_id(id_)
 
+    async def get_existing_ids(self, ids: List[UUID]) -> set:
+        """
+        Return the subset of the given job IDs that exist and are active.
+
+        Args:
+            ids: Job UUIDs to check
+
+        Returns:
+            Set of existing job UUIDs
+        """
+        if not ids:
+            return set()
+
+        stmt = select(self.model.id).where(
+            and_(
+                self.model.id.in_(ids),
+                self.model.is_deleted == False  # type: ignore[attr-defined]
+            )
+        )
+        result = await self._session.execute(stmt)
+        return set(result.scalars().all())
+
+    async def get_status_event(self, id_: UUID) -> Optional[dict]:
+        """
+        Read a job's current status in the shape of a job_events status event.
+
+        Always queries the database, never the entity cache, so it can serve
+        as the baseline for an event stream subscribed just before.
+
+        Args:
+            id_: Job UUID
+
+        Returns:
+            {"type": "status", "job_id", "status", "error_message", "updated_at"}
+            or None if the job does not exist
+        """
+        stmt = select(
+            self.model.id,
+            self.model.status,
+            self.model.error_message,
+            self.model.updated_at
+        ).where(
+            self.model.id == id_,
+            self.model.is_deleted == False  # type: ignore[attr-defined]
+        )
+        result = await self._session.execute(stmt)
+        row = result.one_or_none()
+        if row is None:
+            return None
+        return {
+            "type": "status",
+            "job_id": str(row.id),
+            "status": str(row.status),
+            "error_message": row.error_message,
+            "updated_at": row.updated_at.isoformat() if row.updated_at else None,
+        }
+
     async def get_by_status(
         self,
         status: JobStatus,
         *,
         offset: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        cursor: Optional[str] = None
     ) -> List[AnalysisJob]:
         """
         Retrieve all jobs with a specific status.
@@ -64,22 +158,22 @@ class JobRepository(BaseRepository[AnalysisJob]):
             status: JobStatus enum value (PENDING, PROCESSING, COMPLETED, FAILED)
             offset: Number of records to skip
             limit: Maximum number of records to return
+            cursor: Opaque keyset cursor from a previous page
 
         Returns:
             List of AnalysisJob instances
         """
         stmt = (
             select(self.model)
+            .options(*self.default_load_options)
             .where(
                 and_(
                     self.model.status == status,
                     self.model.is_deleted == False  # type: ignore[attr-defined]
                 )
             )
-            .order_by(desc(self.model.created_at))
-            .offset(offset)
-            .limit(limit)
         )
+        stmt = self._paginate(stmt, offset=offset, limit=limit, cursor=cursor)
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
 
@@ -87,20 +181,29 @@ class JobRepository(BaseRepository[AnalysisJob]):
         """
         Count jobs with a specific status.
 
+        Reads the trigger-maintained job_status_counter table, so the cost
+        is independent of the number of jobs. Without the counter trigger
+        (a create_all database) the jobs are counted instead.
+
         Args:
             status: JobStatus enum value
 
         Returns:
             Number of jobs with the status
         """
-        stmt = select(self.model).where(
-            and_(
-                self.model.status == status,
-                self.model.is_deleted == False  # type: ignore[attr-defined]
+        if await triggers_installed(self._session, self.table_name, STATUS_COUNTER_TRIGGER):
+            stmt = select(func.coalesce(func.sum(JobStatusCounter.count), 0)).where(
+                JobStatusCounter.status == str(status)
+            )
+        else:
+            stmt = select(func.count()).select_from(self.model).where(
+                and_(
+                    self.model.status == status,
+                    self.model.is_deleted == False  # type: ignore[attr-defined]
+                )
             )
-        )
         result = await self._session.execute(stmt)
-        return len(result.scalars().all())
+        return int(result.scalar() or 0)
 
     async def get_recent(
         self,
@@ -130,6 +233,7 @@ class JobRepository(BaseRepository[AnalysisJob]):
 
         stmt = (
             select(self.model)
+            .options(*self.default_load_options)
             .where(and_(*conditions))
             .order_by(desc(self.model.created_at))
             .limit(limit)
@@ -151,6 +255,7 @@ class JobRepository(BaseRepository[AnalysisJob]):
         """
         stmt = (
             select(self.model)
+            .options(*self.default_load_options)
             .where(
                 and_(
                     self.model.status == JobStatus.PENDING,
@@ -163,6 +268,175 @@ class JobRepository(BaseRepository[AnalysisJob]):
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
 
+    async def claim_batch(
+        self,
+        n: int,
+        worker_id: str,
+        lease_seconds: int = DEFAULT_LEASE_SECONDS
+    ) -> List[AnalysisJob]:
+        """
+        Atomically claim up to N of the oldest pending jobs for a worker.
+
+        Selects candidates with FOR UPDATE SKIP LOCKED and moves them to
+        processing in the same UPDATE ... RETURNING statement, so concurrent
+        workers never receive the same job and a claim costs one round trip.
+
+        Args:
+            n: Maximum number of jobs to claim
+            worker_id: Identifier of the claiming worker
+            lease_seconds: Lease duration before the claim is considered expired
+
+        Returns:
+            List of claimed AnalysisJob instances (oldest first)
+        """
+        candidates = (
+            select(self.model.id)
+            .where(
+                and_(
+                    self.model.status == JobStatus.PENDING,
+                    self.model.is_deleted == False  # type: ignore[attr-defined]
+                )
+            )
+            .order_by(self.model.created_at.asc())
+            .limit(n)
+            .with_for_update(skip_locked=True)
+        )
+
+        stmt = (
+            update(self.model)
+            .where(self.model.id.in_(candidates.scalar_subquery()))
+            .values(
+                status=JobStatus.PROCESSING,
+                claimed_by=worker_id,
+                lease_expires_at=func.now() + timedelta(seconds=lease_seconds),
+                attempts=self.model.attempts + 1,
+                updated_at=func.now(),
+            )
+            .returning(self.model)
+            .options(*self.default_load_options)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        result = await self._session.execute(stmt)
+        jobs = list(result.scalars().all())
+        jobs.sort(key=lambda job: job.created_at)
+        await self._invalidate_cached(*(job.id for job in jobs))
+        return jobs
+
+    async def heartbeat(
+        self,
+        id_: UUID,
+        worker_id: str,
+        lease_seconds: int = DEFAULT_LEASE_SECONDS
+    ) -> Optional[AnalysisJob]:
+        """
+        Extend a worker's processing lease to lease_seconds from now.
+
+        Only the worker holding the lease of a processing job can extend it,
+        so a worker whose lease already expired and was reaped learns that
+        it lost the job.
+
+        Args:
+            id_: Job UUID
+            worker_id: Worker that claimed the job
+            lease_seconds: New lease duration
+
+        Returns:
+            Updated AnalysisJob, or None if the job is not processing under
+            this worker's lease
+        """
+        stmt = (
+            update(self.model)
+            .where(
+                self.model.id == id_,
+                self.model.status == JobStatus.PROCESSING,
+                self.model.claimed_by == worker_id,
+                self.model.is_deleted == False  # type: ignore[attr-defined]
+            )
+            .values(
+                lease_expires_at=func.now() + timedelta(seconds=lease_seconds),
+                updated_at=func.now(),
+            )
+            .returning(self.model)
+            .options(*self.default_load_options)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        await self._invalidate_cached(id_)
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def recover_expired_leases(
+        self,
+        max_attempts: int,
+        *,
+        limit: int = 500
+    ) -> List[Tuple[AnalysisJob, Optional[str]]]:
+        """
+        Requeue or fail processing jobs whose worker lease has expired.
+
+        One UPDATE ... FROM (SELECT ... FOR UPDATE SKIP LOCKED) ... RETURNING
+        handles the whole batch: jobs with attempts left go back to pending,
+        jobs that used max_attempts claims are failed. Either way the lease
+        is cleared. Concurrent reapers skip each other's rows. Failed jobs
+        with a callback_url get their callback queued in the same transaction.
+
+        Args:
+            max_attempts: Claims after which an expired job is failed
+            limit: Maximum number of jobs to recover
+
+        Returns:
+            (job after recovery, worker whose lease expired) per job
+        """
+        expired = (
+            select(self.model.id, self.model.claimed_by)
+            .where(
+                self.model.status == JobStatus.PROCESSING,
+                self.model.lease_expires_at < func.now(),
+                self.model.is_deleted == False  # type: ignore[attr-defined]
+            )
+            .order_by(self.model.lease_expires_at.asc())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .subquery("expired")
+        )
+        exhausted = self.model.attempts >= max_attempts
+        status_type = self.model.status.type
+
+        stmt = (
+            update(self.model)
+            .where(self.model.id == expired.c.id)
+            .values(
+                status=case(
+                    (exhausted, cast(literal(JobStatus.FAILED, status_type), status_type)),
+                    else_=cast(literal(JobStatus.PENDING, status_type), status_type)
+                ),
+                error_message=case(
+                    (
+                        exhausted,
+                        literal("Worker lease expired (")
+                        + func.coalesce(expired.c.claimed_by, "unknown")
+                        + ") after "
+                        + cast(self.model.attempts, String)
+                        + " attempt(s)"
+                    ),
+                    else_=self.model.error_message
+                ),
+                claimed_by=None,
+                lease_expires_at=None,
+                updated_at=func.now(),
+            )
+            .returning(self.model, expired.c.claimed_by)
+            .options(*self.default_load_options)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        result = await self._session.execute(stmt)
+        recovered = [(job, worker) for job, worker in result.all()]
+
+        await self._invalidate_cached(*(job.id for job, _worker in recovered))
+        for job, _worker in recovered:
+            if job.status == JobStatus.FAILED and job.callback_url:
+                await self._enqueue_callback(job, CALLBACK_EVENTS[JobStatus.FAILED])
+        return recovered
+
     async def get_processing_jobs(self, limit: int = 100) -> List[AnalysisJob]:
         """
         Get currently processing jobs.
@@ -175,6 +449,7 @@ class JobRepository(BaseRepository[AnalysisJob]):
         """
         stmt = (
             select(self.model)
+            .options(*self.default_load_options)
             .where(
                 and_(
                     self.model.status == JobStatus.PROCESSING,
@@ -213,6 +488,7 @@ class JobRepository(BaseRepository[AnalysisJob]):
 
         stmt = (
             select(self.model)
+            .options(*self.default_load_options)
             .where(and_(*conditions))
             .order_by(desc(self.model.updated_at))
             .limit(limit)
@@ -240,6 +516,7 @@ class JobRepository(BaseRepository[AnalysisJob]):
         """
         stmt = (
             select(self.model)
+            .options(*self.default_load_options)
             .where(
                 and_(
                     self.model.media_type == media_type,
@@ -279,6 +556,7 @@ class JobRepository(BaseRepository[AnalysisJob]):
 
         stmt = (
             select(self.model)
+            .options(*self.default_load_options)
             .where(and_(*conditions))
             .order_by(desc(self.model.completed_at))
             .limit(limit)
@@ -301,9 +579,10 @@ class JobRepository(BaseRepository[AnalysisJob]):
         Returns:
             List of stale processing AnalysisJob instances
         """
-        cutoff_time = datetime.utcnow() - datetime.timedelta(minutes=older_than_minutes)
+        cutoff_time = datetime.now(timezone.utc) - timedelta(minutes=older_than_minutes)
         stmt = (
             select(self.model)
+            .options(*self.default_load_options)
             .where(
                 and_(
                     self.model.status == JobStatus.PROCESSING,
@@ -316,6 +595,64 @@ class JobRepository(BaseRepository[AnalysisJob]):
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
 
+    async def transition(
+        self,
+        id_: UUID,
+        status: JobStatus,
+        error_message: Optional[str] = None,
+        worker_id: Optional[str] = None,
+        lease_seconds: int = DEFAULT_LEASE_SECONDS
+    ) -> TransitionResult[AnalysisJob]:
+        """
+        Move a job to a new status, if status_transitions allows it.
+
+        A single conditional UPDATE ... RETURNING (see
+        BaseRepository._transition): a worker that loses a race, or asks
+        for an illegal move, gets a conflict instead of overwriting the
+        winner. Moving a job to processing takes a lease as claim_batch
+        does (held by worker_id, if given), so the reaper recovers it if
+        nobody finishes it; any other move releases the lease, and with a
+        worker_id only the worker holding the lease may make it.
+        Moving a job with a callback_url to completed or failed also queues
+        the callback in the webhook outbox, in this same transaction; the
+        dispatcher delivers it after commit.
+
+        Args:
+            id_: Job UUID
+            status: New JobStatus
+            error_message: Optional error message (for failed jobs)
+            worker_id: Worker taking the job (processing), or the only
+                worker allowed to move it (other statuses)
+            lease_seconds: Lease duration when moving to processing
+
+        Returns:
+            TransitionResult with the updated job, or the conflict
+        """
+        criteria: tuple = ()
+        if status == JobStatus.PROCESSING:
+            values: dict = {
+                "claimed_by": worker_id,
+                "lease_expires_at": func.now() + timedelta(seconds=lease_seconds),
+                "attempts": self.model.attempts + 1,
+            }
+        else:
+            values = {"claimed_by": None, "lease_expires_at": None}
+            if worker_id is not None:
+                criteria = (self.model.claimed_by == worker_id,)
+        if status == JobStatus.COMPLETED:
+            values["completed_at"] = func.now()
+        elif status == JobStatus.FAILED:
+            values["error_message"] = error_message or "Unknown error"
+
+        result = await self._transition(id_, status, criteria=criteria, **values)
+        conflict = result.conflict
+        if criteria and conflict is not None and conflict.current_status in conflict.allowed_from:
+            conflict.reason = f"job is not claimed by worker {worker_id}"
+        job = result.entity
+        if job is not None and job.callback_url and status in CALLBACK_EVENTS:
+            await self._enqueue_callback(job, CALLBACK_EVENTS[status])
+        return result
+
     async def update_status(
         self,
         id_: UUID,
@@ -325,36 +662,36 @@ class JobRepository(BaseRepository[AnalysisJob]):
         """
         Update job status with optional error message.
 
+        Same as transition(), for callers that do not need to tell a
+        missing job from a refused move.
+
         Args:
             id_: Job UUID
             status: New JobStatus
             error_message: Optional error message (for failed jobs)
 
         Returns:
-            Updated AnalysisJob instance or None
-        """
-        update_data: dict = {"status": status, "updated_at": datetime.utcnow()}
-
-        if status == JobStatus.COMPLETED:
-            update_data["completed_at"] = datetime.utcnow()
-        elif status == JobStatus.FAILED:
-            update_data["error_message"] = error_message or "Unknown error"
-
-        stmt = (
-            select(self.model)
-            .where(self.model.id == id_)
-            .execution_options(populate_existing=True)
+            Updated AnalysisJob instance, or None if the job is missing or
+            its current status does not allow the move
+        """
+        result = await self.transition(id_, status, error_message)
+        return result.entity
+
+    async def _enqueue_callback(self, job: AnalysisJob, event: str) -> None:
+        """Queue a webhook for the job's current state in the session's transaction."""
+        await WebhookOutboxRepository(self._session).enqueue(
+            job.id,
+            job.callback_url,
+            event,
+            {
+                "event": event,
+                "job_id": str(job.id),
+                "status": str(job.status),
+                "error_message": job.error_message,
+                "completed_at": job.completed_at.isoformat() if job.completed_at else None,
+                "updated_at": job.updated_at.isoformat() if job.updated_at else None,
+            }
         )
-        result = await self._session.execute(stmt)
-        job = result.scalar_one_or_none()
-
-        if job:
-            for key, value in update_data.items():
-                setattr(job, key, value)
-            await self._session.flush()
-            await self._session.refresh(job)
-
-        return job
 
     async def mark_as_processing(self, id_: UUID) -> Optional[AnalysisJob]:
         """
@@ -402,29 +739,49 @@ class JobRepository(BaseRepository[AnalysisJob]):
         id_: UUID,
         include_media: bool = True,
         include_results: bool = True,
-        include_transcriptions: bool = True
+        include_transcriptions: bool = True,
+        include_logs: bool = False
     ) -> Optional[AnalysisJob]:
         """
         Get a job with its related entities.
 
+        Each requested relationship is loaded with one targeted SELECT ... IN
+        query; the children's back-reference to the job is left unloaded so
+        nested serialization does not recurse into the parent.
+
         Args:
             id_: Job UUID
             include_media: Include related media files
             include_results: Include analysis results
             include_transcriptions: Include transcriptions
+            include_logs: Include processing log entries
 
         Returns:
             AnalysisJob instance with relations loaded or None
         """
-        stmt = select(self.model).where(
-            and_(
-                self.model.id == id_,
-                self.model.is_deleted == False  # type: ignore[attr-defined]
-            )
+        relations = (
+            (include_media, AnalysisJob.media_files, MediaFile.job),
+            (include_results, AnalysisJob.results, AnalysisResult.job),
+            (include_transcriptions, AnalysisJob.transcriptions, Transcription.job),
+            (include_logs, AnalysisJob.processing_logs, ProcessingLog.job),
         )
+        options = [
+            selectinload(collection).noload(back_reference)
+            for included, collection, back_reference in relations
+            if included
+        ]
 
-        # Note: In a real implementation, you would use joinedload or selectinload
-        # to eagerly load relationships. For now, we just fetch the job.
+        stmt = (
+            select(self.model)
+            .options(*options, noload("*"))
+            .where(
+                and_(
+                    self.model.id == id_,
+                    self.model.is_deleted == False  # type: ignore[attr-defined]
+                )
+            )
+            .execution_options(populate_existing=True)
+        )
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
 
@@ -432,21 +789,26 @@ class JobRepository(BaseRepository[AnalysisJob]):
         """
         Get job statistics summary.
 
+        Reads the trigger-maintained job_status_counter table instead of
+        aggregating analysis_job, unless the counter trigger is not
+        installed (a create_all database).
+
         Returns:
             Dictionary with counts by status
         """
-        from sqlalchemy import text
-
-        result = await self._session.execute(
-            text(f"""
-                SELECT
-                    status,
-                    COUNT(*) as count
-                FROM {self.table_name}
-                WHERE is_deleted = false
-                GROUP BY status
-            """)
-        )
+        if await triggers_installed(self._session, self.table_name, STATUS_COUNTER_TRIGGER):
+            stmt = select(
+                JobStatusCounter.status,
+                func.sum(JobStatusCounter.count).label("count")
+            ).group_by(JobStatusCounter.status)
+        else:
+            stmt = select(
+                self.model.status,
+                func.count().label("count")
+            ).where(
+                self.model.is_deleted == False  # type: ignore[attr-defined]
+            ).group_by(self.model.status)
+        result = await self._session.execute(stmt)
         rows = result.fetchall()
 
         stats = {
@@ -458,11 +820,39 @@ class JobRepository(BaseRepository[AnalysisJob]):
         }
 
         for row in rows:
-            stats[row.status] = row.count
-            stats["total"] += row.count
+            stats[row.status] = int(row.count)
+            stats["total"] += int(row.count)
 
         return stats
 
+    async def reconcile_status_counters(self) -> dict:
+        """
+        Rebuild job_status_counter from analysis_job.
+
+        Takes a SHARE lock on analysis_job so no job writes interleave with
+        the recount, then replaces all counter slots with exact totals.
+        Intended for repair after drift; runs in the caller's transaction.
+
+        Returns:
+            Dictionary with the reconciled counts by status
+        """
+        from sqlalchemy import text
+
+        await self._session.execute(
+            text(f"LOCK TABLE {self.table_name} IN SHARE MODE")
+        )
+        await self._session.execute(delete(JobStatusCounter))
+        await self._session.execute(
+            text(f"""
+                INSERT INTO {JobStatusCounter.__tablename__} (status, slot, count)
+                SELECT status::text, 0, COUNT(*)
+                FROM {self.table_name}
+                WHERE is_deleted = false
+                GROUP BY status
+            """)
+        )
+        return await self.get_statistics()
+
     async def search_jobs(
         self,
         query: str,
@@ -471,7 +861,12 @@ class JobRepository(BaseRepository[AnalysisJob]):
         offset: int = 0
     ) -> List[AnalysisJob]:
         """
-        Search jobs by source URL or metadata.
+        Search jobs by source URL or metadata description substring.
+
+        Each predicate matches a GIN trigram index (ix_analysis_job_*_trgm),
+        so the planner can combine them with a BitmapOr instead of scanning
+        the table. Queries shorter than three characters yield no trigrams
+        and degrade to a full index scan.
 
         Args:
             query: Search query string
@@ -481,14 +876,17 @@ class JobRepository(BaseRepository[AnalysisJob]):
         Returns:
             List of matching AnalysisJob instances
         """
-        search_pattern = f"%{query}%"
+        search_pattern = contains_pattern(query)
+        # Literal key so the expression matches the index expression exactly
+        description = self.model.metadata_json.op("->>")(literal_column("'description'"))
         stmt = (
             select(self.model)
+            .options(*self.default_load_options)
             .where(
                 and_(
                     or_(
-                        self.model.source_url.ilike(search_pattern),
-                        self.model.metadata_json["description"].as_string().ilike(search_pattern)
+                        self.model.source_url.ilike(search_pattern, escape=LIKE_ESCAPE),
+                        description.ilike(search_pattern, escape=LIKE_ESCAPE)
                     ),
                     self.model.is_deleted == False  # type: ignore[attr-defined]
                 )
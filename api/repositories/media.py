@@ -12,7 +12,8 @@ from sqlalchemy import select, desc, and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.models.media import MediaFile, FileType, MediaFileStatus
-from api.repositories.base import BaseRepository
+from api.repositories.base import BaseRepository, LIKE_ESCAPE, contains_pattern
+from api.repositories.transitions import TransitionResult
 
 
 class MediaRepository(BaseRepository[MediaFile]):
@@ -29,6 +30,21 @@ class MediaRepository(BaseRepository[MediaFile]):
         ```
     """
 
+    # Forward through download and processing; failed files may be retried
+    status_transitions = {
+        MediaFileStatus.PENDING: frozenset({MediaFileStatus.FAILED}),
+        MediaFileStatus.DOWNLOADING: frozenset({MediaFileStatus.PENDING}),
+        MediaFileStatus.DOWNLOADED: frozenset({MediaFileStatus.PENDING, MediaFileStatus.DOWNLOADING}),
+        MediaFileStatus.PROCESSING: frozenset({MediaFileStatus.PENDING, MediaFileStatus.DOWNLOADED}),
+        MediaFileStatus.COMPLETED: frozenset({MediaFileStatus.DOWNLOADED, MediaFileStatus.PROCESSING}),
+        MediaFileStatus.FAILED: frozenset({
+            MediaFileStatus.PENDING,
+            MediaFileStatus.DOWNLOADING,
+            MediaFileStatus.DOWNLOADED,
+            MediaFileStatus.PROCESSING,
+        }),
+    }
+
     def __init__(self, session: AsyncSession) -> None:
         """
         Initialize MediaRepository with MediaFile model.
@@ -300,15 +316,18 @@ class MediaRepository(BaseRepository[MediaFile]):
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
 
-    async def update_status(
+    async def transition(
         self,
         id_: UUID,
         status: MediaFileStatus,
         cdn_url: Optional[str] = None,
         file_size: Optional[int] = None
-    ) -> Optional[MediaFile]:
+    ) -> TransitionResult[MediaFile]:
         """
-        Update media file status with optional additional fields.
+        Move a media file to a new status, if status_transitions allows it.
+
+        A single conditional UPDATE ... RETURNING (see
+        BaseRepository._transition).
 
         Args:
             id_: Media file UUID
@@ -317,30 +336,38 @@ class MediaRepository(BaseRepository[MediaFile]):
             file_size: Optional updated file size
 
         Returns:
-            Updated MediaFile instance or None
+            TransitionResult with the updated file, or the conflict
         """
-        update_data: dict = {"status": status, "updated_at": datetime.utcnow()}
-
+        values: dict = {}
         if cdn_url is not None:
-            update_data["cdn_url"] = cdn_url
+            values["cdn_url"] = cdn_url
         if file_size is not None:
-            update_data["file_size"] = file_size
+            values["file_size"] = file_size
 
-        stmt = (
-            select(self.model)
-            .where(self.model.id == id_)
-            .execution_options(populate_existing=True)
-        )
-        result = await self._session.execute(stmt)
-        media_file = result.scalar_one_or_none()
+        return await self._transition(id_, status, **values)
+
+    async def update_status(
+        self,
+        id_: UUID,
+        status: MediaFileStatus,
+        cdn_url: Optional[str] = None,
+        file_size: Optional[int] = None
+    ) -> Optional[MediaFile]:
+        """
+        Update media file status with optional additional fields.
 
-        if media_file:
-            for key, value in update_data.items():
-                setattr(media_file, key, value)
-            await self._session.flush()
-            await self._session.refresh(media_file)
+        Args:
+            id_: Media file UUID
+            status: New MediaFileStatus
+            cdn_url: Optional updated CDN URL
+            file_size: Optional updated file size
 
-        return media_file
+        Returns:
+            Updated MediaFile instance, or None if the file is missing or
+            its current status does not allow the move
+        """
+        result = await self.transition(id_, status, cdn_url, file_size)
+        return result.entity
 
     async def mark_as_downloading(self, id_: UUID) -> Optional[MediaFile]:
         """
@@ -456,7 +483,12 @@ class MediaRepository(BaseRepository[MediaFile]):
         offset: int = 0
     ) -> List[MediaFile]:
         """
-        Search files by filename or original URL.
+        Search files by filename, original URL or CDN URL substring.
+
+        Each predicate matches a GIN trigram index (ix_media_file_*_trgm),
+        so the planner can combine them with a BitmapOr instead of scanning
+        the table. Queries shorter than three characters yield no trigrams
+        and degrade to a full index scan.
 
         Args:
             query: Search query string
@@ -466,15 +498,15 @@ class MediaRepository(BaseRepository[MediaFile]):
         Returns:
             List of matching MediaFile instances
         """
-        search_pattern = f"%{query}%"
+        search_pattern = contains_pattern(query)
         stmt = (
             select(self.model)
             .where(
                 and_(
                     or_(
-                        self.model.filename.ilike(search_pattern),
-                        self.model.original_url.ilike(search_pattern),
-                        self.model.cdn_url.ilike(search_pattern)
+                        self.model.filename.ilike(search_pattern, escape=LIKE_ESCAPE),
+                        self.model.original_url.ilike(search_pattern, escape=LIKE_ESCAPE),
+                        self.model.cdn_url.ilike(search_pattern, escape=LIKE_ESCAPE)
                     ),
                     self.model.is_deleted == False  # type: ignore[attr-defined]
                 )
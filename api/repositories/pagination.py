@@ -0,0 +1,62 @@
+"""
+Pagination Module
+
+Opaque keyset cursors for (created_at, id) ordered listings.
+
+A cursor encodes the sort key of the last row on a page. The next page is
+fetched with a row-value comparison against that key instead of OFFSET, so
+page N costs the same as page 1 regardless of table size.
+"""
+
+import base64
+from datetime import datetime
+from typing import Tuple
+from uuid import UUID
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def encode_cursor(created_at: datetime, id_: UUID) -> str:
+    """
+    Encode a (created_at, id) sort key as an opaque cursor string.
+
+    Args:
+        created_at: Creation timestamp of the last row on the page
+        id_: Primary key of the last row on the page
+
+    Returns:
+        URL-safe cursor string
+    """
+    raw = f"{created_at.isoformat()}|{id_}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    Decode an opaque cursor string into its (created_at, id) sort key.
+
+    Args:
+        cursor: Cursor string produced by encode_cursor
+
+    Returns:
+        Tuple of (created_at, id)
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        created_at, id_ = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), UUID(id_)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise InvalidCursorError(f"Invalid pagination cursor: {cursor!r}") from e
+
+
+__all__ = [
+    "InvalidCursorError",
+    "encode_cursor",
+    "decode_cursor",
+]
@@ -1,17 +1,37 @@
 """
 ProcessingLog Repository Module
 
-Repository for managing ProcessingLog entries with audit trail functionality.
+Repository for managing ProcessingLog entries with audit trail functionality,
+plus maintenance of the table's monthly partitions.
 """
 
-from typing import Optional
-from uuid import UUID
+import re
+from datetime import date, datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
 
-from sqlalchemy import select
+from sqlalchemy import insert, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.models.processing_log import ProcessingLog, ProcessingStage, ProcessingLogStatus
 from api.repositories.base import BaseRepository
+from api.services.log_sink import get_log_sink
+
+
+# Monthly partitions are named processing_log_yYYYYmMM (see migration 000000000009)
+PARTITION_NAME_RE = re.compile(r"^processing_log_y(\d{4})m(\d{2})$")
+
+
+def _month_start(value: Optional[datetime] = None) -> date:
+    """First day of the UTC month containing value (default: now)."""
+    value = value or datetime.now(timezone.utc)
+    return date(value.year, value.month, 1)
+
+
+def _add_months(month: date, months: int) -> date:
+    """Shift a month-start date by a number of months."""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
 
 
 class ProcessingLogRepository(BaseRepository[ProcessingLog]):
@@ -145,6 +165,59 @@ class ProcessingLogRepository(BaseRepository[ProcessingLog]):
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
 
+    async def _log(self, **values: Any) -> ProcessingLog:
+        """
+        Record a log entry through the buffered sink when it is running.
+
+        With the sink, the entry is written after the caller's transaction
+        commits, in a batch, and the returned instance is transient (id and
+        created_at are set client-side). Without it, the entry is inserted in
+        the caller's transaction as before.
+
+        Args:
+            **values: ProcessingLog field values
+
+        Returns:
+            ProcessingLog instance
+        """
+        sink = get_log_sink()
+        if sink is None:
+            return await self.create(**values)
+
+        values.setdefault("id", uuid4())
+        values.setdefault("created_at", datetime.now(timezone.utc))
+        await sink.stage(self._session, values)
+        return self._model(**values)
+
+    async def log_many(self, entries: List[Dict[str, Any]]) -> int:
+        """
+        Record several log entries at once.
+
+        Through the buffered sink when it is running; otherwise one
+        multi-row INSERT in the caller's transaction, with no refresh.
+
+        Args:
+            entries: ProcessingLog field values, one dict per entry
+
+        Returns:
+            Number of entries recorded
+        """
+        now = datetime.now(timezone.utc)
+        rows = [
+            dict(entry, id=entry.get("id") or uuid4(), created_at=entry.get("created_at") or now)
+            for entry in entries
+        ]
+        if not rows:
+            return 0
+
+        sink = get_log_sink()
+        if sink is None:
+            await self._session.execute(insert(self._model), rows)
+        else:
+            for row in rows:
+                await sink.stage(self._session, row)
+        return len(rows)
+
     async def log_start(
         self,
         job_id: UUID,
@@ -164,7 +237,7 @@ class ProcessingLogRepository(BaseRepository[ProcessingLog]):
         Returns:
             Created ProcessingLog instance
         """
-        return await self.create(
+        return await self._log(
             job_id=job_id,
             stage=stage,
             status=ProcessingLogStatus.STARTED,
@@ -193,7 +266,7 @@ class ProcessingLogRepository(BaseRepository[ProcessingLog]):
         Returns:
             Created ProcessingLog instance
         """
-        return await self.create(
+        return await self._log(
             job_id=job_id,
             stage=stage,
             status=ProcessingLogStatus.COMPLETED,
@@ -223,7 +296,7 @@ class ProcessingLogRepository(BaseRepository[ProcessingLog]):
         Returns:
             Created ProcessingLog instance
         """
-        return await self.create(
+        return await self._log(
             job_id=job_id,
             stage=stage,
             status=ProcessingLogStatus.FAILED,
@@ -253,7 +326,7 @@ class ProcessingLogRepository(BaseRepository[ProcessingLog]):
         Returns:
             Created ProcessingLog instance
         """
-        return await self.create(
+        return await self._log(
             job_id=job_id,
             stage=stage,
             status=ProcessingLogStatus.WARNING,
@@ -278,3 +351,92 @@ class ProcessingLogRepository(BaseRepository[ProcessingLog]):
         )
         result = await self._session.execute(stmt)
         return result.scalar() or 0
+
+    # =========================================================================
+    # Partition maintenance
+    # =========================================================================
+
+    async def create_partitions(
+        self,
+        months_ahead: int = 3,
+        *,
+        now: Optional[datetime] = None
+    ) -> List[str]:
+        """
+        Ensure monthly partitions exist from the current month onwards.
+
+        Idempotent; run it regularly (e.g. daily from cron) so inserts never
+        fall into the DEFAULT partition.
+
+        Args:
+            months_ahead: Number of future months to create beyond the current one
+            now: Reference time (default: current UTC time)
+
+        Returns:
+            Names of the partitions covering the requested months
+        """
+        start = _month_start(now)
+        names = []
+        for offset in range(months_ahead + 1):
+            result = await self._session.execute(
+                text("SELECT processing_log_create_partition(:month)"),
+                {"month": _add_months(start, offset)}
+            )
+            names.append(result.scalar_one())
+        return names
+
+    async def list_partitions(self) -> List[Tuple[str, date]]:
+        """
+        List the monthly partitions attached to processing_log.
+
+        Returns:
+            (partition name, month start) tuples, oldest first; the DEFAULT
+            partition is not included
+        """
+        result = await self._session.execute(text("""
+            SELECT child.relname
+            FROM pg_inherits
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE pg_inherits.inhparent = 'processing_log'::regclass
+        """))
+        partitions = []
+        for (name,) in result.all():
+            match = PARTITION_NAME_RE.match(name)
+            if match:
+                partitions.append((name, date(int(match.group(1)), int(match.group(2)), 1)))
+        return sorted(partitions, key=lambda partition: partition[1])
+
+    async def retire_partitions(
+        self,
+        retention_months: int,
+        *,
+        detach_only: bool = False,
+        now: Optional[datetime] = None
+    ) -> List[str]:
+        """
+        Detach (and by default drop) partitions older than the retention window.
+
+        A partition is retired once its whole month precedes the first day
+        of the month `retention_months` before now. Dropping a partition is a
+        catalog operation, unlike a row-by-row DELETE.
+
+        Args:
+            retention_months: Whole months of logs to keep before the current month
+            detach_only: Detach partitions but keep them as standalone tables
+                (e.g. for archiving) instead of dropping them
+            now: Reference time (default: current UTC time)
+
+        Returns:
+            Names of the retired partitions
+        """
+        cutoff = _add_months(_month_start(now), -retention_months)
+        retired = []
+        for name, month in await self.list_partitions():
+            if _add_months(month, 1) > cutoff:
+                continue
+            # name is validated by PARTITION_NAME_RE, safe to interpolate
+            await self._session.execute(text(f"ALTER TABLE processing_log DETACH PARTITION {name}"))
+            if not detach_only:
+                await self._session.execute(text(f"DROP TABLE {name}"))
+            retired.append(name)
+        return retired
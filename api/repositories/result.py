@@ -4,15 +4,27 @@ Result Repository Module
 Repository for AnalysisResult model with result-specific query methods.
 """
 
+import json
 from datetime import datetime
-from typing import Optional, List
-from uuid import UUID
+from typing import Any, Dict, Optional, List, Tuple
+from uuid import UUID, uuid4
 
-from sqlalchemy import select, desc, and_, func
+from sqlalchemy import select, insert, desc, and_, func, literal_column
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import noload
 
-from api.models.result import AnalysisResult, AnalysisProvider
+from api.models.provider_rollup import LATENCY_BUCKET_BOUNDS_MS, RESULT_ROLLUP_TRIGGERS, ResultHourlyRollup
+from api.models.result import AnalysisResult, AnalysisProvider, RESULT_SEARCH_CONFIG
 from api.repositories.base import BaseRepository
+from api.repositories.rollup import (
+    apply_window,
+    as_utc,
+    histogram_buckets,
+    histogram_quantile,
+    hour_floor,
+    time_bucket,
+)
+from api.repositories.triggers import require_triggers, triggers_installed
 
 
 class ResultRepository(BaseRepository[AnalysisResult]):
@@ -29,6 +41,9 @@ class ResultRepository(BaseRepository[AnalysisResult]):
         ```
     """
 
+    # Results rarely change after ingestion and are polled by id
+    cache_enabled = True
+
     def __init__(self, session: AsyncSession) -> None:
         """
         Initialize ResultRepository with AnalysisResult model.
@@ -42,12 +57,86 @@ class ResultRepository(BaseRepository[AnalysisResult]):
         """Get a result by its UUID."""
         return await super().get_by_id(id_)
 
+    # Column order used by the COPY ingestion path. COPY bypasses client-side
+    # defaults, so every NOT NULL column without a server default is listed
+    # (is_active exists only in the migrated table, not on the model)
+    COPY_COLUMNS = (
+        "id", "job_id", "provider", "model", "result_json",
+        "confidence", "tokens_used", "latency_ms",
+        "is_active", "is_deleted",
+    )
+
+    async def bulk_create(self, rows: List[Dict[str, Any]]) -> List[UUID]:
+        """
+        Insert many results with multi-row INSERT ... RETURNING.
+
+        Rows are sent as batched multi-row VALUES statements and only the
+        generated ids come back, in the same order as the input rows.
+
+        Args:
+            rows: Column-value dictionaries for the new results
+
+        Returns:
+            List of inserted result IDs in input order
+        """
+        if not rows:
+            return []
+
+        stmt = insert(self.model).returning(self.model.id, sort_by_parameter_order=True)
+        result = await self._session.execute(stmt, rows)
+        return list(result.scalars().all())
+
+    async def copy_create(self, rows: List[Dict[str, Any]]) -> List[UUID]:
+        """
+        Insert many results through the PostgreSQL COPY protocol.
+
+        Faster than INSERT for very large batches. COPY cannot return rows
+        and skips client-side defaults, so IDs and the is_active/is_deleted
+        flags are filled in here; server defaults still apply to the
+        timestamp columns. Requires the asyncpg driver.
+
+        Args:
+            rows: Column-value dictionaries for the new results
+
+        Returns:
+            List of inserted result IDs in input order
+        """
+        if not rows:
+            return []
+
+        ids = [row.get("id") or uuid4() for row in rows]
+        records = [
+            (
+                id_,
+                row["job_id"],
+                str(row["provider"]),
+                row["model"],
+                json.dumps(row.get("result_json") or {}),
+                row.get("confidence"),
+                row.get("tokens_used"),
+                row.get("latency_ms"),
+                True,
+                False,
+            )
+            for id_, row in zip(ids, rows)
+        ]
+
+        connection = await self._session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            self.table_name,
+            records=records,
+            columns=list(self.COPY_COLUMNS),
+        )
+        return ids
+
     async def get_by_job_id(
         self,
         job_id: UUID,
         *,
         offset: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        cursor: Optional[str] = None
     ) -> List[AnalysisResult]:
         """
         Retrieve all results for a specific job.
@@ -56,6 +145,7 @@ class ResultRepository(BaseRepository[AnalysisResult]):
             job_id: UUID of the parent job
             offset: Number of records to skip
             limit: Maximum number of records to return
+            cursor: Opaque keyset cursor from a previous page
 
         Returns:
             List of AnalysisResult instances
@@ -68,10 +158,8 @@ class ResultRepository(BaseRepository[AnalysisResult]):
                     self.model.is_deleted == False  # type: ignore[attr-defined]
                 )
             )
-            .order_by(desc(self.model.created_at))
-            .offset(offset)
-            .limit(limit)
         )
+        stmt = self._paginate(stmt, offset=offset, limit=limit, cursor=cursor)
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
 
@@ -80,7 +168,8 @@ class ResultRepository(BaseRepository[AnalysisResult]):
         provider: AnalysisProvider,
         *,
         offset: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        cursor: Optional[str] = None
     ) -> List[AnalysisResult]:
         """
         Retrieve all results from a specific provider.
@@ -89,6 +178,7 @@ class ResultRepository(BaseRepository[AnalysisResult]):
             provider: AnalysisProvider enum value
             offset: Number of records to skip
             limit: Maximum number of records to return
+            cursor: Opaque keyset cursor from a previous page
 
         Returns:
             List of AnalysisResult instances
@@ -101,10 +191,8 @@ class ResultRepository(BaseRepository[AnalysisResult]):
                     self.model.is_deleted == False  # type: ignore[attr-defined]
                 )
             )
-            .order_by(desc(self.model.created_at))
-            .offset(offset)
-            .limit(limit)
         )
+        stmt = self._paginate(stmt, offset=offset, limit=limit, cursor=cursor)
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
 
@@ -145,6 +233,7 @@ class ResultRepository(BaseRepository[AnalysisResult]):
         self,
         min_confidence: float = 0.9,
         *,
+        offset: int = 0,
         limit: int = 100
     ) -> List[AnalysisResult]:
         """
@@ -152,6 +241,7 @@ class ResultRepository(BaseRepository[AnalysisResult]):
 
         Args:
             min_confidence: Minimum confidence score (default: 0.9)
+            offset: Number of records to skip
             limit: Maximum number of results to return
 
         Returns:
@@ -166,6 +256,7 @@ class ResultRepository(BaseRepository[AnalysisResult]):
                 )
             )
             .order_by(desc(self.model.confidence))
+            .offset(offset)
             .limit(limit)
         )
         result = await self._session.execute(stmt)
@@ -319,44 +410,184 @@ class ResultRepository(BaseRepository[AnalysisResult]):
         result = await self._session.execute(stmt)
         return float(result.scalar() or 0)
 
-    async def get_statistics_by_provider(self) -> dict:
+    async def get_provider_rollups(
+        self,
+        *,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        by_model: bool = False,
+        granularity: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Aggregate result statistics over a time window from the hourly rollups.
+
+        Reads result_hourly_rollup, which triggers keep current on every
+        result write, so the cost depends on the number of hours and
+        providers in the window rather than on the number of results.
+
+        Args:
+            since: Window start (rounded down to the hour; None: unbounded)
+            until: Window end, exclusive (None: unbounded)
+            by_model: Group by provider and model instead of provider only
+            granularity: Also group by time bucket (see ROLLUP_GRANULARITIES)
+
+        Returns:
+            One dict per group with counts, averages, token totals, a latency
+            histogram and latency quantile estimates
+
+        Raises:
+            ValueError: If granularity is not supported
+            MissingTriggersError: If the rollup triggers are not installed
+        """
+        await require_triggers(self._session, self.table_name, *RESULT_ROLLUP_TRIGGERS)
+        rollup = ResultHourlyRollup
+        keys: List[Any] = [rollup.provider.label("provider")]
+        if by_model:
+            keys.append(rollup.model.label("model"))
+        if granularity:
+            keys.insert(0, time_bucket(rollup.bucket, granularity))
+
+        result_count = func.sum(rollup.result_count)
+        stmt = (
+            select(
+                *keys,
+                result_count.label("result_count"),
+                func.sum(rollup.confidence_count).label("confidence_count"),
+                func.sum(rollup.confidence_sum).label("confidence_sum"),
+                func.sum(rollup.tokens_sum).label("tokens_sum"),
+                func.sum(rollup.latency_count).label("latency_count"),
+                func.sum(rollup.latency_sum).label("latency_sum"),
+                *(
+                    func.sum(rollup.latency_buckets[i + 1]).label(f"latency_bucket_{i}")
+                    for i in range(len(LATENCY_BUCKET_BOUNDS_MS) + 1)
+                ),
+            )
+            .group_by(*keys)
+            .having(result_count > 0)
+            .order_by(*(keys[:1] if granularity else []), result_count.desc())
+        )
+        stmt = apply_window(stmt, rollup.bucket, since, until)
+        result = await self._session.execute(stmt)
+
+        rows = []
+        for row in result.mappings():
+            counts = [
+                int(row[f"latency_bucket_{i}"] or 0)
+                for i in range(len(LATENCY_BUCKET_BOUNDS_MS) + 1)
+            ]
+            entry = {key: row[key] for key in ("bucket", "provider", "model") if key in row}
+            entry.update({
+                "result_count": int(row["result_count"]),
+                "avg_confidence": (
+                    float(row["confidence_sum"]) / int(row["confidence_count"])
+                    if row["confidence_count"] else None
+                ),
+                "total_tokens": int(row["tokens_sum"] or 0),
+                "avg_latency_ms": (
+                    float(row["latency_sum"]) / int(row["latency_count"])
+                    if row["latency_count"] else None
+                ),
+                "latency_p50_ms": histogram_quantile(counts, LATENCY_BUCKET_BOUNDS_MS, 0.50),
+                "latency_p95_ms": histogram_quantile(counts, LATENCY_BUCKET_BOUNDS_MS, 0.95),
+                "latency_p99_ms": histogram_quantile(counts, LATENCY_BUCKET_BOUNDS_MS, 0.99),
+                "latency_histogram": histogram_buckets(counts, LATENCY_BUCKET_BOUNDS_MS),
+            })
+            rows.append(entry)
+        return rows
+
+    async def get_statistics_by_provider(
+        self,
+        *,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None
+    ) -> dict:
         """
         Get statistics grouped by provider.
 
+        Counts, token totals and averages come from the hourly rollups (see
+        get_provider_rollups). job_count is a distinct count, which cannot
+        be summed across hours, so it is still counted from analysis_result
+        (ix_analysis_result_job_provider covers the unbounded count). As
+        before the rollups, averages count missing values as 0. Without the
+        rollup triggers (a create_all database) everything is aggregated
+        from analysis_result.
+
+        Args:
+            since: Window start (rounded down to the hour; None: unbounded)
+            until: Window end, exclusive (None: unbounded)
+
         Returns:
             Dictionary with provider stats
         """
-        from sqlalchemy import text
-
-        result = await self._session.execute(
-            text(f"""
-                SELECT
-                    provider,
-                    COUNT(*) as result_count,
-                    COUNT(DISTINCT job_id) as job_count,
-                    AVG(COALESCE(confidence, 0)) as avg_confidence,
-                    SUM(COALESCE(tokens_used, 0)) as total_tokens,
-                    AVG(COALESCE(latency_ms, 0)) as avg_latency
-                FROM {self.table_name}
-                WHERE is_deleted = false
-                GROUP BY provider
-                ORDER BY result_count DESC
-            """)
-        )
-        rows = result.fetchall()
+        job_count = func.count(func.distinct(self.model.job_id)).label("job_count")
+        if not await triggers_installed(self._session, self.table_name, *RESULT_ROLLUP_TRIGGERS):
+            stmt = select(
+                self.model.provider,
+                func.count().label("result_count"),
+                job_count,
+                func.sum(func.coalesce(self.model.confidence, 0)).label("confidence_sum"),
+                func.sum(func.coalesce(self.model.tokens_used, 0)).label("tokens_sum"),
+                func.sum(func.coalesce(self.model.latency_ms, 0)).label("latency_sum"),
+            )
+            rows = await self._provider_aggregate(stmt, since, until)
+        else:
+            rollup = ResultHourlyRollup
+            result_count = func.sum(rollup.result_count)
+            stmt = (
+                select(
+                    rollup.provider,
+                    result_count.label("result_count"),
+                    func.sum(rollup.confidence_sum).label("confidence_sum"),
+                    func.sum(rollup.tokens_sum).label("tokens_sum"),
+                    func.sum(rollup.latency_sum).label("latency_sum"),
+                )
+                .group_by(rollup.provider)
+                .having(result_count > 0)
+            )
+            result = await self._session.execute(apply_window(stmt, rollup.bucket, since, until))
+            rollups = result.fetchall()
+            job_counts = {
+                str(row["provider"]): row["job_count"]
+                for row in await self._provider_aggregate(
+                    select(self.model.provider, job_count), since, until
+                )
+            }
+            rows = [
+                {**row._mapping, "job_count": job_counts.get(row.provider, 0)}
+                for row in rollups
+            ]
 
         stats = {}
-        for row in rows:
-            stats[row.provider] = {
-                "result_count": row.result_count,
-                "job_count": row.job_count,
-                "avg_confidence": float(row.avg_confidence) if row.avg_confidence else 0,
-                "total_tokens": row.total_tokens,
-                "avg_latency_ms": float(row.avg_latency) if row.avg_latency else 0
+        for row in sorted(rows, key=lambda row: row["result_count"], reverse=True):
+            count = int(row["result_count"])
+            stats[str(row["provider"])] = {
+                "result_count": count,
+                "job_count": int(row["job_count"]),
+                "avg_confidence": float(row["confidence_sum"] or 0) / count,
+                "total_tokens": int(row["tokens_sum"] or 0),
+                "avg_latency_ms": float(row["latency_sum"] or 0) / count
             }
 
         return stats
 
+    async def _provider_aggregate(
+        self,
+        stmt: Any,
+        since: Optional[datetime],
+        until: Optional[datetime]
+    ) -> List[Dict[str, Any]]:
+        """Run a per-provider aggregate over active results in [since, until)."""
+        stmt = stmt.where(
+            self.model.is_deleted == False  # type: ignore[attr-defined]
+        ).group_by(self.model.provider)
+        if since is not None:
+            # Match the hourly resolution of the rollups
+            stmt = stmt.where(self.model.created_at >= hour_floor(since))
+        if until is not None:
+            stmt = stmt.where(self.model.created_at < as_utc(until))
+        result = await self._session.execute(stmt)
+        return [dict(row) for row in result.mappings()]
+
     async def get_latest_results(
         self,
         *,
@@ -386,9 +617,13 @@ class ResultRepository(BaseRepository[AnalysisResult]):
         *,
         limit: int = 50,
         offset: int = 0
-    ) -> List[AnalysisResult]:
+    ) -> List[Tuple[AnalysisResult, float]]:
         """
-        Search results by model name or result content.
+        Full-text search results by model name and result content.
+
+        Matches the web-search style query (quoted phrases, OR, -exclusion)
+        against the GIN-indexed search_vector column and ranks hits with
+        ts_rank_cd, model matches weighing more than result_json text.
 
         Args:
             query: Search query string
@@ -396,23 +631,25 @@ class ResultRepository(BaseRepository[AnalysisResult]):
             offset: Number of records to skip
 
         Returns:
-            List of matching AnalysisResult instances
+            List of (AnalysisResult, rank) tuples, best match first
         """
-        search_pattern = f"%{query}%"
+        ts_query = func.websearch_to_tsquery(
+            literal_column(f"'{RESULT_SEARCH_CONFIG}'::regconfig"),
+            query
+        )
+        rank = func.ts_rank_cd(self.model.search_vector, ts_query).label("rank")
         stmt = (
-            select(self.model)
+            select(self.model, rank)
+            .options(noload("*"))
             .where(
                 and_(
-                    or_(
-                        self.model.model.ilike(search_pattern),
-                        self.model.result_json.cast(str).ilike(search_pattern)
-                    ),
+                    self.model.search_vector.bool_op("@@")(ts_query),
                     self.model.is_deleted == False  # type: ignore[attr-defined]
                 )
             )
-            .order_by(desc(self.model.created_at))
+            .order_by(desc(rank), desc(self.model.created_at))
             .limit(limit)
             .offset(offset)
         )
         result = await self._session.execute(stmt)
-        return list(result.scalars().all())
+        return [(row[0], row[1]) for row in result.all()]
@@ -0,0 +1,121 @@
+"""
+Hourly Rollup Query Helpers
+
+Shared pieces of the provider statistics queries over the trigger-maintained
+hourly rollup tables (see api.models.provider_rollup): time-window
+filtering, coarser time buckets and latency histogram quantiles.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import func, literal_column
+from sqlalchemy.sql import ColumnElement, Select
+
+
+# Time buckets a rollup query can group by (rollups themselves are hourly)
+ROLLUP_GRANULARITIES = ("hour", "day", "week", "month")
+
+
+def as_utc(value: datetime) -> datetime:
+    """Convert a datetime to UTC, treating naive values as UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def hour_floor(value: datetime) -> datetime:
+    """Truncate a datetime to the start of its UTC hour."""
+    return as_utc(value).replace(minute=0, second=0, microsecond=0)
+
+
+def apply_window(
+    stmt: Select,
+    bucket: ColumnElement,
+    since: Optional[datetime],
+    until: Optional[datetime]
+) -> Select:
+    """
+    Restrict a rollup query to the hours overlapping [since, until).
+
+    Rollups have hourly resolution, so a window that does not start on the
+    hour includes its whole first hour.
+
+    Args:
+        stmt: Select over a rollup table
+        bucket: The table's bucket column
+        since: Window start (None: unbounded)
+        until: Window end, exclusive (None: unbounded)
+
+    Returns:
+        Filtered Select statement
+    """
+    if since is not None:
+        stmt = stmt.where(bucket >= hour_floor(since))
+    if until is not None:
+        stmt = stmt.where(bucket < as_utc(until))
+    return stmt
+
+
+def time_bucket(bucket: ColumnElement, granularity: str) -> ColumnElement:
+    """
+    Coarser UTC time bucket over an hourly bucket column, labelled "bucket".
+
+    The unit is rendered inline rather than bound, so the expression in the
+    SELECT list and in GROUP BY compare equal.
+
+    Raises:
+        ValueError: If granularity is not one of ROLLUP_GRANULARITIES
+    """
+    if granularity not in ROLLUP_GRANULARITIES:
+        raise ValueError(f"Unsupported granularity: {granularity!r}")
+    return func.date_trunc(
+        literal_column(f"'{granularity}'"), bucket, literal_column("'UTC'")
+    ).label("bucket")
+
+
+def histogram_quantile(
+    counts: Sequence[int],
+    bounds: Sequence[int],
+    quantile: float
+) -> Optional[int]:
+    """
+    Estimate a quantile from histogram bucket counts.
+
+    Args:
+        counts: Count per bucket (one more than bounds; the last is open-ended)
+        bounds: Exclusive upper bound of each bucket but the last
+        quantile: Quantile between 0 and 1
+
+    Returns:
+        Upper bound of the bucket holding the quantile, or None if the
+        histogram is empty or the quantile is in the open-ended bucket
+    """
+    total = sum(counts)
+    if total <= 0:
+        return None
+    cumulative = 0
+    for bound, count in zip(bounds, counts):
+        cumulative += count
+        if cumulative >= quantile * total:
+            return bound
+    return None
+
+
+def histogram_buckets(counts: Sequence[int], bounds: Sequence[int]) -> List[Dict[str, Any]]:
+    """Pair bucket counts with their exclusive upper bounds (None: open-ended)."""
+    return [
+        {"lt_ms": bound, "count": count}
+        for bound, count in zip(list(bounds) + [None], counts)
+    ]
+
+
+__all__ = [
+    "ROLLUP_GRANULARITIES",
+    "apply_window",
+    "as_utc",
+    "histogram_buckets",
+    "histogram_quantile",
+    "hour_floor",
+    "time_bucket",
+]
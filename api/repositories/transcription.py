@@ -5,14 +5,18 @@ Repository for Transcription model with transcription-specific query methods.
 """
 
 from datetime import datetime
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 from uuid import UUID
 
-from sqlalchemy import select, desc, and_, func
+from sqlalchemy import select, desc, and_, func, literal_column
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from api.models.provider_rollup import TRANSCRIPTION_ROLLUP_TRIGGERS, TranscriptionHourlyRollup
+from api.models.transcript_segment import TranscriptSegment, SEGMENT_SEARCH_CONFIG
 from api.models.transcription import Transcription, TranscriptionProvider
 from api.repositories.base import BaseRepository
+from api.repositories.rollup import apply_window, as_utc, hour_floor, time_bucket
+from api.repositories.triggers import require_triggers, triggers_installed
 
 
 class TranscriptionRepository(BaseRepository[Transcription]):
@@ -332,46 +336,156 @@ class TranscriptionRepository(BaseRepository[Transcription]):
 
         return distribution
 
-    async def get_statistics_by_provider(self) -> dict:
+    async def get_provider_rollups(
+        self,
+        *,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        by_language: bool = False,
+        granularity: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Aggregate transcription statistics over a time window from the hourly rollups.
+
+        Reads transcription_hourly_rollup, which triggers keep current on
+        every transcription write.
+
+        Args:
+            since: Window start (rounded down to the hour; None: unbounded)
+            until: Window end, exclusive (None: unbounded)
+            by_language: Group by provider and language instead of provider only
+            granularity: Also group by time bucket (see ROLLUP_GRANULARITIES)
+
+        Returns:
+            One dict per group with the transcription count and media durations
+
+        Raises:
+            ValueError: If granularity is not supported
+            MissingTriggersError: If the rollup triggers are not installed
+        """
+        await require_triggers(self._session, self.table_name, *TRANSCRIPTION_ROLLUP_TRIGGERS)
+        rollup = TranscriptionHourlyRollup
+        keys: List[Any] = [rollup.provider.label("provider")]
+        if by_language:
+            keys.append(rollup.language.label("language"))
+        if granularity:
+            keys.insert(0, time_bucket(rollup.bucket, granularity))
+
+        transcription_count = func.sum(rollup.transcription_count)
+        stmt = (
+            select(
+                *keys,
+                transcription_count.label("transcription_count"),
+                func.sum(rollup.duration_sum).label("duration_sum"),
+            )
+            .group_by(*keys)
+            .having(transcription_count > 0)
+            .order_by(*(keys[:1] if granularity else []), transcription_count.desc())
+        )
+        stmt = apply_window(stmt, rollup.bucket, since, until)
+        result = await self._session.execute(stmt)
+
+        rows = []
+        for row in result.mappings():
+            count = int(row["transcription_count"])
+            duration = float(row["duration_sum"] or 0)
+            entry = {key: row[key] for key in ("bucket", "provider", "language") if key in row}
+            entry.update({
+                "transcription_count": count,
+                "total_duration_seconds": duration,
+                "avg_duration_seconds": duration / count,
+            })
+            rows.append(entry)
+        return rows
+
+    async def get_statistics_by_provider(
+        self,
+        *,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None
+    ) -> dict:
         """
         Get statistics grouped by provider.
 
+        Counts and durations come from the hourly rollups (see
+        get_provider_rollups). job_count is a distinct count, which cannot
+        be summed across hours, so it is still counted from transcription
+        (ix_transcription_job_provider covers the unbounded count). Without
+        the rollup triggers (a create_all database) everything is
+        aggregated from transcription.
+
+        Args:
+            since: Window start (rounded down to the hour; None: unbounded)
+            until: Window end, exclusive (None: unbounded)
+
         Returns:
             Dictionary with provider stats
         """
-        from sqlalchemy import text
-
-        result = await self._session.execute(
-            text(f"""
-                SELECT
-                    provider,
-                    COUNT(*) as transcription_count,
-                    COUNT(DISTINCT job_id) as job_count,
-                    AVG(COALESCE(confidence, 0)) as avg_confidence,
-                    AVG(COALESCE(duration_seconds, 0)) as avg_duration,
-                    AVG(COALESCE(word_count, 0)) as avg_words,
-                    SUM(COALESCE(tokens_used, 0)) as total_tokens
-                FROM {self.table_name}
-                WHERE is_deleted = false
-                GROUP BY provider
-                ORDER BY transcription_count DESC
-            """)
-        )
-        rows = result.fetchall()
+        job_count = func.count(func.distinct(self.model.job_id)).label("job_count")
+        if not await triggers_installed(self._session, self.table_name, *TRANSCRIPTION_ROLLUP_TRIGGERS):
+            stmt = select(
+                self.model.provider,
+                func.count().label("transcription_count"),
+                job_count,
+                func.sum(func.coalesce(self.model.duration_seconds, 0)).label("duration_sum"),
+            )
+            rows = await self._provider_aggregate(stmt, since, until)
+        else:
+            rollup = TranscriptionHourlyRollup
+            transcription_count = func.sum(rollup.transcription_count)
+            stmt = (
+                select(
+                    rollup.provider,
+                    transcription_count.label("transcription_count"),
+                    func.sum(rollup.duration_sum).label("duration_sum"),
+                )
+                .group_by(rollup.provider)
+                .having(transcription_count > 0)
+            )
+            result = await self._session.execute(apply_window(stmt, rollup.bucket, since, until))
+            rollups = result.fetchall()
+            job_counts = {
+                str(row["provider"]): row["job_count"]
+                for row in await self._provider_aggregate(
+                    select(self.model.provider, job_count), since, until
+                )
+            }
+            rows = [
+                {**row._mapping, "job_count": job_counts.get(row.provider, 0)}
+                for row in rollups
+            ]
 
         stats = {}
-        for row in rows:
-            stats[row.provider] = {
-                "transcription_count": row.transcription_count,
-                "job_count": row.job_count,
-                "avg_confidence": float(row.avg_confidence) if row.avg_confidence else 0,
-                "avg_duration_seconds": float(row.avg_duration) if row.avg_duration else 0,
-                "avg_word_count": float(row.avg_words) if row.avg_words else 0,
-                "total_tokens": row.total_tokens
+        for row in sorted(rows, key=lambda row: row["transcription_count"], reverse=True):
+            count = int(row["transcription_count"])
+            duration = float(row["duration_sum"] or 0)
+            stats[str(row["provider"])] = {
+                "transcription_count": count,
+                "job_count": int(row["job_count"]),
+                "avg_duration_seconds": duration / count,
+                "total_duration_seconds": duration
             }
 
         return stats
 
+    async def _provider_aggregate(
+        self,
+        stmt: Any,
+        since: Optional[datetime],
+        until: Optional[datetime]
+    ) -> List[Dict[str, Any]]:
+        """Run a per-provider aggregate over active transcriptions in [since, until)."""
+        stmt = stmt.where(
+            self.model.is_deleted == False  # type: ignore[attr-defined]
+        ).group_by(self.model.provider)
+        if since is not None:
+            # Match the hourly resolution of the rollups
+            stmt = stmt.where(self.model.created_at >= hour_floor(since))
+        if until is not None:
+            stmt = stmt.where(self.model.created_at < as_utc(until))
+        result = await self._session.execute(stmt)
+        return [dict(row) for row in result.mappings()]
+
     async def get_latest_transcriptions(
         self,
         *,
@@ -429,6 +543,71 @@ class TranscriptionRepository(BaseRepository[Transcription]):
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
 
+    async def search_segments(
+        self,
+        query: str,
+        *,
+        job_id: Optional[UUID] = None,
+        limit: int = 50,
+        offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """
+        Find the transcript segments in which a phrase was spoken.
+
+        Matches the web-search style query against the GIN-indexed segment
+        vectors and returns the matching segments with their timestamps, so
+        callers never need to download segments_json. Without job_id hits are
+        ranked by relevance; within one job they are returned in time order.
+
+        Args:
+            query: Search query string
+            job_id: Optional job to restrict the search to
+            limit: Maximum number of segments
+            offset: Number of segments to skip
+
+        Returns:
+            List of segment dicts (transcription_id, job_id, segment_index,
+            start_seconds, end_seconds, speaker, text, rank)
+        """
+        segment = TranscriptSegment
+        ts_query = func.websearch_to_tsquery(
+            literal_column(f"'{SEGMENT_SEARCH_CONFIG}'::regconfig"),
+            query
+        )
+        rank = func.ts_rank_cd(segment.search_vector, ts_query).label("rank")
+
+        stmt = (
+            select(
+                segment.transcription_id,
+                segment.job_id,
+                segment.segment_index,
+                segment.start_seconds,
+                segment.end_seconds,
+                segment.speaker,
+                segment.text,
+                rank
+            )
+            .join(self.model, self.model.id == segment.transcription_id)
+            .where(
+                and_(
+                    segment.search_vector.bool_op("@@")(ts_query),
+                    self.model.is_deleted == False  # type: ignore[attr-defined]
+                )
+            )
+        )
+
+        if job_id is not None:
+            stmt = stmt.where(segment.job_id == job_id).order_by(
+                segment.start_seconds.asc().nulls_last(),
+                segment.transcription_id,
+                segment.segment_index
+            )
+        else:
+            stmt = stmt.order_by(desc(rank), segment.job_id, segment.start_seconds)
+
+        result = await self._session.execute(stmt.limit(limit).offset(offset))
+        return [dict(row) for row in result.mappings().all()]
+
     async def get_transcriptions_with_segments(
         self,
         job_id: UUID,
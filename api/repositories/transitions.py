@@ -0,0 +1,101 @@
+"""
+Status Transition Results
+
+Return types for the single-statement status transitions of
+BaseRepository._transition: a conditional
+`UPDATE ... WHERE status IN (allowed) RETURNING *` either applies and
+returns the row, or matches nothing and yields a TransitionConflict saying
+why (missing row, or the status it was in).
+"""
+
+from typing import AbstractSet, Any, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class TransitionConflict:
+    """
+    Why a status transition was not applied.
+
+    Attributes:
+        id: Primary key of the row
+        current_status: Status the row was in (None if it does not exist)
+        target_status: Status the transition asked for
+        allowed_from: Statuses the target can be reached from
+        reason: Why a row in an allowed status was refused (e.g. another
+            worker holds it), if known
+    """
+
+    __slots__ = ("id", "current_status", "target_status", "allowed_from", "reason")
+
+    def __init__(
+        self,
+        id_: Any,
+        current_status: Optional[Any],
+        target_status: Any,
+        allowed_from: AbstractSet[Any],
+        reason: Optional[str] = None
+    ) -> None:
+        self.id = id_
+        self.current_status = current_status
+        self.target_status = target_status
+        self.allowed_from = allowed_from
+        self.reason = reason
+
+    @property
+    def not_found(self) -> bool:
+        """Whether the row does not exist (or is soft-deleted)."""
+        return self.current_status is None
+
+    @property
+    def detail(self) -> str:
+        """Human-readable reason, suitable for an API error."""
+        if self.not_found:
+            return "Not found"
+        if self.reason:
+            return f"Cannot move from {self.current_status} to {self.target_status}: {self.reason}"
+        return (
+            f"Cannot move from {self.current_status} to {self.target_status} "
+            f"(allowed from: {', '.join(sorted(map(str, self.allowed_from)))})"
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"<TransitionConflict(id={self.id}, "
+            f"current_status={self.current_status}, "
+            f"target_status={self.target_status})>"
+        )
+
+
+class TransitionResult(Generic[T]):
+    """
+    Outcome of a status transition: the updated entity or a conflict.
+
+    Example:
+        ```python
+        result = await job_repo.transition(job_id, JobStatus.COMPLETED)
+        if not result.applied:
+            raise HTTPException(409, result.conflict.detail)
+        job = result.entity
+        ```
+    """
+
+    __slots__ = ("entity", "conflict")
+
+    def __init__(self, entity: Optional[T] = None, conflict: Optional[TransitionConflict] = None) -> None:
+        self.entity = entity
+        self.conflict = conflict
+
+    @property
+    def applied(self) -> bool:
+        """Whether the row was updated."""
+        return self.entity is not None
+
+    def __bool__(self) -> bool:
+        return self.applied
+
+    def __repr__(self) -> str:
+        return f"<TransitionResult(entity={self.entity!r}, conflict={self.conflict!r})>"
+
+
+__all__ = ["TransitionConflict", "TransitionResult"]
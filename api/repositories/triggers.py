@@ -0,0 +1,111 @@
+"""
+Trigger Presence Checks
+
+Some reads are served from tables that only database triggers keep current
+(job_status_counter and the hourly provider rollups). The triggers come
+from the migrations; a database built with Base.metadata.create_all has the
+tables but not the triggers, so those tables stay empty. Repositories check
+triggers_installed() first and aggregate the source table instead when it
+returns False.
+"""
+
+import logging
+from typing import Set, Tuple
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.types import String
+
+logger = logging.getLogger(__name__)
+
+
+class MissingTriggersError(RuntimeError):
+    """Raised when a trigger-maintained table is read without its triggers installed."""
+
+
+# (table, trigger) pairs found installed; only successes are remembered, so
+# running the migrations fixes a missing trigger without a restart
+_VERIFIED: Set[Tuple[str, str]] = set()
+
+# Tables already reported as missing triggers (logged once per process)
+_REPORTED: Set[str] = set()
+
+_INSTALLED_TRIGGERS = text(
+    "SELECT tgname FROM pg_trigger "
+    "WHERE tgrelid = to_regclass(:table) AND tgname = ANY(:names) AND NOT tgisinternal"
+).bindparams(bindparam("names", type_=ARRAY(String)))
+
+
+async def _missing_triggers(session: AsyncSession, table: str, *triggers: str) -> list:
+    """
+    Find which of the triggers maintaining a derived table are not installed.
+
+    Queries pg_trigger until each trigger has been found once per process.
+    Other dialects (the SQLite test databases) have no triggers at all.
+
+    Args:
+        session: Session to query with
+        table: Table the triggers are defined on
+        *triggers: Trigger names
+
+    Returns:
+        Sorted names of the missing triggers (empty if all are installed)
+    """
+    unverified = [name for name in triggers if (table, name) not in _VERIFIED]
+    if not unverified:
+        return []
+    if session.bind is not None and session.bind.dialect.name != "postgresql":
+        return sorted(unverified)
+
+    result = await session.execute(_INSTALLED_TRIGGERS, {"table": table, "names": unverified})
+    installed = set(result.scalars().all())
+    _VERIFIED.update((table, name) for name in installed)
+
+    missing = sorted(set(unverified) - installed)
+    if missing and table not in _REPORTED:
+        _REPORTED.add(table)
+        logger.warning(
+            "Triggers %s on %s are not installed; run 'alembic upgrade head'",
+            ", ".join(missing), table
+        )
+    return missing
+
+
+async def triggers_installed(session: AsyncSession, table: str, *triggers: str) -> bool:
+    """
+    Check that the triggers maintaining a derived table are installed.
+
+    Args:
+        session: Session to query with
+        table: Table the triggers are defined on
+        *triggers: Trigger names
+
+    Returns:
+        True if every trigger is installed
+    """
+    return not await _missing_triggers(session, table, *triggers)
+
+
+async def require_triggers(session: AsyncSession, table: str, *triggers: str) -> None:
+    """
+    Refuse a read that only a trigger-maintained table can answer.
+
+    Args:
+        session: Session to query with
+        table: Table the triggers are defined on
+        *triggers: Trigger names
+
+    Raises:
+        MissingTriggersError: If any of the triggers is missing
+    """
+    missing = await _missing_triggers(session, table, *triggers)
+    if missing:
+        raise MissingTriggersError(
+            f"Triggers {', '.join(missing)} on {table} are not installed, so the "
+            f"tables they maintain are empty; run 'alembic upgrade head' "
+            f"(Base.metadata.create_all does not create them)"
+        )
+
+
+__all__ = ["MissingTriggersError", "triggers_installed", "require_triggers"]
@@ -0,0 +1,185 @@
+"""
+Webhook Outbox Repository Module
+
+Repository for WebhookOutbox with the enqueue, claim and settle operations
+used by JobRepository and the webhook dispatcher.
+"""
+
+from datetime import timedelta
+from typing import Any, Dict, List
+from uuid import UUID
+
+from sqlalchemy import insert, select, update, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.models.webhook_outbox import WebhookDeliveryStatus, WebhookOutbox
+from api.repositories.base import BaseRepository
+
+
+class WebhookOutboxRepository(BaseRepository[WebhookOutbox]):
+    """
+    Repository for WebhookOutbox model operations.
+
+    Outbox entries are never soft-deleted; they move from pending to
+    delivered or dead.
+
+    Example:
+        ```python
+        outbox = WebhookOutboxRepository(session)
+        entries = await outbox.claim_due(100, lease_seconds=60)
+        ```
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        """
+        Initialize WebhookOutboxRepository with WebhookOutbox model.
+
+        Args:
+            session: AsyncSession instance for database operations
+        """
+        super().__init__(WebhookOutbox, session)
+
+    async def enqueue(
+        self,
+        job_id: UUID,
+        callback_url: str,
+        event: str,
+        payload: Dict[str, Any]
+    ) -> None:
+        """
+        Add a callback to the outbox in the caller's transaction.
+
+        A single INSERT with no flush or refresh: the entry becomes visible
+        to the dispatcher only when the caller commits.
+
+        Args:
+            job_id: Job the event is about
+            callback_url: Endpoint to POST the event to
+            event: Event name
+            payload: Event body
+        """
+        await self._session.execute(
+            insert(self.model).values(
+                job_id=job_id,
+                callback_url=callback_url,
+                event=event,
+                payload=payload,
+            )
+        )
+
+    async def claim_due(self, limit: int, *, lease_seconds: int = 60) -> List[WebhookOutbox]:
+        """
+        Claim up to `limit` due pending entries for delivery.
+
+        Picks the oldest due entries with FOR UPDATE SKIP LOCKED, counts the
+        attempt and pushes next_attempt_at out by the lease in one UPDATE ...
+        RETURNING. Dispatchers in other processes skip claimed entries; if
+        this one dies mid-delivery, they become due again when the lease
+        expires (delivery is at-least-once).
+
+        Args:
+            limit: Maximum number of entries to claim
+            lease_seconds: Time before an unsettled claim is retried
+
+        Returns:
+            Claimed entries, attempts already incremented
+        """
+        candidates = (
+            select(self.model.id)
+            .where(
+                self.model.status == WebhookDeliveryStatus.PENDING.value,
+                self.model.next_attempt_at <= func.now()
+            )
+            .order_by(self.model.next_attempt_at.asc())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(self.model)
+            .where(self.model.id.in_(candidates.scalar_subquery()))
+            .values(
+                attempts=self.model.attempts + 1,
+                next_attempt_at=func.now() + timedelta(seconds=lease_seconds),
+                updated_at=func.now(),
+            )
+            .returning(self.model)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def mark_delivered(self, ids: List[UUID]) -> int:
+        """
+        Settle entries as delivered.
+
+        Args:
+            ids: Entry ids acknowledged by their endpoint
+
+        Returns:
+            Number of entries updated
+        """
+        if not ids:
+            return 0
+        result = await self._session.execute(
+            update(self.model)
+            .where(self.model.id.in_(ids))
+            .values(
+                status=WebhookDeliveryStatus.DELIVERED.value,
+                delivered_at=func.now(),
+                last_error=None,
+                updated_at=func.now(),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+    async def mark_retry(self, ids: List[UUID], error: str, *, delay_seconds: float) -> int:
+        """
+        Record a failed attempt and schedule the next one.
+
+        Args:
+            ids: Entry ids whose delivery failed
+            error: Failure description
+            delay_seconds: Backoff before the entries are due again
+
+        Returns:
+            Number of entries updated
+        """
+        if not ids:
+            return 0
+        result = await self._session.execute(
+            update(self.model)
+            .where(self.model.id.in_(ids))
+            .values(
+                next_attempt_at=func.now() + timedelta(seconds=delay_seconds),
+                last_error=error[:2000],
+                updated_at=func.now(),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+    async def mark_dead(self, ids: List[UUID], error: str) -> int:
+        """
+        Give up on entries that exhausted their attempts.
+
+        Args:
+            ids: Entry ids to stop retrying
+            error: Final failure description
+
+        Returns:
+            Number of entries updated
+        """
+        if not ids:
+            return 0
+        result = await self._session.execute(
+            update(self.model)
+            .where(self.model.id.in_(ids))
+            .values(
+                status=WebhookDeliveryStatus.DEAD.value,
+                last_error=error[:2000],
+                updated_at=func.now(),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
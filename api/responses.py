@@ -0,0 +1,118 @@
+"""
+Fast JSON response path.
+
+The default response path validates each ORM row into a schema, has
+FastAPI validate the result again against response_model, converts it to
+JSON-compatible Python objects and finally encodes it with the stdlib json
+module. For large list pages this dominates request CPU.
+
+This module provides the opt-in alternative: read the schema's fields
+straight off ORM instances (or Row mappings) into plain dicts and encode
+them once with orjson. Endpoints return a FastJSONResponse directly, so
+FastAPI skips response_model validation and serialization. Nested
+relationship fields are not supported on this path; callers exclude them.
+
+orjson is optional; without it FastJSONResponse falls back to the stdlib
+encoder with the same output format.
+"""
+
+import json
+from datetime import date, datetime
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Tuple, Type
+from uuid import UUID
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+
+def _json_default(value: Any) -> Any:
+    """Encode the types orjson handles natively for the stdlib fallback."""
+    if isinstance(value, datetime):
+        text = value.isoformat()
+        return text[:-6] + "Z" if text.endswith("+00:00") else text
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response encoded with orjson when available.
+
+    Accepts dicts, lists and scalars containing UUID, datetime and Enum
+    values; UTC datetimes are rendered with a Z suffix like pydantic does.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content, option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS)
+        return json.dumps(
+            content,
+            default=_json_default,
+            ensure_ascii=False,
+            separators=(",", ":")
+        ).encode("utf-8")
+
+
+@lru_cache(maxsize=None)
+def schema_fields(schema: Type[BaseModel], exclude: FrozenSet[str] = frozenset()) -> Tuple[str, ...]:
+    """
+    Return the field names of a response schema, minus excluded fields.
+
+    Args:
+        schema: Pydantic response schema
+        exclude: Field names to leave out (typically relationship fields)
+
+    Returns:
+        Tuple of field names in declaration order
+    """
+    return tuple(name for name in schema.model_fields if name not in exclude)
+
+
+def rows_to_dicts(
+    rows: Iterable[Any],
+    schema: Type[BaseModel],
+    exclude: FrozenSet[str] = frozenset()
+) -> List[Dict[str, Any]]:
+    """
+    Build response dicts from ORM instances or Row mappings without validation.
+
+    Values are taken as stored: the database already enforces the types the
+    schema would check, so no per-field coercion is performed.
+
+    Args:
+        rows: ORM instances, Row objects or mappings
+        schema: Response schema whose fields to emit
+        exclude: Field names to leave out
+
+    Returns:
+        List of dicts ready for FastJSONResponse
+    """
+    fields = schema_fields(schema, frozenset(exclude))
+    items = []
+    for row in rows:
+        if hasattr(row, "_mapping"):
+            row = row._mapping
+        if isinstance(row, Mapping):
+            items.append({name: row.get(name) for name in fields})
+        else:
+            items.append({name: getattr(row, name) for name in fields})
+    return items
+
+
+__all__ = [
+    "FastJSONResponse",
+    "rows_to_dicts",
+    "schema_fields",
+]
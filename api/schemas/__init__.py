@@ -9,6 +9,7 @@ Schemas are organized by domain:
 - job.py: AnalysisJob schemas
 - result.py: AnalysisResult schemas
 - transcription.py: Transcription schemas
+- processing_log.py: ProcessingLog schemas
 """
 
 from api.schemas.media import (
@@ -24,6 +25,8 @@ from api.schemas.job import (
     JobUpdate,
     JobResponse,
     JobListResponse,
+    JobClaimRequest,
+    JobHeartbeatRequest,
     JobStatus,
     MediaType,
 )
@@ -32,6 +35,10 @@ from api.schemas.result import (
     AnalysisResultUpdate,
     AnalysisResultResponse,
     AnalysisResultListResponse,
+    AnalysisResultSearchHit,
+    AnalysisResultBatchCreate,
+    AnalysisResultBatchResponse,
+    BatchItemError,
     AnalysisProvider,
 )
 from api.schemas.transcription import (
@@ -39,8 +46,31 @@ from api.schemas.transcription import (
     TranscriptionUpdate,
     TranscriptionResponse,
     TranscriptionListResponse,
+    TranscriptSegmentHit,
     TranscriptionProvider,
 )
+from api.schemas.processing_log import (
+    ProcessingLogResponse,
+    ProcessingLogStatus,
+    ProcessingStage,
+)
+
+# The response schemas nest each other (job <-> media, results,
+# transcriptions); resolve their forward references only now that every
+# module has loaded, since rebuilding one mid-import needs the others defined.
+for _schema in (
+    JobResponse,
+    JobListResponse,
+    MediaFileResponse,
+    MediaFileListResponse,
+    AnalysisResultResponse,
+    AnalysisResultListResponse,
+    AnalysisResultSearchHit,
+    TranscriptionResponse,
+    TranscriptionListResponse,
+):
+    _schema.model_rebuild()
+del _schema
 
 __all__ = [
     # Media schemas
@@ -55,6 +85,8 @@ __all__ = [
     "JobUpdate",
     "JobResponse",
     "JobListResponse",
+    "JobClaimRequest",
+    "JobHeartbeatRequest",
     "JobStatus",
     "MediaType",
     # Result schemas
@@ -62,13 +94,22 @@ __all__ = [
     "AnalysisResultUpdate",
     "AnalysisResultResponse",
     "AnalysisResultListResponse",
+    "AnalysisResultSearchHit",
+    "AnalysisResultBatchCreate",
+    "AnalysisResultBatchResponse",
+    "BatchItemError",
     "AnalysisProvider",
     # Transcription schemas
     "TranscriptionCreate",
     "TranscriptionUpdate",
     "TranscriptionResponse",
     "TranscriptionListResponse",
+    "TranscriptSegmentHit",
     "TranscriptionProvider",
+    # Processing log schemas
+    "ProcessingLogResponse",
+    "ProcessingLogStatus",
+    "ProcessingStage",
 ]
 
 __version__ = "4.0.0"
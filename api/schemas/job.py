@@ -66,6 +66,12 @@ class JobCreate(BaseModel):
         None,
         description="Additional metadata as JSON"
     )
+    callback_url: Optional[str] = Field(
+        None,
+        max_length=2048,
+        pattern=r"^https?://",
+        description="Endpoint POSTed to when the job completes or fails"
+    )
 
     model_config = ConfigDict(
         from_attributes=True,
@@ -74,7 +80,8 @@ class JobCreate(BaseModel):
             "example": {
                 "media_type": "video",
                 "source_url": "https://youtube.com/watch?v=example",
-                "metadata_json": {"quality": "720p", "fps": 30}
+                "metadata_json": {"quality": "720p", "fps": 30},
+                "callback_url": "https://n8n.example.com/webhook/job-done"
             }
         }
     )
@@ -124,6 +131,7 @@ class JobResponse(BaseModel):
 
     Used in: GET /jobs/{id}, GET /jobs endpoint
     Contains: All fields from AnalysisJob model for read operations.
+    Relationship lists are only populated when requested via include=.
     """
 
     id: UUID = Field(..., description="Unique identifier for the analysis job")
@@ -147,6 +155,22 @@ class JobResponse(BaseModel):
         None,
         description="Additional metadata as JSON"
     )
+    claimed_by: Optional[str] = Field(
+        None,
+        description="Worker holding the processing lease"
+    )
+    lease_expires_at: Optional[datetime] = Field(
+        None,
+        description="Timestamp when the worker lease expires"
+    )
+    callback_url: Optional[str] = Field(
+        None,
+        description="Endpoint notified when the job completes or fails"
+    )
+    attempts: Optional[int] = Field(
+        0,
+        description="Number of times the job has been claimed by a worker (None until flushed)"
+    )
 
     # Relationship data (optional nested)
     media_files: Optional[List["MediaFileResponse"]] = Field(
@@ -157,6 +181,14 @@ class JobResponse(BaseModel):
         default_factory=list,
         description="Analysis results from different providers"
     )
+    transcriptions: Optional[List["TranscriptionResponse"]] = Field(
+        default_factory=list,
+        description="Transcriptions for this job"
+    )
+    processing_logs: Optional[List["ProcessingLogResponse"]] = Field(
+        default_factory=list,
+        description="Processing log entries for this job"
+    )
 
     model_config = ConfigDict(
         from_attributes=True,
@@ -177,18 +209,96 @@ class JobResponse(BaseModel):
     )
 
 
+class JobClaimRequest(BaseModel):
+    """
+    Schema for claiming pending jobs as a worker.
+
+    Used in: POST /jobs/claim endpoint
+    Validates: Batch size, worker identity and lease duration
+    """
+
+    limit: int = Field(
+        1,
+        ge=1,
+        le=100,
+        description="Maximum number of jobs to claim"
+    )
+    worker_id: str = Field(
+        ...,
+        min_length=1,
+        max_length=128,
+        description="Identifier of the claiming worker"
+    )
+    lease_seconds: int = Field(
+        300,
+        ge=1,
+        le=86400,
+        description="Lease duration in seconds"
+    )
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        json_schema_extra={
+            "example": {
+                "limit": 5,
+                "worker_id": "worker-gpu-01",
+                "lease_seconds": 300
+            }
+        }
+    )
+
+
+class JobHeartbeatRequest(BaseModel):
+    """
+    Schema for extending a worker's processing lease.
+
+    Used in: POST /jobs/{id}/heartbeat endpoint
+    Validates: Worker identity and new lease duration
+    """
+
+    worker_id: str = Field(
+        ...,
+        min_length=1,
+        max_length=128,
+        description="Identifier of the worker holding the lease"
+    )
+    lease_seconds: int = Field(
+        300,
+        ge=1,
+        le=86400,
+        description="New lease duration in seconds, counted from now"
+    )
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        json_schema_extra={
+            "example": {
+                "worker_id": "worker-gpu-01",
+                "lease_seconds": 300
+            }
+        }
+    )
+
 class JobListResponse(BaseModel):
     """Schema for paginated list of analysis jobs."""
 
     items: List[JobResponse] = Field(..., description="List of jobs")
-    total: int = Field(..., description="Total number of jobs")
+    total: Optional[int] = Field(
+        None,
+        description="Total number of jobs (omitted when include_total=false)"
+    )
     page: int = Field(..., description="Current page number")
     page_size: int = Field(..., description="Items per page")
     has_more: bool = Field(..., description="Whether more pages exist")
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Opaque cursor for the next page (None on the last page)"
+    )
 
 
-# Forward references for nested schemas (resolved at end of file)
+# Forward references for nested schemas (rebuilt in api.schemas once every
+# schema module has loaded)
 from api.schemas.media import MediaFileResponse
 from api.schemas.result import AnalysisResultResponse
-
-JobResponse.model_rebuild()
+from api.schemas.transcription import TranscriptionResponse
+from api.schemas.processing_log import ProcessingLogResponse
@@ -243,7 +243,6 @@ class MediaFileListResponse(BaseModel):
     has_more: bool = Field(..., description="Whether more pages exist")
 
 
-# Forward references for nested schemas (resolved at end of file)
+# Forward references for nested schemas (rebuilt in api.schemas once every
+# schema module has loaded)
 from api.schemas.job import JobResponse
-
-MediaFileResponse.model_rebuild()
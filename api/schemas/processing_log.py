@@ -0,0 +1,101 @@
+"""
+Pydantic schemas for ProcessingLog model.
+
+Maps to: api/models/processing_log.py::ProcessingLog
+Table: processing_log
+"""
+
+from datetime import datetime
+from typing import Optional
+from enum import StrEnum
+
+from pydantic import BaseModel, Field, ConfigDict
+from uuid import UUID
+
+
+class ProcessingStage(StrEnum):
+    """
+    Enumeration of processing stages.
+
+    Stages:
+        - upload: File upload stage
+        - download: Media download from URL
+        - validation: Input validation
+        - transcription: Speech-to-text processing
+        - analysis: AI analysis processing
+        - completion: Job completion
+        - cleanup: Resource cleanup
+        - recovery: Job recovered after its worker's lease expired
+    """
+
+    UPLOAD = "upload"
+    DOWNLOAD = "download"
+    VALIDATION = "validation"
+    TRANSCRIPTION = "transcription"
+    ANALYSIS = "analysis"
+    COMPLETION = "completion"
+    CLEANUP = "cleanup"
+    RECOVERY = "recovery"
+
+
+class ProcessingLogStatus(StrEnum):
+    """
+    Enumeration of processing log statuses.
+
+    Statuses:
+        - started: Processing stage started
+        - completed: Processing stage completed successfully
+        - failed: Processing stage failed
+        - warning: Processing completed with warnings
+        - skipped: Processing stage was skipped
+    """
+
+    STARTED = "started"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    WARNING = "warning"
+    SKIPPED = "skipped"
+
+
+class ProcessingLogResponse(BaseModel):
+    """
+    Schema for processing log API responses.
+
+    Used in: GET /jobs/{id}?include=logs
+    Contains: All fields from ProcessingLog model for read operations.
+    """
+
+    id: UUID = Field(..., description="Unique identifier for the log entry")
+    job_id: UUID = Field(..., description="Foreign key to the parent analysis job")
+    stage: ProcessingStage = Field(..., description="Processing stage")
+    status: ProcessingLogStatus = Field(..., description="Status of the processing stage")
+    message: Optional[str] = Field(
+        None,
+        description="Human-readable log message"
+    )
+    details_json: Optional[dict] = Field(
+        None,
+        description="Additional details as JSON"
+    )
+    duration_ms: Optional[int] = Field(
+        None,
+        description="Duration of the stage in milliseconds"
+    )
+    created_at: datetime = Field(..., description="UTC timestamp when the entry was recorded")
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        populate_by_name=True,
+        json_schema_extra={
+            "example": {
+                "id": "770e8400-e29b-41d4-a716-446655440002",
+                "job_id": "550e8400-e29b-41d4-a716-446655440000",
+                "stage": "analysis",
+                "status": "completed",
+                "message": "Analysis finished",
+                "details_json": {"provider": "minimax"},
+                "duration_ms": 5000,
+                "created_at": "2026-01-20T10:05:00Z"
+            }
+        }
+    )
@@ -188,17 +188,68 @@ class AnalysisResultResponse(BaseModel):
     )
 
 
+class AnalysisResultSearchHit(AnalysisResultResponse):
+    """
+    Schema for a ranked full-text search hit.
+
+    Used in: GET /results/search endpoint
+    """
+
+    rank: float = Field(..., description="Full-text relevance rank (higher is better)")
+
+
 class AnalysisResultListResponse(BaseModel):
     """Schema for paginated list of analysis results."""
 
     items: List[AnalysisResultResponse] = Field(..., description="List of analysis results")
-    total: int = Field(..., description="Total number of results")
+    total: Optional[int] = Field(
+        None,
+        description="Total number of results (omitted when include_total=false)"
+    )
     page: int = Field(..., description="Current page number")
     page_size: int = Field(..., description="Items per page")
     has_more: bool = Field(..., description="Whether more pages exist")
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Opaque cursor for the next page (None on the last page)"
+    )
 
 
-# Forward references for nested schemas (resolved at end of file)
-from api.schemas.job import JobResponse
+class AnalysisResultBatchCreate(BaseModel):
+    """
+    Schema for ingesting many analysis results in one request.
+
+    Used in: POST /results:batch endpoint
+    Items are validated individually against AnalysisResultCreate so one
+    bad item is reported without rejecting the rest of the batch.
+    """
+
+    items: List[dict] = Field(
+        ...,
+        min_length=1,
+        max_length=5000,
+        description="Result payloads (AnalysisResultCreate fields)"
+    )
+
+
+class BatchItemError(BaseModel):
+    """Validation error for a single item of a batch request."""
+
+    index: int = Field(..., description="Position of the item in the request")
+    errors: List[dict] = Field(..., description="Validation errors (loc, msg, type)")
 
-AnalysisResultResponse.model_rebuild()
+
+class AnalysisResultBatchResponse(BaseModel):
+    """Schema for the outcome of a batch result ingestion."""
+
+    inserted: int = Field(..., description="Number of results inserted")
+    ids: List[UUID] = Field(..., description="IDs of inserted results, in request order")
+    errors: List[BatchItemError] = Field(
+        default_factory=list,
+        description="Items rejected by validation"
+    )
+
+
+# Forward references for nested schemas (rebuilt in api.schemas once every
+# schema module has loaded)
+from api.schemas.job import JobResponse
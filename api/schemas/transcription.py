@@ -251,7 +251,49 @@ class TranscriptionListResponse(BaseModel):
     has_more: bool = Field(..., description="Whether more pages exist")
 
 
-# Forward references for nested schemas (resolved at end of file)
-from api.schemas.job import JobResponse
+class TranscriptSegmentHit(BaseModel):
+    """
+    Schema for a transcript segment matching a search.
+
+    Used in: GET /transcriptions/segments/search endpoint
+    Maps to: api/models/transcript_segment.py::TranscriptSegment
+    """
+
+    transcription_id: UUID = Field(..., description="Transcription containing the segment")
+    job_id: UUID = Field(..., description="Job of the transcription")
+    segment_index: int = Field(..., description="Position of the segment in segments_json")
+    start_seconds: Optional[float] = Field(
+        None,
+        description="Segment start offset in seconds"
+    )
+    end_seconds: Optional[float] = Field(
+        None,
+        description="Segment end offset in seconds"
+    )
+    speaker: Optional[str] = Field(
+        None,
+        description="Speaker label if available"
+    )
+    text: str = Field(..., description="Segment text")
+    rank: float = Field(..., description="Full-text relevance rank (higher is better)")
 
-TranscriptionResponse.model_rebuild()
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
+            "example": {
+                "transcription_id": "660e8400-e29b-41d4-a716-446655440001",
+                "job_id": "550e8400-e29b-41d4-a716-446655440000",
+                "segment_index": 1,
+                "start_seconds": 5.0,
+                "end_seconds": 10.0,
+                "speaker": "SPEAKER_01",
+                "text": "a sample transcription.",
+                "rank": 0.1
+            }
+        }
+    )
+
+
+# Forward references for nested schemas (rebuilt in api.schemas once every
+# schema module has loaded)
+from api.schemas.job import JobResponse
@@ -0,0 +1,62 @@
+"""
+Services Package
+
+Background subsystems that run alongside the request handlers and are
+started and stopped from the application lifespan.
+"""
+
+from api.services.job_events import (
+    JOB_EVENTS_CHANNEL,
+    JOB_EVENTS_CONFIG,
+    JobEventHub,
+    Subscription,
+    get_job_event_hub,
+    start_job_event_hub,
+    stop_job_event_hub,
+)
+from api.services.log_sink import (
+    LOG_SINK_CONFIG,
+    ProcessingLogSink,
+    get_log_sink,
+    start_log_sink,
+    stop_log_sink,
+)
+from api.services.reaper import (
+    REAPER_CONFIG,
+    StaleJobReaper,
+    get_reaper,
+    start_reaper,
+    stop_reaper,
+)
+from api.services.webhooks import (
+    WEBHOOK_CONFIG,
+    WebhookDispatcher,
+    get_webhook_dispatcher,
+    start_webhook_dispatcher,
+    stop_webhook_dispatcher,
+)
+
+__all__ = [
+    "JOB_EVENTS_CHANNEL",
+    "JOB_EVENTS_CONFIG",
+    "JobEventHub",
+    "Subscription",
+    "get_job_event_hub",
+    "start_job_event_hub",
+    "stop_job_event_hub",
+    "LOG_SINK_CONFIG",
+    "ProcessingLogSink",
+    "get_log_sink",
+    "start_log_sink",
+    "stop_log_sink",
+    "REAPER_CONFIG",
+    "StaleJobReaper",
+    "get_reaper",
+    "start_reaper",
+    "stop_reaper",
+    "WEBHOOK_CONFIG",
+    "WebhookDispatcher",
+    "get_webhook_dispatcher",
+    "start_webhook_dispatcher",
+    "stop_webhook_dispatcher",
+]
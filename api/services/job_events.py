@@ -0,0 +1,368 @@
+"""
+Job Events Module
+
+In-process fan-out of job status changes and new processing_log entries.
+
+Database triggers (migration 000000000010) NOTIFY the job_events channel
+on every job status change and log insert. Each API process holds exactly
+one dedicated LISTEN connection, outside the SQLAlchemy pool, and fans the
+events out in memory to its subscribers: SSE streams, WebSocket clients
+and long-poll waiters. Subscribers cost no database work; adding one is a
+dict insert.
+
+Each subscriber has a bounded queue. A subscriber that falls behind loses
+its oldest events rather than slowing the others down. When the LISTEN
+connection drops, notifications sent in the meantime are lost, so every
+subscriber receives a {"type": "reset"} event after reconnecting and should
+re-read current state.
+"""
+
+import asyncio
+import json
+import logging
+import os
+from typing import Any, AbstractSet, Awaitable, Callable, Dict, Iterable, Optional, Set, Tuple
+
+import asyncpg
+from sqlalchemy.engine import make_url
+
+from api.models.database import get_database_url
+
+logger = logging.getLogger(__name__)
+
+
+# Channel the notify triggers publish on
+JOB_EVENTS_CHANNEL = "job_events"
+
+# =============================================================================
+# Hub Configuration
+# =============================================================================
+JOB_EVENTS_CONFIG = {
+    "enabled": os.environ.get("JOB_EVENTS_ENABLED", "true").lower() == "true",
+    "subscriber_queue": int(os.environ.get("JOB_EVENTS_SUBSCRIBER_QUEUE", "100")),
+    "keepalive_seconds": float(os.environ.get("JOB_EVENTS_KEEPALIVE_SECONDS", "15")),
+    "reconnect_max_seconds": float(os.environ.get("JOB_EVENTS_RECONNECT_MAX_SECONDS", "30")),
+    "wait_max_seconds": float(os.environ.get("JOB_WAIT_MAX_SECONDS", "120")),
+}
+
+RESET_EVENT = {"type": "reset"}
+
+
+class Subscription:
+    """
+    A subscriber's bounded event queue and the jobs it follows.
+
+    Use as an async context manager to unsubscribe on exit.
+    """
+
+    def __init__(self, hub: "JobEventHub", job_ids: Optional[Set[str]], maxsize: int) -> None:
+        """
+        Initialize a subscription.
+
+        Args:
+            hub: Owning hub
+            job_ids: Job ids to receive events for (None: every job)
+            maxsize: Queue bound before the oldest events are dropped
+        """
+        self._hub = hub
+        self.job_ids = job_ids
+        self.queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue(maxsize)
+        self.dropped = 0
+
+    def deliver(self, event: Dict[str, Any]) -> None:
+        """Enqueue an event, dropping the oldest one when full."""
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(event)
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Wait for the next event.
+
+        Args:
+            timeout: Seconds to wait (None: forever)
+
+        Returns:
+            Event dict, or None if the timeout passed first
+        """
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def __aenter__(self) -> "Subscription":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self._hub.unsubscribe(self)
+
+
+class JobEventHub:
+    """
+    One LISTEN connection per process, fanned out to in-memory subscribers.
+
+    Example:
+        ```python
+        async with hub.subscribe({str(job_id)}) as subscription:
+            event = await subscription.get(timeout=30)
+        ```
+    """
+
+    def __init__(
+        self,
+        dsn: Optional[str] = None,
+        *,
+        subscriber_queue: int = 100,
+        reconnect_max_seconds: float = 30.0
+    ) -> None:
+        """
+        Initialize the hub.
+
+        Args:
+            dsn: libpq-style DSN for the LISTEN connection (default: from
+                the configured database URL)
+            subscriber_queue: Per-subscriber queue bound
+            reconnect_max_seconds: Cap on the reconnect backoff
+        """
+        self._dsn = dsn
+        self.subscriber_queue = subscriber_queue
+        self.reconnect_max_seconds = reconnect_max_seconds
+        self._by_job: Dict[str, Set[Subscription]] = {}
+        self._all: Set[Subscription] = set()
+        self._task: Optional[asyncio.Task] = None
+        self._connection: Optional[asyncpg.Connection] = None
+        self.received = 0
+        self.reconnects = 0
+
+    # -------------------------------------------------------------------------
+    # Subscribers
+    # -------------------------------------------------------------------------
+
+    def subscribe(self, job_ids: Optional[Iterable[Any]] = None) -> Subscription:
+        """
+        Register a subscriber.
+
+        Args:
+            job_ids: Jobs to follow (None: every job)
+
+        Returns:
+            Subscription; unsubscribe via `async with` or unsubscribe()
+        """
+        subscription = Subscription(self, None, self.subscriber_queue)
+        if job_ids is None:
+            self._all.add(subscription)
+        else:
+            subscription.job_ids = set()
+            self.follow(subscription, job_ids)
+        return subscription
+
+    def follow(self, subscription: Subscription, job_ids: Iterable[Any]) -> None:
+        """Add jobs to a per-job subscription."""
+        for job_id in map(str, job_ids):
+            subscription.job_ids.add(job_id)
+            self._by_job.setdefault(job_id, set()).add(subscription)
+
+    def unfollow(self, subscription: Subscription, job_ids: Iterable[Any]) -> None:
+        """Remove jobs from a per-job subscription."""
+        for job_id in map(str, job_ids):
+            subscription.job_ids.discard(job_id)
+            subscribers = self._by_job.get(job_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._by_job[job_id]
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove a subscriber entirely."""
+        self._all.discard(subscription)
+        if subscription.job_ids:
+            self.unfollow(subscription, list(subscription.job_ids))
+
+    def publish(self, event: Dict[str, Any]) -> int:
+        """
+        Deliver an event to every interested subscriber.
+
+        Args:
+            event: Event dict; reset events go to everyone
+
+        Returns:
+            Number of subscribers the event was delivered to
+        """
+        if event.get("type") == "reset":
+            targets = set(self._all).union(*self._by_job.values())
+        else:
+            targets = self._all | self._by_job.get(str(event.get("job_id")), set())
+        for subscription in targets:
+            subscription.deliver(event)
+        return len(targets)
+
+    async def wait_for_status(
+        self,
+        job_id: Any,
+        statuses: AbstractSet[str],
+        timeout: float,
+        read_status: Callable[[], Awaitable[Optional[Dict[str, Any]]]]
+    ) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """
+        Park until a job reaches one of the given statuses or the timeout passes.
+
+        Subscribes before reading the current status, so a change committed
+        in between is not missed. While parked the waiter is only a queue in
+        the fan-out; the status is read again only after a reset.
+
+        Args:
+            job_id: Job to wait for
+            statuses: Statuses that end the wait
+            timeout: Seconds to wait at most
+            read_status: Returns the job's current status event (None if missing)
+
+        Returns:
+            (latest status event, or None if the job does not exist;
+            whether one of the statuses was reached)
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        async with self.subscribe({job_id}) as subscription:
+            current = await read_status()
+            while current is not None and current.get("status") not in statuses:
+                event = await subscription.get(timeout=max(deadline - loop.time(), 0))
+                if event is None:
+                    return current, False
+                if event.get("type") == "reset":
+                    current = await read_status()
+                elif event.get("type") == "status":
+                    current = event
+            return current, current is not None
+
+    # -------------------------------------------------------------------------
+    # LISTEN connection
+    # -------------------------------------------------------------------------
+
+    def _listen_dsn(self) -> str:
+        """Plain postgresql:// DSN for asyncpg, derived from the engine URL."""
+        if self._dsn:
+            return self._dsn
+        url = make_url(get_database_url()).set(drivername="postgresql")
+        return url.render_as_string(hide_password=False)
+
+    def _on_notification(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        self.received += 1
+        try:
+            event = json.loads(payload)
+        except ValueError:
+            logger.warning(f"Ignoring malformed {channel} payload: {payload[:200]}")
+            return
+        self.publish(event)
+
+    async def _listen(self) -> None:
+        """Hold the LISTEN connection, reconnecting with backoff."""
+        backoff = 0.5
+        first = True
+        while True:
+            lost = asyncio.Event()
+            try:
+                self._connection = await asyncpg.connect(self._listen_dsn())
+                self._connection.add_termination_listener(lambda _conn: lost.set())
+                await self._connection.add_listener(JOB_EVENTS_CHANNEL, self._on_notification)
+                logger.info(f"Listening on {JOB_EVENTS_CHANNEL}")
+                if not first:
+                    self.reconnects += 1
+                    self.publish(dict(RESET_EVENT))
+                first = False
+                backoff = 0.5
+                await lost.wait()
+                logger.warning(f"{JOB_EVENTS_CHANNEL} listener connection lost")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"{JOB_EVENTS_CHANNEL} listener failed: {e}")
+            finally:
+                if self._connection is not None and not self._connection.is_closed():
+                    await self._connection.close()
+                self._connection = None
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, self.reconnect_max_seconds)
+
+    @property
+    def connected(self) -> bool:
+        """Whether the LISTEN connection is currently up."""
+        return self._connection is not None and not self._connection.is_closed()
+
+    def start(self) -> None:
+        """Start the listener task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen(), name="job-events-listener")
+
+    async def stop(self) -> None:
+        """Stop listening and close the connection."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Listener state and subscriber counts."""
+        return {
+            "connected": self.connected,
+            "subscribers": len(self._all) + len({
+                subscription for subscribers in self._by_job.values() for subscription in subscribers
+            }),
+            "jobs_followed": len(self._by_job),
+            "received": self.received,
+            "reconnects": self.reconnects,
+        }
+
+
+# =============================================================================
+# Global hub reference
+# =============================================================================
+_JOB_EVENT_HUB: Optional[JobEventHub] = None
+
+
+def start_job_event_hub() -> Optional[JobEventHub]:
+    """
+    Create and start the process-wide hub (no-op when JOB_EVENTS_ENABLED=false).
+
+    Returns:
+        Running JobEventHub, or None when disabled
+    """
+    global _JOB_EVENT_HUB
+
+    if not JOB_EVENTS_CONFIG["enabled"]:
+        return None
+    if _JOB_EVENT_HUB is None:
+        _JOB_EVENT_HUB = JobEventHub(
+            subscriber_queue=JOB_EVENTS_CONFIG["subscriber_queue"],
+            reconnect_max_seconds=JOB_EVENTS_CONFIG["reconnect_max_seconds"],
+        )
+        _JOB_EVENT_HUB.start()
+    return _JOB_EVENT_HUB
+
+
+def get_job_event_hub() -> Optional[JobEventHub]:
+    """Get the process-wide hub, or None when job events are disabled."""
+    return _JOB_EVENT_HUB
+
+
+async def stop_job_event_hub() -> None:
+    """Stop the process-wide hub."""
+    global _JOB_EVENT_HUB
+
+    if _JOB_EVENT_HUB is not None:
+        await _JOB_EVENT_HUB.stop()
+        _JOB_EVENT_HUB = None
+
+
+__all__ = [
+    "JOB_EVENTS_CHANNEL",
+    "JOB_EVENTS_CONFIG",
+    "JobEventHub",
+    "Subscription",
+    "get_job_event_hub",
+    "start_job_event_hub",
+    "stop_job_event_hub",
+]
@@ -0,0 +1,300 @@
+"""
+Processing Log Sink Module
+
+Buffered, batched writer for processing_log entries.
+
+ProcessingLogRepository.log_* calls stage entries here instead of doing an
+INSERT + flush + refresh inside the caller's transaction. Entries staged in
+an open transaction are handed to the sink only when that transaction
+commits (and discarded on rollback), so the log never references a job that
+was not committed. A background task writes queued entries with one bulk
+INSERT per batch, flushing when batch_size entries are waiting or
+flush_seconds after the first one arrived.
+
+Capacity is bounded: once max_queue entries are staged or queued, callers
+wait for the writer to catch up (backpressure) instead of growing memory.
+stop() drains everything still queued; lifespan calls it on shutdown.
+"""
+
+import asyncio
+import logging
+import os
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from api.models.processing_log import ProcessingLog
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Sink Configuration
+# =============================================================================
+LOG_SINK_CONFIG = {
+    "enabled": os.environ.get("LOG_SINK_ENABLED", "true").lower() == "true",
+    "max_queue": int(os.environ.get("LOG_SINK_MAX_QUEUE", "10000")),
+    "batch_size": int(os.environ.get("LOG_SINK_BATCH_SIZE", "500")),
+    "flush_seconds": float(os.environ.get("LOG_SINK_FLUSH_SECONDS", "0.25")),
+    "drain_timeout_seconds": float(os.environ.get("LOG_SINK_DRAIN_TIMEOUT_SECONDS", "30")),
+}
+
+# Session.info keys for entries waiting on the session's transaction
+_PENDING_KEY = "processing_log_sink_pending"
+_HOOKED_KEY = "processing_log_sink_hooked"
+
+# Queue marker telling the writer to exit once everything before it is written
+_STOP = object()
+
+
+class ProcessingLogSink:
+    """
+    Bounded in-memory queue of processing_log rows with a background writer.
+
+    Example:
+        ```python
+        sink = ProcessingLogSink(get_session_factory())
+        sink.start()
+        await sink.stage(session, {"job_id": job_id, "stage": "analysis", ...})
+        await sink.stop()
+        ```
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        max_queue: int = 10000,
+        batch_size: int = 500,
+        flush_seconds: float = 0.25
+    ) -> None:
+        """
+        Initialize the sink.
+
+        Args:
+            session_factory: Factory for the writer's own sessions
+            max_queue: Maximum entries staged or queued at once
+            batch_size: Maximum rows per INSERT
+            flush_seconds: Longest an entry waits for its batch to fill
+        """
+        self._session_factory = session_factory
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self._slots = asyncio.Semaphore(max_queue)
+        self._queue: Deque[Any] = deque()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._closing = False
+        self.written = 0
+        self.failed = 0
+        self.batches = 0
+
+    def start(self) -> None:
+        """Start the background writer task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="processing-log-sink")
+
+    async def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop accepting entries and write everything already queued.
+
+        Args:
+            timeout: Seconds to wait for the drain before cancelling the writer
+        """
+        if self._task is None or self._closing:
+            return
+        self._closing = True
+        self._put(_STOP)
+        try:
+            await asyncio.wait_for(self._task, timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"Processing log sink drain timed out; {self.queued} entries lost")
+
+    @property
+    def queued(self) -> int:
+        """Entries waiting to be written."""
+        return sum(1 for item in self._queue if item is not _STOP)
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth and write counters."""
+        return {
+            "queued": self.queued,
+            "written": self.written,
+            "failed": self.failed,
+            "batches": self.batches,
+            "max_queue": self.max_queue,
+        }
+
+    def _put(self, item: Any) -> None:
+        self._queue.append(item)
+        self._wakeup.set()
+
+    async def submit(self, values: Dict[str, Any]) -> None:
+        """
+        Queue a row for writing, waiting while the sink is full.
+
+        Args:
+            values: ProcessingLog column values
+        """
+        if self._closing:
+            raise RuntimeError("Processing log sink is stopped")
+        await self._slots.acquire()
+        self._put(values)
+
+    async def stage(self, session: AsyncSession, values: Dict[str, Any]) -> None:
+        """
+        Queue a row once the session's current transaction commits.
+
+        Outside a transaction the row is queued immediately. Capacity is
+        reserved up front, so backpressure applies when staging.
+
+        Args:
+            session: Caller's session
+            values: ProcessingLog column values
+        """
+        if not session.in_transaction():
+            await self.submit(values)
+            return
+        if self._closing:
+            raise RuntimeError("Processing log sink is stopped")
+
+        await self._slots.acquire()
+        self._hook(session)
+        session.info.setdefault(_PENDING_KEY, []).append(values)
+
+    def _hook(self, session: AsyncSession) -> None:
+        """Attach commit/rollback listeners to a session (once)."""
+        if session.info.get(_HOOKED_KEY):
+            return
+        session.info[_HOOKED_KEY] = True
+        sync_session = session.sync_session
+
+        @event.listens_for(sync_session, "after_commit")
+        def after_commit(sess):
+            for values in sess.info.pop(_PENDING_KEY, []):
+                self._put(values)
+
+        @event.listens_for(sync_session, "after_transaction_end")
+        def after_transaction_end(sess, transaction):
+            # Still pending at the end of the outermost transaction: rolled back
+            if transaction.parent is None:
+                for _values in sess.info.pop(_PENDING_KEY, []):
+                    self._slots.release()
+
+    async def _next_batch(self) -> List[Any]:
+        """Wait for the first entry, then gather until full or flush_seconds pass."""
+        while not self._queue:
+            self._wakeup.clear()
+            await self._wakeup.wait()
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.flush_seconds
+        batch = []
+        while len(batch) < self.batch_size:
+            self._wakeup.clear()
+            while self._queue and len(batch) < self.batch_size:
+                item = self._queue.popleft()
+                batch.append(item)
+                if item is _STOP:
+                    return batch
+            remaining = deadline - loop.time()
+            if len(batch) >= self.batch_size or remaining <= 0:
+                break
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), remaining)
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        """Writer loop: batch, insert, repeat until the stop marker."""
+        while True:
+            batch = await self._next_batch()
+            stopping = batch and batch[-1] is _STOP
+            rows = [item for item in batch if item is not _STOP]
+            if rows:
+                try:
+                    await self._write(rows)
+                finally:
+                    for _row in rows:
+                        self._slots.release()
+            if stopping:
+                return
+
+    async def _write(self, rows: List[Dict[str, Any]]) -> None:
+        """Insert rows in one statement; on failure isolate the bad rows."""
+        try:
+            async with self._session_factory() as session:
+                await session.execute(insert(ProcessingLog), rows)
+                await session.commit()
+            self.written += len(rows)
+            self.batches += 1
+        except Exception as e:
+            if len(rows) == 1:
+                self.failed += 1
+                logger.error(f"Dropping processing log entry for job {rows[0].get('job_id')}: {e}")
+                return
+            logger.warning(f"Processing log batch of {len(rows)} failed, retrying rows individually: {e}")
+            for row in rows:
+                await self._write([row])
+
+
+# =============================================================================
+# Global sink reference
+# =============================================================================
+_LOG_SINK: Optional[ProcessingLogSink] = None
+
+
+def start_log_sink(
+    session_factory: async_sessionmaker[AsyncSession]
+) -> Optional[ProcessingLogSink]:
+    """
+    Create and start the global sink (no-op when LOG_SINK_ENABLED=false).
+
+    Args:
+        session_factory: Factory for the writer's sessions
+
+    Returns:
+        Running ProcessingLogSink, or None when disabled
+    """
+    global _LOG_SINK
+
+    if not LOG_SINK_CONFIG["enabled"]:
+        return None
+    if _LOG_SINK is None:
+        _LOG_SINK = ProcessingLogSink(
+            session_factory,
+            max_queue=LOG_SINK_CONFIG["max_queue"],
+            batch_size=LOG_SINK_CONFIG["batch_size"],
+            flush_seconds=LOG_SINK_CONFIG["flush_seconds"],
+        )
+        _LOG_SINK.start()
+        logger.info("Processing log sink started")
+    return _LOG_SINK
+
+
+def get_log_sink() -> Optional[ProcessingLogSink]:
+    """Get the running sink, or None when log writes are synchronous."""
+    return _LOG_SINK
+
+
+async def stop_log_sink() -> None:
+    """Drain and stop the global sink."""
+    global _LOG_SINK
+
+    if _LOG_SINK is not None:
+        await _LOG_SINK.stop(timeout=LOG_SINK_CONFIG["drain_timeout_seconds"])
+        logger.info(f"Processing log sink stopped: {_LOG_SINK.stats()}")
+        _LOG_SINK = None
+
+
+__all__ = [
+    "LOG_SINK_CONFIG",
+    "ProcessingLogSink",
+    "get_log_sink",
+    "start_log_sink",
+    "stop_log_sink",
+]
@@ -0,0 +1,231 @@
+"""
+Stale Job Reaper Module
+
+Background recovery of jobs whose worker stopped heartbeating.
+
+Workers claim jobs under a lease (POST /api/v1/jobs/claim) and extend it
+with POST /api/v1/jobs/{id}/heartbeat while they work. A worker that
+crashes stops extending its lease. Every interval_seconds the reaper
+recovers processing jobs whose lease has expired. A job that has been
+claimed fewer than max_attempts times goes back to pending for another
+worker. A job that has used all its attempts is failed. Each recovered job
+gets a processing_log entry (stage "recovery").
+
+Recovery is a single bulk UPDATE ... RETURNING per batch, with SKIP LOCKED,
+so every API process can run a reaper without coordination.
+"""
+
+import asyncio
+import logging
+import os
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from api.models.job import JobStatus
+from api.models.processing_log import ProcessingLogStatus, ProcessingStage
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Reaper Configuration
+# =============================================================================
+REAPER_CONFIG = {
+    "enabled": os.environ.get("JOB_REAPER_ENABLED", "true").lower() == "true",
+    "interval_seconds": float(os.environ.get("JOB_REAPER_INTERVAL_SECONDS", "30")),
+    "max_attempts": int(os.environ.get("JOB_MAX_ATTEMPTS", "3")),
+    "batch_size": int(os.environ.get("JOB_REAPER_BATCH_SIZE", "500")),
+}
+
+
+class StaleJobReaper:
+    """
+    Periodically requeues or fails jobs with expired worker leases.
+
+    Example:
+        ```python
+        reaper = StaleJobReaper(get_session_factory(), max_attempts=3)
+        reaper.start()
+        await reaper.stop()
+        ```
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        interval_seconds: float = 30.0,
+        max_attempts: int = 3,
+        batch_size: int = 500
+    ) -> None:
+        """
+        Initialize the reaper.
+
+        Args:
+            session_factory: Factory for the reaper's own sessions
+            interval_seconds: Pause between sweeps
+            max_attempts: Claims after which an expired job is failed
+            batch_size: Maximum jobs recovered per statement
+        """
+        self._session_factory = session_factory
+        self.interval_seconds = interval_seconds
+        self.max_attempts = max_attempts
+        self.batch_size = batch_size
+        self._task: Optional[asyncio.Task] = None
+        self.requeued = 0
+        self.failed = 0
+        self.sweeps = 0
+
+    async def reap_once(self) -> int:
+        """
+        Recover one batch of expired jobs and log each one, in one transaction.
+
+        Returns:
+            Number of jobs recovered
+        """
+        # Imported here: api.repositories.processing_log imports this package
+        from api.repositories.job import JobRepository
+        from api.repositories.processing_log import ProcessingLogRepository
+
+        async with self._session_factory() as session:
+            recovered = await JobRepository(session).recover_expired_leases(
+                self.max_attempts, limit=self.batch_size
+            )
+            entries: List[Dict[str, Any]] = []
+            for job, worker in recovered:
+                gave_up = job.status == JobStatus.FAILED
+                entries.append({
+                    "job_id": job.id,
+                    "stage": ProcessingStage.RECOVERY,
+                    "status": ProcessingLogStatus.FAILED if gave_up else ProcessingLogStatus.WARNING,
+                    "message": (
+                        f"Lease held by {worker} expired on attempt {job.attempts}/{self.max_attempts}; "
+                        + ("job failed" if gave_up else "job requeued")
+                    ),
+                    "details_json": {
+                        "worker_id": worker,
+                        "attempts": job.attempts,
+                        "max_attempts": self.max_attempts,
+                        "action": "failed" if gave_up else "requeued",
+                    },
+                })
+            await ProcessingLogRepository(session).log_many(entries)
+            await session.commit()
+
+        failed = sum(1 for job, _worker in recovered if job.status == JobStatus.FAILED)
+        self.failed += failed
+        self.requeued += len(recovered) - failed
+        if recovered:
+            logger.warning(
+                f"Recovered {len(recovered)} job(s) with expired leases: "
+                f"{len(recovered) - failed} requeued, {failed} failed"
+            )
+        return len(recovered)
+
+    async def sweep(self) -> int:
+        """
+        Recover every currently expired job, batch_size at a time.
+
+        Returns:
+            Number of jobs recovered
+        """
+        total = 0
+        while True:
+            recovered = await self.reap_once()
+            total += recovered
+            if recovered < self.batch_size:
+                break
+        self.sweeps += 1
+        return total
+
+    async def _run(self) -> None:
+        """Sweep loop."""
+        while True:
+            try:
+                await self.sweep()
+            except Exception as e:
+                logger.error(f"Stale job sweep failed: {e}")
+            await asyncio.sleep(self.interval_seconds)
+
+    def start(self) -> None:
+        """Start the sweep loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="stale-job-reaper")
+
+    async def stop(self) -> None:
+        """Stop the sweep loop (a sweep in progress is rolled back)."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Recovery counters."""
+        return {
+            "requeued": self.requeued,
+            "failed": self.failed,
+            "sweeps": self.sweeps,
+            "max_attempts": self.max_attempts,
+            "interval_seconds": self.interval_seconds,
+        }
+
+
+# =============================================================================
+# Global reaper reference
+# =============================================================================
+_REAPER: Optional[StaleJobReaper] = None
+
+
+def start_reaper(
+    session_factory: async_sessionmaker[AsyncSession]
+) -> Optional[StaleJobReaper]:
+    """
+    Create and start the global reaper (no-op when JOB_REAPER_ENABLED=false).
+
+    Args:
+        session_factory: Factory for the reaper's sessions
+
+    Returns:
+        Running StaleJobReaper, or None when disabled
+    """
+    global _REAPER
+
+    if not REAPER_CONFIG["enabled"]:
+        return None
+    if _REAPER is None:
+        _REAPER = StaleJobReaper(
+            session_factory,
+            interval_seconds=REAPER_CONFIG["interval_seconds"],
+            max_attempts=REAPER_CONFIG["max_attempts"],
+            batch_size=REAPER_CONFIG["batch_size"],
+        )
+        _REAPER.start()
+        logger.info("Stale job reaper started")
+    return _REAPER
+
+
+def get_reaper() -> Optional[StaleJobReaper]:
+    """Get the running reaper, or None when disabled."""
+    return _REAPER
+
+
+async def stop_reaper() -> None:
+    """Stop the global reaper."""
+    global _REAPER
+
+    if _REAPER is not None:
+        await _REAPER.stop()
+        _REAPER = None
+
+
+__all__ = [
+    "REAPER_CONFIG",
+    "StaleJobReaper",
+    "get_reaper",
+    "start_reaper",
+    "stop_reaper",
+]
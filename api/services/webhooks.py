@@ -0,0 +1,384 @@
+"""
+Webhook Dispatcher Module
+
+Background delivery of job completion callbacks from the webhook outbox.
+
+JobRepository.update_status writes an outbox row in the status change's own
+transaction when a job with a callback_url completes or fails; the request
+never waits on the receiver. The dispatcher claims due rows, groups them by
+callback_url and POSTs up to batch_size events per request over a pooled,
+keep-alive HTTP client, with at most `concurrency` requests in flight:
+
+    POST {callback_url}
+    {"events": [{"id": ..., "attempt": 1, "event": "job.completed", "job_id": ..., ...}]}
+
+Any 2xx acknowledges every event in the request. Other responses and
+transport errors schedule a retry with exponential backoff and jitter until
+max_attempts, after which the rows are marked dead. Delivery is
+at-least-once; receivers should de-duplicate on the event id.
+
+The dispatcher polls every poll_seconds and is also woken by terminal job
+status events from the job event hub, so callbacks normally go out within
+milliseconds of the commit.
+"""
+
+import asyncio
+import logging
+import os
+import random
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import httpx
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from api.models.webhook_outbox import WebhookOutbox
+from api.repositories.webhook_outbox import WebhookOutboxRepository
+from api.services.job_events import JobEventHub
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Dispatcher Configuration
+# =============================================================================
+WEBHOOK_CONFIG = {
+    "enabled": os.environ.get("WEBHOOKS_ENABLED", "true").lower() == "true",
+    "concurrency": int(os.environ.get("WEBHOOK_CONCURRENCY", "10")),
+    "batch_size": int(os.environ.get("WEBHOOK_BATCH_SIZE", "50")),
+    "claim_limit": int(os.environ.get("WEBHOOK_CLAIM_LIMIT", "500")),
+    "poll_seconds": float(os.environ.get("WEBHOOK_POLL_SECONDS", "1.0")),
+    "max_attempts": int(os.environ.get("WEBHOOK_MAX_ATTEMPTS", "8")),
+    "backoff_seconds": float(os.environ.get("WEBHOOK_BACKOFF_SECONDS", "2")),
+    "backoff_max_seconds": float(os.environ.get("WEBHOOK_BACKOFF_MAX_SECONDS", "600")),
+    "timeout_seconds": float(os.environ.get("WEBHOOK_TIMEOUT_SECONDS", "10")),
+    "lease_seconds": int(os.environ.get("WEBHOOK_LEASE_SECONDS", "120")),
+    "drain_timeout_seconds": float(os.environ.get("WEBHOOK_DRAIN_TIMEOUT_SECONDS", "15")),
+}
+
+USER_AGENT = "media-analysis-api-webhooks/1.0"
+
+# Job statuses whose events may have queued a callback
+_CALLBACK_STATUSES = frozenset({"completed", "failed"})
+
+# Outcome of one POST: the entries it carried and the error (None on success)
+Outcome = Tuple[List[WebhookOutbox], Optional[str]]
+
+
+class WebhookDispatcher:
+    """
+    Claims due outbox entries and delivers them in per-endpoint batches.
+
+    Example:
+        ```python
+        dispatcher = WebhookDispatcher(get_session_factory())
+        dispatcher.start()
+        await dispatcher.stop()
+        ```
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        concurrency: int = 10,
+        batch_size: int = 50,
+        claim_limit: int = 500,
+        poll_seconds: float = 1.0,
+        max_attempts: int = 8,
+        backoff_seconds: float = 2.0,
+        backoff_max_seconds: float = 600.0,
+        timeout_seconds: float = 10.0,
+        lease_seconds: int = 120,
+        client: Optional[httpx.AsyncClient] = None
+    ) -> None:
+        """
+        Initialize the dispatcher.
+
+        Args:
+            session_factory: Factory for the dispatcher's own sessions
+            concurrency: Maximum POSTs in flight (also the connection pool size)
+            batch_size: Maximum events per POST
+            claim_limit: Maximum entries claimed per round
+            poll_seconds: Idle wait between rounds
+            max_attempts: Attempts before an entry is marked dead
+            backoff_seconds: Delay after the first failed attempt (doubles each time)
+            backoff_max_seconds: Cap on the retry delay
+            timeout_seconds: Per-request HTTP timeout
+            lease_seconds: How long a claim is held before another round may retry it
+            client: HTTP client to use (default: a pooled client owned by the dispatcher)
+        """
+        self._session_factory = session_factory
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.claim_limit = claim_limit
+        self.poll_seconds = poll_seconds
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+        self.lease_seconds = lease_seconds
+        self._owns_client = client is None
+        self._client = client or httpx.AsyncClient(
+            timeout=timeout_seconds,
+            limits=httpx.Limits(
+                max_connections=concurrency,
+                max_keepalive_connections=concurrency
+            ),
+            headers={"User-Agent": USER_AGENT},
+        )
+        self._limit = asyncio.Semaphore(concurrency)
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        self._task: Optional[asyncio.Task] = None
+        self._watcher: Optional[asyncio.Task] = None
+        self.delivered = 0
+        self.failed_attempts = 0
+        self.dead = 0
+        self.requests = 0
+
+    # -------------------------------------------------------------------------
+    # Delivery
+    # -------------------------------------------------------------------------
+
+    def backoff(self, attempts: int) -> float:
+        """Delay before the next attempt after `attempts` failures (before jitter)."""
+        return min(self.backoff_max_seconds, self.backoff_seconds * 2 ** max(attempts - 1, 0))
+
+    async def deliver(self, entries: Sequence[WebhookOutbox]) -> List[Outcome]:
+        """
+        POST entries grouped by endpoint, batch_size events per request.
+
+        Args:
+            entries: Claimed outbox entries
+
+        Returns:
+            One (entries, error) outcome per request sent
+        """
+        by_endpoint: Dict[str, List[WebhookOutbox]] = defaultdict(list)
+        for entry in entries:
+            by_endpoint[entry.callback_url].append(entry)
+
+        batches = [
+            group[start:start + self.batch_size]
+            for group in by_endpoint.values()
+            for start in range(0, len(group), self.batch_size)
+        ]
+        return list(await asyncio.gather(*(self._post(batch) for batch in batches)))
+
+    async def _post(self, batch: List[WebhookOutbox]) -> Outcome:
+        """Send one batch to its endpoint."""
+        body = {
+            "events": [
+                dict(entry.payload, id=str(entry.id), attempt=entry.attempts)
+                for entry in batch
+            ]
+        }
+        async with self._limit:
+            self.requests += 1
+            try:
+                response = await self._client.post(batch[0].callback_url, json=body)
+            except httpx.HTTPError as e:
+                return batch, f"{type(e).__name__}: {e}"
+        if 200 <= response.status_code < 300:
+            return batch, None
+        return batch, f"HTTP {response.status_code}"
+
+    async def settle(self, outcomes: Sequence[Outcome]) -> None:
+        """
+        Record delivery outcomes: delivered, retry later, or dead.
+
+        Args:
+            outcomes: Results of deliver()
+        """
+        delivered: List[Any] = []
+        retries: Dict[Tuple[int, str], List[Any]] = defaultdict(list)
+        dead: Dict[str, List[Any]] = defaultdict(list)
+        for batch, error in outcomes:
+            if error is None:
+                delivered.extend(entry.id for entry in batch)
+                continue
+            logger.warning(f"Webhook delivery to {batch[0].callback_url} failed: {error}")
+            for entry in batch:
+                if entry.attempts >= self.max_attempts:
+                    dead[error].append(entry.id)
+                else:
+                    retries[(entry.attempts, error)].append(entry.id)
+
+        async with self._session_factory() as session:
+            outbox = WebhookOutboxRepository(session)
+            await outbox.mark_delivered(delivered)
+            for (attempts, error), ids in retries.items():
+                delay = self.backoff(attempts)
+                await outbox.mark_retry(ids, error, delay_seconds=random.uniform(delay / 2, delay))
+            for error, ids in dead.items():
+                await outbox.mark_dead(ids, error)
+            await session.commit()
+
+        self.delivered += len(delivered)
+        self.failed_attempts += sum(len(ids) for ids in retries.values())
+        self.dead += sum(len(ids) for ids in dead.values())
+        for ids in dead.values():
+            logger.error(f"Giving up on {len(ids)} webhook(s) after {self.max_attempts} attempts")
+
+    async def dispatch_once(self) -> int:
+        """
+        Claim, deliver and settle one round of due entries.
+
+        Returns:
+            Number of entries claimed
+        """
+        async with self._session_factory() as session:
+            entries = await WebhookOutboxRepository(session).claim_due(
+                self.claim_limit, lease_seconds=self.lease_seconds
+            )
+            await session.commit()
+        if entries:
+            await self.settle(await self.deliver(entries))
+        return len(entries)
+
+    # -------------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------------
+
+    def wake(self) -> None:
+        """Run the next round now instead of after poll_seconds."""
+        self._wakeup.set()
+
+    async def _run(self) -> None:
+        """Dispatch loop: back-to-back rounds while busy, otherwise wait."""
+        while not self._stopping:
+            self._wakeup.clear()
+            try:
+                claimed = await self.dispatch_once()
+            except Exception as e:
+                logger.error(f"Webhook dispatch round failed: {e}")
+                claimed = 0
+            if claimed >= self.claim_limit or self._stopping:
+                continue
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _watch(self, hub: JobEventHub) -> None:
+        """Wake on terminal job status events (and after listener reconnects)."""
+        async with hub.subscribe() as subscription:
+            while True:
+                event = await subscription.get()
+                if event.get("type") == "reset" or (
+                    event.get("type") == "status" and event.get("status") in _CALLBACK_STATUSES
+                ):
+                    self.wake()
+
+    def start(self, hub: Optional[JobEventHub] = None) -> None:
+        """
+        Start the dispatch loop.
+
+        Args:
+            hub: Job event hub to take wake-ups from (optional)
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="webhook-dispatcher")
+        if hub is not None and self._watcher is None:
+            self._watcher = asyncio.create_task(self._watch(hub), name="webhook-dispatcher-watch")
+
+    async def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Finish the current round and stop.
+
+        Entries claimed by a round cut short by the timeout are retried by
+        the next dispatcher once their lease expires.
+
+        Args:
+            timeout: Seconds to wait for the current round before cancelling it
+        """
+        self._stopping = True
+        self.wake()
+        for task in (self._watcher, self._task):
+            if task is None:
+                continue
+            if task is self._watcher:
+                task.cancel()
+            try:
+                await asyncio.wait_for(task, timeout)
+            except (asyncio.CancelledError, asyncio.TimeoutError):
+                pass
+        self._task = self._watcher = None
+        if self._owns_client:
+            await self._client.aclose()
+
+    def stats(self) -> Dict[str, Any]:
+        """Delivery counters."""
+        return {
+            "delivered": self.delivered,
+            "failed_attempts": self.failed_attempts,
+            "dead": self.dead,
+            "requests": self.requests,
+            "concurrency": self.concurrency,
+        }
+
+
+# =============================================================================
+# Global dispatcher reference
+# =============================================================================
+_WEBHOOK_DISPATCHER: Optional[WebhookDispatcher] = None
+
+
+def start_webhook_dispatcher(
+    session_factory: async_sessionmaker[AsyncSession],
+    hub: Optional[JobEventHub] = None
+) -> Optional[WebhookDispatcher]:
+    """
+    Create and start the global dispatcher (no-op when WEBHOOKS_ENABLED=false).
+
+    Args:
+        session_factory: Factory for the dispatcher's sessions
+        hub: Job event hub to take wake-ups from (optional)
+
+    Returns:
+        Running WebhookDispatcher, or None when disabled
+    """
+    global _WEBHOOK_DISPATCHER
+
+    if not WEBHOOK_CONFIG["enabled"]:
+        return None
+    if _WEBHOOK_DISPATCHER is None:
+        _WEBHOOK_DISPATCHER = WebhookDispatcher(
+            session_factory,
+            concurrency=WEBHOOK_CONFIG["concurrency"],
+            batch_size=WEBHOOK_CONFIG["batch_size"],
+            claim_limit=WEBHOOK_CONFIG["claim_limit"],
+            poll_seconds=WEBHOOK_CONFIG["poll_seconds"],
+            max_attempts=WEBHOOK_CONFIG["max_attempts"],
+            backoff_seconds=WEBHOOK_CONFIG["backoff_seconds"],
+            backoff_max_seconds=WEBHOOK_CONFIG["backoff_max_seconds"],
+            timeout_seconds=WEBHOOK_CONFIG["timeout_seconds"],
+            lease_seconds=WEBHOOK_CONFIG["lease_seconds"],
+        )
+        _WEBHOOK_DISPATCHER.start(hub)
+        logger.info("Webhook dispatcher started")
+    return _WEBHOOK_DISPATCHER
+
+
+def get_webhook_dispatcher() -> Optional[WebhookDispatcher]:
+    """Get the running dispatcher, or None when webhooks are disabled."""
+    return _WEBHOOK_DISPATCHER
+
+
+async def stop_webhook_dispatcher() -> None:
+    """Stop the global dispatcher."""
+    global _WEBHOOK_DISPATCHER
+
+    if _WEBHOOK_DISPATCHER is not None:
+        await _WEBHOOK_DISPATCHER.stop(timeout=WEBHOOK_CONFIG["drain_timeout_seconds"])
+        logger.info(f"Webhook dispatcher stopped: {_WEBHOOK_DISPATCHER.stats()}")
+        _WEBHOOK_DISPATCHER = None
+
+
+__all__ = [
+    "WEBHOOK_CONFIG",
+    "WebhookDispatcher",
+    "get_webhook_dispatcher",
+    "start_webhook_dispatcher",
+    "stop_webhook_dispatcher",
+]
@@ -0,0 +1,199 @@
+"""
+Startup Module
+
+Fast production startup for the API (DB_STARTUP_MODE=fast).
+
+The default startup runs Base.metadata.create_all, which reflects every
+table, and verifies connectivity over a single connection; the first burst
+of requests after a deploy then pays for opening the rest of the pool.
+Fast mode instead:
+
+- checks that the database is at the Alembic head revision (one query)
+- opens DB_POOL_MIN connections concurrently and runs the hot repository
+  queries on each, so asyncpg's per-connection prepared statement cache is
+  already populated when traffic arrives
+"""
+
+import asyncio
+import logging
+import os
+from contextlib import AsyncExitStack
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Awaitable, Callable, List, Optional
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+
+from api.models.database import POOL_CONFIG
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Startup Configuration
+# =============================================================================
+STARTUP_CONFIG = {
+    # "create_all" (development default) or "fast" (production)
+    "mode": os.environ.get("DB_STARTUP_MODE", "create_all").lower(),
+    # Connections to open before serving; defaults to the pool size
+    "warm_connections": int(os.environ.get("DB_WARM_CONNECTIONS", str(POOL_CONFIG["min_size"]))),
+    # Skip reading migration scripts when the image ships without them
+    "expected_revision": os.environ.get("DB_EXPECTED_REVISION"),
+    "alembic_config": os.environ.get(
+        "ALEMBIC_CONFIG",
+        str(Path(__file__).resolve().parent.parent / "alembic.ini")
+    ),
+}
+
+# Placeholder key for warm-up lookups; matches no row
+_WARM_ID = UUID(int=0)
+
+
+def expected_schema_revision() -> Optional[str]:
+    """
+    Return the Alembic head revision the code expects.
+
+    Uses DB_EXPECTED_REVISION when set, otherwise reads the migration
+    scripts next to alembic.ini.
+
+    Returns:
+        Head revision id, or None if it cannot be determined
+
+    Raises:
+        RuntimeError: If DB_EXPECTED_REVISION is unset and alembic is not
+            installed
+    """
+    if STARTUP_CONFIG["expected_revision"]:
+        return STARTUP_CONFIG["expected_revision"]
+
+    try:
+        from alembic.script import ScriptDirectory
+    except ImportError as e:
+        raise RuntimeError(
+            "Cannot determine the expected schema revision: alembic is not "
+            "installed; set DB_EXPECTED_REVISION to the migration head revision"
+        ) from e
+
+    # script_location in alembic.ini is relative to the repository root; the
+    # scripts are opened directly so the ini's file_template is never parsed
+    config_path = Path(STARTUP_CONFIG["alembic_config"])
+    return ScriptDirectory(str(config_path.parent / "migrations")).get_current_head()
+
+
+async def check_schema_revision(engine: AsyncEngine) -> str:
+    """
+    Verify the database is migrated to the expected Alembic revision.
+
+    Args:
+        engine: AsyncEngine to check
+
+    Returns:
+        The database's current revision
+
+    Raises:
+        RuntimeError: If the database is unmigrated or at another revision
+    """
+    async with engine.connect() as conn:
+        try:
+            result = await conn.execute(text("SELECT version_num FROM alembic_version"))
+        except Exception as e:
+            raise RuntimeError(f"Database has no alembic_version table; run migrations first: {e}")
+        current = result.scalar_one_or_none()
+
+    expected = expected_schema_revision()
+    if expected is not None and current != expected:
+        raise RuntimeError(
+            f"Database schema is at revision {current!r}, expected {expected!r}; "
+            f"run 'alembic upgrade head'"
+        )
+
+    logger.info(f"Database schema at revision {current}")
+    return current
+
+
+def _hot_queries() -> List[Callable[[AsyncSession], Awaitable[object]]]:
+    """Repository calls whose statements are prepared on every warmed connection."""
+    from api.repositories.job import JobRepository
+    from api.repositories.pagination import encode_cursor
+    from api.repositories.result import ResultRepository
+
+    # Keyset cursor older than every row (empty page), for the cursor listings
+    cursor = encode_cursor(datetime(1970, 1, 1, tzinfo=timezone.utc), _WARM_ID)
+    return [
+        lambda session: JobRepository(session).get_by_id(_WARM_ID),
+        lambda session: JobRepository(session).get_updated_at(_WARM_ID),
+        lambda session: JobRepository(session).get_all(limit=1),
+        lambda session: JobRepository(session).get_all(limit=1, cursor=cursor),
+        lambda session: JobRepository(session).get_pending_jobs(limit=1),
+        lambda session: JobRepository(session).count(),
+        lambda session: ResultRepository(session).get_by_id(_WARM_ID),
+        lambda session: ResultRepository(session).get_updated_at(_WARM_ID),
+        lambda session: ResultRepository(session).get_all(limit=1, cursor=cursor),
+    ]
+
+
+async def _warm_connection(conn: AsyncConnection) -> int:
+    """Run the hot queries on one connection; returns how many succeeded."""
+    from api.repositories.cache import SESSION_BYPASS_CACHE
+
+    warmed = 0
+    for query in _hot_queries():
+        # Read the database, so the statements are really prepared and the
+        # entity cache neither records misses nor keeps stale entries
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            autoflush=False,
+            info={SESSION_BYPASS_CACHE: True}
+        )
+        try:
+            await query(session)
+            warmed += 1
+        except Exception as e:
+            logger.debug(f"Warm-up query failed: {e}")
+        finally:
+            await session.close()
+            await conn.rollback()
+    return warmed
+
+
+async def warm_pool(engine: AsyncEngine, connections: Optional[int] = None) -> int:
+    """
+    Open pool connections concurrently and prepare the hot statements.
+
+    All connections are held until every one is warmed, so the pool
+    really opens `connections` distinct connections rather than reusing
+    the first one.
+
+    Args:
+        engine: AsyncEngine whose pool to warm
+        connections: Number of connections (default: DB_WARM_CONNECTIONS)
+
+    Returns:
+        Number of connections opened
+    """
+    count = STARTUP_CONFIG["warm_connections"] if connections is None else connections
+    if count <= 0:
+        return 0
+
+    async with AsyncExitStack() as stack:
+        opened = await asyncio.gather(
+            *(stack.enter_async_context(engine.connect()) for _ in range(count))
+        )
+        warmed = await asyncio.gather(*(_warm_connection(conn) for conn in opened))
+
+    logger.info(
+        f"Warmed {len(opened)} pooled connections "
+        f"({min(warmed) if warmed else 0}/{len(_hot_queries())} hot statements each)"
+    )
+    return len(opened)
+
+
+__all__ = [
+    "STARTUP_CONFIG",
+    "check_schema_revision",
+    "expected_schema_revision",
+    "warm_pool",
+]
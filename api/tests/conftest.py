@@ -11,6 +11,7 @@ This module provides pytest fixtures for database testing, including:
 import asyncio
 import sys
 from typing import AsyncGenerator, Generator
+from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
@@ -181,6 +182,28 @@ async def db_session_factory(test_engine) -> async_sessionmaker[AsyncSession]:
     )
 
 
+@pytest_asyncio.fixture
+async def api_client(test_session):
+    """
+    HTTP client for the app with its database dependencies bound to test_session.
+    """
+    import httpx
+
+    from api.main import app
+    from api.models.dependencies import get_read_session, get_session
+
+    async def override_session():
+        yield test_session
+
+    app.dependency_overrides[get_read_session] = override_session
+    app.dependency_overrides[get_session] = override_session
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        yield client
+    app.dependency_overrides.clear()
+
+
 # =============================================================================
 # Model Instance Fixtures
 # =============================================================================
@@ -396,9 +419,74 @@ def mock_session(mocker):
     mock.close = mocker.AsyncMock()
     mock.add = mocker.Mock()
     mock.delete = mocker.Mock()
+    mock.info = {}
+    mock.bind.dialect.name = "postgresql"
     return mock
 
 
+@pytest.fixture
+def db_result(mock_session, mocker):
+    """Result returned by every mock_session.execute call; tests set its returns."""
+    result = mocker.MagicMock()
+    mock_session.execute = mocker.AsyncMock(return_value=result)
+    return result
+
+
+@pytest.fixture
+def compile_postgres():
+    """Compile a statement against the PostgreSQL dialect for inspection."""
+    from sqlalchemy.dialects import postgresql
+
+    return lambda stmt: str(stmt.compile(dialect=postgresql.dialect()))
+
+
+class _RecordingSessionFactory:
+    """Session factory stand-in that records the rows of each bulk insert."""
+
+    def __init__(self):
+        self.batches = []
+
+    def __call__(self):
+        session = MagicMock()
+        session.execute = AsyncMock(side_effect=lambda stmt, rows: self.batches.append(list(rows)))
+        session.commit = AsyncMock()
+        context = MagicMock()
+        context.__aenter__ = AsyncMock(return_value=session)
+        context.__aexit__ = AsyncMock(return_value=False)
+        return context
+
+
+@pytest.fixture
+def recording_session_factory():
+    """Session factory that records the rows of each bulk insert."""
+    return _RecordingSessionFactory()
+
+
+@pytest.fixture(autouse=True)
+def entity_cache_disabled():
+    """Keep the global entity cache off unless a test configures one."""
+    from api.repositories.cache import configure_entity_cache
+
+    configure_entity_cache(enabled=False)
+    yield
+    configure_entity_cache(enabled=False)
+
+
+@pytest.fixture(autouse=True)
+def derived_table_triggers_installed():
+    """Treat the counter and rollup triggers as installed unless a test clears them."""
+    from api.models.job_status_counter import STATUS_COUNTER_TRIGGER
+    from api.models.provider_rollup import RESULT_ROLLUP_TRIGGERS, TRANSCRIPTION_ROLLUP_TRIGGERS
+    from api.repositories import triggers
+
+    triggers._VERIFIED.clear()
+    triggers._VERIFIED.add(("analysis_job", STATUS_COUNTER_TRIGGER))
+    triggers._VERIFIED.update(("analysis_result", name) for name in RESULT_ROLLUP_TRIGGERS)
+    triggers._VERIFIED.update(("transcription", name) for name in TRANSCRIPTION_ROLLUP_TRIGGERS)
+    yield
+    triggers._VERIFIED.clear()
+
+
 @pytest.fixture
 def mock_engine(mocker):
     """Mock database engine."""
@@ -0,0 +1,81 @@
+"""
+Tests for the job API endpoints.
+
+This module tests:
+- Statistics and pending counts
+- Status transition endpoints
+"""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+
+from api.models.job import AnalysisJob, JobStatus, MediaType
+
+
+class TestJobStatisticsEndpoints:
+    """Tests for job statistics on a database built with create_all."""
+
+    @pytest.fixture(autouse=True)
+    def without_migration_triggers(self):
+        """create_all does not install the counter trigger."""
+        from api.repositories import triggers
+
+        triggers._VERIFIED.clear()
+
+    @pytest_asyncio.fixture
+    async def jobs(self, test_session):
+        """Two pending jobs and one failed job."""
+        for status in (JobStatus.PENDING, JobStatus.PENDING, JobStatus.FAILED):
+            test_session.add(AnalysisJob(status=status, media_type=MediaType.VIDEO))
+        await test_session.flush()
+
+    @pytest.mark.asyncio
+    async def test_statistics_count_jobs(self, api_client, jobs):
+        """/jobs/statistics aggregates analysis_job instead of failing."""
+        response = await api_client.get("/api/v1/jobs/statistics")
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "pending": 2, "processing": 0, "completed": 0, "failed": 1, "total": 3
+        }
+
+    @pytest.mark.asyncio
+    async def test_pending_total_counts_jobs(self, api_client, jobs):
+        """The pending listing's total is counted from analysis_job."""
+        response = await api_client.get("/api/v1/jobs", params={"status": "pending"})
+
+        assert response.status_code == 200
+        assert response.json()["total"] == 2
+
+
+class TestJobTransitionEndpoints:
+    """Tests for the job status transition endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_processing_passes_worker_to_transition(self, api_client):
+        """/processing moves the job with the worker that will hold its lease."""
+        from api.main import app, get_job_repository
+        from api.repositories.transitions import TransitionResult
+
+        now = datetime(2026, 10, 17, 12, 0)
+        job = AnalysisJob(
+            id=uuid4(), status=JobStatus.PROCESSING, media_type=MediaType.VIDEO,
+            claimed_by="worker-1", created_at=now, updated_at=now,
+        )
+        repository = MagicMock()
+        repository.transition = AsyncMock(return_value=TransitionResult(job))
+        app.dependency_overrides[get_job_repository] = lambda: repository
+
+        response = await api_client.post(
+            f"/api/v1/jobs/{job.id}/processing", params={"worker_id": "worker-1"}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["claimed_by"] == "worker-1"
+        repository.transition.assert_awaited_once_with(
+            job.id, JobStatus.PROCESSING, worker_id="worker-1"
+        )
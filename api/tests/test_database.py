@@ -20,9 +20,8 @@ from sqlalchemy.pool import StaticPool
 
 sys.path.insert(0, "/home/oz/projects/2025/oz/12/runpod/api")
 
-from models.base import Base
-from models.database import (
-    ASYNC_DATABASE_URL,
+from api.models.base import Base
+from api.models.database import (
     close_engine,
     create_async_engine_configured,
     get_async_session,
@@ -114,7 +113,7 @@ class TestSessionLifecycle:
     @pytest.mark.asyncio
     async def test_session_can_add_objects(self, test_session):
         """Test that objects can be added to the session."""
-        from models.job import AnalysisJob, JobStatus, MediaType
+        from api.models.job import AnalysisJob, JobStatus, MediaType
 
         job = AnalysisJob(
             status=JobStatus.PENDING,
@@ -131,7 +130,7 @@ class TestSessionLifecycle:
     @pytest.mark.asyncio
     async def test_session_can_refresh_objects(self, test_session):
         """Test that session can refresh objects from database."""
-        from models.job import AnalysisJob, JobStatus, MediaType
+        from api.models.job import AnalysisJob, JobStatus, MediaType
 
         job = AnalysisJob(
             status=JobStatus.PENDING,
@@ -149,7 +148,7 @@ class TestSessionLifecycle:
     @pytest.mark.asyncio
     async def test_session_close(self, test_session):
         """Test that session can be closed properly."""
-        from models.job import AnalysisJob, JobStatus, MediaType
+        from api.models.job import AnalysisJob, JobStatus, MediaType
 
         job = AnalysisJob(
             status=JobStatus.PROCESSING,
@@ -171,7 +170,7 @@ class TestTransactionRollback:
     @pytest.mark.asyncio
     async def test_rollback_discards_changes(self, test_session):
         """Test that rollback discards uncommitted changes."""
-        from models.job import AnalysisJob, JobStatus, MediaType
+        from api.models.job import AnalysisJob, JobStatus, MediaType
 
         # Add a job
         job = AnalysisJob(
@@ -205,7 +204,7 @@ class TestTransactionRollback:
     @pytest.mark.asyncio
     async def test_rollback_on_error(self, test_session):
         """Test that session rolls back on errors."""
-        from models.job import AnalysisJob, JobStatus, MediaType
+        from api.models.job import AnalysisJob, JobStatus, MediaType
 
         job = AnalysisJob(
             status=JobStatus.PENDING,
@@ -241,7 +240,7 @@ class TestTransactionRollback:
     @pytest.mark.asyncio
     async def test_nested_transaction_rollback(self, test_session):
         """Test rollback behavior with nested transactions."""
-        from models.job import AnalysisJob, JobStatus, MediaType
+        from api.models.job import AnalysisJob, JobStatus, MediaType
 
         # Create first job (committed)
         job1 = AnalysisJob(
@@ -387,7 +386,7 @@ class TestInMemoryDatabase:
         )
 
         async with session_factory() as session:
-            from models.job import AnalysisJob, JobStatus, MediaType
+            from api.models.job import AnalysisJob, JobStatus, MediaType
 
             job = AnalysisJob(
                 status=JobStatus.COMPLETED,
@@ -409,3 +408,80 @@ class TestInMemoryDatabase:
 
             assert fetched_job is not None
             assert fetched_job.status == JobStatus.COMPLETED
+
+
+class TestReadReplicaRouting:
+    """Tests for RoutingSession primary/replica routing."""
+
+    @pytest.fixture
+    def engines(self):
+        """Patch in a primary engine and a one-replica ReplicaSet."""
+        from api.models import database as database_package
+        from api.models.database import ReplicaSet
+
+        module = database_package.database_module
+        primary = create_async_engine("sqlite+aiosqlite:///:memory:")
+        replica = create_async_engine("sqlite+aiosqlite:///:memory:")
+        replicas = ReplicaSet([replica], retry_seconds=30)
+
+        with patch.object(module, "_ENGINE", primary), \
+                patch.object(module, "_REPLICAS", replicas):
+            yield primary, replica, replicas
+
+    def _session(self, read_only=True):
+        from api.models.database import READ_ONLY_KEY, RoutingSession
+        return RoutingSession(info={READ_ONLY_KEY: read_only})
+
+    def test_plain_select_goes_to_replica(self, engines):
+        """Test that reads in a read-only session use the replica."""
+        from sqlalchemy import select
+        from api.models.job import AnalysisJob
+
+        primary, replica, _ = engines
+        session = self._session()
+
+        assert session.get_bind(clause=select(AnalysisJob)) is replica.sync_engine
+
+    def test_write_pins_session_to_primary(self, engines):
+        """Test that a write routes to the primary and pins later reads."""
+        from sqlalchemy import select, update
+        from api.models.job import AnalysisJob
+
+        primary, replica, _ = engines
+        session = self._session()
+
+        assert session.get_bind(clause=update(AnalysisJob)) is primary.sync_engine
+        assert session.get_bind(clause=select(AnalysisJob)) is primary.sync_engine
+
+    def test_locking_select_goes_to_primary(self, engines):
+        """Test that SELECT ... FOR UPDATE is never sent to a replica."""
+        from sqlalchemy import select
+        from api.models.job import AnalysisJob
+
+        primary, _, _ = engines
+        session = self._session()
+
+        stmt = select(AnalysisJob).with_for_update(skip_locked=True)
+        assert session.get_bind(clause=stmt) is primary.sync_engine
+
+    def test_non_read_only_session_uses_primary(self, engines):
+        """Test that sticky (read-your-writes) sessions read from the primary."""
+        from sqlalchemy import select
+        from api.models.job import AnalysisJob
+
+        primary, _, _ = engines
+        session = self._session(read_only=False)
+
+        assert session.get_bind(clause=select(AnalysisJob)) is primary.sync_engine
+
+    def test_unhealthy_replica_falls_back_to_primary(self, engines):
+        """Test that reads fall back to the primary when no replica is healthy."""
+        from sqlalchemy import select
+        from api.models.job import AnalysisJob
+
+        primary, _, replicas = engines
+        replicas.mark_down(0)
+        session = self._session()
+
+        assert replicas.status() == {"configured": 1, "healthy": 0}
+        assert session.get_bind(clause=select(AnalysisJob)) is primary.sync_engine
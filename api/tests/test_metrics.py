@@ -0,0 +1,71 @@
+"""
+Tests for repository and statement metrics.
+
+This module tests:
+- Repository call timing, errors and metric rendering
+"""
+
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+
+class TestRepositoryMetrics:
+    """Tests for per-method repository instrumentation and /metrics output."""
+
+    @pytest.mark.asyncio
+    async def test_repository_calls_are_timed(self, mock_session, db_result):
+        """Inherited methods are recorded under the concrete repository name."""
+        from api.metrics import REPOSITORY_CALL_SECONDS
+        from api.repositories.result import ResultRepository
+
+        db_result.scalar_one_or_none.return_value = None
+        before = REPOSITORY_CALL_SECONDS.count(repository="ResultRepository", method="get_updated_at")
+
+        await ResultRepository(mock_session).get_updated_at(uuid4())
+
+        assert REPOSITORY_CALL_SECONDS.count(
+            repository="ResultRepository", method="get_updated_at"
+        ) == before + 1
+
+    @pytest.mark.asyncio
+    async def test_repository_errors_are_counted(self, mock_session):
+        """A raising method increments the error counter and re-raises."""
+        from api.metrics import REPOSITORY_ERRORS
+        from api.repositories.job import JobRepository
+
+        mock_session.execute = AsyncMock(side_effect=RuntimeError("boom"))
+        before = REPOSITORY_ERRORS.value(repository="JobRepository", method="get_updated_at")
+
+        with pytest.raises(RuntimeError):
+            await JobRepository(mock_session).get_updated_at(uuid4())
+
+        assert REPOSITORY_ERRORS.value(
+            repository="JobRepository", method="get_updated_at"
+        ) == before + 1
+
+    def test_statement_labels(self):
+        """Statements are labelled by leading keyword and first table."""
+        from api.metrics import statement_labels
+
+        assert statement_labels("SELECT analysis_job.id \nFROM analysis_job") == ("SELECT", "analysis_job")
+        assert statement_labels('INSERT INTO "processing_log" (id) VALUES ($1)') == ("INSERT", "processing_log")
+        assert statement_labels("UPDATE analysis_job SET status=$1") == ("UPDATE", "analysis_job")
+        assert statement_labels("select 1") == ("SELECT", "")
+
+    def test_histogram_renders_cumulative_buckets(self):
+        """Histogram output follows the Prometheus text format."""
+        from api.metrics import Histogram, MetricsRegistry
+
+        registry = MetricsRegistry()
+        histogram = registry.register(Histogram("demo_seconds", "Demo", ("pool",), buckets=(0.1, 1.0)))
+        for value in (0.05, 0.5, 5.0):
+            histogram.observe(value, pool="primary")
+
+        text = registry.render()
+        assert "# TYPE demo_seconds histogram" in text
+        assert 'demo_seconds_bucket{pool="primary",le="0.1"} 1' in text
+        assert 'demo_seconds_bucket{pool="primary",le="1"} 2' in text
+        assert 'demo_seconds_bucket{pool="primary",le="+Inf"} 3' in text
+        assert 'demo_seconds_count{pool="primary"} 3' in text
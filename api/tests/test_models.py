@@ -19,11 +19,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 sys.path.insert(0, "/home/oz/projects/2025/oz/12/runpod/api")
 
-from models.base import TimestampMixin
-from models.job import AnalysisJob, JobStatus, MediaType
-from models.media import FileType, MediaFile, MediaFileStatus
-from models.result import AnalysisProvider, AnalysisResult
-from models.transcription import Transcription, TranscriptionProvider
+from api.models.base import TimestampMixin
+from api.models.job import AnalysisJob, JobStatus, MediaType
+from api.models.media import FileType, MediaFile, MediaFileStatus
+from api.models.result import AnalysisProvider, AnalysisResult
+from api.models.transcription import Transcription, TranscriptionProvider
 
 
 class TestAnalysisJobModel:
@@ -229,7 +229,7 @@ class TestTranscriptionModel:
 
         transcription = Transcription(
             job_id=sample_job.id,
-            provider=TranscriptionProvider.DEEGRAM,
+            provider=TranscriptionProvider.DEEPGRAM,
             text="Hello world. This is a test. Transcription test.",
             segments_json=segments,
             language="en",
@@ -327,7 +327,7 @@ class TestRelationships:
         )
         transcription2 = Transcription(
             job_id=sample_job.id,
-            provider=TranscriptionProvider.DEEGRAM,
+            provider=TranscriptionProvider.DEEPGRAM,
             text="Second transcription",
             language="es",
         )
@@ -469,9 +469,9 @@ class TestEnumConstraints:
             TranscriptionProvider.WHISPER,
             TranscriptionProvider.GOOGLE,
             TranscriptionProvider.AZURE,
-            TranscriptionProvider.DEEGRAM,
+            TranscriptionProvider.DEEPGRAM,
             TranscriptionProvider.ASSEMBLYAI,
-            TranscriptionProvider.OPENAI,
+            TranscriptionProvider.ELEVENLABS,
         ],
     )
     def test_transcription_provider_enum_values(self, provider):
@@ -530,6 +530,34 @@ class TestTimestampMixin:
         assert job.updated_at is not None
 
 
+class TestSoftDeleteMixin:
+    """Tests for the SoftDeleteMixin."""
+
+    @pytest.mark.parametrize("model", [AnalysisJob, MediaFile, AnalysisResult, Transcription])
+    def test_soft_delete_columns_are_mapped(self, model):
+        """Every model whose queries filter on is_deleted maps the columns."""
+        columns = model.__table__.c
+
+        assert "is_deleted" in columns
+        assert "deleted_at" in columns
+
+    @pytest.mark.asyncio
+    async def test_new_rows_are_active(self, test_session):
+        """A flushed row defaults to not deleted."""
+        job = AnalysisJob(
+            status=JobStatus.PENDING,
+            media_type=MediaType.VIDEO,
+            source_url="https://example.com/soft-delete-test.mp4",
+        )
+
+        test_session.add(job)
+        await test_session.flush()
+
+        assert job.is_deleted is False
+        assert job.deleted_at is None
+        assert job.is_active
+
+
 class TestJSONBFields:
     """Tests for JSONB field handling."""
 
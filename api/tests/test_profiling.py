@@ -0,0 +1,56 @@
+"""
+Tests for per-request database profiling.
+
+This module tests:
+- Query accounting, N+1 detection and Server-Timing
+"""
+
+import pytest
+
+
+class TestRequestProfiling:
+    """Tests for per-request query accounting and N+1 detection."""
+
+    def test_records_only_inside_a_profile(self):
+        """Statements outside a request are ignored."""
+        import contextvars
+        from api.profiling import current_profile, record_statement, start_profile
+
+        def run():
+            record_statement("SELECT 1", 0.5)
+            assert current_profile() is None
+            profile = start_profile()
+            record_statement("SELECT 1", 0.002)
+            record_statement("SELECT 2", 0.003)
+            return profile
+
+        profile = contextvars.copy_context().run(run)
+
+        assert profile.query_count == 2
+        assert profile.db_seconds == pytest.approx(0.005)
+
+    def test_repeated_statements_are_flagged(self):
+        """Identical SQL issued per row is reported as an N+1 pattern."""
+        from api.profiling import PROFILE_CONFIG, RequestProfile
+
+        profile = RequestProfile()
+        profile.record("SELECT analysis_job.id FROM analysis_job", 0.001)
+        for _ in range(PROFILE_CONFIG["repeat_threshold"]):
+            profile.record("SELECT analysis_result.id FROM analysis_result WHERE job_id = $1", 0.001)
+
+        repeated = profile.repeated(PROFILE_CONFIG["repeat_threshold"])
+        assert repeated == [
+            ("SELECT analysis_result.id FROM analysis_result WHERE job_id = $1",
+             PROFILE_CONFIG["repeat_threshold"])
+        ]
+        assert profile.is_suspicious()
+
+    def test_server_timing_splits_db_and_app_time(self):
+        """Server-Timing reports DB time, query count and the remainder."""
+        from api.profiling import RequestProfile
+
+        profile = RequestProfile()
+        profile.record("SELECT 1", 0.010)
+        profile.record("SELECT 2", 0.005)
+
+        assert profile.server_timing(0.020) == 'db;dur=15.0;desc="2 queries", app;dur=5.0'
@@ -22,10 +22,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 sys.path.insert(0, "/home/oz/projects/2025/oz/12/runpod/api")
 
-from models.job import AnalysisJob, JobStatus, MediaType
-from models.media import FileType, MediaFile, MediaFileStatus
-from models.result import AnalysisProvider, AnalysisResult
-from models.transcription import Transcription, TranscriptionProvider
+from api.models.job import AnalysisJob, JobStatus, MediaType
+from api.models.media import FileType, MediaFile, MediaFileStatus
+from api.models.result import AnalysisProvider, AnalysisResult
+from api.models.transcription import Transcription, TranscriptionProvider
 
 
 # =============================================================================
@@ -621,7 +621,7 @@ class TestTranscriptionRepository:
         await repository.create(
             {
                 "job_id": sample_job.id,
-                "provider": TranscriptionProvider.DEEGRAM,
+                "provider": TranscriptionProvider.DEEPGRAM,
                 "text": "Transcription 2",
                 "language": "es",
             }
@@ -810,3 +810,424 @@ class TestRepositoryIntegration:
         # Verify deletion
         deleted_job = await job_repo.get_by_id(new_job.id)
         assert deleted_job is None
+
+
+# =============================================================================
+# Soft Delete Tests
+# =============================================================================
+
+class TestSoftDeletedRows:
+    """Tests for soft-deleted rows on a database built from the models."""
+
+    @pytest.mark.asyncio
+    async def test_soft_deleted_job_is_hidden(self, test_session, sample_job_data):
+        """A soft-deleted job is only returned by get_by_id_with_deleted."""
+        from api.repositories.job import JobRepository
+
+        job = AnalysisJob(**sample_job_data)
+        test_session.add(job)
+        await test_session.flush()
+        repository = JobRepository(test_session)
+
+        assert await repository.soft_delete(job.id)
+        assert await repository.get_by_id(job.id) is None
+        deleted = await repository.get_by_id_with_deleted(job.id)
+        assert deleted is not None
+        assert deleted.is_deleted
+
+
+# =============================================================================
+# Keyset Pagination Tests
+# =============================================================================
+
+class TestKeysetPagination:
+    """Tests for opaque cursors and keyset pagination statements."""
+
+    def test_cursor_round_trip(self):
+        """Encoded cursors decode back to the same sort key."""
+        from datetime import datetime, timezone
+        from api.repositories.pagination import decode_cursor, encode_cursor
+
+        created_at = datetime(2026, 1, 20, 10, 0, 0, 123456, tzinfo=timezone.utc)
+        id_ = uuid4()
+
+        assert decode_cursor(encode_cursor(created_at, id_)) == (created_at, id_)
+
+    def test_invalid_cursor_raises(self):
+        """Malformed cursors raise InvalidCursorError."""
+        from api.repositories.pagination import InvalidCursorError, decode_cursor
+
+        with pytest.raises(InvalidCursorError):
+            decode_cursor("not-a-cursor")
+
+    @pytest.mark.asyncio
+    async def test_cursor_page_uses_row_value_seek(self, mock_session, db_result, compile_postgres):
+        """Cursor pages seek by (created_at, id) instead of OFFSET."""
+        from datetime import datetime, timezone
+        from api.repositories.job import JobRepository
+        from api.repositories.pagination import encode_cursor
+
+        db_result.scalars.return_value.all.return_value = []
+
+        cursor = encode_cursor(datetime(2026, 1, 20, tzinfo=timezone.utc), uuid4())
+        await JobRepository(mock_session).get_by_status(
+            JobStatus.PENDING, offset=500, limit=21, cursor=cursor
+        )
+
+        sql = compile_postgres(mock_session.execute.call_args.args[0])
+        assert "(analysis_job.created_at, analysis_job.id) <" in sql
+        assert "ORDER BY analysis_job.created_at DESC, analysis_job.id DESC" in sql
+        assert "OFFSET" not in sql
+
+
+# =============================================================================
+# Streaming Export Tests
+# =============================================================================
+
+class TestRepositoryStream:
+    """Tests for BaseRepository.stream server-side cursor iteration."""
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_partitions_with_yield_per(self, mock_session, compile_postgres):
+        """Rows are fetched batch_size at a time from one streamed query."""
+        from api.repositories.result import ResultRepository
+
+        first, second = [MagicMock(), MagicMock()], [MagicMock()]
+
+        async def partitions(size):
+            assert size == 2
+            for partition in (first, second):
+                yield partition
+
+        stream_result = MagicMock()
+        stream_result.partitions = partitions
+        stream_result.close = AsyncMock()
+        mock_session.stream_scalars = AsyncMock(return_value=stream_result)
+
+        repo = ResultRepository(mock_session)
+        batches = [
+            batch async for batch in repo.stream(filters={"provider": "groq"}, batch_size=2)
+        ]
+
+        assert batches == [first, second]
+        stream_result.close.assert_awaited_once()
+        stmt = mock_session.stream_scalars.call_args.args[0]
+        assert stmt.get_execution_options()["yield_per"] == 2
+        sql = compile_postgres(stmt)
+        assert "analysis_result.provider = " in sql
+        assert "ORDER BY analysis_result.created_at ASC, analysis_result.id ASC" in sql
+
+
+# =============================================================================
+# Trigram Search Tests
+# =============================================================================
+
+class TestTrigramSearch:
+    """Tests that substring searches are shaped to use trigram indexes."""
+
+    def test_contains_pattern_escapes_like_metacharacters(self):
+        """% and _ in the query match themselves, not any character."""
+        from api.repositories.base import contains_pattern
+
+        assert contains_pattern("100%_done!") == "%100!%!_done!!%"
+
+    @pytest.mark.asyncio
+    async def test_search_jobs_uses_indexed_expressions(self, mock_session, db_result, compile_postgres):
+        """The description key is inlined so it matches the index expression."""
+        from api.repositories.job import JobRepository
+
+        db_result.scalars.return_value.all.return_value = []
+
+        await JobRepository(mock_session).search_jobs("interview")
+
+        sql = compile_postgres(mock_session.execute.call_args.args[0])
+        assert "analysis_job.source_url ILIKE" in sql
+        assert "(analysis_job.metadata_json ->> 'description') ILIKE" in sql
+        assert "ESCAPE '!'" in sql
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(
+    "MEDIA_TEST_DATABASE_URL" not in __import__("os").environ,
+    reason="requires a migrated PostgreSQL database in MEDIA_TEST_DATABASE_URL"
+)
+class TestTrigramSearchPlans:
+    """EXPLAIN checks for trigram-indexed search against real PostgreSQL."""
+
+    async def _explain(self, search) -> str:
+        """Run a repository search and return the EXPLAIN of its statement."""
+        import os
+        from sqlalchemy import text
+        from sqlalchemy.dialects import postgresql
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        engine = create_async_engine(os.environ["MEDIA_TEST_DATABASE_URL"])
+        try:
+            async with AsyncSession(engine) as session:
+                # Small test tables favour seq scans; ask whether the index is usable
+                await session.execute(text("SET LOCAL enable_seqscan = off"))
+                execute = session.execute
+                captured = []
+
+                async def capture(stmt, *args, **kwargs):
+                    captured.append(stmt)
+                    return await execute(stmt, *args, **kwargs)
+
+                session.execute = capture
+                await search(session)
+                sql = str(captured[0].compile(
+                    dialect=postgresql.dialect(),
+                    compile_kwargs={"literal_binds": True}
+                ))
+                plan = await execute(text(f"EXPLAIN {sql}"))
+                return "\n".join(row[0] for row in plan)
+        finally:
+            await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_search_jobs_plan_uses_trigram_indexes(self):
+        """Both job search predicates are answered from trigram indexes."""
+        from api.repositories.job import JobRepository
+
+        plan = await self._explain(
+            lambda session: JobRepository(session).search_jobs("interview")
+        )
+
+        assert "ix_analysis_job_source_url_trgm" in plan
+        assert "ix_analysis_job_description_trgm" in plan
+
+    @pytest.mark.asyncio
+    async def test_search_files_plan_uses_trigram_indexes(self):
+        """All three media file search predicates use trigram indexes."""
+        from api.repositories.media import MediaRepository
+
+        plan = await self._explain(
+            lambda session: MediaRepository(session).search_files("clip")
+        )
+
+        assert "ix_media_file_filename_trgm" in plan
+        assert "ix_media_file_original_url_trgm" in plan
+        assert "ix_media_file_cdn_url_trgm" in plan
+
+
+# =============================================================================
+# Conditional GET Tests
+# =============================================================================
+
+class TestGetUpdatedAt:
+    """Tests for BaseRepository.get_updated_at version probes."""
+
+    @pytest.mark.asyncio
+    async def test_selects_only_updated_at(self, mock_session, db_result, compile_postgres):
+        """The probe fetches a single column, never the full row."""
+        from datetime import datetime, timezone
+        from api.repositories.result import ResultRepository
+
+        stamp = datetime(2026, 10, 17, tzinfo=timezone.utc)
+        db_result.scalar_one_or_none.return_value = stamp
+
+        assert await ResultRepository(mock_session).get_updated_at(uuid4()) == stamp
+        sql = compile_postgres(mock_session.execute.call_args.args[0])
+        assert sql.startswith("SELECT analysis_result.updated_at \nFROM analysis_result")
+        assert "result_json" not in sql
+
+    @pytest.mark.asyncio
+    async def test_served_from_entity_cache(self, mock_session):
+        """A cached snapshot answers the probe without a query."""
+        from datetime import datetime, timezone
+        from api.repositories.cache import configure_entity_cache
+        from api.repositories.job import JobRepository
+
+        job_id = uuid4()
+        stamp = datetime(2026, 10, 17, tzinfo=timezone.utc)
+        cache = configure_entity_cache(ttl_seconds=60, enabled=True)
+        await cache.set("analysis_job", job_id, {"id": job_id, "updated_at": stamp})
+
+        assert await JobRepository(mock_session).get_updated_at(job_id) == stamp
+        mock_session.execute.assert_not_called()
+
+
+# =============================================================================
+# Status Transition Tests
+# =============================================================================
+
+class TestStatusTransitions:
+    """Tests for single-statement status transitions."""
+
+    @pytest.mark.asyncio
+    async def test_applied_transition_is_one_conditional_update(self, mock_session, db_result, compile_postgres):
+        """A legal move is one UPDATE ... WHERE status IN (...) RETURNING."""
+        from api.repositories.job import JobRepository
+
+        job = AnalysisJob(id=uuid4(), status=JobStatus.COMPLETED, media_type=MediaType.VIDEO)
+        db_result.scalar_one_or_none.return_value = job
+
+        result = await JobRepository(mock_session).transition(job.id, JobStatus.COMPLETED)
+
+        assert result.applied and result.entity is job and result.conflict is None
+        assert mock_session.execute.await_count == 1
+        sql = compile_postgres(mock_session.execute.call_args.args[0])
+        assert sql.startswith("UPDATE analysis_job SET ")
+        assert "status=" in sql and "completed_at=now()" in sql
+        assert "analysis_job.status IN " in sql
+        assert "RETURNING" in sql
+        mock_session.flush.assert_not_called()
+        mock_session.refresh.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_lost_race_returns_conflict_with_current_status(self, mock_session, db_result):
+        """When nothing matches, the conflict reports the status that won."""
+        from api.repositories.job import JobRepository
+
+        db_result.scalar_one_or_none.side_effect = [None, JobStatus.COMPLETED]
+        job_id = uuid4()
+
+        result = await JobRepository(mock_session).transition(job_id, JobStatus.PROCESSING)
+
+        assert not result.applied
+        assert result.conflict.id == job_id
+        assert result.conflict.current_status == JobStatus.COMPLETED
+        assert result.conflict.target_status == JobStatus.PROCESSING
+        assert not result.conflict.not_found
+        assert "completed" in result.conflict.detail
+        assert mock_session.execute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_missing_row_is_not_found_and_update_status_returns_none(self, mock_session, db_result, compile_postgres):
+        """update_status keeps returning None for a missing or refused move."""
+        from api.repositories.media import MediaRepository
+
+        db_result.scalar_one_or_none.return_value = None
+        repo = MediaRepository(mock_session)
+
+        result = await repo.transition(uuid4(), MediaFileStatus.DOWNLOADED, cdn_url="https://cdn.example.com/a")
+        assert result.conflict.not_found
+        assert "media_file.status IN " in compile_postgres(mock_session.execute.call_args_list[0].args[0])
+        assert await repo.update_status(uuid4(), MediaFileStatus.COMPLETED) is None
+
+    def test_terminal_statuses_cannot_be_left_illegally(self):
+        """Completed jobs are final; completed media files are final."""
+        from api.repositories.job import JobRepository
+        from api.repositories.media import MediaRepository
+
+        assert all(
+            JobStatus.COMPLETED not in allowed
+            for allowed in JobRepository.status_transitions.values()
+        )
+        assert all(
+            MediaFileStatus.COMPLETED not in allowed
+            for allowed in MediaRepository.status_transitions.values()
+        )
+        assert set(JobRepository.status_transitions) == set(JobStatus)
+        assert set(MediaRepository.status_transitions) == set(MediaFileStatus)
+
+    def test_jobs_complete_only_from_processing(self):
+        """A job must be processing to complete; it may fail before it starts."""
+        from api.repositories.job import JobRepository
+
+        transitions = JobRepository.status_transitions
+        assert transitions[JobStatus.COMPLETED] == {JobStatus.PROCESSING}
+        assert transitions[JobStatus.FAILED] == {JobStatus.PENDING, JobStatus.PROCESSING}
+
+    @pytest.mark.asyncio
+    async def test_finishing_with_worker_id_checks_and_releases_lease(self, mock_session, db_result, compile_postgres):
+        """worker_id guards the UPDATE on claimed_by; terminal moves clear the lease."""
+        from api.repositories.job import JobRepository
+
+        job = AnalysisJob(id=uuid4(), status=JobStatus.COMPLETED, media_type=MediaType.VIDEO)
+        db_result.scalar_one_or_none.return_value = job
+
+        await JobRepository(mock_session).transition(job.id, JobStatus.COMPLETED, worker_id="worker-1")
+
+        stmt = mock_session.execute.call_args.args[0]
+        sql = compile_postgres(stmt)
+        params = stmt.compile().params
+        assert "analysis_job.claimed_by = " in sql
+        assert "worker-1" in params.values()
+        assert "claimed_by=%(claimed_by)s" in sql and params["claimed_by"] is None
+        assert "lease_expires_at=%(lease_expires_at)s" in sql and params["lease_expires_at"] is None
+
+    @pytest.mark.asyncio
+    async def test_other_workers_job_is_a_conflict(self, mock_session, db_result):
+        """A processing job held by another worker is refused with a reason."""
+        from api.repositories.job import JobRepository
+
+        db_result.scalar_one_or_none.side_effect = [None, JobStatus.PROCESSING]
+
+        result = await JobRepository(mock_session).transition(uuid4(), JobStatus.FAILED, "boom", worker_id="worker-2")
+
+        assert not result.applied
+        assert "not claimed by worker worker-2" in result.conflict.detail
+
+    @pytest.mark.asyncio
+    async def test_processing_transition_takes_lease(self, mock_session, db_result, compile_postgres):
+        """Moving to processing records the worker, a lease and an attempt."""
+        from api.repositories.job import JobRepository
+
+        job = AnalysisJob(id=uuid4(), status=JobStatus.PROCESSING, media_type=MediaType.VIDEO)
+        db_result.scalar_one_or_none.return_value = job
+
+        await JobRepository(mock_session).transition(job.id, JobStatus.PROCESSING, worker_id="worker-1")
+
+        stmt = mock_session.execute.call_args.args[0]
+        sql = compile_postgres(stmt)
+        assert "lease_expires_at=(now() + " in sql
+        assert "attempts=(analysis_job.attempts + " in sql
+        assert stmt.compile().params["claimed_by"] == "worker-1"
+        assert "analysis_job.claimed_by = " not in sql
+
+    @pytest.mark.asyncio
+    async def test_requeue_releases_lease(self, mock_session, db_result):
+        """Moving a job back to pending clears its worker and lease."""
+        from api.repositories.job import JobRepository
+
+        job = AnalysisJob(id=uuid4(), status=JobStatus.PENDING, media_type=MediaType.VIDEO)
+        db_result.scalar_one_or_none.return_value = job
+
+        await JobRepository(mock_session).transition(job.id, JobStatus.PENDING)
+
+        params = mock_session.execute.call_args.args[0].compile().params
+        assert params["claimed_by"] is None
+        assert params["lease_expires_at"] is None
+
+# =============================================================================
+# Repository Create Tests
+# =============================================================================
+
+class TestRepositoryCreate:
+    """Tests for BaseRepository.create."""
+
+    @pytest.mark.asyncio
+    async def test_create_is_single_insert_returning(self, mock_session, db_result, compile_postgres):
+        """Server defaults come back with the INSERT; no flush or refresh."""
+        from api.repositories.job import JobRepository
+
+        job = AnalysisJob(id=uuid4(), status=JobStatus.PENDING, media_type=MediaType.VIDEO)
+        db_result.scalar_one.return_value = job
+
+        created = await JobRepository(mock_session).create(
+            status="pending", media_type="video", source_url="https://example.com/a.mp4"
+        )
+
+        assert created is job
+        assert mock_session.execute.await_count == 1
+        sql = compile_postgres(mock_session.execute.call_args.args[0])
+        assert sql.startswith("INSERT INTO analysis_job")
+        assert "RETURNING analysis_job.id" in sql
+        assert "analysis_job.created_at" in sql and "analysis_job.updated_at" in sql
+        mock_session.add.assert_not_called()
+        mock_session.refresh.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_create_with_related_objects_adds_the_graph(self, mock_session):
+        """Relationship arguments fall back to session.add so children are inserted."""
+        from api.repositories.job import JobRepository
+
+        result = AnalysisResult(provider=AnalysisProvider.GROQ, model="m", result_json={})
+        created = await JobRepository(mock_session).create(
+            status="pending", media_type="video", results=[result]
+        )
+
+        mock_session.add.assert_called_once_with(created)
+        assert created.results == [result]
+        mock_session.execute.assert_not_called()
@@ -0,0 +1,130 @@
+"""
+Tests for the read-through entity cache.
+
+This module tests:
+- Cache hits, misses and invalidation
+"""
+
+from uuid import uuid4
+
+import pytest
+
+from api.models.job import AnalysisJob, JobStatus
+
+
+class TestEntityCache:
+    """Tests for the read-through entity cache and its invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_lru_evicts_oldest_and_expires(self):
+        """The LRU honours its size bound and per-entry TTL."""
+        from api.repositories.cache import LRUCacheBackend
+
+        lru = LRUCacheBackend(max_entries=2)
+        await lru.set("a", {"v": 1}, 60)
+        await lru.set("b", {"v": 2}, 60)
+        await lru.get("a")
+        await lru.set("c", {"v": 3}, 60)
+
+        assert await lru.get("b") is None
+        assert await lru.get("a") == {"v": 1}
+
+        await lru.set("d", {"v": 4}, 0)
+        assert await lru.get("d") is None
+
+    @pytest.mark.asyncio
+    async def test_shared_tier_fills_local_tier(self):
+        """A local miss falls back to the shared backend and counts a hit."""
+        from api.repositories.cache import EntityCache, LRUCacheBackend
+
+        shared = LRUCacheBackend()
+        writer = EntityCache(LRUCacheBackend(), shared, ttl_seconds=60)
+        reader = EntityCache(LRUCacheBackend(), shared, ttl_seconds=60)
+
+        await writer.set("analysis_job", "1", {"id": "1"})
+        assert await reader.get("analysis_job", "1") == {"id": "1"}
+        assert await reader.get("analysis_job", "2") is None
+
+        stats = reader.stats()
+        assert (stats["hits"], stats["shared_hits"], stats["misses"]) == (1, 1, 1)
+
+    @pytest.mark.asyncio
+    async def test_get_by_id_reads_through_cache(self, mock_session, sample_job_data, db_result):
+        """A second lookup of the same job is served without a query."""
+        from api.repositories.cache import configure_entity_cache
+        from api.repositories.job import JobRepository
+
+        cache = configure_entity_cache(ttl_seconds=60, enabled=True)
+        job = AnalysisJob(id=uuid4(), **sample_job_data)
+        db_result.scalar_one_or_none.return_value = job
+
+        first = await JobRepository(mock_session).get_by_id(job.id)
+        second = await JobRepository(mock_session).get_by_id(job.id)
+
+        assert first is job
+        assert second is not job
+        assert second.id == job.id
+        assert second.source_url == job.source_url
+        assert mock_session.execute.await_count == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_writes_invalidate_and_bypass_cache(self, mock_session, sample_job_data, db_result):
+        """update_status drops the entry and later reads in the session hit the DB."""
+        from api.repositories.cache import configure_entity_cache
+        from api.repositories.job import JobRepository
+
+        cache = configure_entity_cache(ttl_seconds=60, enabled=True)
+        job = AnalysisJob(id=uuid4(), **sample_job_data)
+        await cache.set("analysis_job", job.id, {"id": job.id})
+
+        db_result.scalar_one_or_none.return_value = job
+
+        repo = JobRepository(mock_session)
+        await repo.update_status(job.id, JobStatus.PROCESSING)
+        assert await cache.local.get(cache.key("analysis_job", job.id)) is None
+
+        await repo.get_by_id(job.id)
+        assert await cache.local.get(cache.key("analysis_job", job.id)) is None
+        assert cache.invalidations == 1
+
+    @pytest.mark.asyncio
+    async def test_commit_invalidates_written_keys_again(self):
+        """A snapshot re-cached between the write and the commit is dropped after commit."""
+        import asyncio
+        from sqlalchemy.orm import Session
+        from api.repositories.cache import SESSION_DIRTY_KEYS, configure_entity_cache
+
+        cache = configure_entity_cache(ttl_seconds=60, enabled=True)
+        job_id = uuid4()
+        key = cache.key("analysis_job", job_id)
+        session = Session()
+        session.info[SESSION_DIRTY_KEYS] = {key}
+        # A concurrent reader caches the pre-commit row
+        await cache.set("analysis_job", job_id, {"id": job_id})
+
+        session.commit()
+        await asyncio.sleep(0)
+
+        assert await cache.local.get(key) is None
+        assert SESSION_DIRTY_KEYS not in session.info
+
+    @pytest.mark.asyncio
+    async def test_rollback_forgets_written_keys(self):
+        """A rolled-back transaction leaves the cache alone and stops bypassing it."""
+        import asyncio
+        from sqlalchemy.orm import Session
+        from api.repositories.cache import SESSION_DIRTY_KEYS, configure_entity_cache
+
+        cache = configure_entity_cache(ttl_seconds=60, enabled=True)
+        job_id = uuid4()
+        session = Session()
+        session.begin()
+        session.info[SESSION_DIRTY_KEYS] = {cache.key("analysis_job", job_id)}
+        await cache.set("analysis_job", job_id, {"id": job_id})
+
+        session.rollback()
+        await asyncio.sleep(0)
+
+        assert await cache.get("analysis_job", job_id) == {"id": job_id}
+        assert SESSION_DIRTY_KEYS not in session.info
@@ -0,0 +1,180 @@
+"""
+Tests for JobRepository queries and statements.
+
+This module tests:
+- Lease-based claiming, heartbeats and lease recovery
+- Job statistics from the status counters
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from api.models.job import AnalysisJob, JobStatus, MediaType
+
+
+class TestJobRepositoryClaim:
+    """Tests for JobRepository.claim_batch statement generation."""
+
+    @pytest.mark.asyncio
+    async def test_claim_batch_is_single_skip_locked_update(self, mock_session, db_result, compile_postgres):
+        """Claiming jobs issues one UPDATE ... RETURNING with SKIP LOCKED."""
+        from api.repositories.job import JobRepository
+
+        db_result.scalars.return_value.all.return_value = []
+
+        repository = JobRepository(mock_session)
+        jobs = await repository.claim_batch(5, "worker-1", lease_seconds=60)
+
+        assert jobs == []
+        assert mock_session.execute.await_count == 1
+        sql = compile_postgres(mock_session.execute.call_args.args[0])
+        assert sql.startswith("UPDATE analysis_job")
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert "RETURNING" in sql
+        assert "claimed_by" in sql
+        assert "lease_expires_at" in sql
+        assert "analysis_job.attempts + " in sql
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_only_extends_own_processing_lease(self, mock_session, db_result, compile_postgres):
+        """The lease UPDATE is guarded by status and claimed_by."""
+        from api.repositories.job import JobRepository
+
+        db_result.scalar_one_or_none.return_value = None
+
+        assert await JobRepository(mock_session).heartbeat(uuid4(), "worker-1", 120) is None
+        sql = compile_postgres(mock_session.execute.call_args.args[0])
+        assert sql.startswith("UPDATE analysis_job SET lease_expires_at=")
+        assert "analysis_job.status = " in sql
+        assert "analysis_job.claimed_by = " in sql
+
+    @pytest.mark.asyncio
+    async def test_recover_expired_leases_is_single_update(self, mock_session, db_result, compile_postgres):
+        """Expired jobs are requeued or failed by one UPDATE ... FROM ... RETURNING."""
+        from api.repositories.job import JobRepository
+
+        db_result.all.return_value = []
+
+        assert await JobRepository(mock_session).recover_expired_leases(3, limit=50) == []
+        assert mock_session.execute.await_count == 1
+        stmt = mock_session.execute.call_args.args[0]
+        sql = compile_postgres(stmt)
+        assert sql.startswith("UPDATE analysis_job SET status=CASE WHEN")
+        assert "analysis_job.attempts >= " in sql
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert "lease_expires_at < now()" in sql
+        assert "claimed_by=%(claimed_by)s" in sql
+        assert stmt.compile().params["claimed_by"] is None
+        assert "RETURNING" in sql and "expired.claimed_by" in sql
+
+    @pytest.mark.asyncio
+    async def test_failed_recovery_queues_callback(self, mock_session, db_result):
+        """Jobs failed by the reaper notify their callback_url like any failure."""
+        from datetime import datetime, timezone
+        from api.repositories.job import JobRepository
+
+        requeued = AnalysisJob(id=uuid4(), status=JobStatus.PENDING, media_type=MediaType.VIDEO,
+                               callback_url="https://hooks.example.com/a")
+        failed = AnalysisJob(id=uuid4(), status=JobStatus.FAILED, media_type=MediaType.VIDEO,
+                             callback_url="https://hooks.example.com/b",
+                             updated_at=datetime(2026, 10, 17, tzinfo=timezone.utc))
+        db_result.all.return_value = [(requeued, "worker-1"), (failed, "worker-2")]
+
+        recovered = await JobRepository(mock_session).recover_expired_leases(3)
+
+        assert [worker for _job, worker in recovered] == ["worker-1", "worker-2"]
+        assert mock_session.execute.await_count == 2
+        outbox_insert = mock_session.execute.call_args.args[0]
+        assert outbox_insert.compile().params["callback_url"] == "https://hooks.example.com/b"
+
+    @pytest.mark.asyncio
+    async def test_get_stale_processing_jobs_builds_cutoff(self, mock_session, db_result):
+        """The stale-job query no longer fails building its cutoff time."""
+        from api.repositories.job import JobRepository
+
+        db_result.scalars.return_value.all.return_value = []
+
+        assert await JobRepository(mock_session).get_stale_processing_jobs(older_than_minutes=5) == []
+        mock_session.execute.assert_awaited_once()
+
+
+class TestJobStatusCounters:
+    """Tests for counter-backed job statistics."""
+
+    @pytest.mark.asyncio
+    async def test_statistics_read_counter_table(self, mock_session, db_result, compile_postgres):
+        """Statistics sum counter slots instead of scanning analysis_job."""
+        from api.repositories.job import JobRepository
+
+        rows = [
+            MagicMock(status="pending", count=3),
+            MagicMock(status="completed", count=7),
+        ]
+        db_result.fetchall.return_value = rows
+
+        stats = await JobRepository(mock_session).get_statistics()
+
+        sql = compile_postgres(mock_session.execute.call_args.args[0])
+        assert "FROM job_status_counter" in sql
+        assert "analysis_job" not in sql
+        assert stats == {
+            "pending": 3,
+            "processing": 0,
+            "completed": 7,
+            "failed": 0,
+            "total": 10,
+        }
+
+    @pytest.mark.asyncio
+    async def test_status_count_is_single_scalar_query(self, mock_session, db_result, compile_postgres):
+        """Status totals come from one aggregate over counter slots."""
+        from api.repositories.job import JobRepository
+
+        db_result.scalar.return_value = 42
+
+        count = await JobRepository(mock_session).get_by_status_count(JobStatus.FAILED)
+
+        assert count == 42
+        sql = compile_postgres(mock_session.execute.call_args.args[0])
+        assert "sum(job_status_counter.count)" in sql
+
+    @pytest.mark.asyncio
+    async def test_statistics_fall_back_without_counter_trigger(self, mock_session, compile_postgres):
+        """Without the counter trigger, statistics group analysis_job instead."""
+        from api.repositories import triggers
+        from api.repositories.job import JobRepository
+
+        triggers._VERIFIED.clear()
+        lookup, counts = MagicMock(), MagicMock()
+        lookup.scalars.return_value.all.return_value = []
+        counts.fetchall.return_value = [MagicMock(status=JobStatus.PENDING, count=2)]
+        mock_session.execute = AsyncMock(side_effect=[lookup, counts])
+
+        stats = await JobRepository(mock_session).get_statistics()
+
+        assert "pg_trigger" in str(mock_session.execute.call_args_list[0].args[0])
+        sql = compile_postgres(mock_session.execute.call_args_list[1].args[0])
+        assert "FROM analysis_job" in sql
+        assert "GROUP BY analysis_job.status" in sql
+        assert "job_status_counter" not in sql
+        assert stats["pending"] == 2
+        assert stats["total"] == 2
+
+    @pytest.mark.asyncio
+    async def test_create_all_database_counts_jobs(self, test_session):
+        """A create_all database has no counter trigger, so jobs are counted."""
+        from api.repositories import triggers
+        from api.repositories.job import JobRepository
+
+        triggers._VERIFIED.clear()
+        for status in (JobStatus.PENDING, JobStatus.PENDING, JobStatus.FAILED):
+            test_session.add(AnalysisJob(status=status, media_type=MediaType.VIDEO))
+        await test_session.flush()
+        repository = JobRepository(test_session)
+
+        assert await repository.get_statistics() == {
+            "pending": 2, "processing": 0, "completed": 0, "failed": 1, "total": 3
+        }
+        assert await repository.get_by_status_count(JobStatus.PENDING) == 2
@@ -0,0 +1,77 @@
+"""
+Tests for processing_log partition management.
+
+This module tests:
+- Monthly partition creation and retention
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+
+class TestProcessingLogPartitions:
+    """Tests for processing_log partition maintenance."""
+
+    def test_add_months_wraps_years(self):
+        """Month arithmetic crosses year boundaries in both directions."""
+        from datetime import date
+        from api.repositories.processing_log import _add_months
+
+        assert _add_months(date(2026, 11, 1), 3) == date(2027, 2, 1)
+        assert _add_months(date(2026, 2, 1), -6) == date(2025, 8, 1)
+
+    @pytest.mark.asyncio
+    async def test_create_partitions_covers_current_and_future_months(self, mock_session, db_result):
+        """One partition call per month, starting with the current month."""
+        from datetime import date, datetime, timezone
+        from api.repositories.processing_log import ProcessingLogRepository
+
+        db_result.scalar_one.return_value = "processing_log_y2026m10"
+
+        repo = ProcessingLogRepository(mock_session)
+        await repo.create_partitions(2, now=datetime(2026, 10, 17, tzinfo=timezone.utc))
+
+        months = [call.args[1]["month"] for call in mock_session.execute.call_args_list]
+        assert months == [date(2026, 10, 1), date(2026, 11, 1), date(2026, 12, 1)]
+        assert "processing_log_create_partition" in str(mock_session.execute.call_args.args[0])
+
+    @pytest.mark.asyncio
+    async def test_retire_partitions_drops_only_expired_months(self, mock_session):
+        """Partitions wholly before the retention window are detached and dropped."""
+        from datetime import date, datetime, timezone
+        from api.repositories.processing_log import ProcessingLogRepository
+
+        partitions = [
+            ("processing_log_y2026m03", date(2026, 3, 1)),
+            ("processing_log_y2026m04", date(2026, 4, 1)),
+            ("processing_log_y2026m05", date(2026, 5, 1)),
+        ]
+        repo = ProcessingLogRepository(mock_session)
+        with patch.object(ProcessingLogRepository, "list_partitions", AsyncMock(return_value=partitions)):
+            retired = await repo.retire_partitions(
+                6, now=datetime(2026, 10, 17, tzinfo=timezone.utc)
+            )
+
+        assert retired == ["processing_log_y2026m03"]
+        statements = [str(call.args[0]) for call in mock_session.execute.call_args_list]
+        assert statements == [
+            "ALTER TABLE processing_log DETACH PARTITION processing_log_y2026m03",
+            "DROP TABLE processing_log_y2026m03",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_retire_partitions_detach_only_keeps_tables(self, mock_session):
+        """detach_only leaves the old partition as a standalone table."""
+        from datetime import date, datetime, timezone
+        from api.repositories.processing_log import ProcessingLogRepository
+
+        partitions = [("processing_log_y2025m01", date(2025, 1, 1))]
+        repo = ProcessingLogRepository(mock_session)
+        with patch.object(ProcessingLogRepository, "list_partitions", AsyncMock(return_value=partitions)):
+            await repo.retire_partitions(
+                6, detach_only=True, now=datetime(2026, 10, 17, tzinfo=timezone.utc)
+            )
+
+        statements = [str(call.args[0]) for call in mock_session.execute.call_args_list]
+        assert statements == ["ALTER TABLE processing_log DETACH PARTITION processing_log_y2025m01"]
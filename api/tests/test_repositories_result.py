@@ -0,0 +1,268 @@
+"""
+Tests for ResultRepository queries and statements.
+
+This module tests:
+- The min_confidence listing
+- Batch ingestion with multi-row INSERT and COPY
+- Full-text search over results
+- Provider statistics from the hourly rollups
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from api.models.result import AnalysisProvider, AnalysisResult
+
+
+class TestHighConfidenceResults:
+    """Tests for the min_confidence listing query."""
+
+    @pytest.mark.asyncio
+    async def test_pages_by_offset_and_limit(self, mock_session, db_result, compile_postgres):
+        """Later pages skip earlier rows instead of repeating the first page."""
+        from api.repositories.result import ResultRepository
+
+        db_result.scalars.return_value.all.return_value = []
+
+        await ResultRepository(mock_session).get_high_confidence_results(0.8, offset=40, limit=21)
+
+        stmt = mock_session.execute.call_args.args[0]
+        sql = compile_postgres(stmt)
+        assert "ORDER BY analysis_result.confidence DESC" in sql
+        assert "LIMIT" in sql and "OFFSET" in sql
+        assert {21, 40} <= set(stmt.compile().params.values())
+
+
+class TestResultBulkCreate:
+    """Tests for ResultRepository bulk ingestion."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_is_single_insert_returning(self, mock_session, db_result, compile_postgres):
+        """All rows go to one executemany INSERT ... RETURNING id."""
+        from api.repositories.result import ResultRepository
+
+        ids = [uuid4(), uuid4()]
+        db_result.scalars.return_value.all.return_value = ids
+
+        rows = [
+            {"job_id": uuid4(), "provider": "minimax", "model": "m", "result_json": {}},
+            {"job_id": uuid4(), "provider": "groq", "model": "m", "result_json": {}},
+        ]
+        returned = await ResultRepository(mock_session).bulk_create(rows)
+
+        assert returned == ids
+        assert mock_session.execute.await_count == 1
+        stmt, params = mock_session.execute.call_args.args
+        assert params == rows
+        sql = compile_postgres(stmt)
+        assert sql.startswith("INSERT INTO analysis_result")
+        assert "RETURNING analysis_result.id" in sql
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_empty_skips_database(self, mock_session):
+        """An empty batch does not touch the database."""
+        from api.repositories.result import ResultRepository
+
+        assert await ResultRepository(mock_session).bulk_create([]) == []
+        mock_session.execute.assert_not_called()
+
+    def test_copy_columns_cover_required_columns(self):
+        """COPY skips client defaults, so it must send every NOT NULL column without a server default."""
+        from api.models.result import AnalysisResult
+        from api.repositories.result import ResultRepository
+
+        required = {
+            column.name
+            for column in AnalysisResult.__table__.columns
+            if not column.nullable and column.server_default is None and column.computed is None
+        }
+        assert required <= set(ResultRepository.COPY_COLUMNS)
+
+    @pytest.mark.asyncio
+    async def test_copy_create_fills_every_copy_column(self, mock_session):
+        """Each COPY record has one value per column, with the soft-delete flags set."""
+        from api.repositories.result import ResultRepository
+
+        driver_connection = MagicMock()
+        driver_connection.copy_records_to_table = AsyncMock()
+        connection = MagicMock()
+        connection.get_raw_connection = AsyncMock(return_value=MagicMock(driver_connection=driver_connection))
+        mock_session.connection = AsyncMock(return_value=connection)
+
+        rows = [{"job_id": uuid4(), "provider": "groq", "model": "m", "result_json": {"a": 1}}]
+        ids = await ResultRepository(mock_session).copy_create(rows)
+
+        kwargs = driver_connection.copy_records_to_table.call_args.kwargs
+        columns = kwargs["columns"]
+        (record,) = kwargs["records"]
+        assert len(record) == len(columns)
+        values = dict(zip(columns, record))
+        assert values["id"] == ids[0]
+        assert values["is_active"] is True
+        assert values["is_deleted"] is False
+
+
+class TestResultFullTextSearch:
+    """Tests for ResultRepository.search_results over search_vector."""
+
+    @pytest.mark.asyncio
+    async def test_search_uses_tsvector_match_and_rank(self, mock_session, db_result, compile_postgres):
+        """Search matches the indexed vector and orders by rank, not ILIKE."""
+        from api.repositories.result import ResultRepository
+
+        result = MagicMock()
+        db_result.all.return_value = [(result, 0.8)]
+
+        hits = await ResultRepository(mock_session).search_results("scene change", limit=10)
+
+        assert hits == [(result, 0.8)]
+        sql = compile_postgres(mock_session.execute.call_args.args[0])
+        assert "analysis_result.search_vector @@ websearch_to_tsquery('english'::regconfig" in sql
+        assert "ts_rank_cd(analysis_result.search_vector" in sql
+        assert "ORDER BY rank DESC" in sql
+        assert "ILIKE" not in sql.upper()
+
+    def test_search_vector_is_generated_and_deferred(self):
+        """The ORM never writes or eagerly loads the generated column."""
+        from api.models.result import AnalysisResult
+
+        column = AnalysisResult.__table__.c.search_vector
+        assert column.computed is not None
+        assert column.computed.persisted is True
+        assert AnalysisResult.search_vector.property.deferred is True
+
+    def test_search_vector_is_only_generated_on_postgresql(self):
+        """SQLite test databases get a plain column; PostgreSQL keeps GENERATED."""
+        from sqlalchemy.dialects import postgresql, sqlite
+        from sqlalchemy.schema import CreateTable
+        from api.models.result import AnalysisResult
+
+        table = AnalysisResult.__table__
+        sqlite_ddl = str(CreateTable(table).compile(dialect=sqlite.dialect()))
+        postgres_ddl = str(CreateTable(table).compile(dialect=postgresql.dialect()))
+
+        assert "GENERATED" not in sqlite_ddl
+        assert "search_vector TSVECTOR GENERATED ALWAYS AS" in postgres_ddl
+
+class TestProviderRollups:
+    """Tests for provider statistics served from hourly rollups."""
+
+    def test_histogram_quantile_returns_bucket_upper_bound(self):
+        """Quantiles resolve to the bound of the bucket that reaches them."""
+        from api.repositories.rollup import histogram_quantile
+
+        bounds = (100, 250, 500)
+        assert histogram_quantile([50, 40, 10, 0], bounds, 0.5) == 100
+        assert histogram_quantile([50, 40, 10, 0], bounds, 0.95) == 500
+        assert histogram_quantile([0, 0, 0, 5], bounds, 0.5) is None
+        assert histogram_quantile([0, 0, 0, 0], bounds, 0.5) is None
+
+    def test_window_is_aligned_to_utc_hours(self):
+        """since rounds down to the hour; naive datetimes are UTC."""
+        from datetime import datetime, timezone
+        from api.repositories.rollup import hour_floor
+
+        assert hour_floor(datetime(2026, 10, 17, 9, 45, 12)) == datetime(2026, 10, 17, 9, tzinfo=timezone.utc)
+
+    @pytest.mark.asyncio
+    async def test_result_rollups_never_scan_results(self, mock_session, db_result, compile_postgres):
+        """Windowed statistics aggregate result_hourly_rollup only."""
+        from datetime import datetime, timezone
+        from api.models.provider_rollup import LATENCY_BUCKET_BOUNDS_MS
+        from api.repositories.result import ResultRepository
+
+        row = {
+            "bucket": datetime(2026, 10, 17, tzinfo=timezone.utc),
+            "provider": "groq", "model": "llama",
+            "result_count": 10, "confidence_count": 4, "confidence_sum": 3.0,
+            "tokens_sum": 5000, "latency_count": 10, "latency_sum": 4000,
+        }
+        row.update({f"latency_bucket_{i}": 0 for i in range(len(LATENCY_BUCKET_BOUNDS_MS) + 1)})
+        row["latency_bucket_2"] = 10
+        db_result.mappings.return_value = [row]
+
+        rows = await ResultRepository(mock_session).get_provider_rollups(
+            since=datetime(2026, 10, 1, 8, 30), by_model=True, granularity="day"
+        )
+
+        sql = compile_postgres(mock_session.execute.call_args.args[0])
+        assert "FROM result_hourly_rollup" in sql and "analysis_result" not in sql
+        assert "date_trunc('day', result_hourly_rollup.bucket, 'UTC')" in sql
+        assert "result_hourly_rollup.latency_buckets[" in sql
+        assert rows[0]["avg_confidence"] == 0.75
+        assert rows[0]["avg_latency_ms"] == 400
+        assert rows[0]["latency_p50_ms"] == 500
+        assert rows[0]["latency_histogram"][2] == {"lt_ms": 500, "count": 10}
+
+    @pytest.mark.asyncio
+    async def test_unsupported_granularity_is_rejected(self, mock_session):
+        """Granularity is rendered inline, so only known units are accepted."""
+        from api.repositories.transcription import TranscriptionRepository
+
+        with pytest.raises(ValueError):
+            await TranscriptionRepository(mock_session).get_provider_rollups(granularity="hour'; --")
+        mock_session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_statistics_keep_baseline_keys(self, mock_session):
+        """Rollup-backed statistics still report job_count and zero-filled averages."""
+        from api.repositories.result import ResultRepository
+
+        rollups, job_counts = MagicMock(), MagicMock()
+        rollups.fetchall.return_value = [MagicMock(
+            provider="groq", result_count=4, confidence_sum=2.0, tokens_sum=100, latency_sum=None,
+            _mapping={"provider": "groq", "result_count": 4, "confidence_sum": 2.0,
+                      "tokens_sum": 100, "latency_sum": None},
+        )]
+        job_counts.mappings.return_value = [{"provider": "groq", "job_count": 3}]
+        mock_session.execute = AsyncMock(side_effect=[rollups, job_counts])
+
+        stats = await ResultRepository(mock_session).get_statistics_by_provider()
+
+        assert stats == {"groq": {
+            "result_count": 4,
+            "job_count": 3,
+            "avg_confidence": 0.5,
+            "total_tokens": 100,
+            "avg_latency_ms": 0.0,
+        }}
+
+    @pytest.mark.asyncio
+    async def test_create_all_database_aggregates_results(self, test_session, sample_job):
+        """Without the rollup triggers, statistics aggregate analysis_result."""
+        from api.repositories import triggers
+        from api.repositories.result import ResultRepository
+
+        triggers._VERIFIED.clear()
+        for confidence in (0.9, None):
+            test_session.add(AnalysisResult(
+                job_id=sample_job.id, provider=AnalysisProvider.GROQ, model="m",
+                result_json={}, confidence=confidence, tokens_used=10, latency_ms=200,
+            ))
+        await test_session.flush()
+
+        stats = await ResultRepository(test_session).get_statistics_by_provider()
+
+        assert stats == {"groq": {
+            "result_count": 2,
+            "job_count": 1,
+            "avg_confidence": pytest.approx(0.45),
+            "total_tokens": 20,
+            "avg_latency_ms": 200.0,
+        }}
+
+    @pytest.mark.asyncio
+    async def test_missing_rollup_triggers_refuse_rollups(self, mock_session, db_result):
+        """Without the rollup triggers the hourly series is refused, not zero."""
+        from api.repositories import triggers
+        from api.repositories.result import ResultRepository
+        from api.repositories.triggers import MissingTriggersError
+
+        triggers._VERIFIED.clear()
+        db_result.scalars.return_value.all.return_value = []
+
+        with pytest.raises(MissingTriggersError, match="trg_analysis_result_rollup_insert"):
+            await ResultRepository(mock_session).get_provider_rollups()
+        assert mock_session.execute.await_count == 1
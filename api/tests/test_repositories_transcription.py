@@ -0,0 +1,65 @@
+"""
+Tests for TranscriptionRepository queries and statements.
+
+This module tests:
+- Transcript segment search
+"""
+
+from uuid import uuid4
+
+import pytest
+
+
+class TestTranscriptSegmentSearch:
+    """Tests for TranscriptionRepository.search_segments."""
+
+    @pytest.mark.asyncio
+    async def test_search_segments_queries_segment_index(self, mock_session, db_result, compile_postgres):
+        """Search hits the segment vector and never touches segments_json."""
+        from api.repositories.transcription import TranscriptionRepository
+
+        row = {
+            "transcription_id": uuid4(),
+            "job_id": uuid4(),
+            "segment_index": 3,
+            "start_seconds": 12.5,
+            "end_seconds": 15.0,
+            "speaker": None,
+            "text": "the quarterly numbers",
+            "rank": 0.2,
+        }
+        db_result.mappings.return_value.all.return_value = [row]
+
+        hits = await TranscriptionRepository(mock_session).search_segments("quarterly numbers")
+
+        assert hits == [row]
+        sql = compile_postgres(mock_session.execute.call_args.args[0])
+        assert "transcript_segment.search_vector @@ websearch_to_tsquery('simple'::regconfig" in sql
+        assert "segments_json" not in sql
+        assert "ORDER BY rank DESC" in sql
+
+    @pytest.mark.asyncio
+    async def test_search_segments_within_job_is_time_ordered(self, mock_session, db_result, compile_postgres):
+        """Restricting to one job returns hits in playback order."""
+        from api.repositories.transcription import TranscriptionRepository
+
+        db_result.mappings.return_value.all.return_value = []
+
+        await TranscriptionRepository(mock_session).search_segments("hello", job_id=uuid4())
+
+        sql = compile_postgres(mock_session.execute.call_args.args[0])
+        assert "transcript_segment.job_id = " in sql
+        assert "ORDER BY transcript_segment.start_seconds ASC NULLS LAST" in sql
+
+    def test_segment_vector_is_only_generated_on_postgresql(self):
+        """SQLite test databases get a plain text column; PostgreSQL keeps GENERATED."""
+        from sqlalchemy.dialects import postgresql, sqlite
+        from sqlalchemy.schema import CreateTable
+        from api.models.transcript_segment import TranscriptSegment
+
+        table = TranscriptSegment.__table__
+        sqlite_ddl = str(CreateTable(table).compile(dialect=sqlite.dialect()))
+        postgres_ddl = str(CreateTable(table).compile(dialect=postgresql.dialect()))
+
+        assert "GENERATED" not in sqlite_ddl
+        assert "search_vector TSVECTOR GENERATED ALWAYS AS" in postgres_ddl
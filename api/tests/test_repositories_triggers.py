@@ -0,0 +1,73 @@
+"""
+Tests for trigger presence checks.
+
+This module tests:
+- pg_trigger lookups and their caching
+"""
+
+import logging
+
+import pytest
+
+
+class TestTriggerChecks:
+    """Tests for the pg_trigger lookups behind triggers_installed."""
+
+    @pytest.fixture(autouse=True)
+    def nothing_verified(self):
+        """Start every test with no trigger known to be installed."""
+        from api.repositories import triggers
+
+        triggers._VERIFIED.clear()
+        triggers._REPORTED.clear()
+        yield
+        triggers._REPORTED.clear()
+
+    @pytest.mark.asyncio
+    async def test_installed_triggers_are_checked_once(self, mock_session, db_result):
+        """Once found, a trigger is not looked up again."""
+        from api.models.job_status_counter import STATUS_COUNTER_TRIGGER
+        from api.repositories.triggers import triggers_installed
+
+        db_result.scalars.return_value.all.return_value = [STATUS_COUNTER_TRIGGER]
+
+        assert await triggers_installed(mock_session, "analysis_job", STATUS_COUNTER_TRIGGER)
+        assert await triggers_installed(mock_session, "analysis_job", STATUS_COUNTER_TRIGGER)
+
+        assert mock_session.execute.await_count == 1
+        assert "pg_trigger" in str(mock_session.execute.call_args.args[0])
+
+    @pytest.mark.asyncio
+    async def test_missing_trigger_is_rechecked_and_reported_once(self, mock_session, db_result, caplog):
+        """A missing trigger is looked up again (migrations may run) but logged once."""
+        from api.repositories.triggers import triggers_installed
+
+        db_result.scalars.return_value.all.return_value = []
+
+        with caplog.at_level(logging.WARNING, logger="api.repositories.triggers"):
+            assert not await triggers_installed(mock_session, "analysis_job", "trg_missing")
+            assert not await triggers_installed(mock_session, "analysis_job", "trg_missing")
+
+        assert mock_session.execute.await_count == 2
+        assert len([r for r in caplog.records if "trg_missing" in r.getMessage()]) == 1
+
+    @pytest.mark.asyncio
+    async def test_other_dialects_have_no_triggers(self, mock_session):
+        """SQLite test databases report the triggers missing without a lookup."""
+        from api.repositories.triggers import triggers_installed
+
+        mock_session.bind.dialect.name = "sqlite"
+
+        assert not await triggers_installed(mock_session, "analysis_job", "trg_any")
+        mock_session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_require_triggers_names_the_missing_ones(self, mock_session, db_result):
+        """require_triggers refuses the read and says which triggers are missing."""
+        from api.repositories.triggers import MissingTriggersError, require_triggers
+
+        db_result.scalars.return_value.all.return_value = ["trg_present"]
+
+        with pytest.raises(MissingTriggersError, match="trg_absent") as excinfo:
+            await require_triggers(mock_session, "analysis_result", "trg_present", "trg_absent")
+        assert "trg_present" not in str(excinfo.value)
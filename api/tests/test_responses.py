@@ -0,0 +1,40 @@
+"""
+Tests for the fast JSON response path.
+
+This module tests:
+- Row encoding that matches the response schemas
+"""
+
+from datetime import datetime
+from uuid import uuid4
+
+from api.schemas.job import JobResponse
+
+
+class TestFastJSONResponse:
+    """The fast response path must encode rows exactly like the schemas do."""
+
+    def test_job_row_matches_schema_serialization(self):
+        """rows_to_dicts + FastJSONResponse equals JobResponse JSON output."""
+        import json
+        from datetime import timezone
+        from api.models.job import AnalysisJob, JobStatus as ModelJobStatus, MediaType as ModelMediaType
+        from api.responses import FastJSONResponse, rows_to_dicts
+
+        relations = frozenset({"media_files", "results", "transcriptions", "processing_logs"})
+        now = datetime(2026, 10, 17, 12, 30, tzinfo=timezone.utc)
+        job = AnalysisJob(
+            id=uuid4(),
+            status=ModelJobStatus.COMPLETED,
+            media_type=ModelMediaType.VIDEO,
+            source_url="https://example.com/test.mp4",
+            metadata_json={"description": "café", "tags": ["a", "b"]},
+            created_at=now,
+            updated_at=now,
+            completed_at=now,
+        )
+
+        fast = json.loads(FastJSONResponse(rows_to_dicts([job], JobResponse, relations)).body)
+        expected = json.loads(JobResponse.model_validate(job).model_dump_json(exclude=set(relations)))
+
+        assert fast == [expected]
@@ -18,21 +18,21 @@ from pydantic import ValidationError
 
 sys.path.insert(0, "/home/oz/projects/2025/oz/12/runpod/api")
 
-from schemas.job import JobCreate, JobResponse, JobUpdate, JobStatus, MediaType
-from schemas.media import (
+from api.schemas.job import JobCreate, JobResponse, JobUpdate, JobStatus, MediaType
+from api.schemas.media import (
     MediaFileCreate,
     MediaFileResponse,
     MediaFileUpdate,
     FileType,
     MediaFileStatus,
 )
-from schemas.result import (
+from api.schemas.result import (
     AnalysisResultCreate,
     AnalysisResultResponse,
     AnalysisResultUpdate,
     AnalysisProvider,
 )
-from schemas.transcription import (
+from api.schemas.transcription import (
     TranscriptionCreate,
     TranscriptionResponse,
     TranscriptionUpdate,
@@ -155,7 +155,7 @@ class TestJobResponseSchema:
 
     def test_job_response_from_dict(self, sample_job):
         """Test creating JobResponse from model instance."""
-        from schemas.job import JobResponse
+        from api.schemas.job import JobResponse
 
         response = JobResponse.model_validate(sample_job)
 
@@ -166,7 +166,7 @@ class TestJobResponseSchema:
 
     def test_job_response_serialization(self, sample_job):
         """Test JobResponse serializes all fields."""
-        from schemas.job import JobResponse
+        from api.schemas.job import JobResponse
 
         response = JobResponse.model_validate(sample_job)
         dumped = response.model_dump()
@@ -181,7 +181,7 @@ class TestJobResponseSchema:
 
     def test_job_response_json_serialization(self, sample_job):
         """Test JobResponse serializes to JSON."""
-        from schemas.job import JobResponse
+        from api.schemas.job import JobResponse
 
         response = JobResponse.model_validate(sample_job)
         json_str = response.model_dump_json()
@@ -190,6 +190,19 @@ class TestJobResponseSchema:
         assert '"status"' in json_str
         assert "pending" in json_str
 
+    def test_unflushed_job_validates(self):
+        """A job not yet flushed (attempts still unset) converts to JobResponse."""
+        from api.models.job import AnalysisJob, JobStatus as ModelJobStatus, MediaType as ModelMediaType
+
+        now = datetime(2026, 10, 17, 12, 0)
+        job = AnalysisJob(
+            id=uuid4(), status=ModelJobStatus.PENDING, media_type=ModelMediaType.VIDEO,
+            created_at=now, updated_at=now,
+        )
+
+        response = JobResponse.model_validate(job)
+
+        assert response.attempts is None
 
 class TestJobUpdateSchema:
     """Tests for JobUpdate schema validation."""
@@ -265,7 +278,7 @@ class TestMediaFileResponseSchema:
 
     def test_media_file_response_from_dict(self, sample_media_file):
         """Test creating MediaFileResponse from model instance."""
-        from schemas.media import MediaFileResponse
+        from api.schemas.media import MediaFileResponse
 
         response = MediaFileResponse.model_validate(sample_media_file)
 
@@ -341,7 +354,7 @@ class TestAnalysisResultResponseSchema:
 
     def test_analysis_result_response_from_dict(self, sample_analysis_result):
         """Test creating AnalysisResultResponse from model instance."""
-        from schemas.result import AnalysisResultResponse
+        from api.schemas.result import AnalysisResultResponse
 
         response = AnalysisResultResponse.model_validate(sample_analysis_result)
 
@@ -403,7 +416,7 @@ class TestTranscriptionResponseSchema:
 
     def test_transcription_response_from_dict(self, sample_transcription):
         """Test creating TranscriptionResponse from model instance."""
-        from schemas.transcription import TranscriptionResponse
+        from api.schemas.transcription import TranscriptionResponse
 
         response = TranscriptionResponse.model_validate(sample_transcription)
 
@@ -615,3 +628,41 @@ class TestComplexTypes:
         assert len(transcription.segments_json) == 3
         assert transcription.segments_json[0]["start"] == 0.0
         assert transcription.segments_json[2]["end"] == 10.0
+
+
+class TestSchemaImports:
+    """The mutually nested response schemas must resolve on a clean import."""
+
+    @pytest.mark.parametrize("module", ["api.schemas", "api.main"])
+    def test_clean_import(self, module):
+        """Importing the package (or the app) in a fresh interpreter succeeds."""
+        import subprocess
+        from pathlib import Path
+
+        completed = subprocess.run(
+            [sys.executable, "-c", f"import {module}"],
+            cwd=Path(__file__).resolve().parents[2],
+            capture_output=True,
+            text=True,
+        )
+        assert completed.returncode == 0, completed.stderr
+
+    def test_nested_job_response_validates(self):
+        """JobResponse resolves its nested result and transcription schemas."""
+        from api.schemas import JobResponse as PackageJobResponse
+
+        job_id = uuid4()
+        now = datetime(2026, 10, 17, 12, 0)
+        response = PackageJobResponse.model_validate({
+            "id": job_id,
+            "status": "completed",
+            "media_type": "video",
+            "created_at": now,
+            "updated_at": now,
+            "results": [{
+                "id": uuid4(), "job_id": job_id, "provider": "groq", "model": "m",
+                "result_json": {}, "created_at": now, "updated_at": now,
+            }],
+            "transcriptions": [],
+        })
+        assert response.results[0].provider == "groq"
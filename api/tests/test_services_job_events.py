@@ -0,0 +1,156 @@
+"""
+Tests for the job event hub.
+
+This module tests:
+- Fan-out of job_events notifications to subscribers
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from api.models.job import JobStatus
+
+
+class TestJobEventHub:
+    """Tests for the in-memory fan-out of job_events notifications."""
+
+    @pytest.mark.asyncio
+    async def test_events_reach_job_and_global_subscribers_only(self):
+        """A job's events go to its followers and to catch-all subscribers."""
+        from api.services.job_events import JobEventHub
+
+        hub = JobEventHub()
+        job_id, other_id = uuid4(), uuid4()
+        follower = hub.subscribe({job_id})
+        bystander = hub.subscribe({other_id})
+        everyone = hub.subscribe()
+
+        delivered = hub.publish({"type": "status", "job_id": str(job_id), "status": "processing"})
+
+        assert delivered == 2
+        assert (await follower.get(timeout=0.1))["status"] == "processing"
+        assert (await everyone.get(timeout=0.1))["job_id"] == str(job_id)
+        assert await bystander.get(timeout=0.01) is None
+
+    @pytest.mark.asyncio
+    async def test_reset_goes_to_every_subscriber(self):
+        """A reset after reconnecting reaches per-job and catch-all subscribers."""
+        from api.services.job_events import JobEventHub
+
+        hub = JobEventHub()
+        subscriptions = [hub.subscribe({uuid4()}), hub.subscribe({uuid4()}), hub.subscribe()]
+
+        assert hub.publish({"type": "reset"}) == 3
+        for subscription in subscriptions:
+            assert (await subscription.get(timeout=0.1)) == {"type": "reset"}
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_drops_oldest_events(self):
+        """A full queue discards its oldest events instead of blocking publish."""
+        from api.services.job_events import JobEventHub
+
+        hub = JobEventHub(subscriber_queue=2)
+        job_id = str(uuid4())
+        subscription = hub.subscribe({job_id})
+        for index in range(3):
+            hub.publish({"type": "log", "job_id": job_id, "message": str(index)})
+
+        assert subscription.dropped == 1
+        assert (await subscription.get(timeout=0.1))["message"] == "1"
+        assert (await subscription.get(timeout=0.1))["message"] == "2"
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_on_exit_cleans_up(self):
+        """Leaving the context removes the subscriber from every job it followed."""
+        from api.services.job_events import JobEventHub
+
+        hub = JobEventHub()
+        job_ids = {uuid4(), uuid4()}
+        async with hub.subscribe(job_ids) as subscription:
+            hub.unfollow(subscription, [next(iter(job_ids))])
+            assert hub.stats()["jobs_followed"] == 1
+
+        stats = hub.stats()
+        assert stats["subscribers"] == 0
+        assert stats["jobs_followed"] == 0
+        assert hub.publish({"type": "status", "job_id": str(next(iter(job_ids)))}) == 0
+
+    @pytest.mark.asyncio
+    async def test_status_event_bypasses_entity_cache(self, mock_session, db_result):
+        """The stream baseline is always read from the database."""
+        from datetime import datetime, timezone
+        from api.repositories.cache import configure_entity_cache
+        from api.repositories.job import JobRepository
+
+        job_id = uuid4()
+        stamp = datetime(2026, 10, 17, tzinfo=timezone.utc)
+        cache = configure_entity_cache(ttl_seconds=60, enabled=True)
+        await cache.set("analysis_job", job_id, {"id": job_id, "status": "pending", "updated_at": stamp})
+        row = MagicMock(id=job_id, status=JobStatus.COMPLETED, error_message=None, updated_at=stamp)
+        db_result.one_or_none.return_value = row
+
+        event = await JobRepository(mock_session).get_status_event(job_id)
+
+        assert event == {
+            "type": "status",
+            "job_id": str(job_id),
+            "status": "completed",
+            "error_message": None,
+            "updated_at": stamp.isoformat(),
+        }
+        mock_session.execute.assert_awaited_once()
+
+
+    @pytest.mark.asyncio
+    async def test_wait_returns_when_status_event_arrives(self):
+        """A parked waiter wakes on the matching status event without re-reading."""
+        import asyncio
+        from api.services.job_events import JobEventHub
+
+        hub = JobEventHub()
+        job_id = str(uuid4())
+        read_status = AsyncMock(return_value={"type": "status", "job_id": job_id, "status": "processing"})
+
+        waiter = asyncio.create_task(hub.wait_for_status(job_id, {"completed", "failed"}, 5, read_status))
+        await asyncio.sleep(0.01)
+        hub.publish({"type": "log", "job_id": job_id, "message": "step"})
+        hub.publish({"type": "status", "job_id": job_id, "status": "completed"})
+        current, reached = await asyncio.wait_for(waiter, 1)
+
+        assert reached is True
+        assert current["status"] == "completed"
+        read_status.assert_awaited_once()
+        assert hub.stats()["subscribers"] == 0
+
+    @pytest.mark.asyncio
+    async def test_wait_times_out_and_rereads_after_reset(self):
+        """A reset triggers a fresh read; without a match the wait times out."""
+        import asyncio
+        from api.services.job_events import JobEventHub
+
+        hub = JobEventHub()
+        job_id = str(uuid4())
+        read_status = AsyncMock(return_value={"type": "status", "job_id": job_id, "status": "pending"})
+
+        waiter = asyncio.create_task(hub.wait_for_status(job_id, {"completed"}, 0.1, read_status))
+        await asyncio.sleep(0.01)
+        hub.publish({"type": "reset"})
+        current, reached = await asyncio.wait_for(waiter, 1)
+
+        assert reached is False
+        assert current["status"] == "pending"
+        assert read_status.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_wait_returns_immediately_for_reached_or_missing_job(self):
+        """No parking when the job is already in a target status or does not exist."""
+        from api.services.job_events import JobEventHub
+
+        hub = JobEventHub()
+        done = AsyncMock(return_value={"type": "status", "status": "failed"})
+        missing = AsyncMock(return_value=None)
+
+        assert (await hub.wait_for_status(uuid4(), {"failed"}, 30, done))[1] is True
+        assert await hub.wait_for_status(uuid4(), {"failed"}, 30, missing) == (None, False)
@@ -0,0 +1,87 @@
+"""
+Tests for the buffered processing log writer.
+
+This module tests:
+- Batched writes, backpressure and transaction staging
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class TestProcessingLogSink:
+    """Tests for the buffered processing_log writer."""
+
+    @pytest.mark.asyncio
+    async def test_rows_are_written_in_batches_and_drained_on_stop(self, recording_session_factory):
+        """Queued rows are inserted batch_size at a time; stop() writes the rest."""
+        from api.services.log_sink import ProcessingLogSink
+
+        sink = ProcessingLogSink(recording_session_factory, batch_size=3, flush_seconds=0.05)
+        for index in range(7):
+            await sink.submit({"job_id": uuid4(), "stage": "analysis", "status": "started", "message": str(index)})
+        sink.start()
+        await sink.stop(timeout=5)
+
+        assert [len(batch) for batch in recording_session_factory.batches] == [3, 3, 1]
+        assert sink.stats()["written"] == 7
+        assert sink.stats()["queued"] == 0
+
+    @pytest.mark.asyncio
+    async def test_full_sink_applies_backpressure(self, recording_session_factory):
+        """submit() waits while max_queue entries are outstanding."""
+        import asyncio
+        from api.services.log_sink import ProcessingLogSink
+
+        sink = ProcessingLogSink(recording_session_factory, max_queue=2)
+        await sink.submit({"job_id": uuid4()})
+        await sink.submit({"job_id": uuid4()})
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(sink.submit({"job_id": uuid4()}), timeout=0.05)
+
+    @pytest.mark.asyncio
+    async def test_staged_rows_follow_the_callers_transaction(self, recording_session_factory):
+        """Rows staged in a transaction are queued on commit and dropped on rollback."""
+        from sqlalchemy.ext.asyncio import create_async_engine
+        from api.services.log_sink import ProcessingLogSink
+
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        sink = ProcessingLogSink(recording_session_factory, max_queue=5)
+        try:
+            async with AsyncSession(engine) as session:
+                await session.connection()
+                await sink.stage(session, {"job_id": uuid4()})
+                assert sink.queued == 0
+                await session.commit()
+                assert sink.queued == 1
+
+                await session.connection()
+                await sink.stage(session, {"job_id": uuid4()})
+                await session.rollback()
+                assert sink.queued == 1
+                assert sink._slots._value == 4
+        finally:
+            await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_repository_routes_through_running_sink(self, mock_session):
+        """log_* stage the entry instead of INSERT + flush + refresh."""
+        from api.models.processing_log import ProcessingLogStatus, ProcessingStage
+        from api.repositories.processing_log import ProcessingLogRepository
+
+        sink = MagicMock()
+        sink.stage = AsyncMock()
+        with patch("api.repositories.processing_log.get_log_sink", return_value=sink):
+            entry = await ProcessingLogRepository(mock_session).log_start(
+                uuid4(), ProcessingStage.ANALYSIS, message="begin"
+            )
+
+        mock_session.flush.assert_not_called()
+        staged = sink.stage.call_args.args[1]
+        assert staged["status"] == ProcessingLogStatus.STARTED
+        assert entry.id == staged["id"]
+        assert entry.created_at == staged["created_at"]
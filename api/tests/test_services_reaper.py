@@ -0,0 +1,58 @@
+"""
+Tests for the stale-job reaper.
+
+This module tests:
+- Requeueing and failing jobs with expired leases
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from api.models.job import AnalysisJob, JobStatus, MediaType
+
+
+class TestStaleJobReaper:
+    """Tests for the background lease reaper."""
+
+    @pytest.mark.asyncio
+    async def test_recovered_jobs_are_logged_in_the_same_transaction(self, recording_session_factory):
+        """Each recovered job gets a recovery log entry; one commit covers both."""
+        from api.models.processing_log import ProcessingLogStatus, ProcessingStage
+        from api.services.reaper import StaleJobReaper
+
+        requeued = AnalysisJob(id=uuid4(), status=JobStatus.PENDING, media_type=MediaType.AUDIO, attempts=1)
+        failed = AnalysisJob(id=uuid4(), status=JobStatus.FAILED, media_type=MediaType.AUDIO, attempts=3)
+        jobs = MagicMock()
+        jobs.recover_expired_leases = AsyncMock(return_value=[(requeued, "w1"), (failed, "w2")])
+        logs = MagicMock()
+        logs.log_many = AsyncMock()
+
+        reaper = StaleJobReaper(recording_session_factory, max_attempts=3, batch_size=10)
+        with patch("api.repositories.job.JobRepository", return_value=jobs), \
+                patch("api.repositories.processing_log.ProcessingLogRepository", return_value=logs):
+            assert await reaper.sweep() == 2
+
+        jobs.recover_expired_leases.assert_awaited_once_with(3, limit=10)
+        entries = logs.log_many.call_args.args[0]
+        assert [entry["stage"] for entry in entries] == [ProcessingStage.RECOVERY] * 2
+        assert [entry["status"] for entry in entries] == [
+            ProcessingLogStatus.WARNING, ProcessingLogStatus.FAILED
+        ]
+        assert entries[1]["details_json"] == {
+            "worker_id": "w2", "attempts": 3, "max_attempts": 3, "action": "failed"
+        }
+        assert reaper.stats()["requeued"] == 1
+        assert reaper.stats()["failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_sweep_repeats_full_batches(self):
+        """A sweep keeps reaping while batches come back full."""
+        from api.services.reaper import StaleJobReaper
+
+        reaper = StaleJobReaper(MagicMock(), batch_size=2)
+        reaper.reap_once = AsyncMock(side_effect=[2, 2, 1])
+
+        assert await reaper.sweep() == 5
+        assert reaper.reap_once.await_count == 3
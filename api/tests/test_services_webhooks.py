@@ -0,0 +1,166 @@
+"""
+Tests for webhook delivery from the outbox.
+
+This module tests:
+- Pooled delivery, retries and outbox enqueueing
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from api.models.job import AnalysisJob, JobStatus, MediaType
+
+
+class _LocalWebhookReceiver:
+    """Minimal keep-alive HTTP/1.1 server recording the JSON bodies POSTed to it."""
+
+    def __init__(self, status: int = 200):
+        self.status = status
+        self.requests = []
+        self.connections = 0
+        self._server = None
+
+    async def __aenter__(self):
+        import asyncio
+
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self._server.close()
+        await self._server.wait_closed()
+
+    def url(self, path: str) -> str:
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}{path}"
+
+    async def _handle(self, reader, writer):
+        import json
+
+        self.connections += 1
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                request_line, *header_lines = head.decode().split("\r\n")
+                headers = dict(line.split(": ", 1) for line in header_lines if ": " in line)
+                length = int(headers.get("Content-Length", headers.get("content-length", 0)))
+                body = await reader.readexactly(length)
+                self.requests.append((request_line.split(" ")[1], json.loads(body)))
+                writer.write(f"HTTP/1.1 {self.status} X\r\nContent-Length: 0\r\n\r\n".encode())
+                await writer.drain()
+        except Exception:
+            pass
+        finally:
+            writer.close()
+
+
+def _outbox_entry(callback_url: str, attempts: int = 1):
+    """Claimed-outbox-row stand-in."""
+    from types import SimpleNamespace
+
+    job_id = uuid4()
+    return SimpleNamespace(
+        id=uuid4(),
+        job_id=job_id,
+        callback_url=callback_url,
+        attempts=attempts,
+        payload={"event": "job.completed", "job_id": str(job_id), "status": "completed"},
+    )
+
+
+class TestWebhookDelivery:
+    """Tests for the webhook outbox and dispatcher."""
+
+    @pytest.mark.asyncio
+    async def test_events_are_batched_per_endpoint(self):
+        """Entries are grouped by callback_url and sent batch_size per POST."""
+        from api.services.webhooks import WebhookDispatcher
+
+        async with _LocalWebhookReceiver() as receiver:
+            first = [_outbox_entry(receiver.url("/first")) for _ in range(5)]
+            second = [_outbox_entry(receiver.url("/second"))]
+            dispatcher = WebhookDispatcher(MagicMock(), batch_size=2, concurrency=1)
+            try:
+                outcomes = await dispatcher.deliver(first + second)
+            finally:
+                await dispatcher.stop()
+
+        assert [error for _batch, error in outcomes] == [None] * 4
+        sizes = sorted((path, len(body["events"])) for path, body in receiver.requests)
+        assert sizes == [("/first", 1), ("/first", 2), ("/first", 2), ("/second", 1)]
+        sent = [event["id"] for path, body in receiver.requests if path == "/first" for event in body["events"]]
+        assert sorted(sent) == sorted(str(entry.id) for entry in first)
+        # One pooled keep-alive connection served every request
+        assert receiver.connections == 1
+
+    @pytest.mark.asyncio
+    async def test_failures_are_retried_with_backoff_then_dead(self, recording_session_factory):
+        """Non-2xx responses schedule a retry; exhausted entries are marked dead."""
+        from api.services.webhooks import WebhookDispatcher
+
+        outbox = MagicMock()
+        outbox.mark_delivered = AsyncMock()
+        outbox.mark_retry = AsyncMock()
+        outbox.mark_dead = AsyncMock()
+        async with _LocalWebhookReceiver(status=503) as receiver:
+            retrying = _outbox_entry(receiver.url("/hook"), attempts=3)
+            exhausted = _outbox_entry(receiver.url("/hook"), attempts=4)
+            dispatcher = WebhookDispatcher(
+                recording_session_factory, max_attempts=4, backoff_seconds=2, backoff_max_seconds=600
+            )
+            try:
+                with patch("api.services.webhooks.WebhookOutboxRepository", return_value=outbox):
+                    await dispatcher.settle(await dispatcher.deliver([retrying, exhausted]))
+            finally:
+                await dispatcher.stop()
+
+        outbox.mark_delivered.assert_awaited_once_with([])
+        ids, error = outbox.mark_retry.call_args.args
+        assert ids == [retrying.id] and error == "HTTP 503"
+        assert 4 <= outbox.mark_retry.call_args.kwargs["delay_seconds"] <= 8
+        outbox.mark_dead.assert_awaited_once_with([exhausted.id], "HTTP 503")
+        assert dispatcher.stats()["dead"] == 1
+        assert dispatcher.backoff(20) == 600
+
+    @pytest.mark.asyncio
+    async def test_terminal_status_queues_callback_in_same_transaction(self, mock_session, db_result, compile_postgres):
+        """update_status inserts the outbox row through the caller's session."""
+        from datetime import datetime, timezone
+        from api.repositories.job import JobRepository
+
+        # As returned by the UPDATE ... RETURNING
+        job = AnalysisJob(
+            id=uuid4(),
+            status=JobStatus.COMPLETED,
+            media_type=MediaType.VIDEO,
+            callback_url="https://hooks.example.com/done",
+            updated_at=datetime(2026, 10, 17, tzinfo=timezone.utc),
+        )
+        db_result.scalar_one_or_none.return_value = job
+
+        await JobRepository(mock_session).update_status(job.id, JobStatus.COMPLETED)
+
+        insert_stmt = mock_session.execute.call_args_list[-1].args[0]
+        assert compile_postgres(insert_stmt).startswith("INSERT INTO webhook_outbox")
+        values = insert_stmt.compile().params
+        assert values["callback_url"] == "https://hooks.example.com/done"
+        assert values["event"] == "job.completed"
+        assert values["payload"]["status"] == "completed"
+        mock_session.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_no_callback_without_url_or_for_non_terminal_status(self, mock_session, db_result):
+        """Jobs without a callback_url, and non-terminal moves, queue nothing."""
+        from api.repositories.job import JobRepository
+
+        job = AnalysisJob(id=uuid4(), status=JobStatus.PENDING, media_type=MediaType.VIDEO)
+        db_result.scalar_one_or_none.return_value = job
+        repo = JobRepository(mock_session)
+
+        await repo.update_status(job.id, JobStatus.COMPLETED)
+        job.callback_url = "https://hooks.example.com/done"
+        await repo.update_status(job.id, JobStatus.PROCESSING)
+
+        assert mock_session.execute.await_count == 2
@@ -0,0 +1,119 @@
+"""
+Tests for the production startup path.
+
+This module tests:
+- Schema revision check and pool warm-up
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
+
+
+class TestFastStartup:
+    """Tests for the production startup path (revision check, pool warm-up)."""
+
+    @pytest_asyncio.fixture
+    async def versioned_engine(self):
+        """In-memory engine with an alembic_version table."""
+        from sqlalchemy import text
+
+        engine = create_async_engine(
+            "sqlite+aiosqlite:///:memory:",
+            poolclass=StaticPool,
+            connect_args={"check_same_thread": False},
+        )
+        async with engine.begin() as conn:
+            await conn.execute(text("CREATE TABLE alembic_version (version_num VARCHAR(32))"))
+            await conn.execute(text("INSERT INTO alembic_version VALUES ('000000000008')"))
+        yield engine
+        await engine.dispose()
+
+    def test_expected_revision_is_migration_head(self):
+        """The expected revision is read from the migration scripts."""
+        from api.startup import expected_schema_revision
+
+        with patch.dict("api.startup.STARTUP_CONFIG", {"expected_revision": None}):
+            head = expected_schema_revision()
+
+        assert head is not None
+        assert len(head) == 12
+
+    def test_missing_alembic_asks_for_expected_revision(self):
+        """Without alembic installed, startup says to set DB_EXPECTED_REVISION."""
+        from api.startup import expected_schema_revision
+
+        missing = {"alembic": None, "alembic.config": None, "alembic.script": None}
+        with patch.dict("api.startup.STARTUP_CONFIG", {"expected_revision": None}), \
+                patch.dict("sys.modules", missing):
+            with pytest.raises(RuntimeError, match="DB_EXPECTED_REVISION"):
+                expected_schema_revision()
+
+    @pytest.mark.asyncio
+    async def test_matching_revision_passes(self, versioned_engine):
+        """A database at the expected revision is accepted."""
+        from api.startup import check_schema_revision
+
+        with patch.dict("api.startup.STARTUP_CONFIG", {"expected_revision": "000000000008"}):
+            assert await check_schema_revision(versioned_engine) == "000000000008"
+
+    @pytest.mark.asyncio
+    async def test_stale_revision_fails_startup(self, versioned_engine):
+        """A database behind the code's head revision stops startup."""
+        from api.startup import check_schema_revision
+
+        with patch.dict("api.startup.STARTUP_CONFIG", {"expected_revision": "000000000099"}):
+            with pytest.raises(RuntimeError, match="alembic upgrade head"):
+                await check_schema_revision(versioned_engine)
+
+    @pytest.mark.asyncio
+    async def test_warm_pool_opens_connections_concurrently(self, tmp_path):
+        """Warm-up holds the requested number of connections at once."""
+        from sqlalchemy.pool import AsyncAdaptedQueuePool
+        from api.startup import warm_pool
+
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{tmp_path}/warm.db",
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=3,
+        )
+        try:
+            assert await warm_pool(engine, connections=3) == 3
+            assert engine.pool.checkedin() == 3
+        finally:
+            await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_warm_up_reads_bypass_entity_cache(self):
+        """Warm-up reads go to the database even with the entity cache on."""
+        from sqlalchemy.ext.asyncio import AsyncConnection
+        from api.repositories.cache import configure_entity_cache
+        from api.repositories.job import JobRepository
+        from api.startup import _warm_connection
+
+        caches = []
+
+        async def query(session):
+            caches.append(JobRepository(session)._entity_cache())
+
+        configure_entity_cache(enabled=True)
+        conn = MagicMock(spec=AsyncConnection)
+        with patch("api.startup._hot_queries", return_value=[query]):
+            assert await _warm_connection(conn) == 1
+
+        assert caches == [None]
+
+    @pytest.mark.asyncio
+    async def test_hot_queries_prepare_keyset_listings(self, mock_session, db_result, compile_postgres):
+        """Cursor pages of jobs and results are among the prepared statements."""
+        from api.startup import _hot_queries
+
+        for query in _hot_queries():
+            await query(mock_session)
+
+        statements = [compile_postgres(call.args[0]) for call in mock_session.execute.call_args_list]
+        for table in ("analysis_job", "analysis_result"):
+            assert any(f"({table}.created_at, {table}.id) <" in sql for sql in statements)
@@ -26,9 +26,11 @@ from api.models.database import DATABASE_URL
 
 # Import all models to ensure they are registered with Base.metadata
 from api.models.job import AnalysisJob
+from api.models.job_status_counter import JobStatusCounter
 from api.models.media import MediaFile
 from api.models.result import AnalysisResult
 from api.models.transcription import Transcription
+from api.models.transcript_segment import TranscriptSegment
 
 
 # =============================================================================
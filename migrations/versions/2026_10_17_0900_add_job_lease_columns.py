@@ -0,0 +1,45 @@
+"""
+Add worker lease columns to analysis_job.
+
+Revision ID: 000000000003
+Revises: 000000000002
+Create Date: 2026-10-17 09:00:00
+
+This migration:
+1. Adds claimed_by and lease_expires_at columns to analysis_job
+2. Adds a partial index over pending jobs ordered by created_at so
+   JobRepository.claim_batch can pick the oldest claimable rows without
+   scanning completed history
+"""
+
+from typing import Union
+from alembic import op
+import sqlalchemy as sa
+
+# Revision identifiers
+revision: str = "000000000003"
+down_revision: Union[str, None] = "000000000002"
+branch_labels: Union[str, None] = None
+depends_on: Union[str, None] = None
+
+
+def upgrade() -> None:
+    """Apply migration: add lease columns and claim index."""
+
+    op.add_column("analysis_job", sa.Column("claimed_by", sa.String(128), nullable=True))
+    op.add_column("analysis_job", sa.Column("lease_expires_at", sa.DateTime(timezone=True), nullable=True))
+
+    # Partial index for claim_batch (oldest pending first)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_analysis_job_pending_created
+        ON analysis_job (created_at)
+        WHERE status = 'pending' AND is_deleted = FALSE;
+    """)
+
+
+def downgrade() -> None:
+    """Revert migration: drop claim index and lease columns."""
+
+    op.execute("DROP INDEX IF EXISTS ix_analysis_job_pending_created;")
+    op.drop_column("analysis_job", "lease_expires_at")
+    op.drop_column("analysis_job", "claimed_by")
@@ -0,0 +1,70 @@
+"""
+Add (created_at, id) indexes for keyset pagination.
+
+Revision ID: 000000000004
+Revises: 000000000003
+Create Date: 2026-10-17 09:30:00
+
+This migration:
+1. Adds composite (created_at, id) indexes on analysis_job and analysis_result
+   so cursor pages seek directly to the row-value boundary
+2. Adds filtered variants for the status, job_id and provider listings
+"""
+
+from typing import Union
+from alembic import op
+
+# Revision identifiers
+revision: str = "000000000004"
+down_revision: Union[str, None] = "000000000003"
+branch_labels: Union[str, None] = None
+depends_on: Union[str, None] = None
+
+
+def upgrade() -> None:
+    """Apply migration: create keyset pagination indexes."""
+
+    # 1. Unfiltered job listing
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_analysis_job_created_id
+        ON analysis_job (created_at DESC, id DESC)
+        WHERE is_deleted = FALSE;
+    """)
+
+    # 2. Status-filtered job listing
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_analysis_job_status_created_id
+        ON analysis_job (status, created_at DESC, id DESC)
+        WHERE is_deleted = FALSE;
+    """)
+
+    # 3. Unfiltered result listing
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_analysis_result_created_id
+        ON analysis_result (created_at DESC, id DESC)
+        WHERE is_deleted = FALSE;
+    """)
+
+    # 4. Results by job
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_analysis_result_job_created_id
+        ON analysis_result (job_id, created_at DESC, id DESC)
+        WHERE is_deleted = FALSE;
+    """)
+
+    # 5. Results by provider
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_analysis_result_provider_created_id
+        ON analysis_result (provider, created_at DESC, id DESC)
+        WHERE is_deleted = FALSE;
+    """)
+
+
+def downgrade() -> None:
+    """Revert migration: drop keyset pagination indexes."""
+
+    op.execute("DROP INDEX IF EXISTS ix_analysis_result_provider_created_id;")
+    op.execute("DROP INDEX IF EXISTS ix_analysis_result_job_created_id;")
+    op.execute("DROP INDEX IF EXISTS ix_analysis_result_created_id;")
+    op.execute("DROP INDEX IF EXISTS ix_analysis_job_status_created_id;")
+    op.execute("DROP INDEX IF EXISTS ix_analysis_job_created_id;")
@@ -0,0 +1,91 @@
+"""
+Add trigger-maintained job status counters.
+
+Revision ID: 000000000005
+Revises: 000000000004
+Create Date: 2026-10-17 10:00:00
+
+This migration:
+1. Creates the job_status_counter table (status, slot) -> count
+2. Creates a row trigger on analysis_job that adjusts the counters on
+   insert, delete, status change and soft delete / restore
+3. Seeds the counters from the current contents of analysis_job
+"""
+
+from typing import Union
+from alembic import op
+import sqlalchemy as sa
+
+# Revision identifiers
+revision: str = "000000000005"
+down_revision: Union[str, None] = "000000000004"
+branch_labels: Union[str, None] = None
+depends_on: Union[str, None] = None
+
+# Must match api.models.job_status_counter.STATUS_COUNTER_SLOTS
+STATUS_COUNTER_SLOTS = 8
+
+
+def upgrade() -> None:
+    """Apply migration: create counter table, trigger and seed counts."""
+
+    op.create_table(
+        "job_status_counter",
+        sa.Column("status", sa.String(32), primary_key=True),
+        sa.Column("slot", sa.SmallInteger, primary_key=True),
+        sa.Column("count", sa.BigInteger, nullable=False, server_default=sa.text("0")),
+    )
+
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION analysis_job_status_counter()
+        RETURNS trigger AS $$
+        DECLARE
+            counter_slot smallint := floor(random() * {STATUS_COUNTER_SLOTS})::smallint;
+        BEGIN
+            IF TG_OP = 'UPDATE'
+               AND OLD.status = NEW.status
+               AND OLD.is_deleted = NEW.is_deleted THEN
+                RETURN NULL;
+            END IF;
+
+            IF TG_OP IN ('UPDATE', 'DELETE') AND NOT OLD.is_deleted THEN
+                INSERT INTO job_status_counter (status, slot, count)
+                VALUES (OLD.status::text, counter_slot, -1)
+                ON CONFLICT (status, slot)
+                DO UPDATE SET count = job_status_counter.count - 1;
+            END IF;
+
+            IF TG_OP IN ('INSERT', 'UPDATE') AND NOT NEW.is_deleted THEN
+                INSERT INTO job_status_counter (status, slot, count)
+                VALUES (NEW.status::text, counter_slot, 1)
+                ON CONFLICT (status, slot)
+                DO UPDATE SET count = job_status_counter.count + 1;
+            END IF;
+
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+    op.execute("""
+        CREATE TRIGGER trg_analysis_job_status_counter
+        AFTER INSERT OR DELETE OR UPDATE OF status, is_deleted ON analysis_job
+        FOR EACH ROW EXECUTE FUNCTION analysis_job_status_counter();
+    """)
+
+    # Seed counters from existing rows
+    op.execute("""
+        INSERT INTO job_status_counter (status, slot, count)
+        SELECT status::text, 0, COUNT(*)
+        FROM analysis_job
+        WHERE is_deleted = FALSE
+        GROUP BY status;
+    """)
+
+
+def downgrade() -> None:
+    """Revert migration: drop trigger, function and counter table."""
+
+    op.execute("DROP TRIGGER IF EXISTS trg_analysis_job_status_counter ON analysis_job;")
+    op.execute("DROP FUNCTION IF EXISTS analysis_job_status_counter();")
+    op.drop_table("job_status_counter")
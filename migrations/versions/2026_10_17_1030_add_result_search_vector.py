@@ -0,0 +1,52 @@
+"""
+Add full-text search vector for analysis results.
+
+Revision ID: 000000000006
+Revises: 000000000005
+Create Date: 2026-10-17 10:30:00
+
+This migration:
+1. Adds a stored generated tsvector column analysis_result.search_vector
+   over model (weight A) and the string values of result_json (weight B)
+2. Creates a GIN index on search_vector for ranked full-text search
+
+Adding a stored generated column rewrites analysis_result; run it in a
+maintenance window on large installations.
+"""
+
+from typing import Union
+from alembic import op
+
+# Revision identifiers
+revision: str = "000000000006"
+down_revision: Union[str, None] = "000000000005"
+branch_labels: Union[str, None] = None
+depends_on: Union[str, None] = None
+
+# Must match api.models.result.RESULT_SEARCH_VECTOR_SQL
+RESULT_SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(model, '')), 'A') || "
+    "setweight(jsonb_to_tsvector('english', result_json, '[\"string\"]'), 'B')"
+)
+
+
+def upgrade() -> None:
+    """Apply migration: add search_vector column and its GIN index."""
+
+    op.execute(f"""
+        ALTER TABLE analysis_result
+        ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS ({RESULT_SEARCH_VECTOR_SQL}) STORED;
+    """)
+
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_analysis_result_search_vector
+        ON analysis_result USING GIN (search_vector);
+    """)
+
+
+def downgrade() -> None:
+    """Revert migration: drop search_vector index and column."""
+
+    op.execute("DROP INDEX IF EXISTS ix_analysis_result_search_vector;")
+    op.execute("ALTER TABLE analysis_result DROP COLUMN IF EXISTS search_vector;")
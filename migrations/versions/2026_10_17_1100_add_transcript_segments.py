@@ -0,0 +1,121 @@
+"""
+Add searchable transcript segments.
+
+Revision ID: 000000000007
+Revises: 000000000006
+Create Date: 2026-10-17 11:00:00
+
+This migration:
+1. Creates the transcript_segment table, one row per element of
+   transcription.segments_json, with a generated tsvector over its text
+2. Creates a GIN index on the vector and a (job_id, start_seconds) index
+3. Creates a trigger on transcription that rebuilds a transcription's
+   segments whenever segments_json (or job_id) is written
+4. Backfills segments for existing transcriptions
+"""
+
+from typing import Union
+from alembic import op
+
+# Revision identifiers
+revision: str = "000000000007"
+down_revision: Union[str, None] = "000000000006"
+branch_labels: Union[str, None] = None
+depends_on: Union[str, None] = None
+
+# Must match api.models.transcript_segment.SEGMENT_SEARCH_CONFIG
+SEGMENT_SEARCH_CONFIG = "simple"
+
+# Explodes segments_json of the transcription aliased as "src" into rows
+SEGMENT_ROWS_SQL = """
+    SELECT
+        src.id AS transcription_id,
+        (seg.ordinality - 1)::integer AS segment_index,
+        src.job_id AS job_id,
+        CASE WHEN jsonb_typeof(seg.value->'start') = 'number'
+             THEN (seg.value->>'start')::double precision END AS start_seconds,
+        CASE WHEN jsonb_typeof(seg.value->'end') = 'number'
+             THEN (seg.value->>'end')::double precision END AS end_seconds,
+        left(seg.value->>'speaker', 64) AS speaker,
+        seg.value->>'text' AS text
+    FROM jsonb_array_elements(
+        CASE WHEN jsonb_typeof(src.segments_json) = 'array'
+             THEN src.segments_json ELSE '[]'::jsonb END
+    ) WITH ORDINALITY AS seg(value, ordinality)
+    WHERE coalesce(seg.value->>'text', '') <> ''
+"""
+
+
+def upgrade() -> None:
+    """Apply migration: create segment table, indexes, trigger and backfill."""
+
+    op.execute(f"""
+        CREATE TABLE IF NOT EXISTS transcript_segment (
+            transcription_id UUID NOT NULL,
+            segment_index INTEGER NOT NULL,
+            job_id UUID NOT NULL,
+            start_seconds DOUBLE PRECISION,
+            end_seconds DOUBLE PRECISION,
+            speaker VARCHAR(64),
+            text TEXT NOT NULL,
+            search_vector tsvector
+                GENERATED ALWAYS AS (to_tsvector('{SEGMENT_SEARCH_CONFIG}', text)) STORED,
+            CONSTRAINT pk_transcript_segment PRIMARY KEY (transcription_id, segment_index),
+            CONSTRAINT fk_transcript_segment_transcription_id
+                FOREIGN KEY (transcription_id) REFERENCES transcription (id) ON DELETE CASCADE
+        );
+    """)
+
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_transcript_segment_search_vector
+        ON transcript_segment USING GIN (search_vector);
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_transcript_segment_job_start
+        ON transcript_segment (job_id, start_seconds);
+    """)
+
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION transcription_sync_segments()
+        RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'UPDATE' THEN
+                DELETE FROM transcript_segment WHERE transcription_id = NEW.id;
+            END IF;
+
+            INSERT INTO transcript_segment (
+                transcription_id, segment_index, job_id,
+                start_seconds, end_seconds, speaker, text
+            )
+            {SEGMENT_ROWS_SQL.replace("src.", "NEW.")};
+
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+    op.execute("""
+        CREATE TRIGGER trg_transcription_sync_segments
+        AFTER INSERT OR UPDATE OF segments_json, job_id ON transcription
+        FOR EACH ROW EXECUTE FUNCTION transcription_sync_segments();
+    """)
+
+    # Backfill segments from existing transcriptions
+    op.execute(f"""
+        INSERT INTO transcript_segment (
+            transcription_id, segment_index, job_id,
+            start_seconds, end_seconds, speaker, text
+        )
+        SELECT segment_rows.*
+        FROM transcription AS src
+        CROSS JOIN LATERAL ({SEGMENT_ROWS_SQL}) AS segment_rows
+        ON CONFLICT DO NOTHING;
+    """)
+
+
+def downgrade() -> None:
+    """Revert migration: drop trigger, function and segment table."""
+
+    op.execute("DROP TRIGGER IF EXISTS trg_transcription_sync_segments ON transcription;")
+    op.execute("DROP FUNCTION IF EXISTS transcription_sync_segments();")
+    op.execute("DROP TABLE IF EXISTS transcript_segment;")
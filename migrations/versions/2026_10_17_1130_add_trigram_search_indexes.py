@@ -0,0 +1,52 @@
+"""
+Add trigram indexes for job and media file substring search.
+
+Revision ID: 000000000008
+Revises: 000000000007
+Create Date: 2026-10-17 11:30:00
+
+This migration:
+1. Creates GIN trigram indexes on analysis_job.source_url and the
+   metadata_json ->> 'description' expression
+2. Creates GIN trigram indexes on media_file filename, original_url and
+   cdn_url
+
+Requires the pg_trgm extension (enabled by migration 000000000002).
+"""
+
+from typing import Union
+from alembic import op
+
+# Revision identifiers
+revision: str = "000000000008"
+down_revision: Union[str, None] = "000000000007"
+branch_labels: Union[str, None] = None
+depends_on: Union[str, None] = None
+
+# (index name, table, indexed expression)
+TRIGRAM_INDEXES = [
+    ("ix_analysis_job_source_url_trgm", "analysis_job", "source_url"),
+    ("ix_analysis_job_description_trgm", "analysis_job", "(metadata_json ->> 'description')"),
+    ("ix_media_file_filename_trgm", "media_file", "filename"),
+    ("ix_media_file_original_url_trgm", "media_file", "original_url"),
+    ("ix_media_file_cdn_url_trgm", "media_file", "cdn_url"),
+]
+
+
+def upgrade() -> None:
+    """Apply migration: create trigram GIN indexes."""
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm;")
+
+    for name, table, expression in TRIGRAM_INDEXES:
+        op.execute(f"""
+            CREATE INDEX IF NOT EXISTS {name}
+            ON {table} USING GIN ({expression} gin_trgm_ops);
+        """)
+
+
+def downgrade() -> None:
+    """Revert migration: drop trigram GIN indexes."""
+
+    for name, _table, _expression in reversed(TRIGRAM_INDEXES):
+        op.execute(f"DROP INDEX IF EXISTS {name};")
@@ -0,0 +1,179 @@
+"""
+Convert processing_log to monthly range partitions on created_at.
+
+Revision ID: 000000000009
+Revises: 000000000008
+Create Date: 2026-10-17 12:00:00
+
+This migration:
+1. Renames the existing table to processing_log_legacy
+2. Creates processing_log partitioned by RANGE (created_at) with a
+   (id, created_at) primary key and a DEFAULT partition
+3. Creates processing_log_create_partition(month), used here and by
+   `python -m api.manage create-log-partitions`, and monthly partitions
+   from the oldest existing row through three months ahead
+4. Copies the rows over and drops the legacy table
+5. Replaces the job_id, stage, status and created_at btree indexes with
+   (job_id, created_at) plus a partial index for failures; keeps the GIN
+   index on details_json
+
+The copy rewrites the whole table; run it in a maintenance window.
+"""
+
+from typing import Union
+from alembic import op
+
+# Revision identifiers
+revision: str = "000000000009"
+down_revision: Union[str, None] = "000000000008"
+branch_labels: Union[str, None] = None
+depends_on: Union[str, None] = None
+
+COLUMNS = "id, job_id, stage, status, message, details_json, duration_ms, created_at"
+
+# Indexes created by migration 000000000002 on the unpartitioned table
+LEGACY_INDEXES = [
+    ("ix_processing_log_job_id", "(job_id)"),
+    ("ix_processing_log_stage", "(stage)"),
+    ("ix_processing_log_status", "(status)"),
+    ("ix_processing_log_created_at", "(created_at)"),
+    ("ix_processing_log_details_gin", "USING GIN (details_json)"),
+]
+
+# Creates the monthly partition containing p_month (UTC bounds). Rows that
+# already landed in the DEFAULT partition for that month are moved into it.
+CREATE_PARTITION_FUNCTION = """
+    CREATE OR REPLACE FUNCTION processing_log_create_partition(p_month date)
+    RETURNS text AS $$
+    DECLARE
+        start_at timestamptz := date_trunc('month', p_month)::timestamp AT TIME ZONE 'UTC';
+        end_at timestamptz := (date_trunc('month', p_month) + interval '1 month')::timestamp AT TIME ZONE 'UTC';
+        partition_name text := 'processing_log_y' || to_char(p_month, 'YYYY') || 'm' || to_char(p_month, 'MM');
+        has_default_rows boolean;
+    BEGIN
+        IF to_regclass(partition_name) IS NOT NULL THEN
+            RETURN partition_name;
+        END IF;
+
+        SELECT EXISTS (
+            SELECT 1 FROM processing_log_default
+            WHERE created_at >= start_at AND created_at < end_at
+        ) INTO has_default_rows;
+
+        IF has_default_rows THEN
+            ALTER TABLE processing_log DETACH PARTITION processing_log_default;
+        END IF;
+
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF processing_log FOR VALUES FROM (%L) TO (%L)',
+            partition_name, start_at, end_at
+        );
+
+        IF has_default_rows THEN
+            INSERT INTO processing_log
+            SELECT * FROM processing_log_default
+            WHERE created_at >= start_at AND created_at < end_at;
+            DELETE FROM processing_log_default
+            WHERE created_at >= start_at AND created_at < end_at;
+            ALTER TABLE processing_log ATTACH PARTITION processing_log_default DEFAULT;
+        END IF;
+
+        RETURN partition_name;
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+
+def upgrade() -> None:
+    """Apply migration: partition processing_log by month."""
+
+    op.execute("ALTER TABLE processing_log RENAME TO processing_log_legacy;")
+    op.execute(
+        "ALTER TABLE processing_log_legacy "
+        "RENAME CONSTRAINT processing_log_pkey TO processing_log_legacy_pkey;"
+    )
+    for name, _definition in LEGACY_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name};")
+
+    op.execute("""
+        CREATE TABLE processing_log (
+            id UUID NOT NULL DEFAULT gen_random_uuid(),
+            job_id UUID NOT NULL,
+            stage processing_stage NOT NULL,
+            status processing_log_status NOT NULL,
+            message TEXT,
+            details_json JSONB,
+            duration_ms INTEGER,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+            CONSTRAINT processing_log_pkey PRIMARY KEY (id, created_at),
+            CONSTRAINT fk_processing_log_job_id FOREIGN KEY (job_id)
+                REFERENCES analysis_job (id) ON DELETE CASCADE
+        ) PARTITION BY RANGE (created_at);
+    """)
+    op.execute("CREATE TABLE processing_log_default PARTITION OF processing_log DEFAULT;")
+    op.execute(CREATE_PARTITION_FUNCTION)
+
+    # Partitions for existing data through three months ahead
+    op.execute("""
+        SELECT processing_log_create_partition(month::date)
+        FROM generate_series(
+            date_trunc('month', COALESCE(
+                (SELECT min(created_at) FROM processing_log_legacy), now()
+            ) AT TIME ZONE 'UTC'),
+            date_trunc('month', now() AT TIME ZONE 'UTC') + interval '3 months',
+            interval '1 month'
+        ) AS month;
+    """)
+
+    op.execute(f"""
+        INSERT INTO processing_log ({COLUMNS})
+        SELECT {COLUMNS} FROM processing_log_legacy;
+    """)
+    op.execute("DROP TABLE processing_log_legacy;")
+
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_processing_log_job_created
+        ON processing_log (job_id, created_at);
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_processing_log_job_failures
+        ON processing_log (job_id, created_at)
+        WHERE status = 'failed';
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_processing_log_details_gin
+        ON processing_log USING GIN (details_json);
+    """)
+
+
+def downgrade() -> None:
+    """Revert migration: copy processing_log back into a plain table."""
+
+    op.execute("""
+        CREATE TABLE processing_log_unpartitioned (
+            id UUID NOT NULL DEFAULT gen_random_uuid(),
+            job_id UUID NOT NULL REFERENCES analysis_job (id) ON DELETE CASCADE,
+            stage processing_stage NOT NULL,
+            status processing_log_status NOT NULL,
+            message TEXT,
+            details_json JSONB,
+            duration_ms INTEGER,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+            CONSTRAINT processing_log_unpartitioned_pkey PRIMARY KEY (id)
+        );
+    """)
+    op.execute(f"""
+        INSERT INTO processing_log_unpartitioned ({COLUMNS})
+        SELECT {COLUMNS} FROM processing_log;
+    """)
+
+    op.execute("DROP TABLE processing_log CASCADE;")
+    op.execute("DROP FUNCTION IF EXISTS processing_log_create_partition(date);")
+
+    op.execute("ALTER TABLE processing_log_unpartitioned RENAME TO processing_log;")
+    op.execute(
+        "ALTER TABLE processing_log "
+        "RENAME CONSTRAINT processing_log_unpartitioned_pkey TO processing_log_pkey;"
+    )
+    for name, definition in LEGACY_INDEXES:
+        op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON processing_log {definition};")
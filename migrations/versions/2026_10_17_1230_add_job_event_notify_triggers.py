@@ -0,0 +1,93 @@
+"""
+Add NOTIFY triggers for job status changes and processing log entries.
+
+Revision ID: 000000000010
+Revises: 000000000009
+Create Date: 2026-10-17 12:30:00
+
+This migration:
+1. Creates a row trigger on analysis_job that sends a 'status' event on
+   the job_events channel when a job is inserted or its status changes
+2. Creates a row trigger on processing_log (inherited by every partition)
+   that sends a 'log' event for each new entry
+
+Payloads are JSON and stay well under the 8000 byte NOTIFY limit: long
+text fields are truncated. Notifications are delivered on commit, so
+listeners never see uncommitted state.
+"""
+
+from typing import Union
+from alembic import op
+
+# Revision identifiers
+revision: str = "000000000010"
+down_revision: Union[str, None] = "000000000009"
+branch_labels: Union[str, None] = None
+depends_on: Union[str, None] = None
+
+# Must match api.services.job_events.JOB_EVENTS_CHANNEL
+JOB_EVENTS_CHANNEL = "job_events"
+
+
+def upgrade() -> None:
+    """Apply migration: create notify functions and triggers."""
+
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION analysis_job_notify_status()
+        RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'UPDATE' AND OLD.status = NEW.status THEN
+                RETURN NULL;
+            END IF;
+
+            PERFORM pg_notify('{JOB_EVENTS_CHANNEL}', json_build_object(
+                'type', 'status',
+                'job_id', NEW.id,
+                'status', NEW.status,
+                'error_message', left(NEW.error_message, 1000),
+                'updated_at', NEW.updated_at
+            )::text);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+    op.execute("""
+        CREATE TRIGGER trg_analysis_job_notify_status
+        AFTER INSERT OR UPDATE OF status ON analysis_job
+        FOR EACH ROW EXECUTE FUNCTION analysis_job_notify_status();
+    """)
+
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION processing_log_notify()
+        RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('{JOB_EVENTS_CHANNEL}', json_build_object(
+                'type', 'log',
+                'job_id', NEW.job_id,
+                'id', NEW.id,
+                'stage', NEW.stage,
+                'status', NEW.status,
+                'message', left(NEW.message, 1000),
+                'duration_ms', NEW.duration_ms,
+                'created_at', NEW.created_at
+            )::text);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+    op.execute("""
+        CREATE TRIGGER trg_processing_log_notify
+        AFTER INSERT ON processing_log
+        FOR EACH ROW EXECUTE FUNCTION processing_log_notify();
+    """)
+
+
+def downgrade() -> None:
+    """Revert migration: drop notify triggers and functions."""
+
+    op.execute("DROP TRIGGER IF EXISTS trg_processing_log_notify ON processing_log;")
+    op.execute("DROP FUNCTION IF EXISTS processing_log_notify();")
+    op.execute("DROP TRIGGER IF EXISTS trg_analysis_job_notify_status ON analysis_job;")
+    op.execute("DROP FUNCTION IF EXISTS analysis_job_notify_status();")
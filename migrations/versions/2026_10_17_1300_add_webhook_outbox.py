@@ -0,0 +1,69 @@
+"""
+Add job callback URLs and the webhook outbox.
+
+Revision ID: 000000000011
+Revises: 000000000010
+Create Date: 2026-10-17 13:00:00
+
+This migration:
+1. Adds callback_url to analysis_job
+2. Creates the webhook_outbox table, written in the same transaction as
+   the job status change that triggers a callback
+3. Adds a partial index over pending entries ordered by next_attempt_at
+   for the dispatcher's claim query, and a job_id index for the cascade
+"""
+
+from typing import Union
+from alembic import op
+import sqlalchemy as sa
+
+# Revision identifiers
+revision: str = "000000000011"
+down_revision: Union[str, None] = "000000000010"
+branch_labels: Union[str, None] = None
+depends_on: Union[str, None] = None
+
+
+def upgrade() -> None:
+    """Apply migration: add callback_url and the outbox table."""
+
+    op.add_column("analysis_job", sa.Column("callback_url", sa.String(2048), nullable=True))
+
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS webhook_outbox (
+            id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+            job_id UUID NOT NULL,
+            callback_url VARCHAR(2048) NOT NULL,
+            event VARCHAR(64) NOT NULL,
+            payload JSONB NOT NULL,
+            status VARCHAR(16) NOT NULL DEFAULT 'pending',
+            attempts INTEGER NOT NULL DEFAULT 0,
+            next_attempt_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+            last_error TEXT,
+            delivered_at TIMESTAMPTZ,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+            updated_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+            CONSTRAINT fk_webhook_outbox_job_id FOREIGN KEY (job_id)
+                REFERENCES analysis_job (id) ON DELETE CASCADE,
+            CONSTRAINT ck_webhook_outbox_status
+                CHECK (status IN ('pending', 'delivered', 'dead'))
+        );
+    """)
+
+    # Claim query: oldest due pending entries first
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_webhook_outbox_due
+        ON webhook_outbox (next_attempt_at)
+        WHERE status = 'pending';
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_webhook_outbox_job_id
+        ON webhook_outbox (job_id);
+    """)
+
+
+def downgrade() -> None:
+    """Revert migration: drop the outbox table and callback_url."""
+
+    op.execute("DROP TABLE IF EXISTS webhook_outbox;")
+    op.drop_column("analysis_job", "callback_url")
@@ -0,0 +1,55 @@
+"""
+Add job attempt counter and expired-lease index for the stale-job reaper.
+
+Revision ID: 000000000012
+Revises: 000000000011
+Create Date: 2026-10-17 13:30:00
+
+This migration:
+1. Adds attempts to analysis_job (incremented by every claim); jobs that
+   are processing now count as on their first attempt
+2. Adds a partial index over processing jobs ordered by lease_expires_at,
+   so the reaper finds expired leases without scanning job history
+3. Adds the 'recovery' value to processing_stage for the reaper's
+   processing_log entries
+"""
+
+from typing import Union
+from alembic import op
+import sqlalchemy as sa
+
+# Revision identifiers
+revision: str = "000000000012"
+down_revision: Union[str, None] = "000000000011"
+branch_labels: Union[str, None] = None
+depends_on: Union[str, None] = None
+
+
+def upgrade() -> None:
+    """Apply migration: add attempts, lease index and recovery stage."""
+
+    op.add_column(
+        "analysis_job",
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0")
+    )
+    op.execute("UPDATE analysis_job SET attempts = 1 WHERE status = 'processing';")
+
+    # Reaper: processing jobs whose lease has expired, oldest first
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_analysis_job_processing_lease
+        ON analysis_job (lease_expires_at)
+        WHERE status = 'processing' AND is_deleted = FALSE;
+    """)
+
+    op.execute("ALTER TYPE processing_stage ADD VALUE IF NOT EXISTS 'recovery';")
+
+
+def downgrade() -> None:
+    """Revert migration: drop lease index and attempts.
+
+    PostgreSQL cannot drop an enum value; 'recovery' stays in
+    processing_stage, which is harmless to earlier revisions.
+    """
+
+    op.execute("DROP INDEX IF EXISTS ix_analysis_job_processing_lease;")
+    op.drop_column("analysis_job", "attempts")
@@ -0,0 +1,202 @@
+"""
+Add trigger-maintained hourly provider rollups for results and transcriptions.
+
+Revision ID: 000000000013
+Revises: 000000000012
+Create Date: 2026-10-17 14:00:00
+
+This migration:
+1. Creates result_hourly_rollup (hour, provider, model, slot) with counts,
+   confidence/token/latency sums and a latency histogram
+2. Creates transcription_hourly_rollup (hour, provider, language, slot)
+   with counts and duration sums
+3. Creates statement-level triggers on analysis_result and transcription
+   that fold each INSERT, UPDATE or DELETE statement into the rollups with
+   one upsert per affected (hour, provider, model), using transition tables
+4. Seeds the rollups from the current contents of both tables
+
+Soft-deleted rows are excluded, as in the statistics they replace.
+"""
+
+from typing import Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# Revision identifiers
+revision: str = "000000000013"
+down_revision: Union[str, None] = "000000000012"
+branch_labels: Union[str, None] = None
+depends_on: Union[str, None] = None
+
+# Must match api.models.provider_rollup.ROLLUP_SLOTS
+ROLLUP_SLOTS = 4
+
+# Must match api.models.provider_rollup.LATENCY_BUCKET_BOUNDS_MS
+LATENCY_BUCKET_BOUNDS_MS = (100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+
+LATENCY_BOUNDS_SQL = f"ARRAY[{', '.join(map(str, LATENCY_BUCKET_BOUNDS_MS))}]"
+
+# Columns whose changes move a row between or within rollups
+RESULT_ROLLUP_COLUMNS = ("provider", "model", "confidence", "tokens_used", "latency_ms", "created_at", "is_deleted")
+TRANSCRIPTION_ROLLUP_COLUMNS = ("provider", "language", "duration_seconds", "created_at", "is_deleted")
+
+
+def _changed(rows: str, others: str, columns: tuple) -> str:
+    """Subquery of transition-table rows whose rollup columns actually changed."""
+    compared = " AND ".join(f"o.{column} IS NOT DISTINCT FROM r.{column}" for column in columns)
+    return f"""(
+        SELECT r.* FROM {rows} r
+        WHERE NOT EXISTS (SELECT 1 FROM {others} o WHERE o.id = r.id AND {compared})
+    )"""
+
+
+def _result_upsert(rows: str, direction: str, slot: str) -> str:
+    """Fold the non-deleted rows of `rows` into result_hourly_rollup."""
+    histogram = ", ".join(
+        f"{direction} * count(*) FILTER (WHERE width_bucket(latency_ms, {LATENCY_BOUNDS_SQL}) = {i})"
+        for i in range(len(LATENCY_BUCKET_BOUNDS_MS) + 1)
+    )
+    return f"""
+        INSERT INTO result_hourly_rollup AS rollup (
+            bucket, provider, model, slot, result_count, confidence_count,
+            confidence_sum, tokens_sum, latency_count, latency_sum, latency_buckets
+        )
+        SELECT
+            date_trunc('hour', created_at, 'UTC'),
+            provider::text,
+            model,
+            {slot},
+            {direction} * count(*),
+            {direction} * count(confidence),
+            {direction} * coalesce(sum(confidence), 0),
+            {direction} * coalesce(sum(tokens_used), 0),
+            {direction} * count(latency_ms),
+            {direction} * coalesce(sum(latency_ms), 0),
+            ARRAY[{histogram}]::bigint[]
+        FROM {rows} AS source
+        WHERE NOT is_deleted
+        GROUP BY 1, 2, 3
+        ON CONFLICT (bucket, provider, model, slot) DO UPDATE SET
+            result_count = rollup.result_count + EXCLUDED.result_count,
+            confidence_count = rollup.confidence_count + EXCLUDED.confidence_count,
+            confidence_sum = rollup.confidence_sum + EXCLUDED.confidence_sum,
+            tokens_sum = rollup.tokens_sum + EXCLUDED.tokens_sum,
+            latency_count = rollup.latency_count + EXCLUDED.latency_count,
+            latency_sum = rollup.latency_sum + EXCLUDED.latency_sum,
+            latency_buckets = ARRAY(
+                SELECT t.total + t.delta
+                FROM unnest(rollup.latency_buckets, EXCLUDED.latency_buckets)
+                    WITH ORDINALITY AS t(total, delta, i)
+                ORDER BY t.i
+            );
+    """
+
+
+def _transcription_upsert(rows: str, direction: str, slot: str) -> str:
+    """Fold the non-deleted rows of `rows` into transcription_hourly_rollup."""
+    return f"""
+        INSERT INTO transcription_hourly_rollup AS rollup (
+            bucket, provider, language, slot, transcription_count, duration_sum
+        )
+        SELECT
+            date_trunc('hour', created_at, 'UTC'),
+            provider::text,
+            language,
+            {slot},
+            {direction} * count(*),
+            {direction} * coalesce(sum(duration_seconds), 0)
+        FROM {rows} AS source
+        WHERE NOT is_deleted
+        GROUP BY 1, 2, 3
+        ON CONFLICT (bucket, provider, language, slot) DO UPDATE SET
+            transcription_count = rollup.transcription_count + EXCLUDED.transcription_count,
+            duration_sum = rollup.duration_sum + EXCLUDED.duration_sum;
+    """
+
+
+def _rollup_function(name: str, upsert, columns: tuple) -> str:
+    """Statement trigger function applying old_rows (-1) and new_rows (+1)."""
+    return f"""
+        CREATE OR REPLACE FUNCTION {name}()
+        RETURNS trigger AS $$
+        DECLARE
+            rollup_slot smallint := floor(random() * {ROLLUP_SLOTS})::smallint;
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                {upsert("new_rows", "1", "rollup_slot")}
+            ELSIF TG_OP = 'DELETE' THEN
+                {upsert("old_rows", "-1", "rollup_slot")}
+            ELSE
+                {upsert(_changed("old_rows", "new_rows", columns), "-1", "rollup_slot")}
+                {upsert(_changed("new_rows", "old_rows", columns), "1", "rollup_slot")}
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """
+
+
+def _create_triggers(table: str, function: str) -> None:
+    """One statement trigger per event (transition tables allow only one)."""
+    for event, referencing in (
+        ("INSERT", "NEW TABLE AS new_rows"),
+        ("UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+        ("DELETE", "OLD TABLE AS old_rows"),
+    ):
+        op.execute(f"""
+            CREATE TRIGGER trg_{table}_rollup_{event.lower()}
+            AFTER {event} ON {table}
+            REFERENCING {referencing}
+            FOR EACH STATEMENT EXECUTE FUNCTION {function}();
+        """)
+
+
+def upgrade() -> None:
+    """Apply migration: create rollup tables, triggers and seed them."""
+
+    op.create_table(
+        "result_hourly_rollup",
+        sa.Column("bucket", sa.DateTime(timezone=True), primary_key=True),
+        sa.Column("provider", sa.String(64), primary_key=True),
+        sa.Column("model", sa.String(256), primary_key=True),
+        sa.Column("slot", sa.SmallInteger, primary_key=True),
+        sa.Column("result_count", sa.BigInteger, nullable=False, server_default=sa.text("0")),
+        sa.Column("confidence_count", sa.BigInteger, nullable=False, server_default=sa.text("0")),
+        sa.Column("confidence_sum", sa.Float, nullable=False, server_default=sa.text("0")),
+        sa.Column("tokens_sum", sa.BigInteger, nullable=False, server_default=sa.text("0")),
+        sa.Column("latency_count", sa.BigInteger, nullable=False, server_default=sa.text("0")),
+        sa.Column("latency_sum", sa.BigInteger, nullable=False, server_default=sa.text("0")),
+        sa.Column("latency_buckets", postgresql.ARRAY(sa.BigInteger), nullable=False),
+    )
+
+    op.create_table(
+        "transcription_hourly_rollup",
+        sa.Column("bucket", sa.DateTime(timezone=True), primary_key=True),
+        sa.Column("provider", sa.String(64), primary_key=True),
+        sa.Column("language", sa.String(10), primary_key=True),
+        sa.Column("slot", sa.SmallInteger, primary_key=True),
+        sa.Column("transcription_count", sa.BigInteger, nullable=False, server_default=sa.text("0")),
+        sa.Column("duration_sum", sa.Float, nullable=False, server_default=sa.text("0")),
+    )
+
+    op.execute(_rollup_function("analysis_result_rollup", _result_upsert, RESULT_ROLLUP_COLUMNS))
+    op.execute(_rollup_function("transcription_rollup", _transcription_upsert, TRANSCRIPTION_ROLLUP_COLUMNS))
+    _create_triggers("analysis_result", "analysis_result_rollup")
+    _create_triggers("transcription", "transcription_rollup")
+
+    # Seed rollups from existing rows
+    op.execute(_result_upsert("analysis_result", "1", "0"))
+    op.execute(_transcription_upsert("transcription", "1", "0"))
+
+
+def downgrade() -> None:
+    """Revert migration: drop triggers, functions and rollup tables."""
+
+    for table in ("analysis_result", "transcription"):
+        for event in ("insert", "update", "delete"):
+            op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_rollup_{event} ON {table};")
+    op.execute("DROP FUNCTION IF EXISTS transcription_rollup();")
+    op.execute("DROP FUNCTION IF EXISTS analysis_result_rollup();")
+    op.drop_table("transcription_hourly_rollup")
+    op.drop_table("result_hourly_rollup")